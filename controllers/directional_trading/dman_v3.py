@@ -2,12 +2,14 @@ import time
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import BollingerBandsIndicator
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -40,6 +42,12 @@ class DManV3ControllerConfig(DirectionalTradingControllerConfigBase):
     bb_std: float = Field(default=2.0)
     bb_long_threshold: float = Field(default=0.0)
     bb_short_threshold: float = Field(default=1.0)
+    use_streaming_indicators: bool = Field(
+        default=False,
+        json_schema_extra={
+            "prompt": "Use the streaming indicators of the candles feed instead of recalculating them with pandas-ta "
+                      "on every update? (live trading only) (True/False): ",
+            "prompt_on_new": False})
     trailing_stop: Optional[TrailingStop] = Field(
         default="0.015,0.005",
         json_schema_extra={
@@ -146,6 +154,7 @@ class DManV3Controller(DirectionalTradingControllerBase):
     def __init__(self, config: DManV3ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = config.bb_length
+        self.bbands = BollingerBandsIndicator(length=config.bb_length, std=config.bb_std)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -156,6 +165,9 @@ class DManV3Controller(DirectionalTradingControllerBase):
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
+        if self.config.use_streaming_indicators:
+            self.update_processed_data_from_streaming_indicators()
+            return
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
@@ -176,6 +188,27 @@ class DManV3Controller(DirectionalTradingControllerBase):
         self.processed_data["signal"] = df["signal"].iloc[-1]
         self.processed_data["features"] = df
 
+    def update_processed_data_from_streaming_indicators(self):
+        bbands = self.market_data_provider.get_candles_indicator(connector_name=self.config.candles_connector,
+                                                                 trading_pair=self.config.candles_trading_pair,
+                                                                 interval=self.config.interval,
+                                                                 indicator=self.bbands,
+                                                                 max_records=self.max_records)
+        features = bbands.last
+        bbp = features[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+
+        # Generate signal
+        signal = 0
+        if bbp < self.config.bb_long_threshold:
+            signal = 1
+        elif bbp > self.config.bb_short_threshold:
+            signal = -1
+
+        # Update processed data
+        features["signal"] = signal
+        self.processed_data["signal"] = signal
+        self.processed_data["features"] = pd.DataFrame([features])
+
     def get_spread_multiplier(self) -> Decimal:
         if self.config.dynamic_order_spread:
             df = self.processed_data["features"]
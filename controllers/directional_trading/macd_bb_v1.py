@@ -1,10 +1,12 @@
 from typing import List
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import BollingerBandsIndicator, MACDIndicator
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -44,6 +46,12 @@ class MACDBBV1ControllerConfig(DirectionalTradingControllerConfigBase):
     macd_signal: int = Field(
         default=9,
         json_schema_extra={"prompt": "Enter the MACD signal period: ", "prompt_on_new": True})
+    use_streaming_indicators: bool = Field(
+        default=False,
+        json_schema_extra={
+            "prompt": "Use the streaming indicators of the candles feed instead of recalculating them with pandas-ta "
+                      "on every update? (live trading only) (True/False): ",
+            "prompt_on_new": False})
 
     @field_validator("candles_connector", mode="before")
     @classmethod
@@ -65,6 +73,8 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
     def __init__(self, config: MACDBBV1ControllerConfig, *args, **kwargs):
         self.config = config
         self.max_records = max(config.macd_slow, config.macd_fast, config.macd_signal, config.bb_length) + 20
+        self.bbands = BollingerBandsIndicator(length=config.bb_length, std=config.bb_std)
+        self.macd = MACDIndicator(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -75,6 +85,9 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
+        if self.config.use_streaming_indicators:
+            self.update_processed_data_from_streaming_indicators()
+            return
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
@@ -98,3 +111,28 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
         # Update processed data
         self.processed_data["signal"] = df["signal"].iloc[-1]
         self.processed_data["features"] = df
+
+    def update_processed_data_from_streaming_indicators(self):
+        features = {}
+        for indicator in (self.bbands, self.macd):
+            features.update(self.market_data_provider.get_candles_indicator(
+                connector_name=self.config.candles_connector,
+                trading_pair=self.config.candles_trading_pair,
+                interval=self.config.interval,
+                indicator=indicator,
+                max_records=self.max_records).last)
+        bbp = features[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        macdh = features[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macd = features[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+
+        # Generate signal
+        signal = 0
+        if bbp < self.config.bb_long_threshold and macdh > 0 and macd < 0:
+            signal = 1
+        elif bbp > self.config.bb_short_threshold and macdh < 0 and macd > 0:
+            signal = -1
+
+        # Update processed data
+        features["signal"] = signal
+        self.processed_data["signal"] = signal
+        self.processed_data["features"] = pd.DataFrame([features])
@@ -1,10 +1,12 @@
 from typing import List
 
+import pandas as pd
 import pandas_ta as ta  # noqa: F401
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import CLOSE_INDEX, SuperTrendIndicator
 from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -36,6 +38,12 @@ class SuperTrendConfig(DirectionalTradingControllerConfigBase):
     percentage_threshold: float = Field(
         default=0.01,
         json_schema_extra={"prompt": "Enter the percentage threshold: ", "prompt_on_new": True})
+    use_streaming_indicators: bool = Field(
+        default=False,
+        json_schema_extra={
+            "prompt": "Use the streaming indicators of the candles feed instead of recalculating them with pandas-ta "
+                      "on every update? (live trading only) (True/False): ",
+            "prompt_on_new": False})
 
     @field_validator("candles_connector", mode="before")
     @classmethod
@@ -56,6 +64,7 @@ class SuperTrend(DirectionalTradingControllerBase):
     def __init__(self, config: SuperTrendConfig, *args, **kwargs):
         self.config = config
         self.max_records = config.length + 10
+        self.supertrend = SuperTrendIndicator(length=config.length, multiplier=config.multiplier)
         if len(self.config.candles_config) == 0:
             self.config.candles_config = [CandlesConfig(
                 connector=config.candles_connector,
@@ -66,6 +75,9 @@ class SuperTrend(DirectionalTradingControllerBase):
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
+        if self.config.use_streaming_indicators:
+            self.update_processed_data_from_streaming_indicators()
+            return
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
@@ -86,3 +98,27 @@ class SuperTrend(DirectionalTradingControllerBase):
         # Update processed data
         self.processed_data["signal"] = df["signal"].iloc[-1]
         self.processed_data["features"] = df
+
+    def update_processed_data_from_streaming_indicators(self):
+        supertrend = self.market_data_provider.get_candles_indicator(connector_name=self.config.candles_connector,
+                                                                     trading_pair=self.config.candles_trading_pair,
+                                                                     interval=self.config.interval,
+                                                                     indicator=self.supertrend,
+                                                                     max_records=self.max_records)
+        features = supertrend.last
+        signal = 0
+        if supertrend.last_candle is not None:
+            close = float(supertrend.last_candle[CLOSE_INDEX])
+            features["percentage_distance"] = abs(close - features[f"SUPERT_{self.config.length}_{self.config.multiplier}"]) / close
+
+            # Choose side
+            direction = features[f"SUPERTd_{self.config.length}_{self.config.multiplier}"]
+            if direction == 1 and features["percentage_distance"] < self.config.percentage_threshold:
+                signal = 1
+            elif direction == -1 and features["percentage_distance"] < self.config.percentage_threshold:
+                signal = -1
+
+        # Update processed data
+        features["signal"] = signal
+        self.processed_data["signal"] = signal
+        self.processed_data["features"] = pd.DataFrame([features])
@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.log_pipeline import install_log_pipeline, shutdown_log_pipeline
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,12 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        async_logging_settings: Optional[Dict] = config_dict.pop("async_logging", None)
+        # The queued records are handled before the handlers are replaced
+        shutdown_log_pipeline()
         logging.config.dictConfig(config_dict)
+        if async_logging_settings is not None:
+            install_log_pipeline(async_logging_settings, list(config_dict.get("loggers", {}).keys()))
 
 
 def get_strategy_list() -> List[str]:
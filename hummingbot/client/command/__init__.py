@@ -10,6 +10,7 @@ from .history_command import HistoryCommand
 from .import_command import ImportCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
+from .profile_command import ProfileCommand
 from .rate_command import RateCommand
 from .silly_commands import SillyCommands
 from .start_command import StartCommand
@@ -36,4 +37,5 @@ __all__ = [
     StopCommand,
     TickerCommand,
     MQTTCommand,
+    ProfileCommand,
 ]
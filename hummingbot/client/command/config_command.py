@@ -62,6 +62,10 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_events",
                              "mqtt_external_events",
                              "mqtt_autostart",
+                             "mqtt_batching",
+                             "mqtt_batch_encoding",
+                             "mqtt_batch_max_size",
+                             "mqtt_batch_interval",
                              "instance_id",
                              "send_error_logs",
                              "ethereum_chain_name",
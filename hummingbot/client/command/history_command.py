@@ -3,12 +3,13 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import PerformanceAccumulator
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -41,6 +42,16 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if days == 0 and self.trading_core.markets_recorder is not None:
+            # The performance of the current session is kept up to date by the markets recorder
+            accumulator = self.trading_core.markets_recorder.get_performance_accumulator(int(start_time * 1e3))
+            if accumulator.trades_count == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.performance_report(start_time, accumulator, precision))
+            return
         with self.trading_core.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -70,12 +81,18 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        accumulator = PerformanceAccumulator.from_trades(trades)
+        return await self.performance_report(start_time, accumulator, precision, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 accumulator: PerformanceAccumulator,
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), market_performance in list(accumulator.markets.items()):
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +101,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await market_performance.metrics(cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -207,14 +224,8 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
-
-        with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
-        return avg_return
+        accumulator = self.trading_core.markets_recorder.get_performance_accumulator(int(start_time * 1e3))
+        return await self.performance_report(start_time, accumulator, display_report=False)
 
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
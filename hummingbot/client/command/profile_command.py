@@ -0,0 +1,114 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.loop_profiler import LoopProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+SUBCOMMANDS = ["start", "stop", "export"]
+EXPORT_FORMATS = ["prometheus", "json"]
+TOP_TASKS_COUNT = 15
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                option: Optional[str] = None,
+                export_format: str = "prometheus",
+                file_path: Optional[str] = None,
+                interval: Optional[float] = None):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, option, export_format, file_path, interval)
+            return
+        profiler = LoopProfiler.get_instance()
+        if option == "start":
+            self.start_profiler(profiler, file_path, interval)
+        elif option == "stop":
+            profiler.stop()
+            self.notify("\nProfiling stopped.")
+        elif option == "export":
+            self.export_profile(profiler, export_format, file_path)
+        else:
+            self.show_profile(profiler)
+
+    def start_profiler(self,  # type: HummingbotApplication
+                       profiler: LoopProfiler,
+                       file_path: Optional[str] = None,
+                       interval: Optional[float] = None):
+        if profiler.is_running:
+            self.notify("\nProfiling is already running.")
+            return
+        profiler.reset()
+        profiler.start(lag_sample_interval=interval, export_file_path=file_path)
+        for connector_name, connector in self.trading_core.markets.items():
+            profiler.register_connector_queues(connector_name, connector)
+        message = "\nProfiling started, only the tasks started from now on are profiled."
+        if file_path is not None:
+            message += f" The metrics are written to {file_path} every {profiler.DEFAULT_EXPORT_INTERVAL:.0f} seconds."
+        self.notify(message)
+
+    def export_profile(self,  # type: HummingbotApplication
+                       profiler: LoopProfiler,
+                       export_format: str = "prometheus",
+                       file_path: Optional[str] = None):
+        if file_path is None:
+            extension = "json" if export_format == "json" else "prom"
+            file_path = os.path.join(data_path(), f"profile.{extension}")
+        profiler.sample_gauges()
+        try:
+            profiler.write(file_path, export_format)
+        except OSError as e:
+            self.notify(f"\nError exporting the profiling metrics: {e}")
+            return
+        self.notify(f"\nProfiling metrics exported to {file_path}")
+
+    def show_profile(self,  # type: HummingbotApplication
+                     profiler: LoopProfiler):
+        if not profiler.is_running and len(profiler.task_profiles) == 0:
+            self.notify("\nProfiling is not running. Start it with `profile start`.")
+            return
+        profiler.sample_gauges()
+        metrics = profiler.to_dict()
+        tables_format = self.client_config_map.tables_format
+        lines = [f"\nProfiling {'running' if profiler.is_running else 'stopped'}."]
+
+        loop_lag = metrics["loop_lag"]
+        lines.append(f"\n  Event loop lag (ms): last {loop_lag['last'] * 1e3:.2f}, mean {loop_lag['mean'] * 1e3:.2f}, "
+                     f"p99 {loop_lag['p99'] * 1e3:.2f}, max {loop_lag['max'] * 1e3:.2f} "
+                     f"({loop_lag['count']} samples)")
+
+        tasks = sorted(metrics["tasks"].items(), key=lambda item: item[1]["cpu_time"], reverse=True)
+        if len(tasks) > 0:
+            tasks_df = pd.DataFrame(
+                data=[[name, task["running"], task["finished"], task["steps"], task["cpu_time"], task["busy_time"],
+                       task["max_step_time"] * 1e3]
+                      for name, task in tasks[:TOP_TASKS_COUNT]],
+                columns=["Task", "Running", "Finished", "Steps", "CPU (s)", "Wall (s)", "Max step (ms)"],
+            )
+            lines.append(f"\n  Tasks (top {TOP_TASKS_COUNT} by CPU time):")
+            lines.append(format_df_for_printout(tasks_df, tables_format, max_col_width=60))
+
+        if len(metrics["gauges"]) > 0:
+            queues_df = pd.DataFrame(
+                data=[[name, gauge["value"], gauge["max"]] for name, gauge in metrics["gauges"].items()],
+                columns=["Queue", "Size", "Max size"],
+            )
+            lines.append("\n  Queues:")
+            lines.append(format_df_for_printout(queues_df, tables_format, max_col_width=60))
+
+        if len(metrics["throttler_waits"]) > 0:
+            waits_df = pd.DataFrame(
+                data=[[limit_id, wait["count"], wait["mean"] * 1e3, wait["p99"] * 1e3, wait["max"] * 1e3]
+                      for limit_id, wait in metrics["throttler_waits"].items()],
+                columns=["Rate limit", "Requests", "Mean wait (ms)", "p99 wait (ms)", "Max wait (ms)"],
+            )
+            lines.append("\n  Rate limit waits:")
+            lines.append(format_df_for_printout(waits_df, tables_format, max_col_width=60))
+
+        self.notify("\n".join(lines))
@@ -86,8 +86,33 @@ class MQTTBridgeConfigMap(BaseClientModel):
         default=False,
         json_schema_extra={"prompt": lambda cm: "Enable/Disable MQTT Autostart"},
     )
+    mqtt_batching: bool = Field(
+        default=False,
+        json_schema_extra={"prompt": lambda cm: "Enable/Disable batching of the MQTT events and logs"},
+    )
+    mqtt_batch_encoding: str = Field(
+        default="msgpack",
+        json_schema_extra={"prompt": lambda cm: "Set the encoding of the MQTT batches (msgpack or zlib_json)"},
+    )
+    mqtt_batch_max_size: int = Field(
+        default=100,
+        gt=0,
+        json_schema_extra={"prompt": lambda cm: "Set the maximum number of messages in a MQTT batch (e.g. 100)"},
+    )
+    mqtt_batch_interval: float = Field(
+        default=0.1,
+        gt=0,
+        json_schema_extra={"prompt": lambda cm: "Set the maximum time in seconds a MQTT batch is held (e.g. 0.1)"},
+    )
     model_config = ConfigDict(title="mqtt_bridge")
 
+    @field_validator("mqtt_batch_encoding")
+    @classmethod
+    def validate_mqtt_batch_encoding(cls, v: str) -> str:
+        if v not in ("msgpack", "zlib_json"):
+            raise ValueError("The MQTT batch encoding should be msgpack or zlib_json.")
+        return v
+
 
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
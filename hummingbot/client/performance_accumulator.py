@@ -0,0 +1,470 @@
+import json
+import logging
+import os
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.logger import HummingbotLogger
+
+s_decimal_0 = Decimal("0")
+
+pa_logger = None
+
+
+class _OrderFills:
+    """
+    The fills of an order aggregated the way PerformanceMetrics.aggregate_orders does it: the price is the average of
+    the fill prices, the amount their sum, and the position the one of the first fill.
+    """
+    __slots__ = ("position", "price_sum", "fills_count", "amount")
+
+    def __init__(self, position: str):
+        self.position = position
+        self.price_sum = s_decimal_0
+        self.fills_count = 0
+        self.amount = s_decimal_0
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills_count
+
+    def to_json(self) -> List[Any]:
+        return [self.position, str(self.price_sum), self.fills_count, str(self.amount)]
+
+    @classmethod
+    def from_json(cls, data: List[Any]) -> "_OrderFills":
+        order_fills = cls(data[0])
+        order_fills.price_sum = Decimal(data[1])
+        order_fills.fills_count = data[2]
+        order_fills.amount = Decimal(data[3])
+        return order_fills
+
+
+class MarketPerformance:
+    """
+    Performance of a market (connector and trading pair) updated fill by fill, so the performance metrics can be
+    calculated without the trades: the result of `metrics` is the same as the one of `PerformanceMetrics.create` with
+    all the trades added.
+
+    For derivatives the trade PnL is the PnL of the closed positions, the open positions being paired with the closing
+    ones in order like PerformanceMetrics does. The realized and unrealized PnL are also tracked with the average cost
+    of the position (for spot markets).
+
+    Only the derivative orders are kept, to pair them. Once `SETTLED_PAIRS_KEPT` more recent pairs of the same
+    direction are complete, a pair is settled: its PnL is kept in the closed positions PnL and its orders are dropped,
+    so fills of these orders added afterwards are taken as new orders.
+    """
+    SETTLED_PAIRS_KEPT = 100
+
+    def __init__(self, market: str, trading_pair: str):
+        self.market = market
+        self.trading_pair = trading_pair
+        self.num_buys = 0
+        self.num_sells = 0
+        self.b_vol_base = s_decimal_0
+        self.s_vol_base = s_decimal_0
+        self.b_vol_quote = s_decimal_0
+        self.s_vol_quote = s_decimal_0
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Number of fills without position (spot fills) by side, the trades are derivatives if one side has none
+        self._nil_position_buys = 0
+        self._nil_position_sells = 0
+        # Derivative orders by (is_buy, order_id), and the open and close orders of each side in order of their first
+        # fill. The order indexes count the settled pairs (by is_long) dropped from the start of the lists.
+        self._orders: Dict[Tuple[bool, str], _OrderFills] = {}
+        self._order_indexes: Dict[Tuple[bool, str], int] = {}
+        self._position_orders: Dict[Tuple[bool, str], Deque[str]] = {
+            (True, PositionAction.OPEN.value): deque(),
+            (False, PositionAction.CLOSE.value): deque(),
+            (False, PositionAction.OPEN.value): deque(),
+            (True, PositionAction.CLOSE.value): deque(),
+        }
+        self._settled_pairs: Dict[bool, int] = {True: 0, False: 0}
+        self._closed_positions_pnl = s_decimal_0
+        # Spot position with its average cost
+        self.position_amount = s_decimal_0
+        self.position_average_price = s_decimal_0
+        self.realized_pnl = s_decimal_0
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return (self.num_buys > 0 and self._nil_position_buys == 0) or \
+            (self.num_sells > 0 and self._nil_position_sells == 0)
+
+    @property
+    def closed_positions_pnl(self) -> Decimal:
+        return self._closed_positions_pnl
+
+    def unrealized_pnl(self, price: Decimal) -> Decimal:
+        return self.position_amount * (price - self.position_average_price)
+
+    def add_trade_fill(self, trade: Any):
+        """
+        :param trade: a TradeFill, or any object with the same attributes (with the trade fee as JSON)
+        """
+        trade_fee = trade.trade_fee
+        fee_percent = Decimal(str(trade_fee["percent"])) if trade_fee.get("percent") is not None else None
+        self.add_fill(order_id=trade.order_id,
+                      trade_type=trade.trade_type,
+                      price=Decimal(str(trade.price)),
+                      amount=Decimal(str(trade.amount)),
+                      position=trade.position if trade.position else PositionAction.NIL.value,
+                      fee_percent=fee_percent,
+                      fee_type=trade_fee.get("fee_type", ""),
+                      flat_fees=[(flat_fee["token"], Decimal(flat_fee["amount"]))
+                                 for flat_fee in trade_fee.get("flat_fees", [])])
+
+    def add_fill(self,
+                 order_id: str,
+                 trade_type: str,
+                 price: Decimal,
+                 amount: Decimal,
+                 position: str,
+                 fee_percent: Optional[Decimal],
+                 fee_type: str,
+                 flat_fees: Iterable[Tuple[str, Decimal]]):
+        is_buy = trade_type.upper() == TradeType.BUY.name
+        if is_buy:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+            self._nil_position_buys += position == PositionAction.NIL.value
+        elif trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+            self._nil_position_sells += position == PositionAction.NIL.value
+        else:
+            return
+        if fee_percent is not None and fee_type == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+            self.s_vol_quote -= amount * price * fee_percent
+
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        if fee_percent is not None:
+            self.fees[quote] += price * amount * fee_percent
+        for token, fee_amount in flat_fees:
+            self.fees[token] += fee_amount
+
+        self._add_order_fill(is_buy, order_id, price, amount, position)
+        self._update_position(is_buy, price, amount)
+
+    async def metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        :return: the performance metrics of the market, the same as PerformanceMetrics.create with all the trades
+        """
+        performance = PerformanceMetrics()
+        performance.num_buys = self.num_buys
+        performance.num_sells = self.num_sells
+        performance.num_trades = self.num_trades
+        performance.b_vol_base = self.b_vol_base
+        performance.s_vol_base = self.s_vol_base
+        performance.b_vol_quote = self.b_vol_quote
+        performance.s_vol_quote = self.s_vol_quote
+        performance._calculate_totals_and_averages()
+
+        await performance._calculate_balances_and_values(self.trading_pair,
+                                                         current_balances,
+                                                         start_price=self.start_price,
+                                                         last_price=self.last_price)
+        if self.are_derivatives:
+            performance.trade_pnl = self._closed_positions_pnl
+        else:
+            performance.trade_pnl = performance.cur_value - performance.hold_value
+
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        performance.fees.update(self.fees)
+        await performance._calculate_fee_in_quote(quote)
+
+        performance.total_pnl = performance.trade_pnl - performance.fee_in_quote
+        performance.return_pct = performance.divide(performance.total_pnl, performance.hold_value)
+        return performance
+
+    def _add_order_fill(self, is_buy: bool, order_id: str, price: Decimal, amount: Decimal, position: str):
+        key = (is_buy, order_id)
+        order_fills = self._orders.get(key)
+        is_new_order = order_fills is None
+        if is_new_order:
+            if (is_buy, position) not in self._position_orders:
+                # Spot orders are not paired
+                return
+            order_fills = _OrderFills(position)
+            self._add_position_order(key, order_fills)
+
+        pair = self._position_pair(key, order_fills.position)
+        if pair is not None and not is_new_order:
+            self._closed_positions_pnl -= self._pair_pnl(*pair)
+        order_fills.price_sum += price
+        order_fills.fills_count += 1
+        order_fills.amount += amount
+        if pair is not None:
+            self._closed_positions_pnl += self._pair_pnl(*pair)
+        if is_new_order:
+            self._drop_settled_pairs(is_buy == (order_fills.position == PositionAction.OPEN.value))
+
+    def _add_position_order(self, key: Tuple[bool, str], order_fills: _OrderFills):
+        is_buy, order_id = key
+        is_long = is_buy == (order_fills.position == PositionAction.OPEN.value)
+        position_orders = self._position_orders[(is_buy, order_fills.position)]
+        self._orders[key] = order_fills
+        self._order_indexes[key] = self._settled_pairs[is_long] + len(position_orders)
+        position_orders.append(order_id)
+
+    def _drop_settled_pairs(self, is_long: bool):
+        open_orders = self._position_orders[(is_long, PositionAction.OPEN.value)]
+        close_orders = self._position_orders[(not is_long, PositionAction.CLOSE.value)]
+        while min(len(open_orders), len(close_orders)) > self.SETTLED_PAIRS_KEPT:
+            for key in ((is_long, open_orders.popleft()), (not is_long, close_orders.popleft())):
+                del self._orders[key]
+                del self._order_indexes[key]
+            self._settled_pairs[is_long] += 1
+
+    def _position_pair(self, key: Tuple[bool, str], position: str) -> Optional[Tuple[bool, _OrderFills, _OrderFills]]:
+        """
+        :return: (is_long, open order, close order) if the order is paired with an order closing or opening the same
+        position
+        """
+        index = self._order_indexes.get(key)
+        if index is None:
+            return None
+        is_buy = key[0]
+        is_open = position == PositionAction.OPEN.value
+        is_long = is_buy == is_open
+        other_orders = self._position_orders[
+            (not is_buy, PositionAction.CLOSE.value if is_open else PositionAction.OPEN.value)]
+        index -= self._settled_pairs[is_long]
+        if index >= len(other_orders):
+            return None
+        other_order = self._orders[(not is_buy, other_orders[index])]
+        order = self._orders[key]
+        return (is_long, order, other_order) if is_open else (is_long, other_order, order)
+
+    @staticmethod
+    def _pair_pnl(is_long: bool, open_order: _OrderFills, close_order: _OrderFills) -> Decimal:
+        if open_order.fills_count == 0 or close_order.fills_count == 0:
+            return s_decimal_0
+        if is_long:
+            return (close_order.price - open_order.price) * close_order.amount
+        return (open_order.price - close_order.price) * close_order.amount
+
+    def _update_position(self, is_buy: bool, price: Decimal, amount: Decimal):
+        signed_amount = amount if is_buy else -amount
+        if self.position_amount == s_decimal_0 or (self.position_amount > 0) == is_buy:
+            new_amount = self.position_amount + signed_amount
+            self.position_average_price = (self.position_amount * self.position_average_price
+                                           + signed_amount * price) / new_amount
+            self.position_amount = new_amount
+            return
+        closed_amount = min(amount, abs(self.position_amount))
+        direction = Decimal(1) if self.position_amount > 0 else Decimal(-1)
+        self.realized_pnl += (price - self.position_average_price) * closed_amount * direction
+        self.position_amount -= closed_amount * direction
+        remaining_amount = amount - closed_amount
+        if self.position_amount == s_decimal_0:
+            self.position_average_price = s_decimal_0
+        if remaining_amount > 0:
+            self.position_amount = remaining_amount if is_buy else -remaining_amount
+            self.position_average_price = price
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "market": self.market,
+            "trading_pair": self.trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "start_price": str(self.start_price) if self.start_price is not None else None,
+            "last_price": str(self.last_price) if self.last_price is not None else None,
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "nil_position_buys": self._nil_position_buys,
+            "nil_position_sells": self._nil_position_sells,
+            "orders": [[is_buy, order_id, order_fills.to_json()]
+                       for (is_buy, order_id), order_fills in self._orders.items()],
+            "closed_positions_pnl": str(self._closed_positions_pnl),
+            "position_amount": str(self.position_amount),
+            "position_average_price": str(self.position_average_price),
+            "realized_pnl": str(self.realized_pnl),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MarketPerformance":
+        performance = cls(data["market"], data["trading_pair"])
+        performance.num_buys = data["num_buys"]
+        performance.num_sells = data["num_sells"]
+        for name in ("b_vol_base", "s_vol_base", "b_vol_quote", "s_vol_quote", "position_amount",
+                     "position_average_price", "realized_pnl"):
+            setattr(performance, name, Decimal(data[name]))
+        for name in ("start_price", "last_price"):
+            setattr(performance, name, Decimal(data[name]) if data[name] is not None else None)
+        performance.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        performance._nil_position_buys = data["nil_position_buys"]
+        performance._nil_position_sells = data["nil_position_sells"]
+        # The settled pairs are dropped from the open and close orders alike, the pairs stay aligned without them
+        for is_buy, order_id, order_data in data["orders"]:
+            order_fills = _OrderFills.from_json(order_data)
+            if (is_buy, order_fills.position) in performance._position_orders:
+                performance._add_position_order((is_buy, order_id), order_fills)
+        performance._closed_positions_pnl = Decimal(data["closed_positions_pnl"])
+        return performance
+
+
+class PerformanceAccumulator:
+    """
+    Performance of every market traded since `start_timestamp` (in milliseconds), fed with the trade fills as they are
+    recorded. Reading the performance doesn't depend on the number of trades.
+
+    The accumulator can be saved to a checkpoint file, and restored from it: the trades recorded since the checkpoint
+    are then the only ones to add.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global pa_logger
+        if pa_logger is None:
+            pa_logger = logging.getLogger(__name__)
+        return pa_logger
+
+    def __init__(self, start_timestamp: int, config_file_path: Optional[str] = None):
+        self.start_timestamp = start_timestamp
+        self.config_file_path = config_file_path
+        self._markets: Dict[Tuple[str, str], MarketPerformance] = {}
+        self.trades_count = 0
+        self.last_trade_timestamp: Optional[int] = None
+        # The trades of the last timestamp, to ignore them if they are added again
+        self._last_trade_ids: Set[Tuple[str, str, str]] = set()
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Any]) -> "PerformanceAccumulator":
+        """
+        :return: an accumulator with all the trades added, in their order
+        """
+        accumulator = cls(start_timestamp=0)
+        for trade in trades:
+            accumulator.add_trade_fill(trade)
+        return accumulator
+
+    @property
+    def markets(self) -> Dict[Tuple[str, str], MarketPerformance]:
+        """
+        :return: the performance by (market, trading pair)
+        """
+        return self._markets
+
+    def add_trade_fill(self, trade: Any) -> bool:
+        """
+        Adds a trade fill, unless it was before the start timestamp or was already added.
+        :return: True if the trade fill was added
+        """
+        if trade.timestamp < self.start_timestamp:
+            return False
+        trade_id = (trade.market, trade.order_id, trade.exchange_trade_id)
+        if self.last_trade_timestamp is None or trade.timestamp > self.last_trade_timestamp:
+            self.last_trade_timestamp = trade.timestamp
+            self._last_trade_ids = {trade_id}
+        elif trade.timestamp == self.last_trade_timestamp:
+            # The trades of the last timestamp are read again when catching up with the database after a checkpoint
+            if trade_id in self._last_trade_ids:
+                return False
+            self._last_trade_ids.add(trade_id)
+        else:
+            self.logger().debug(f"Trade fill {trade.exchange_trade_id} on {trade.market} added after more recent ones.")
+
+        key = (trade.market, trade.symbol)
+        market_performance = self._markets.get(key)
+        if market_performance is None:
+            market_performance = MarketPerformance(trade.market, trade.symbol)
+            self._markets[key] = market_performance
+        market_performance.add_trade_fill(trade)
+        self.trades_count += 1
+        return True
+
+    async def average_return_pct(
+            self,
+            balances_fn: Callable[[str], Awaitable[Optional[Dict[str, Decimal]]]]) -> Decimal:
+        """
+        :param balances_fn: returns the current balances of a market, None to leave the market out
+        :return: the average of the markets return %, the way the history command calculates it
+        """
+        return_pcts = []
+        for (market, _), market_performance in self._markets.items():
+            balances = await balances_fn(market)
+            if balances is None:
+                continue
+            performance = await market_performance.metrics(balances)
+            return_pcts.append(performance.return_pct)
+        return sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "start_timestamp": self.start_timestamp,
+            "config_file_path": self.config_file_path,
+            "trades_count": self.trades_count,
+            "last_trade_timestamp": self.last_trade_timestamp,
+            "last_trade_ids": sorted(list(trade_id) for trade_id in self._last_trade_ids),
+            "markets": [market_performance.to_json() for market_performance in self._markets.values()],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceAccumulator":
+        accumulator = cls(data["start_timestamp"], data["config_file_path"])
+        accumulator.trades_count = data["trades_count"]
+        accumulator.last_trade_timestamp = data["last_trade_timestamp"]
+        accumulator._last_trade_ids = {tuple(trade_id) for trade_id in data["last_trade_ids"]}
+        for market_data in data["markets"]:
+            market_performance = MarketPerformance.from_json(market_data)
+            accumulator._markets[(market_performance.market, market_performance.trading_pair)] = market_performance
+        return accumulator
+
+    def save_checkpoint(self, file_path: str):
+        self.write_checkpoint(file_path, self.to_json())
+
+    @classmethod
+    def write_checkpoint(cls, file_path: str, checkpoint: Dict[str, Any]):
+        """
+        Writes a checkpoint (the result of `to_json`) as JSON, replacing the previous one atomically. The state is only
+        read, so it can be called from a worker thread with a snapshot taken on the event loop.
+        """
+        temp_file_path = f"{file_path}.tmp"
+        try:
+            with open(temp_file_path, "w") as checkpoint_file:
+                json.dump(checkpoint, checkpoint_file)
+            os.replace(temp_file_path, file_path)
+        except Exception:
+            cls.logger().warning(f"Could not write the performance checkpoint {file_path}.", exc_info=True)
+
+    @classmethod
+    def load_checkpoint(cls,
+                        file_path: str,
+                        start_timestamp: int,
+                        config_file_path: Optional[str] = None) -> Optional["PerformanceAccumulator"]:
+        """
+        :return: the accumulator saved to the file, None if there is none for the same start timestamp and config
+        """
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path) as checkpoint_file:
+                accumulator = cls.from_json(json.load(checkpoint_file))
+        except Exception:
+            cls.logger().warning(f"Could not read the performance checkpoint {file_path}.", exc_info=True)
+            return None
+        if accumulator.start_timestamp != start_timestamp or accumulator.config_file_path != config_file_path:
+            return None
+        return accumulator
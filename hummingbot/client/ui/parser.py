@@ -171,6 +171,17 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> ThrowingAr
     )
     mqtt_restart_parser.set_defaults(func=hummingbot.mqtt_restart)
 
+    profile_parser = subparsers.add_parser("profile", help="Profile the event loop, the tasks, the queues and the rate limits")
+    profile_parser.add_argument("option", nargs="?", choices=("start", "stop", "export"), default=None,
+                                help="Start or stop profiling, or export the metrics (shows them by default)")
+    profile_parser.add_argument("--format", choices=("prometheus", "json"), default="prometheus",
+                                dest="export_format", help="The export format")
+    profile_parser.add_argument("--file", type=str, default=None, dest="file_path",
+                                help="The export file, written periodically while profiling when set on start")
+    profile_parser.add_argument("--interval", type=float, default=None, dest="interval",
+                                help="The seconds between two event loop lag samples")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     rate_parser = subparsers.add_parser('rate', help="Show rate of a given trading pair")
     rate_parser.add_argument("-p", "--pair", default=None,
                              dest="pair", help="The market trading pair for which you want to get a rate.")
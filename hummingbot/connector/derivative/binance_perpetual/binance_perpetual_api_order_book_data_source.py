@@ -51,14 +51,45 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
 
     async def get_funding_info(self, trading_pair: str) -> FundingInfo:
         symbol_info: Dict[str, Any] = await self._request_complete_funding_info(trading_pair)
-        funding_info = FundingInfo(
+        return self._funding_info_from_symbol_info(trading_pair, symbol_info)
+
+    async def get_funding_infos(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Requests the premium index of all the symbols in one call when it weighs less than one call per trading pair
+        """
+        if len(trading_pairs) <= CONSTANTS.MARK_PRICE_ALL_SYMBOLS_WEIGHT:
+            return await super().get_funding_infos(trading_pairs)
+        try:
+            symbol_to_pair = {
+                await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair): trading_pair
+                for trading_pair in trading_pairs
+            }
+            data = await self._connector._api_get(
+                path_url=CONSTANTS.MARK_PRICE_URL,
+                is_auth_required=True,
+                limit_id=CONSTANTS.MARK_PRICE_ALL_SYMBOLS_LIMIT_ID)
+            return {
+                symbol_to_pair[symbol_info["symbol"]]: self._funding_info_from_symbol_info(
+                    symbol_to_pair[symbol_info["symbol"]], symbol_info)
+                for symbol_info in data
+                if symbol_info["symbol"] in symbol_to_pair
+            }
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # All the trading pairs are left out, the caller requests them again
+            self.logger().error("Error fetching the funding info of all the symbols.", exc_info=True)
+            return {}
+
+    @staticmethod
+    def _funding_info_from_symbol_info(trading_pair: str, symbol_info: Dict[str, Any]) -> FundingInfo:
+        return FundingInfo(
             trading_pair=trading_pair,
             index_price=Decimal(symbol_info["indexPrice"]),
             mark_price=Decimal(symbol_info["markPrice"]),
             next_funding_utc_timestamp=int(float(symbol_info["nextFundingTime"]) * 1e-3),
             rate=Decimal(symbol_info["lastFundingRate"]),
         )
-        return funding_info
 
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         ex_trading_pair = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
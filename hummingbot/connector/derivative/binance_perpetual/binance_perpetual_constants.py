@@ -30,6 +30,8 @@ EXCHANGE_INFO_URL = "v1/exchangeInfo"
 RECENT_TRADES_URL = "v1/trades"
 PING_URL = "v1/ping"
 MARK_PRICE_URL = "v1/premiumIndex"
+MARK_PRICE_ALL_SYMBOLS_LIMIT_ID = "MarkPriceAllSymbols"
+MARK_PRICE_ALL_SYMBOLS_WEIGHT = 10
 SERVER_TIME_PATH_URL = "v1/time"
 
 # Private API v1 Endpoints
@@ -40,8 +42,16 @@ SET_LEVERAGE_URL = "v1/leverage"
 GET_INCOME_HISTORY_URL = "v1/income"
 CHANGE_POSITION_MODE_URL = "v1/positionSide/dual"
 
+BATCH_ORDER_URL = "v1/batchOrders"
+
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
+POST_BATCH_ORDER_LIMIT_ID = f"POST{BATCH_ORDER_URL}"
+DELETE_BATCH_ORDER_LIMIT_ID = f"DELETE{BATCH_ORDER_URL}"
+
+# Batch requests limits, see https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Place-Multiple-Orders
+BATCH_ORDER_CREATE_MAX_SIZE = 5
+BATCH_ORDER_CANCEL_MAX_SIZE = 10
 
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "v2/account"
@@ -107,6 +117,12 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
+    RateLimit(limit_id=POST_BATCH_ORDER_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5),
+                             LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
+                             LinkedLimitWeightPair(ORDERS_1SEC, weight=5)]),
+    RateLimit(limit_id=DELETE_BATCH_ORDER_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
@@ -125,6 +141,9 @@ RATE_LIMITS = [
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5)]),
     RateLimit(limit_id=MARK_PRICE_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE, weight=1,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
+    RateLimit(limit_id=MARK_PRICE_ALL_SYMBOLS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              weight=MARK_PRICE_ALL_SYMBOLS_WEIGHT,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=MARK_PRICE_ALL_SYMBOLS_WEIGHT)]),
 ]
 
 ORDER_NOT_EXIST_ERROR_CODE = -2013
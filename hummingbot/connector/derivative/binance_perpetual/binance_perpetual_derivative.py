@@ -1,8 +1,9 @@
 import asyncio
+import json
 import time
 from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -44,6 +45,9 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
     LONG_POLL_INTERVAL = 120.0
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     def __init__(
             self,
             client_config_map: "ClientConfigAdapter",
@@ -240,7 +244,41 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             position_action: PositionAction = PositionAction.NIL,
             **kwargs,
     ) -> Tuple[str, float]:
+        api_params = await self._order_request_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        try:
+            order_result = await self._api_post(
+                path_url=CONSTANTS.ORDER_URL,
+                data=api_params,
+                is_auth_required=True)
+            o_id = str(order_result["orderId"])
+            transact_time = order_result["updateTime"] * 1e-3
+        except IOError as e:
+            if self._is_server_overloaded_error(e):
+                o_id = "UNKNOWN"
+                transact_time = time.time()
+            else:
+                raise
+        return o_id, transact_time
 
+    async def _order_request_params(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction = PositionAction.NIL,
+            **kwargs,
+    ) -> Dict[str, Any]:
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -261,23 +299,90 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
                 api_params["positionSide"] = "LONG" if trade_type is TradeType.BUY else "SHORT"
             else:
                 api_params["positionSide"] = "SHORT" if trade_type is TradeType.BUY else "LONG"
+        return api_params
+
+    @staticmethod
+    def _is_server_overloaded_error(error: Exception) -> bool:
+        error_description = str(error)
+        return ("status is 503" in error_description
+                and "Unknown error, please check your request or try again later." in error_description)
+
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. The response has the result of each order in the order of
+        the request.
+        """
+        orders_params = [
+            await self._order_request_params(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
+            for order, kwargs in orders
+        ]
         try:
-            order_result = await self._api_post(
-                path_url=CONSTANTS.ORDER_URL,
-                data=api_params,
-                is_auth_required=True)
-            o_id = str(order_result["orderId"])
-            transact_time = order_result["updateTime"] * 1e-3
+            orders_results = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_URL,
+                data={"batchOrders": json.dumps(orders_params, separators=(",", ":"))},
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_BATCH_ORDER_LIMIT_ID)
         except IOError as e:
-            error_description = str(e)
-            is_server_overloaded = ("status is 503" in error_description
-                                    and "Unknown error, please check your request or try again later." in error_description)
-            if is_server_overloaded:
-                o_id = "UNKNOWN"
-                transact_time = time.time()
-            else:
-                raise
-        return o_id, transact_time
+            if self._is_server_overloaded_error(e):
+                return [("UNKNOWN", time.time())] * len(orders)
+            raise
+        if len(orders_results) != len(orders):
+            raise IOError(f"The batch orders response has {len(orders_results)} results for {len(orders)} orders.")
+        return [
+            (str(order_result["orderId"]), order_result["updateTime"] * 1e-3)
+            if "orderId" in order_result
+            else IOError(f"{order_result.get('code')} - {order_result.get('msg')}")
+            for order_result in orders_results
+        ]
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint, that only takes the orders of a single symbol. The orders
+        are canceled with their client order id, so they do not have to wait for their exchange order id.
+        """
+        orders_by_symbol: Dict[str, List[InFlightOrder]] = defaultdict(list)
+        for order in orders:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair)
+            orders_by_symbol[symbol].append(order)
+        symbols = list(orders_by_symbol)
+        responses = await safe_gather(*[
+            self._api_delete(
+                path_url=CONSTANTS.BATCH_ORDER_URL,
+                params={
+                    "symbol": symbol,
+                    "origClientOrderIdList": json.dumps(
+                        [order.client_order_id for order in orders_by_symbol[symbol]], separators=(",", ":")),
+                },
+                is_auth_required=True,
+                limit_id=CONSTANTS.DELETE_BATCH_ORDER_LIMIT_ID)
+            for symbol in symbols
+        ], return_exceptions=True)
+
+        results: Dict[str, Union[bool, Exception]] = {}
+        for symbol, response in zip(symbols, responses):
+            symbol_orders = orders_by_symbol[symbol]
+            if not isinstance(response, Exception) and len(response) != len(symbol_orders):
+                response = IOError(f"The batch cancel response has {len(response)} results for "
+                                   f"{len(symbol_orders)} orders.")
+            if isinstance(response, Exception):
+                results.update({order.client_order_id: response for order in symbol_orders})
+                continue
+            for order, cancel_result in zip(symbol_orders, response):
+                if "code" in cancel_result and "orderId" not in cancel_result:
+                    results[order.client_order_id] = IOError(f"{cancel_result.get('code')} - {cancel_result.get('msg')}")
+                else:
+                    results[order.client_order_id] = cancel_result.get("status") == "CANCELED"
+        return [results[order.client_order_id] for order in orders]
 
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
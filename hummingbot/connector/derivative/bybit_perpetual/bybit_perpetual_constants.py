@@ -88,6 +88,12 @@ PLACE_ACTIVE_ORDER_PATH_URL = {
 CANCEL_ACTIVE_ORDER_PATH_URL = {
     LINEAR_MARKET: "v5/order/cancel",
     NON_LINEAR_MARKET: "v5/order/cancel"}
+PLACE_BATCH_ORDERS_PATH_URL = {
+    LINEAR_MARKET: "v5/order/create-batch",
+    NON_LINEAR_MARKET: "v5/order/create-batch"}
+CANCEL_BATCH_ORDERS_PATH_URL = {
+    LINEAR_MARKET: "v5/order/cancel-batch",
+    NON_LINEAR_MARKET: "v5/order/cancel-batch"}
 QUERY_ACTIVE_ORDER_PATH_URL = {
     LINEAR_MARKET: "v5/order/realtime",
     NON_LINEAR_MARKET: "v5/order/realtime"}
@@ -102,6 +108,11 @@ SET_POSITION_MODE_URL = {
 GET_TRANSFERABLE_AMOUNT_PATH_URL = {
     LINEAR_MARKET: "v5/account/withdrawal",
 }
+
+# Batch requests limits, see https://bybit-exchange.github.io/docs/v5/order/batch-place
+BATCH_ORDER_CREATE_MAX_SIZE = 20
+BATCH_ORDER_CANCEL_MAX_SIZE = 20
+
 # Funding Settlement Time Span
 FUNDING_SETTLEMENT_DURATION = (5, 5)  # seconds before snapshot, seconds after snapshot
 
@@ -1,4 +1,5 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
@@ -39,6 +40,9 @@ s_decimal_0 = Decimal(0)
 
 class BybitPerpetualDerivative(PerpetualDerivativePyBase):
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(
@@ -196,6 +200,17 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
             CONSTANTS.RET_MSG_ORDER_NOT_FOUND in str(cancelation_exception))
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        data = await self._cancel_request_data(tracked_order)
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.CANCEL_ACTIVE_ORDER_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            trading_pair=tracked_order.trading_pair,
+        )
+        self._validate_exchange_response(cancel_result)
+        return True
+
+    async def _cancel_request_data(self, tracked_order: InFlightOrder) -> Dict[str, Any]:
         data = {
             "category": "linear" if bybit_utils.is_linear_perpetual(tracked_order.trading_pair) else "inverse",
             "symbol": await self.exchange_symbol_associated_to_pair(tracked_order.trading_pair)
@@ -204,14 +219,23 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
             data["orderId"] = tracked_order.exchange_order_id
         else:
             data["orderLinkId"] = tracked_order.client_order_id
-        cancel_result = await self._api_post(
-            path_url=CONSTANTS.CANCEL_ACTIVE_ORDER_PATH_URL,
-            data=data,
-            is_auth_required=True,
-            trading_pair=tracked_order.trading_pair,
+        return data
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. One request is sent per trading pair, since the endpoint
+        URL and the rate limits depend on it.
+        """
+        requests_data = [await self._cancel_request_data(order) for order in orders]
+        results = await self._execute_batch_requests_by_trading_pair(
+            path_url=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+            orders=orders,
+            requests_data=requests_data,
         )
-        self._validate_exchange_response(cancel_result)
-        return True
+        return [
+            result if isinstance(result, Exception) else True
+            for result in results
+        ]
 
     async def _place_order(
         self,
@@ -224,6 +248,39 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         position_action: PositionAction = PositionAction.NIL,
         **kwargs,
     ) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        resp = await self._api_post(
+            path_url=CONSTANTS.PLACE_ACTIVE_ORDER_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            trading_pair=trading_pair,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+            **kwargs,
+        )
+
+        self._validate_exchange_response(resp, before_text="Error submitting order {order_id}: ")
+
+        return str(resp["result"]["orderId"]), self.current_timestamp
+
+    async def _order_request_data(
+        self,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price: Decimal,
+        position_action: PositionAction = PositionAction.NIL,
+        **kwargs,
+    ) -> Dict[str, Any]:
         position_idx = self._get_position_idx(trade_type, position_action)
         data = {
             "category": "linear" if bybit_utils.is_linear_perpetual(trading_pair) else "inverse",
@@ -239,19 +296,101 @@ class BybitPerpetualDerivative(PerpetualDerivativePyBase):
         }
         if order_type.is_limit_type():
             data["price"] = str(price)
+        return data
 
-        resp = await self._api_post(
-            path_url=CONSTANTS.PLACE_ACTIVE_ORDER_PATH_URL,
-            data=data,
-            is_auth_required=True,
-            trading_pair=trading_pair,
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. One request is sent per trading pair, since the endpoint
+        URL and the rate limits depend on it.
+        """
+        requests_data = []
+        for order, kwargs in orders:
+            try:
+                requests_data.append(await self._order_request_data(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    **kwargs,
+                ))
+            except NotImplementedError as ex:
+                requests_data.append(ex)
+        results = await self._execute_batch_requests_by_trading_pair(
+            path_url=CONSTANTS.PLACE_BATCH_ORDERS_PATH_URL,
+            orders=[order for order, _ in orders],
+            requests_data=requests_data,
             headers={"referer": CONSTANTS.HBOT_BROKER_ID},
-            **kwargs,
         )
+        return [
+            result if isinstance(result, Exception) else (str(result["orderId"]), self.current_timestamp)
+            for result in results
+        ]
 
-        self._validate_exchange_response(resp, before_text="Error submitting order {order_id}: ")
+    async def _execute_batch_requests_by_trading_pair(
+        self,
+        path_url: Dict[str, str],
+        orders: List[InFlightOrder],
+        requests_data: List[Union[Dict[str, Any], Exception]],
+        **kwargs,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Sends the request data of the orders to a batch endpoint, with one request per trading pair.
 
-        return str(resp["result"]["orderId"]), self.current_timestamp
+        :param path_url: the batch endpoint
+        :param orders: the orders of the batch
+        :param requests_data: the request data of each order, or the exception raised building it
+        :return: the result of each order in the response, or the exception of the order
+        """
+        results: Dict[str, Union[Dict[str, Any], Exception]] = {}
+        requests_by_trading_pair: Dict[str, List[Tuple[InFlightOrder, Dict[str, Any]]]] = defaultdict(list)
+        for order, request_data in zip(orders, requests_data):
+            if isinstance(request_data, Exception):
+                results[order.client_order_id] = request_data
+            else:
+                requests_by_trading_pair[order.trading_pair].append((order, request_data))
+        trading_pairs = list(requests_by_trading_pair)
+        responses = await safe_gather(*[
+            self._api_post(
+                path_url=path_url,
+                data={
+                    "category": requests_by_trading_pair[trading_pair][0][1]["category"],
+                    "request": [
+                        {key: value for key, value in request_data.items() if key != "category"}
+                        for _, request_data in requests_by_trading_pair[trading_pair]
+                    ],
+                },
+                is_auth_required=True,
+                trading_pair=trading_pair,
+                **kwargs,
+            )
+            for trading_pair in trading_pairs
+        ], return_exceptions=True)
+
+        for trading_pair, response in zip(trading_pairs, responses):
+            pair_orders = [order for order, _ in requests_by_trading_pair[trading_pair]]
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                self._validate_exchange_response(response)
+                orders_results = response["result"]["list"]
+                orders_codes = response["retExtInfo"]["list"]
+                if len(orders_results) != len(pair_orders) or len(orders_codes) != len(pair_orders):
+                    raise IOError(f"The batch response has {len(orders_results)} results for "
+                                  f"{len(pair_orders)} orders.")
+            except Exception as ex:
+                results.update({order.client_order_id: ex for order in pair_orders})
+                continue
+            for order, order_result, order_code in zip(pair_orders, orders_results, orders_codes):
+                if order_code["code"] != CONSTANTS.RET_CODE_OK:
+                    formatted_ret_code = self._format_ret_code_for_print(order_code["code"])
+                    results[order.client_order_id] = IOError(f"{formatted_ret_code} - {order_code['msg']}")
+                else:
+                    results[order.client_order_id] = order_result
+        return [results[order.client_order_id] for order in orders]
 
     def _get_position_idx(self, trade_type: TradeType, position_action: PositionAction) -> int:
         if position_action == PositionAction.NIL:
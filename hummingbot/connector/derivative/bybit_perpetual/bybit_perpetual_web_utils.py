@@ -310,6 +310,26 @@ def _build_private_pair_specific_non_linear_rate_limits(trading_pair: str) -> Li
             linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
                            LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_100_limit_id)],
         ),
+        RateLimit(  # every order of a batch counts against the orders limit
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.PLACE_BATCH_ORDERS_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100 // CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(  # every order of a batch counts against the orders limit
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100 // CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_non_linear_private_bucket_100_limit_id)],
+        ),
         RateLimit(
             limit_id=get_pair_specific_limit_id(
                 base_limit_id=CONSTANTS.QUERY_ACTIVE_ORDER_PATH_URL[CONSTANTS.NON_LINEAR_MARKET],
@@ -399,6 +419,26 @@ def _build_private_pair_specific_linear_rate_limits(trading_pair: str) -> List[R
             linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
                            LinkedLimitWeightPair(pair_specific_linear_private_bucket_100_limit_id)],
         ),
+        RateLimit(  # every order of a batch counts against the orders limit
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.PLACE_BATCH_ORDERS_PATH_URL[CONSTANTS.LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100 // CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_linear_private_bucket_100_limit_id)],
+        ),
+        RateLimit(  # every order of a batch counts against the orders limit
+            limit_id=get_pair_specific_limit_id(
+                base_limit_id=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL[CONSTANTS.LINEAR_MARKET],
+                trading_pair=trading_pair,
+            ),
+            limit=100 // CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE,
+            time_interval=60,
+            linked_limits=[LinkedLimitWeightPair(CONSTANTS.POST_LIMIT_ID),
+                           LinkedLimitWeightPair(pair_specific_linear_private_bucket_100_limit_id)],
+        ),
         RateLimit(
             limit_id=get_pair_specific_limit_id(
                 base_limit_id=CONSTANTS.QUERY_ACTIVE_ORDER_PATH_URL[CONSTANTS.LINEAR_MARKET], trading_pair=trading_pair
@@ -69,6 +69,7 @@ class GateIoPerpetualDerivative(PerpetualDerivativePyBase):
         self._gate_io_perpetual_user_id = gate_io_perpetual_user_id
         self._domain = domain
         self._position_mode = None
+        self._position_mode_lock = asyncio.Lock()
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
 
@@ -742,45 +743,33 @@ class GateIoPerpetualDerivative(PerpetualDerivativePyBase):
             self._position_mode = PositionMode.ONEWAY if response[0]["mode"] == 'single' else PositionMode.HEDGE
         return self._position_mode
 
-    async def _execute_set_position_mode_for_pairs(
-            # To-do: ensure there's no active order or contract before changing position mode
-            self, mode: PositionMode, trading_pairs: List[str]
-    ) -> Tuple[bool, List[str], str]:
-        successful_pairs = []
-        success = True
-        msg = ""
-
-        for trading_pair in trading_pairs:
-            initial_mode = await self._get_position_mode()
-            if mode != initial_mode:
-                success, msg = await self._trading_pair_position_mode_set(mode, trading_pair)
-                self._position_mode = mode
-            if success:
-                successful_pairs.append(trading_pair)
-            else:
-                self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
-                break
-
-        return success, successful_pairs, msg
-
     async def _trading_pair_position_mode_set(self, mode: PositionMode, trading_pair: str) -> Tuple[bool, str]:
-        msg = ""
-        success = True
+        # The position mode is set for the whole account: it is only changed for the first trading pair, the requests
+        # for the other trading pairs (sent concurrently) wait for it and find the account already in the mode
+        # To-do: ensure there's no active order or contract before changing position mode
+        async with self._position_mode_lock:
+            if await self._get_position_mode() == mode:
+                return True, ""
 
-        dual_mode = 'true' if mode is PositionMode.HEDGE else 'false'
+            msg = ""
+            success = True
 
-        data = {"dual_mode": dual_mode}
+            dual_mode = 'true' if mode is PositionMode.HEDGE else 'false'
 
-        response = await self._api_post(
-            path_url=CONSTANTS.SET_POSITION_MODE_URL,
-            params=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.SET_POSITION_MODE_URL,
-        )
-        if 'detail' in response:
-            success = False
-            msg = response['detail']
-        return success, msg
+            data = {"dual_mode": dual_mode}
+
+            response = await self._api_post(
+                path_url=CONSTANTS.SET_POSITION_MODE_URL,
+                params=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.SET_POSITION_MODE_URL,
+            )
+            if 'detail' in response:
+                success = False
+                msg = response['detail']
+            else:
+                self._position_mode = mode
+            return success, msg
 
     async def _set_trading_pair_leverage(self, trading_pair: str, leverage: int) -> Tuple[bool, str]:
         success = True
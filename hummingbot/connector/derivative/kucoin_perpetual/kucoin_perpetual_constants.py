@@ -60,6 +60,12 @@ GET_WALLET_BALANCE_PATH_URL = f"{REST_API_VERSION}/account-overview?currency={{c
 GET_POSITIONS_PATH_URL = f"{REST_API_VERSION}/positions"
 QUERY_ACTIVE_ORDER_PATH_URL = f"{REST_API_VERSION}/orders?status=active"
 QUERY_ALL_ORDER_PATH_URL = f"{REST_API_VERSION}/orders"
+CREATE_BATCH_ORDERS_PATH_URL = f"{REST_API_VERSION}/orders/multi"
+CANCEL_BATCH_ORDERS_PATH_URL = f"{REST_API_VERSION}/orders/multi-cancel"
+
+# Batch requests limits, see https://www.kucoin.com/docs/rest/futures-trading/orders/place-multiple-orders
+BATCH_ORDER_CREATE_MAX_SIZE = 20
+BATCH_ORDER_CANCEL_MAX_SIZE = 10
 
 # Websocket
 PUBLIC_WS_DATA_PATH_URL = f"{REST_API_VERSION}/bullet-public"
@@ -96,6 +102,7 @@ ORDER_STATE = {
 
 # Request error codes
 RET_CODE_OK = "200000"
+RET_CODE_BATCH_ORDER_OK = "200"  # code of the successful orders in the batch responses
 RET_CODE_PARAMS_ERROR = "100001"
 RET_CODE_API_KEY_INVALID = "400001"
 RET_CODE_ORDER_NOT_EXISTS = "20001"
@@ -125,6 +132,9 @@ RATE_LIMITS = [
     RateLimit(limit_id=GET_CONTRACT_INFO_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=CREATE_ORDER_PATH_URL, limit=25, time_interval=3),
     RateLimit(limit_id=CANCEL_ORDER_PATH_URL, limit=35, time_interval=3),
+    # Every order of a batch counts against the orders limit
+    RateLimit(limit_id=CREATE_BATCH_ORDERS_PATH_URL, limit=25 // BATCH_ORDER_CREATE_MAX_SIZE, time_interval=3),
+    RateLimit(limit_id=CANCEL_BATCH_ORDERS_PATH_URL, limit=35 // BATCH_ORDER_CANCEL_MAX_SIZE, time_interval=3),
     RateLimit(limit_id=GET_FILL_INFO_PATH_URL, limit=9, time_interval=3),
     RateLimit(limit_id=GET_RECENT_FILLS_INFO_PATH_URL, limit=9, time_interval=3),
     RateLimit(limit_id=GET_FUNDING_HISTORY_PATH_URL, limit=9, time_interval=3),
@@ -39,6 +39,9 @@ s_decimal_0 = Decimal(0)
 
 
 class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(
@@ -175,6 +178,42 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
 
         return True
 
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. The orders are canceled with their client order id, so
+        they do not have to wait for their exchange order id.
+        """
+        cancel_result = await self._api_delete(
+            path_url=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+            is_auth_required=True,
+            limit_id=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL,
+            data={
+                "clientOidsList": [
+                    {"symbol": await self.exchange_symbol_associated_to_pair(order.trading_pair),
+                     "clientOid": order.client_order_id}
+                    for order in orders
+                ],
+            }
+        )
+        if cancel_result["code"] != CONSTANTS.RET_CODE_OK:
+            formatted_ret_code = self._format_ret_code_for_print(cancel_result["code"])
+            raise IOError(f"{formatted_ret_code} - {cancel_result['msg']}")
+        orders_results = {order_result.get("clientOid"): order_result for order_result in cancel_result["data"]}
+
+        results = []
+        for order in orders:
+            order_result = orders_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"The order {order.client_order_id} is missing from the batch cancel response"))
+            elif order_result["code"] in (CONSTANTS.RET_CODE_OK, CONSTANTS.RET_CODE_BATCH_ORDER_OK):
+                results.append(True)
+            else:
+                if order_result["code"] == CONSTANTS.RET_CODE_ORDER_NOT_EXISTS:
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+                formatted_ret_code = self._format_ret_code_for_print(order_result["code"])
+                results.append(IOError(f"{formatted_ret_code} - {order_result['msg']}"))
+        return results
+
     async def _place_order(
             self,
             order_id: str,
@@ -186,6 +225,40 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
             position_action: PositionAction = PositionAction.NIL,
             **kwargs,
     ) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        resp = await self._api_post(
+            path_url=CONSTANTS.CREATE_ORDER_PATH_URL,
+            data=data,
+            is_auth_required=True,
+            trading_pair=trading_pair,
+            headers={"referer": CONSTANTS.HB_PARTNER_ID},
+            **kwargs,
+        )
+
+        if resp["code"] != CONSTANTS.RET_CODE_OK:
+            formatted_ret_code = self._format_ret_code_for_print(resp['code'])
+            raise IOError(f"Error submitting order {order_id}: {formatted_ret_code} - {resp['msg']}")
+        return str(resp["data"]["orderId"]), self.current_timestamp
+
+    async def _order_request_data(
+            self,
+            order_id: str,
+            trading_pair: str,
+            amount: Decimal,
+            trade_type: TradeType,
+            order_type: OrderType,
+            price: Decimal,
+            position_action: PositionAction = PositionAction.NIL,
+            **kwargs,
+    ) -> Dict[str, Any]:
         data = {
             "side": "buy" if trade_type is TradeType.BUY else "sell",
             "symbol": await self.exchange_symbol_associated_to_pair(trading_pair),
@@ -203,20 +276,51 @@ class KucoinPerpetualDerivative(PerpetualDerivativePyBase):
                 data["postOnly"] = True
         else:
             data["timeInForce"] = "IOC"
+        return data
 
+    async def _place_batch_orders(
+            self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the multiple orders endpoint. The response has the result of each order, identified
+        by its client order id.
+        """
+        orders_data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
+            for order, kwargs in orders
+        ]
         resp = await self._api_post(
-            path_url=CONSTANTS.CREATE_ORDER_PATH_URL,
-            data=data,
+            path_url=CONSTANTS.CREATE_BATCH_ORDERS_PATH_URL,
+            data=orders_data,
             is_auth_required=True,
-            trading_pair=trading_pair,
             headers={"referer": CONSTANTS.HB_PARTNER_ID},
-            **kwargs,
         )
-
         if resp["code"] != CONSTANTS.RET_CODE_OK:
             formatted_ret_code = self._format_ret_code_for_print(resp['code'])
-            raise IOError(f"Error submitting order {order_id}: {formatted_ret_code} - {resp['msg']}")
-        return str(resp["data"]["orderId"]), self.current_timestamp
+            raise IOError(f"Error submitting orders: {formatted_ret_code} - {resp['msg']}")
+        orders_results = {order_result.get("clientOid"): order_result for order_result in resp["data"]}
+
+        results = []
+        for order, _ in orders:
+            order_result = orders_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: missing from the response"))
+            elif (order_result.get("orderId")
+                  and order_result["code"] in (CONSTANTS.RET_CODE_OK, CONSTANTS.RET_CODE_BATCH_ORDER_OK)):
+                results.append((str(order_result["orderId"]), self.current_timestamp))
+            else:
+                formatted_ret_code = self._format_ret_code_for_print(order_result["code"])
+                results.append(IOError(
+                    f"Error submitting order {order.client_order_id}: {formatted_ret_code} - {order_result['msg']}"))
+        return results
 
     def _get_fee(self,
                  base_currency: str,
@@ -124,6 +124,10 @@ REST_PLACE_ACTIVE_ORDER = {METHOD: POST,
                            ENDPOINT: f"/api/{REST_API_VERSION}/trade/order"}
 REST_CANCEL_ACTIVE_ORDER = {METHOD: POST,
                             ENDPOINT: f"/api/{REST_API_VERSION}/trade/cancel-order"}
+REST_PLACE_BATCH_ORDERS = {METHOD: POST,
+                           ENDPOINT: f"/api/{REST_API_VERSION}/trade/batch-orders"}
+REST_CANCEL_BATCH_ORDERS = {METHOD: POST,
+                            ENDPOINT: f"/api/{REST_API_VERSION}/trade/cancel-batch-orders"}
 REST_QUERY_ACTIVE_ORDER = {METHOD: GET,
                            ENDPOINT: REST_PLACE_ACTIVE_ORDER[ENDPOINT]}
 REST_USER_TRADE_RECORDS = {METHOD: GET,
@@ -133,6 +137,9 @@ REST_BILLS_DETAILS = {METHOD: GET,
 REST_WS_LOGIN_PATH = {METHOD: GET,
                       ENDPOINT: "/users/self/verify"}
 
+# Batch requests limits, see https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-multiple-orders
+BATCH_ORDER_CREATE_MAX_SIZE = 20
+BATCH_ORDER_CANCEL_MAX_SIZE = 20
 
 # -------------------------------------------
 # RET CODES
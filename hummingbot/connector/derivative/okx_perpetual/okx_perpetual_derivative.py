@@ -39,6 +39,9 @@ s_decimal_0 = Decimal(0)
 
 class OkxPerpetualDerivative(PerpetualDerivativePyBase):
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(
@@ -240,6 +243,40 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
         position_action: PositionAction = PositionAction.NIL,
         **kwargs,
     ) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+            position_action=position_action,
+        )
+        exchange_order_id = await self._api_post(
+            path_url=CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+            data=data,
+            is_auth_required=True,
+            trading_pair=data["instId"],
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+            **kwargs,
+        )
+
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
+
+    async def _order_request_data(
+        self,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price: Decimal,
+        position_action: PositionAction = PositionAction.NIL,
+        **kwargs,
+    ) -> Dict[str, Any]:
         if position_action == PositionAction.NIL:
             raise NotImplementedError
         ex_trading_pair = await self.exchange_symbol_associated_to_pair(trading_pair)
@@ -260,37 +297,96 @@ class OkxPerpetualDerivative(PerpetualDerivativePyBase):
                 data["posSide"] = "short" if trade_type is TradeType.BUY else "long"
         else:
             data["posSide"] = "net"
+        return data
 
-        exchange_order_id = await self._api_post(
-            path_url=CONSTANTS.REST_PLACE_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. The response has the result of each order, identified by
+        its client order id.
+        """
+        results: Dict[str, Union[Tuple[str, float], Exception]] = {}
+        request_data = []
+        for order, kwargs in orders:
+            try:
+                request_data.append(await self._order_request_data(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    **kwargs,
+                ))
+            except NotImplementedError as ex:
+                results[order.client_order_id] = ex
+        if len(request_data) > 0:
+            response = await self._api_post(
+                path_url=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.ENDPOINT],
+                data=request_data,
+                is_auth_required=True,
+                headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+            )
+            for order_result in response.get("data", []):
+                if order_result["sCode"] != "0":
+                    results[order_result["clOrdId"]] = IOError(
+                        f"Error submitting order {order_result['clOrdId']}: {order_result['sMsg']}")
+                else:
+                    results[order_result["clOrdId"]] = str(order_result["ordId"]), self.current_timestamp
+        return [
+            results.get(order.client_order_id,
+                        IOError(f"Error submitting order {order.client_order_id}: missing from the batch response"))
+            for order, _ in orders
+        ]
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        data = await self._cancel_request_data(tracked_order)
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.REST_CANCEL_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
             data=data,
             is_auth_required=True,
-            trading_pair=ex_trading_pair,
-            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
-            **kwargs,
+            trading_pair=tracked_order.trading_pair,
         )
+        return self._cancel_result(order_id=order_id, cancel_data=cancel_result["data"][0], cancel_result=cancel_result)
 
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. The orders are identified by their client order id, so
+        they do not have to wait for their exchange order id.
+        """
+        request_data = [await self._cancel_request_data(order) for order in orders]
+        response = await self._api_post(
+            path_url=CONSTANTS.REST_CANCEL_BATCH_ORDERS[CONSTANTS.ENDPOINT],
+            data=request_data,
+            is_auth_required=True,
+        )
+        cancel_results = {cancel_data.get("clOrdId"): cancel_data for cancel_data in response.get("data", [])}
+        results = []
+        for order in orders:
+            try:
+                results.append(self._cancel_result(
+                    order_id=order.client_order_id,
+                    cancel_data=cancel_results.get(order.client_order_id, {}),
+                    cancel_result=response,
+                ))
+            except IOError as ex:
+                results.append(ex)
+        return results
 
-    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+    async def _cancel_request_data(self, tracked_order: InFlightOrder) -> Dict[str, Any]:
         data = {"instId": await self.exchange_symbol_associated_to_pair(tracked_order.trading_pair)}
         if tracked_order.exchange_order_id:
             data["ordId"] = tracked_order.exchange_order_id
         if tracked_order.client_order_id:
             data["clOrdId"] = tracked_order.client_order_id
-        cancel_result = await self._api_post(
-            path_url=CONSTANTS.REST_CANCEL_ACTIVE_ORDER[CONSTANTS.ENDPOINT],
-            data=data,
-            is_auth_required=True,
-            trading_pair=tracked_order.trading_pair,
-        )
-        data = cancel_result["data"][0]
-        ret_code_ok = data["sCode"] == CONSTANTS.RET_CODE_OK
-        ret_code_order_not_exists = data["sCode"] == CONSTANTS.RET_CODE_CANCEL_FAILED_BECAUSE_ORDER_NOT_EXISTS
-        ret_code_already_canceled = data["sCode"] == CONSTANTS.RET_CODE_ORDER_ALREADY_CANCELLED
+        return data
+
+    @staticmethod
+    def _cancel_result(order_id: str, cancel_data: Dict[str, Any], cancel_result: Dict[str, Any]) -> bool:
+        ret_code_ok = cancel_data.get("sCode") == CONSTANTS.RET_CODE_OK
+        ret_code_order_not_exists = cancel_data.get("sCode") == CONSTANTS.RET_CODE_CANCEL_FAILED_BECAUSE_ORDER_NOT_EXISTS
+        ret_code_already_canceled = cancel_data.get("sCode") == CONSTANTS.RET_CODE_ORDER_ALREADY_CANCELLED
         if ret_code_ok or ret_code_order_not_exists or ret_code_already_canceled:
             final_result = True
         else:
@@ -245,6 +245,19 @@ def _build_private_general_rate_limits() -> List[RateLimit]:
             limit=60,
             time_interval=2,
         ),
+        # 300 orders every 2 seconds
+        RateLimit(
+            limit_id=get_rest_api_limit_id_for_endpoint(method=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.METHOD],
+                                                        endpoint=CONSTANTS.REST_PLACE_BATCH_ORDERS[CONSTANTS.ENDPOINT]),
+            limit=300 // CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE,
+            time_interval=2,
+        ),
+        RateLimit(
+            limit_id=get_rest_api_limit_id_for_endpoint(method=CONSTANTS.REST_CANCEL_BATCH_ORDERS[CONSTANTS.METHOD],
+                                                        endpoint=CONSTANTS.REST_CANCEL_BATCH_ORDERS[CONSTANTS.ENDPOINT]),
+            limit=300 // CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE,
+            time_interval=2,
+        ),
         RateLimit(
             limit_id=get_rest_api_limit_id_for_endpoint(method=CONSTANTS.REST_SET_LEVERAGE[CONSTANTS.METHOD],
                                                         endpoint=CONSTANTS.REST_SET_LEVERAGE[CONSTANTS.ENDPOINT]),
@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import typing
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.connector.perpetual_trading import PerpetualTrading
+from hummingbot.core.data_type.common import PositionSide
+from hummingbot.core.event.events import AccountEvent, PositionRiskEvent
+from hummingbot.logger import HummingbotLogger
+
+if typing.TYPE_CHECKING:  # avoid circular import problems
+    from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
+
+
+@dataclass
+class PositionRisk:
+    """
+    The valuation of a position at the current mark price. The values are floats, as they are calculated with array
+    math for all the positions at once.
+
+    The liquidation price is estimated for an isolated margin position (NaN when the leverage is unknown). The
+    liquidation distance is the fraction of the mark price the price can move against the position before reaching
+    the liquidation price, and the margin ratio is the maintenance margin divided by the position margin (the
+    position is liquidated when it reaches 1).
+    """
+    trading_pair: str
+    position_side: PositionSide
+    amount: float
+    entry_price: float
+    mark_price: float
+    unrealized_pnl: float
+    notional: float
+    liquidation_price: float
+    liquidation_distance: float
+    margin_ratio: float
+
+
+class PositionRiskMonitor:
+    """
+    Values the connector positions with the live order book mid price (or the funding info mark price if there is no
+    order book price) every time an order book, the funding info or a position changes. The updates are coalesced:
+    the positions are valued at most once per event loop iteration.
+
+    When thresholds are set, the monitor triggers AccountEvent.MarginCall and AccountEvent.LiquidationRisk events on
+    the connector (with a PositionRiskEvent) when a position crosses them. A position triggers each event once, and
+    again only after getting back within the threshold.
+    """
+    DEFAULT_MAINTENANCE_MARGIN_RATE = Decimal("0.005")
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    def __init__(self,
+                 connector: "PerpetualDerivativePyBase",
+                 perpetual_trading: PerpetualTrading,
+                 max_margin_ratio: Optional[Decimal] = None,
+                 min_liquidation_distance: Optional[Decimal] = None,
+                 maintenance_margin_rate: Decimal = DEFAULT_MAINTENANCE_MARGIN_RATE):
+        self._connector = connector
+        self._perpetual_trading = perpetual_trading
+        self._max_margin_ratio = max_margin_ratio
+        self._min_liquidation_distance = min_liquidation_distance
+        self._maintenance_margin_rate = maintenance_margin_rate
+        self._maintenance_margin_rates: Dict[str, Decimal] = {}
+        self._risks: Dict[str, PositionRisk] = {}
+        self._position_pairs: Set[str] = set()
+        self._alerts: Set[Tuple[str, AccountEvent]] = set()
+        self._update_scheduled = False
+        self._started = False
+
+    @property
+    def risks(self) -> Dict[str, PositionRisk]:
+        """
+        The risk of every position, with the same keys as the connector account positions.
+        """
+        return self._risks
+
+    def set_thresholds(self,
+                       max_margin_ratio: Optional[Decimal] = None,
+                       min_liquidation_distance: Optional[Decimal] = None):
+        """
+        :param max_margin_ratio: the margin ratio from which a MarginCall event is triggered, None to disable it
+        :param min_liquidation_distance: the liquidation distance (as a fraction of the mark price) under which a
+        LiquidationRisk event is triggered, None to disable it
+        """
+        self._max_margin_ratio = max_margin_ratio
+        self._min_liquidation_distance = min_liquidation_distance
+        self._alerts.clear()
+        self.schedule_update()
+
+    def set_maintenance_margin_rate(self, trading_pair: str, rate: Decimal):
+        self._maintenance_margin_rates[trading_pair] = rate
+        self.schedule_update()
+
+    def start(self):
+        if not self._started:
+            self._started = True
+            self._connector.order_book_tracker.add_update_listener(self._did_update_order_book)
+            self._perpetual_trading.add_update_listener(self._did_update_positions)
+            self.schedule_update()
+
+    def stop(self):
+        if self._started:
+            self._started = False
+            self._connector.order_book_tracker.remove_update_listener(self._did_update_order_book)
+            self._perpetual_trading.remove_update_listener(self._did_update_positions)
+        self._risks = {}
+        self._position_pairs = set()
+        self._alerts.clear()
+
+    def schedule_update(self):
+        """
+        Values the positions in the next event loop iteration, or right away if there is no running event loop.
+        """
+        if self._update_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.update()
+            return
+        self._update_scheduled = True
+        loop.call_soon(self._run_scheduled_update)
+
+    def update(self) -> Dict[str, PositionRisk]:
+        """
+        Values all the positions at the current prices and triggers the threshold events.
+        """
+        positions = [(key, position) for key, position in self._perpetual_trading.account_positions.items()
+                     if position.amount != 0]
+        self._position_pairs = {position.trading_pair for _, position in positions}
+        if len(positions) == 0:
+            self._risks = {}
+            self._alerts.clear()
+            return self._risks
+
+        mark_prices = {trading_pair: self._mark_price(trading_pair) for trading_pair in self._position_pairs}
+        amounts = np.array([float(position.amount) for _, position in positions])
+        entry_prices = np.array([float(position.entry_price) for _, position in positions])
+        leverages = np.array([float(position.leverage) for _, position in positions])
+        maintenance_margin_rates = np.array([
+            float(self._maintenance_margin_rates.get(position.trading_pair, self._maintenance_margin_rate))
+            for _, position in positions
+        ])
+        prices = np.array([mark_prices[position.trading_pair] for _, position in positions])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            signs = np.sign(amounts)
+            sizes = np.abs(amounts)
+            unrealized_pnls = (prices - entry_prices) * amounts
+            notionals = sizes * prices
+            initial_margins = np.where(leverages > 0, sizes * entry_prices / leverages, np.nan)
+            position_margins = initial_margins + unrealized_pnls
+            margin_ratios = notionals * maintenance_margin_rates / position_margins
+            margin_ratios[position_margins <= 0] = np.inf
+            liquidation_prices = np.where(
+                leverages > 0,
+                entry_prices * (1 - signs / leverages) / (1 - signs * maintenance_margin_rates),
+                np.nan,
+            )
+            liquidation_prices = np.maximum(liquidation_prices, 0)
+            liquidation_distances = signs * (prices - liquidation_prices) / prices
+
+        self._risks = {
+            key: PositionRisk(
+                trading_pair=position.trading_pair,
+                position_side=position.position_side,
+                amount=amounts[i],
+                entry_price=entry_prices[i],
+                mark_price=prices[i],
+                unrealized_pnl=unrealized_pnls[i],
+                notional=notionals[i],
+                liquidation_price=liquidation_prices[i],
+                liquidation_distance=liquidation_distances[i],
+                margin_ratio=margin_ratios[i],
+            )
+            for i, (key, position) in enumerate(positions)
+        }
+        self._alerts = {alert for alert in self._alerts if alert[0] in self._risks}
+
+        if self._max_margin_ratio is not None:
+            self._process_threshold(
+                AccountEvent.MarginCall, margin_ratios >= float(self._max_margin_ratio), float(self._max_margin_ratio)
+            )
+        if self._min_liquidation_distance is not None:
+            self._process_threshold(
+                AccountEvent.LiquidationRisk,
+                liquidation_distances <= float(self._min_liquidation_distance),
+                float(self._min_liquidation_distance),
+            )
+        return self._risks
+
+    def _process_threshold(self, event_tag: AccountEvent, crossed: np.ndarray, threshold: float):
+        for i, key in enumerate(self._risks):
+            alert = (key, event_tag)
+            if not crossed[i]:
+                self._alerts.discard(alert)
+            elif alert not in self._alerts:
+                self._alerts.add(alert)
+                risk = self._risks[key]
+                self._connector.trigger_event(
+                    event_tag,
+                    PositionRiskEvent(
+                        timestamp=self._connector.current_timestamp,
+                        trading_pair=risk.trading_pair,
+                        position_side=risk.position_side,
+                        mark_price=risk.mark_price,
+                        unrealized_pnl=risk.unrealized_pnl,
+                        liquidation_price=risk.liquidation_price,
+                        liquidation_distance=risk.liquidation_distance,
+                        margin_ratio=risk.margin_ratio,
+                        threshold=threshold,
+                    ),
+                )
+
+    def _mark_price(self, trading_pair: str) -> float:
+        order_book = self._connector.order_books.get(trading_pair)
+        if order_book is not None:
+            try:
+                return (order_book.get_price(True) + order_book.get_price(False)) / 2
+            except EnvironmentError:
+                # The order book is empty
+                pass
+        funding_info = self._perpetual_trading.funding_info.get(trading_pair)
+        return float(funding_info.mark_price) if funding_info is not None else np.nan
+
+    def _run_scheduled_update(self):
+        self._update_scheduled = False
+        try:
+            self.update()
+        except Exception:
+            self.logger().error("Unexpected error valuing the positions.", exc_info=True)
+
+    def _did_update_order_book(self, trading_pair: str):
+        if trading_pair in self._position_pairs:
+            self.schedule_update()
+
+    def _did_update_positions(self, trading_pair: str):
+        self.schedule_update()
@@ -69,6 +69,12 @@ ORDER_CANCEL_PATH_URL = "/v5/order/cancel"
 GET_ORDERS_PATH_URL = "/v5/order/realtime"
 TRADE_HISTORY_PATH_URL = "/v5/execution/list"
 EXCHANGE_FEE_RATE_PATH_URL = "/v5/account/fee-rate"
+BATCH_ORDER_PLACE_PATH_URL = "/v5/order/create-batch"
+BATCH_ORDER_CANCEL_PATH_URL = "/v5/order/cancel-batch"
+
+# Batch requests limits, see https://bybit-exchange.github.io/docs/v5/order/batch-place
+BATCH_ORDER_CREATE_MAX_SIZE = 10
+BATCH_ORDER_CANCEL_MAX_SIZE = 10
 
 
 # Order States
@@ -184,6 +190,23 @@ RATE_LIMITS = {
             LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
         ]
     ),
+    # Every order of a batch counts against the orders limit
+    RateLimit(
+        limit_id=BATCH_ORDER_PLACE_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT / BATCH_ORDER_CREATE_MAX_SIZE,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
+    RateLimit(
+        limit_id=BATCH_ORDER_CANCEL_PATH_URL,
+        limit=MAX_REQUEST_LIMIT_DEFAULT / BATCH_ORDER_CANCEL_MAX_SIZE,
+        time_interval=ONE_SECOND,
+        linked_limits=[
+            LinkedLimitWeightPair(REQUEST_GET_POST_SHARED),
+        ]
+    ),
     RateLimit(
         limit_id=GET_ORDERS_PATH_URL,
         limit=MAX_REQUEST_LIMIT_DEFAULT,
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from bidict import bidict
@@ -18,6 +18,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -30,6 +31,9 @@ s_decimal_NaN = Decimal("nan")
 
 
 class BybitExchange(ExchangePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -220,13 +224,42 @@ class BybitExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        api_params = await self._order_request_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        api_params["category"] = self._category
+
+        response = await self._api_post(
+            path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
+            data=api_params,
+            is_auth_required=True,
+            trading_pair=trading_pair
+        )
+        if response["retCode"] != 0:
+            raise ValueError(f"{response['retMsg']}")
+        order_result = response.get("result", {})
+        o_id = str(order_result["orderId"])
+        transact_time = int(response["time"]) * 1e-3
+        return (o_id, transact_time)
+
+    async def _order_request_params(self,
+                                    order_id: str,
+                                    trading_pair: str,
+                                    amount: Decimal,
+                                    trade_type: TradeType,
+                                    order_type: OrderType,
+                                    price: Decimal) -> Dict[str, Any]:
         type_str = self.bybit_order_type(order_type)
 
         side_str = CONSTANTS.SIDE_BUY if trade_type is TradeType.BUY else CONSTANTS.SIDE_SELL
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
 
         api_params = {
-            "category": self._category,
             "symbol": symbol,
             "side": side_str,
             "orderType": type_str,
@@ -237,32 +270,53 @@ class BybitExchange(ExchangePyBase):
         }
         if order_type == OrderType.LIMIT:
             api_params["timeInForce"] = CONSTANTS.TIME_IN_FORCE_GTC
+        return api_params
 
+    async def _place_batch_orders(
+            self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. The response has the result of each order in the order of
+        the request. Classic accounts can not use the spot batch endpoints, so their orders are sent one by one.
+        """
+        if self._account_type == "SPOT":
+            return await safe_gather(*[
+                self._place_order(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    **kwargs,
+                )
+                for order, kwargs in orders
+            ], return_exceptions=True)
+        orders_params = [
+            await self._order_request_params(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order, _ in orders
+        ]
         response = await self._api_post(
-            path_url=CONSTANTS.ORDER_PLACE_PATH_URL,
-            data=api_params,
+            path_url=CONSTANTS.BATCH_ORDER_PLACE_PATH_URL,
+            data={"category": self._category, "request": orders_params},
             is_auth_required=True,
-            trading_pair=trading_pair
         )
-        if response["retCode"] != 0:
-            raise ValueError(f"{response['retMsg']}")
-        order_result = response.get("result", {})
-        o_id = str(order_result["orderId"])
         transact_time = int(response["time"]) * 1e-3
-        return (o_id, transact_time)
+        return [
+            result if isinstance(result, Exception) else (str(result["orderId"]), transact_time)
+            for result in self._batch_results(response=response, orders_count=len(orders))
+        ]
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
-        exchange_order_id = tracked_order.exchange_order_id
-        client_order_id = tracked_order.client_order_id
-        trading_pair = tracked_order.trading_pair
-        api_params = {
-            "category": self._category,
-            "symbol": trading_pair
-        }
-        if exchange_order_id:
-            api_params["orderId"] = exchange_order_id
-        else:
-            api_params["orderLinkId"] = client_order_id
+        api_params = await self._cancel_request_params(tracked_order)
+        api_params["category"] = self._category
         api_params = dict(sorted(api_params.items()))
         response = await self._api_post(
             path_url=CONSTANTS.ORDER_CANCEL_PATH_URL,
@@ -276,6 +330,55 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _cancel_request_params(self, tracked_order: InFlightOrder) -> Dict[str, Any]:
+        api_params = {
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=tracked_order.trading_pair)
+        }
+        if tracked_order.exchange_order_id:
+            api_params["orderId"] = tracked_order.exchange_order_id
+        else:
+            api_params["orderLinkId"] = tracked_order.client_order_id
+        return api_params
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. Classic accounts can not use the spot batch endpoints, so
+        their orders are canceled one by one.
+        """
+        if self._account_type == "SPOT":
+            return await safe_gather(*[
+                self._place_cancel(order.client_order_id, order) for order in orders
+            ], return_exceptions=True)
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            data={
+                "category": self._category,
+                "request": [await self._cancel_request_params(order) for order in orders],
+            },
+            is_auth_required=True,
+            headers={"referer": CONSTANTS.HBOT_BROKER_ID},
+        )
+        return [
+            result if isinstance(result, Exception) else "orderLinkId" in result
+            for result in self._batch_results(response=response, orders_count=len(orders))
+        ]
+
+    @staticmethod
+    def _batch_results(response: Dict[str, Any], orders_count: int) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Matches the result of each order in a batch response with its error code, in the order of the request.
+        """
+        if response["retCode"] != CONSTANTS.RET_CODE_OK:
+            raise ValueError(f"{response['retMsg']}")
+        orders_results = response["result"]["list"]
+        orders_codes = response["retExtInfo"]["list"]
+        if len(orders_results) != orders_count or len(orders_codes) != orders_count:
+            raise IOError(f"The batch response has {len(orders_results)} results for {orders_count} orders.")
+        return [
+            order_result if order_code["code"] == CONSTANTS.RET_CODE_OK else ValueError(f"{order_code['msg']}")
+            for order_result, order_code in zip(orders_results, orders_codes)
+        ]
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_pair_rules = exchange_info_dict.get("result", []).get("list", [])
         retval = []
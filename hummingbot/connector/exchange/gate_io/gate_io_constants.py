@@ -14,6 +14,8 @@ NETWORK_CHECK_PATH_URL = "spot/currencies/BTC"
 SYMBOL_PATH_URL = "spot/currency_pairs"
 ORDER_CREATE_PATH_URL = "spot/orders"
 ORDER_DELETE_PATH_URL = "spot/orders/{order_id}"
+BATCH_ORDER_CREATE_PATH_URL = "spot/batch_orders"
+BATCH_ORDER_CANCEL_PATH_URL = "spot/cancel_batch_orders"
 USER_BALANCES_PATH_URL = "spot/accounts"
 ORDER_STATUS_PATH_URL = "spot/orders/{order_id}"
 USER_ORDERS_PATH_URL = "spot/open_orders"
@@ -30,6 +32,11 @@ USER_ORDERS_ENDPOINT_NAME = "spot.orders"
 USER_BALANCE_ENDPOINT_NAME = "spot.balances"
 PONG_CHANNEL_NAME = "spot.pong"
 
+# Batch requests limits, see https://www.gate.io/docs/developers/apiv4/#create-a-batch-of-orders
+BATCH_ORDER_CREATE_MAX_SIZE = 10
+BATCH_ORDER_CREATE_MAX_CURRENCY_PAIRS = 4
+BATCH_ORDER_CANCEL_MAX_SIZE = 20
+
 # Timeouts
 MESSAGE_TIMEOUT = 30.0
 PING_TIMEOUT = 10.0
@@ -59,6 +66,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=SYMBOL_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PUBLIC_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_CREATE_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_DELETE_LIMIT_ID, limit=5_000, time_interval=1, linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID)]),
+    RateLimit(limit_id=BATCH_ORDER_CREATE_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
+    RateLimit(limit_id=BATCH_ORDER_CANCEL_PATH_URL, limit=5_000, time_interval=1, linked_limits=[LinkedLimitWeightPair(CANCEL_ORDERS_LIMITS_ID)]),
     RateLimit(limit_id=USER_BALANCES_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=ORDER_STATUS_LIMIT_ID, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
     RateLimit(limit_id=USER_ORDERS_PATH_URL, limit=900, time_interval=1, linked_limits=[LinkedLimitWeightPair(PRIVATE_URL_POINTS_LIMIT_ID)]),
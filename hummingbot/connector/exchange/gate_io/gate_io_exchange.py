@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -17,6 +17,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -30,6 +31,9 @@ class GateIoExchange(ExchangePyBase):
     # Using 120 seconds here as Gate.io websocket is quiet
     TICK_INTERVAL_LIMIT = 120.0
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -184,6 +188,36 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        # RESTRequest does not support json, and if we pass a dict
+        # the underlying aiohttp will encode it to params
+        data = data
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -217,21 +251,64 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
+        return data
 
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
-            data=data,
-            is_auth_required=True,
-            limit_id=endpoint,
-        )
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. A request can only have orders for up to
+        BATCH_ORDER_CREATE_MAX_CURRENCY_PAIRS currency pairs, so the orders are split by currency pair when needed.
+        """
+        orders_data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order, _ in orders
+        ]
+        orders_data_by_pair: Dict[str, List[Dict[str, Any]]] = {}
+        for data in orders_data:
+            orders_data_by_pair.setdefault(data["currency_pair"], []).append(data)
+        currency_pairs = list(orders_data_by_pair)
+        requests_data = [
+            [data for pair in currency_pairs[i:i + CONSTANTS.BATCH_ORDER_CREATE_MAX_CURRENCY_PAIRS]
+             for data in orders_data_by_pair[pair]]
+            for i in range(0, len(currency_pairs), CONSTANTS.BATCH_ORDER_CREATE_MAX_CURRENCY_PAIRS)
+        ]
+        responses = await safe_gather(*[
+            self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+                data=request_data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_CREATE_PATH_URL,
+            )
+            for request_data in requests_data
+        ], return_exceptions=True)
+
+        results: Dict[str, Union[Tuple[str, float], Exception]] = {}
+        for request_data, response in zip(requests_data, responses):
+            if isinstance(response, Exception):
+                results.update({data["text"]: response for data in request_data})
+                continue
+            for order_result in response:
+                results[order_result.get("text")] = self._batch_order_creation_result(order_result)
+        return [
+            results.get(order.client_order_id, IOError({"label": "ORDER_REJECTED",
+                                                        "message": "Order missing from the batch response."}))
+            for order, _ in orders
+        ]
+
+    def _batch_order_creation_result(self, order_result: Dict[str, Any]) -> Union[Tuple[str, float], Exception]:
+        if not order_result.get("succeeded", False):
+            return IOError({"label": order_result.get("label"), "message": order_result.get("message")})
         if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+            return IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        return str(order_result["id"]), self.current_timestamp
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -252,6 +329,48 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. The orders without an exchange order id yet are not sent
+        and get the timeout error of their exchange order id wait.
+        """
+        exchange_order_ids = await safe_gather(
+            *[order.get_exchange_order_id() for order in orders],
+            return_exceptions=True,
+        )
+        request_data = [
+            {
+                "currency_pair": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "id": exchange_order_id,
+            }
+            for order, exchange_order_id in zip(orders, exchange_order_ids)
+            if not isinstance(exchange_order_id, Exception)
+        ]
+        cancel_results = {}
+        if len(request_data) > 0:
+            response = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+                data=request_data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            )
+            cancel_results = {str(cancel_result.get("id")): cancel_result for cancel_result in response}
+
+        results = []
+        for exchange_order_id in exchange_order_ids:
+            if isinstance(exchange_order_id, Exception):
+                results.append(exchange_order_id)
+                continue
+            cancel_result = cancel_results.get(exchange_order_id, {})
+            if cancel_result.get("succeeded", False):
+                results.append(True)
+            else:
+                results.append(IOError({
+                    "label": cancel_result.get("label"),
+                    "message": cancel_result.get("message", "Order missing from the batch cancel response."),
+                }))
+        return results
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
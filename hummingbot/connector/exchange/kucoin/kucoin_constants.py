@@ -23,6 +23,8 @@ SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
 ORDERS_PATH_URL_HFT = "/api/v1/hf/orders"
+ORDERS_MULTI_PATH_URL = "/api/v1/orders/multi"
+ORDERS_MULTI_PATH_URL_HFT = "/api/v1/hf/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
@@ -37,6 +39,7 @@ WS_REQUEST_LIMIT_ID = "WSRequest"
 GET_ORDER_LIMIT_ID = "GetOrders"
 POST_ORDER_LIMIT_ID = "PostOrder"
 DELETE_ORDER_LIMIT_ID = "DeleteOrder"
+POST_BATCH_ORDER_LIMIT_ID = "PostBatchOrder"
 WS_PING_HEARTBEAT = 10
 
 DIFF_EVENT_TYPE = "trade.l2update"
@@ -44,6 +47,10 @@ TRADE_EVENT_TYPE = "trade.l3match"
 ORDER_CHANGE_EVENT_TYPE = "orderChange"
 BALANCE_EVENT_TYPE = "account.balance"
 
+# Batch requests limits, see https://www.kucoin.com/docs/rest/spot-trading/orders/place-multiple-orders
+# Only limit orders of a single symbol can be created in a batch, and there is no batch cancel by order id
+BATCH_ORDER_CREATE_MAX_SIZE = 5
+
 NO_LIMIT = sys.maxsize
 RATE_LIMITS = [
     RateLimit(WS_CONNECTION_LIMIT_ID, limit=WS_CONNECTION_LIMIT, time_interval=WS_CONNECTION_TIME_INTERVAL),
@@ -63,6 +70,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=ORDER_CLIENT_ORDER_PATH_URL, limit=NO_LIMIT, time_interval=1),
     RateLimit(limit_id=POST_ORDER_LIMIT_ID, limit=45, time_interval=3),
     RateLimit(limit_id=DELETE_ORDER_LIMIT_ID, limit=60, time_interval=3),
+    RateLimit(limit_id=POST_BATCH_ORDER_LIMIT_ID, limit=45 // BATCH_ORDER_CREATE_MAX_SIZE, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL, limit=45, time_interval=3),
     RateLimit(limit_id=ORDERS_PATH_URL_HFT, limit=45, time_interval=3),
     RateLimit(limit_id=FILLS_PATH_URL, limit=9, time_interval=3),
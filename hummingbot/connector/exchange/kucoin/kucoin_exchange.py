@@ -1,6 +1,7 @@
 import asyncio
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -21,6 +22,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -30,6 +32,8 @@ if TYPE_CHECKING:
 
 
 class KucoinExchange(ExchangePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -93,6 +97,10 @@ class KucoinExchange(ExchangePyBase):
     def orders_path_url(self):
         return CONSTANTS.ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_PATH_URL
 
+    @property
+    def orders_multi_path_url(self):
+        return CONSTANTS.ORDERS_MULTI_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.ORDERS_MULTI_PATH_URL
+
     @property
     def fills_path_url(self):
         return CONSTANTS.FILLS_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.FILLS_PATH_URL
@@ -195,6 +203,31 @@ class KucoinExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_post(
+            path_url=self.orders_path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        if exchange_order_id.get("data") is None:
+            raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
+        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
@@ -209,15 +242,91 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
-        exchange_order_id = await self._api_post(
-            path_url=self.orders_path_url,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
-        )
-        if exchange_order_id.get("data") is None:
-            raise IOError(f"Error placing order on Kucoin: {exchange_order_id}")
-        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+        return data
+
+    async def _place_batch_orders(
+            self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the limit orders with the multiple orders endpoint, that only takes limit orders of a single symbol.
+        One request is sent per symbol, and the market orders are sent with the regular endpoint.
+        """
+        orders_data_by_symbol: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        single_orders = []
+        for order, kwargs in orders:
+            if order.order_type.is_limit_type():
+                data = await self._order_request_data(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                orders_data_by_symbol[data["symbol"]].append(data)
+            else:
+                single_orders.append((order, kwargs))
+        symbols = list(orders_data_by_symbol)
+        responses = await safe_gather(
+            *[self._api_post(
+                path_url=self.orders_multi_path_url,
+                data=self._batch_orders_request_data(symbol=symbol, orders_data=orders_data_by_symbol[symbol]),
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_BATCH_ORDER_LIMIT_ID,
+            ) for symbol in symbols],
+            *[self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            ) for order, kwargs in single_orders],
+            return_exceptions=True)
+
+        results: Dict[str, Union[Tuple[str, float], Exception]] = {}
+        for symbol, response in zip(symbols, responses):
+            orders_data = orders_data_by_symbol[symbol]
+            try:
+                orders_results = self._batch_orders_results(response=response, orders_count=len(orders_data))
+            except Exception as ex:
+                results.update({data["clientOid"]: ex for data in orders_data})
+                continue
+            results.update({data["clientOid"]: result for data, result in zip(orders_data, orders_results)})
+        for (order, _), result in zip(single_orders, responses[len(symbols):]):
+            results[order.client_order_id] = result
+        return [results[order.client_order_id] for order, _ in orders]
+
+    def _batch_orders_request_data(self, symbol: str, orders_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if self.domain == "hft":
+            return {"orderList": orders_data}
+        return {
+            "symbol": symbol,
+            "orderList": [{key: value for key, value in data.items() if key != "symbol"} for data in orders_data],
+        }
+
+    def _batch_orders_results(
+            self, response: Union[Dict[str, Any], Exception], orders_count: int
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        if isinstance(response, Exception):
+            raise response
+        if response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {response}")
+        orders_results = response["data"] if self.domain == "hft" else response["data"].get("data", [])
+        if len(orders_results) != orders_count:
+            raise IOError(f"The multiple orders response has {len(orders_results)} results for {orders_count} orders.")
+        results = []
+        for order_result in orders_results:
+            if self.domain == "hft":
+                successful, exchange_order_id = order_result.get("success", False), order_result.get("orderId")
+            else:
+                successful, exchange_order_id = order_result.get("status") == "success", order_result.get("id")
+            if successful:
+                results.append((str(exchange_order_id), self.current_timestamp))
+            else:
+                results.append(IOError(f"Error placing order on Kucoin: {order_result.get('failMsg')}"))
+        return results
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -51,12 +51,17 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_ORDER_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
 
+# Batch requests limits, see https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-multiple-orders
+BATCH_ORDER_CREATE_MAX_SIZE = 20
+BATCH_ORDER_CANCEL_MAX_SIZE = 20
+
 # WebSocket channels
 OKX_WS_ACCOUNT_CHANNEL = "account"
 OKX_WS_ORDERS_CHANNEL = "orders"
@@ -100,6 +105,8 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKERS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=20, time_interval=2),
+    # 300 orders every 2 seconds
+    RateLimit(limit_id=OKX_BATCH_ORDER_PATH, limit=300 // BATCH_ORDER_CREATE_MAX_SIZE, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -27,6 +27,9 @@ if TYPE_CHECKING:
 
 class OkxExchange(ExchangePyBase):
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.BATCH_ORDER_CREATE_MAX_SIZE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.BATCH_ORDER_CANCEL_MAX_SIZE
+
     web_utils = web_utils
 
     def __init__(self,
@@ -191,7 +194,33 @@ class OkxExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        exchange_order_id = await self._api_request(
+            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+        )
+        data = exchange_order_id["data"][0]
+        if data["sCode"] != "0":
+            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
+        return str(data["ordId"]), self.current_timestamp
 
+    async def _order_request_data(self,
+                                  order_id: str,
+                                  trading_pair: str,
+                                  amount: Decimal,
+                                  trade_type: TradeType,
+                                  order_type: OrderType,
+                                  price: Decimal) -> Dict[str, Any]:
         data = {
             "clOrdId": order_id,
             "tdMode": "cash",
@@ -205,18 +234,44 @@ class OkxExchange(ExchangePyBase):
         else:
             # Specify that the the order quantity for market orders is denominated in base currency
             data["tgtCcy"] = "base_ccy"
+        return data
 
-        exchange_order_id = await self._api_request(
-            path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates the orders with the batch orders endpoint. The response has the result of each order, identified by
+        its client order id.
+        """
+        request_data = [
+            await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order, _ in orders
+        ]
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_PATH,
             method=RESTMethod.POST,
-            data=data,
+            data=request_data,
             is_auth_required=True,
-            limit_id=CONSTANTS.OKX_PLACE_ORDER_PATH,
+            limit_id=CONSTANTS.OKX_BATCH_ORDER_PATH,
         )
-        data = exchange_order_id["data"][0]
-        if data["sCode"] != "0":
-            raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
-        return str(data["ordId"]), self.current_timestamp
+        orders_results = {order_result.get("clOrdId"): order_result for order_result in response.get("data", [])}
+        results = []
+        for order, _ in orders:
+            order_result = orders_results.get(order.client_order_id)
+            if order_result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response.get('msg')}"))
+            elif order_result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {order_result['sMsg']}"))
+            else:
+                results.append((str(order_result["ordId"]), self.current_timestamp))
+        return results
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -231,12 +286,46 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
+        return self._cancel_result(order_id=order_id, cancel_data=cancel_result["data"][0], cancel_result=cancel_result)
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels the orders with the batch cancel endpoint. The orders are canceled with their client order id, so
+        they do not have to wait for their exchange order id.
+        """
+        request_data = [
+            {
+                "clOrdId": order.client_order_id,
+                "instId": order.trading_pair,
+            }
+            for order in orders
+        ]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=request_data,
+            is_auth_required=True,
+        )
+        cancel_results = {cancel_data.get("clOrdId"): cancel_data for cancel_data in response.get("data", [])}
+        results = []
+        for order in orders:
+            try:
+                results.append(self._cancel_result(
+                    order_id=order.client_order_id,
+                    cancel_data=cancel_results.get(order.client_order_id, {}),
+                    cancel_result=response,
+                ))
+            except IOError as ex:
+                results.append(ex)
+        return results
+
+    @staticmethod
+    def _cancel_result(order_id: str, cancel_data: Dict[str, Any], cancel_result: Dict[str, Any]) -> bool:
+        if cancel_data.get("sCode") == "0":
             final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
+        elif cancel_data.get("sCode") == "51400":
             # Cancelation failed because the order does not exist
             final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
+        elif cancel_data.get("sCode") == "51401":
             # Cancelation failed because order has been cancelled
             final_result = True
         else:
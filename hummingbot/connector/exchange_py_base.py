@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -45,6 +45,11 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders sent in a single batch request. Connectors implementing _place_batch_orders or
+    # _place_batch_cancel with a batch endpoint should set them to the exchange limit, any value lower than 2
+    # disables batching
+    BATCH_ORDER_CREATE_MAX_SIZE = 1
+    BATCH_ORDER_CANCEL_MAX_SIZE = 1
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -83,6 +88,10 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        # Orders waiting to be sent in the next batch request, with the future resolved by the batch result
+        self._orders_queued_to_create: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]] = []
+        self._orders_queued_to_cancel: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]] = []
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -468,15 +477,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        if self.BATCH_ORDER_CREATE_MAX_SIZE > 1:
+            exchange_order_id, update_timestamp = await self._enqueue_batch_request(
+                queue=self._orders_queued_to_create,
+                flush=self._flush_orders_queued_to_create,
+                order=order,
+                **kwargs,
+            )
+        else:
+            exchange_order_id, update_timestamp = await self._place_single_order(order=order, **kwargs)
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -546,7 +555,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE > 1:
+            cancelled = await self._enqueue_batch_request(
+                queue=self._orders_queued_to_cancel,
+                flush=self._flush_orders_queued_to_cancel,
+                order=order,
+            )
+        else:
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -576,6 +592,106 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    # === Batch requests ===
+
+    def _enqueue_batch_request(
+        self,
+        queue: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]],
+        flush: Callable[[], None],
+        order: InFlightOrder,
+        **kwargs,
+    ) -> asyncio.Future:
+        """
+        Adds an order to a batch queue. The queue is flushed once the event loop has run all the tasks that were ready
+        when the first order was queued, so all the orders created (or canceled) in the same tick share the requests.
+
+        :param queue: the queue the order should be added to
+        :param flush: the method that sends the queued orders
+        :param order: the order to add
+        :return: a future resolved with the result of the request for the order (or its exception)
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        queue.append((order, kwargs, future))
+        if len(queue) == 1:
+            loop.call_soon(flush)
+        return future
+
+    def _flush_orders_queued_to_create(self):
+        queued_orders, self._orders_queued_to_create = self._orders_queued_to_create, []
+        for i in range(0, len(queued_orders), self.BATCH_ORDER_CREATE_MAX_SIZE):
+            safe_ensure_future(self._execute_batch_request(
+                batch=queued_orders[i:i + self.BATCH_ORDER_CREATE_MAX_SIZE],
+                single_request=self._place_single_order,
+                batch_request=self._place_batch_orders,
+            ))
+
+    def _flush_orders_queued_to_cancel(self):
+        queued_orders, self._orders_queued_to_cancel = self._orders_queued_to_cancel, []
+        for i in range(0, len(queued_orders), self.BATCH_ORDER_CANCEL_MAX_SIZE):
+            safe_ensure_future(self._execute_batch_request(
+                batch=queued_orders[i:i + self.BATCH_ORDER_CANCEL_MAX_SIZE],
+                single_request=self._place_single_cancel,
+                batch_request=self._place_batch_cancel_with_args,
+            ))
+
+    async def _execute_batch_request(
+        self,
+        batch: List[Tuple[InFlightOrder, Dict[str, Any], asyncio.Future]],
+        single_request: Callable[..., Awaitable[Any]],
+        batch_request: Callable[[List[Tuple[InFlightOrder, Dict[str, Any]]]], Awaitable[List[Any]]],
+    ):
+        """
+        Sends a batch of queued orders and splits the response back into the futures of each order. A batch with a
+        single order is sent with the regular (non batch) request.
+
+        :param batch: the queued orders with their request arguments and futures
+        :param single_request: the method used to send a single order
+        :param batch_request: the method used to send several orders (with their request arguments) in one request.
+            It returns one result per order, in the same order, where an exception is the failure of that order alone
+        """
+        try:
+            if len(batch) == 1:
+                order, kwargs, _ = batch[0]
+                results = [await single_request(order=order, **kwargs)]
+            else:
+                results = await batch_request([(order, kwargs) for order, kwargs, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(f"The batch request returned {len(results)} results for {len(batch)} orders.")
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as ex:
+            results = [ex] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _place_single_order(self, order: InFlightOrder, **kwargs) -> Tuple[str, float]:
+        return await self._place_order(
+            order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            amount=order.amount,
+            trade_type=order.trade_type,
+            order_type=order.order_type,
+            price=order.price,
+            **kwargs,
+        )
+
+    async def _place_single_cancel(self, order: InFlightOrder) -> bool:
+        return await self._place_cancel(order.client_order_id, order)
+
+    async def _place_batch_cancel_with_args(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[bool, Exception]]:
+        return await self._place_batch_cancel([order for order, _ in orders])
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -649,6 +765,38 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates several orders in the exchange. Only used when BATCH_ORDER_CREATE_MAX_SIZE is greater than 1.
+        Connectors override it to use the exchange batch endpoint, by default each order is sent with its own request.
+
+        :param orders: the orders to create (at most BATCH_ORDER_CREATE_MAX_SIZE), each one with the arguments it
+            was created with
+        :return: for each order, in the same order, a tuple with the exchange order id and the update timestamp, or
+            the exception describing why that order was rejected
+        """
+        return await safe_gather(
+            *[self._place_single_order(order=order, **kwargs) for order, kwargs in orders],
+            return_exceptions=True,
+        )
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels several orders in the exchange. Only used when BATCH_ORDER_CANCEL_MAX_SIZE is greater than 1.
+        Connectors override it to use the exchange batch endpoint, by default each order is canceled with its own
+        request.
+
+        :param orders: the orders to cancel (at most BATCH_ORDER_CANCEL_MAX_SIZE)
+        :return: for each order, in the same order, True if the cancelation was accepted, or the exception raised
+            for that order
+        """
+        return await safe_gather(
+            *[self._place_single_cancel(order=order) for order in orders],
+            return_exceptions=True,
+        )
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
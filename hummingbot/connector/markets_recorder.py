@@ -11,8 +11,9 @@ from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
-from hummingbot import data_path
+from hummingbot import data_path, get_executor
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.performance_accumulator import PerformanceAccumulator
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
@@ -54,6 +55,7 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 class MarketsRecorder:
     _logger = None
     _shared_instance: "MarketsRecorder" = None
+    PERFORMANCE_CHECKPOINT_INTERVAL = 100
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -87,6 +89,8 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._performance_accumulator: Optional[PerformanceAccumulator] = None
+        self._fills_since_performance_checkpoint = 0
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -219,6 +223,8 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._performance_accumulator is not None:
+            self._performance_accumulator.save_checkpoint(self._performance_checkpoint_path())
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -322,6 +328,32 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def get_performance_accumulator(self, start_timestamp: int) -> PerformanceAccumulator:
+        """
+        Returns the performance of the trades recorded for the config since start_timestamp (in milliseconds), updated
+        with every new trade fill. The accumulator is restored from its last checkpoint if there is one, and only the
+        trades recorded after the checkpoint are read from the database.
+        """
+        accumulator = self._performance_accumulator
+        if accumulator is not None and accumulator.start_timestamp == start_timestamp:
+            return accumulator
+        accumulator = PerformanceAccumulator.load_checkpoint(self._performance_checkpoint_path(),
+                                                             start_timestamp,
+                                                             self._config_file_path)
+        if accumulator is None:
+            accumulator = PerformanceAccumulator(start_timestamp, self._config_file_path)
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.timestamp >= (accumulator.last_trade_timestamp or start_timestamp),
+                                    TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+                            .order_by(TradeFill.timestamp.asc()))
+            for trade_fill in query.yield_per(1000):
+                accumulator.add_trade_fill(trade_fill)
+        self._performance_accumulator = accumulator
+        self._fills_since_performance_checkpoint = 0
+        return accumulator
+
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
@@ -466,6 +498,25 @@ class MarketsRecorder:
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                                    trade_fill_record.exchange_trade_id,
                                                                                    trade_fill_record.symbol)})
+            # The record is read back after the commit, so the performance gets the values stored in the database
+            if self._performance_accumulator is not None:
+                self._add_to_performance(trade_fill_record)
+
+    def _add_to_performance(self, trade_fill: TradeFill):
+        if not self._performance_accumulator.add_trade_fill(trade_fill):
+            return
+        self._fills_since_performance_checkpoint += 1
+        if self._fills_since_performance_checkpoint >= self.PERFORMANCE_CHECKPOINT_INTERVAL:
+            self._fills_since_performance_checkpoint = 0
+            # The snapshot only holds strings and numbers (the state is bounded), the JSON is built by the worker
+            self._ev_loop.run_in_executor(get_executor(),
+                                          PerformanceAccumulator.write_checkpoint,
+                                          self._performance_checkpoint_path(),
+                                          self._performance_accumulator.to_json())
+
+    def _performance_checkpoint_path(self) -> str:
+        config_name = os.path.splitext(os.path.basename(self._config_file_path))[0]
+        return os.path.join(data_path(), f"{config_name}_performance.json")
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -1,15 +1,17 @@
 import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
 from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position_risk_monitor import PositionRiskMonitor
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
-from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.funding_info import FundingInfo, FundingRateRecord
 from hummingbot.core.data_type.in_flight_order import PerpetualDerivativeInFlightOrder
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.data_type.trade_fee import TradeFeeBase
@@ -25,8 +27,30 @@ if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
 
+@dataclass
+class PairConfigurationResult:
+    """
+    The result of configuring the position mode and/or the leverage of a trading pair, the fields of the settings that
+    were not requested are None.
+    """
+    trading_pair: str
+    position_mode: Optional[PositionMode] = None
+    position_mode_set: Optional[bool] = None
+    rolled_back: bool = False
+    leverage: Optional[int] = None
+    leverage_set: Optional[bool] = None
+    error: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.position_mode_set is not False and self.leverage_set is not False
+
+
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    PAIR_CONFIGURATION_CONCURRENCY = 10
+    PAIR_CONFIGURATION_MAX_RETRIES = 2
+    PAIR_CONFIGURATION_RETRY_INTERVAL = 1.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -39,6 +63,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         self._orderbook_ds: PerpetualAPIOrderBookDataSource = self._orderbook_ds  # for type-hinting
 
         self._budget_checker = PerpetualBudgetChecker(self)
+        self._position_risk_monitor = PositionRiskMonitor(self, self._perpetual_trading)
 
     @property
     @abstractmethod
@@ -59,6 +84,14 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         """Returns the current position mode."""
         return self._perpetual_trading.position_mode
 
+    @property
+    def position_risk_monitor(self) -> PositionRiskMonitor:
+        """
+        Values the positions with the live prices, and triggers AccountEvent.MarginCall and AccountEvent.LiquidationRisk
+        events once its thresholds are set.
+        """
+        return self._position_risk_monitor
+
     @property
     def budget_checker(self) -> PerpetualBudgetChecker:
         """Returns the exchange's associated budget checker."""
@@ -98,6 +131,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         self._funding_info_listener_task = safe_ensure_future(self._listen_for_funding_info())
         if self.is_trading_required:
             self._funding_fee_polling_task = safe_ensure_future(self._funding_payment_polling_loop())
+            self._position_risk_monitor.start()
 
     def set_position_mode(self, mode: PositionMode):
         """
@@ -119,6 +153,9 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     def get_funding_info(self, trading_pair: str) -> FundingInfo:
         return self._perpetual_trading.get_funding_info(trading_pair)
 
+    def get_funding_rate_history(self, trading_pair: str) -> List[FundingRateRecord]:
+        return self._perpetual_trading.get_funding_rate_history(trading_pair)
+
     def start_tracking_order(
         self,
         order_id: str,
@@ -204,6 +241,7 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
 
     async def stop_network(self):
         self._funding_fee_poll_notifier = asyncio.Event()
+        self._position_risk_monitor.stop()
         self._perpetual_trading.stop()
         if self._funding_info_listener_task is not None:
             self._funding_info_listener_task.cancel()
@@ -302,16 +340,109 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
             self._update_order_status(),
         )
 
+    async def configure_pairs(
+        self,
+        mode: Optional[PositionMode] = None,
+        leverage_by_pair: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, PairConfigurationResult]:
+        """
+        Sets the position mode for all the connector trading pairs and/or the leverage for some trading pairs. The
+        requests for the different trading pairs are sent concurrently (at most PAIR_CONFIGURATION_CONCURRENCY at a
+        time, on top of the rate limits enforced by the throttler), and the requests raising an exception are retried.
+
+        If the position mode can't be set for a trading pair, the trading pairs that changed mode are switched back to
+        the current mode and the position mode is not changed. The leverage is only set once the position mode is set.
+
+        :param mode: the position mode to set, None to keep the current one
+        :param leverage_by_pair: the leverage to set for each trading pair
+        :return: the configuration result of each trading pair
+        """
+        leverage_by_pair = leverage_by_pair or {}
+        results: Dict[str, PairConfigurationResult] = {}
+        semaphore = asyncio.Semaphore(self.PAIR_CONFIGURATION_CONCURRENCY)
+
+        if mode is not None:
+            if mode in self.supported_position_modes():
+                await self._configure_position_mode(mode, results, semaphore)
+            else:
+                self.logger().error(f"Position mode {mode} is not supported. Mode not set.")
+                for trading_pair in self.trading_pairs:
+                    results[trading_pair] = PairConfigurationResult(
+                        trading_pair=trading_pair,
+                        position_mode=mode,
+                        position_mode_set=False,
+                        error=f"Position mode {mode} is not supported",
+                    )
+
+        if any(result.position_mode_set is False for result in results.values()):
+            for trading_pair, leverage in leverage_by_pair.items():
+                result = results.setdefault(trading_pair, PairConfigurationResult(trading_pair=trading_pair))
+                result.leverage = leverage
+                result.leverage_set = False
+        elif len(leverage_by_pair) > 0:
+            leverage_results = await safe_gather(*[
+                self._configure_leverage(trading_pair, leverage, semaphore)
+                for trading_pair, leverage in leverage_by_pair.items()
+            ])
+            for trading_pair, (leverage_set, msg) in zip(leverage_by_pair, leverage_results):
+                result = results.setdefault(trading_pair, PairConfigurationResult(trading_pair=trading_pair))
+                result.leverage = leverage_by_pair[trading_pair]
+                result.leverage_set = leverage_set
+                if not leverage_set:
+                    result.error = msg
+
+        return results
+
     async def _execute_set_position_mode(self, mode: PositionMode):
-        success, successful_pairs, msg = await self._execute_set_position_mode_for_pairs(
-            mode=mode, trading_pairs=self.trading_pairs
-        )
+        await self.configure_pairs(mode=mode)
 
-        if not success:
-            await self._execute_set_position_mode_for_pairs(
-                mode=self._perpetual_trading.position_mode, trading_pairs=successful_pairs
-            )
-            for trading_pair in self.trading_pairs:
+    async def _configure_position_mode(
+        self,
+        mode: PositionMode,
+        results: Dict[str, PairConfigurationResult],
+        semaphore: asyncio.Semaphore,
+    ):
+        previous_mode = self._perpetual_trading.position_mode
+        trading_pairs = self.trading_pairs
+        if mode != previous_mode:
+            outcomes = await safe_gather(*[
+                self._call_with_retries(self._trading_pair_position_mode_set, semaphore, mode, trading_pair)
+                for trading_pair in trading_pairs
+            ])
+        else:
+            outcomes = [(True, "")] * len(trading_pairs)
+
+        failed_outcomes = [(trading_pair, msg)
+                           for trading_pair, (success, msg) in zip(trading_pairs, outcomes)
+                           if not success]
+        changed_pairs = [trading_pair
+                         for trading_pair, (success, _) in zip(trading_pairs, outcomes)
+                         if success and mode != previous_mode]
+
+        for trading_pair, msg in failed_outcomes:
+            self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
+
+        if len(failed_outcomes) > 0:
+            msg = failed_outcomes[0][1]
+            rollback_outcomes = await safe_gather(*[
+                self._call_with_retries(self._trading_pair_position_mode_set, semaphore, previous_mode, trading_pair)
+                for trading_pair in changed_pairs
+            ])
+            rolled_back = {trading_pair: success
+                           for trading_pair, (success, _) in zip(changed_pairs, rollback_outcomes)}
+            for trading_pair, rollback_success in rolled_back.items():
+                if not rollback_success:
+                    self.logger().network(
+                        f"Error switching {trading_pair} mode back to {previous_mode} after failing to set {mode}."
+                    )
+            for trading_pair, (success, pair_msg) in zip(trading_pairs, outcomes):
+                results[trading_pair] = PairConfigurationResult(
+                    trading_pair=trading_pair,
+                    position_mode=mode,
+                    position_mode_set=False,
+                    rolled_back=rolled_back.get(trading_pair, False),
+                    error=pair_msg if not success else msg,
+                )
                 self.trigger_event(
                     AccountEvent.PositionModeChangeFailed,
                     PositionModeChangeEvent(
@@ -323,7 +454,12 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
                 )
         else:
             self._perpetual_trading.set_position_mode(mode)
-            for trading_pair in self.trading_pairs:
+            for trading_pair in trading_pairs:
+                results[trading_pair] = PairConfigurationResult(
+                    trading_pair=trading_pair,
+                    position_mode=mode,
+                    position_mode_set=True,
+                )
                 self.trigger_event(
                     AccountEvent.PositionModeChangeSucceeded,
                     PositionModeChangeEvent(
@@ -334,31 +470,50 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
                 )
             self.logger().debug(f"Position mode switched to {mode}.")
 
-    async def _execute_set_position_mode_for_pairs(
-        self, mode: PositionMode, trading_pairs: List[str]
-    ) -> Tuple[bool, List[str], str]:
-        successful_pairs = []
-        success = True
-        msg = ""
-
-        for trading_pair in trading_pairs:
-            if mode != self._perpetual_trading.position_mode:
-                success, msg = await self._trading_pair_position_mode_set(mode, trading_pair)
-            if success:
-                successful_pairs.append(trading_pair)
-            else:
-                self.logger().network(f"Error switching {trading_pair} mode to {mode}: {msg}")
-                break
-
-        return success, successful_pairs, msg
-
     async def _execute_set_leverage(self, trading_pair: str, leverage: int):
-        success, msg = await self._set_trading_pair_leverage(trading_pair, leverage)
+        await self._configure_leverage(trading_pair, leverage)
+
+    async def _configure_leverage(
+        self,
+        trading_pair: str,
+        leverage: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[bool, str]:
+        success, msg = await self._call_with_retries(
+            self._set_trading_pair_leverage, semaphore, trading_pair, leverage
+        )
         if success:
             self._perpetual_trading.set_leverage(trading_pair, leverage)
             self.logger().info(f"Leverage for {trading_pair} successfully set to {leverage}.")
         else:
             self.logger().network(f"Error setting leverage {leverage} for {trading_pair}: {msg}")
+        return success, msg
+
+    async def _call_with_retries(
+        self,
+        request: Callable[..., Awaitable[Tuple[bool, str]]],
+        semaphore: Optional[asyncio.Semaphore],
+        *args,
+    ) -> Tuple[bool, str]:
+        """
+        Calls a pair configuration request, retrying it if it raises an exception. A request returning a failure
+        (the exchange rejecting the configuration) is not retried.
+        """
+        msg = ""
+        for attempt in range(self.PAIR_CONFIGURATION_MAX_RETRIES + 1):
+            if attempt > 0:
+                await self._sleep(self.PAIR_CONFIGURATION_RETRY_INTERVAL)
+            try:
+                if semaphore is None:
+                    return await request(*args)
+                async with semaphore:
+                    return await request(*args)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                msg = str(exception) or exception.__class__.__name__
+                self.logger().debug(f"Configuration request {request.__name__}{args} failed ({msg}).")
+        return False, msg
 
     async def _listen_for_funding_info(self):
         await self._init_funding_info()
@@ -367,9 +522,23 @@ class PerpetualDerivativePyBase(ExchangePyBase, ABC):
         )
 
     async def _init_funding_info(self):
-        for trading_pair in self.trading_pairs:
-            funding_info = await self._orderbook_ds.get_funding_info(trading_pair)
-            self._perpetual_trading.initialize_funding_info(funding_info)
+        """
+        Fetches the funding info of all the trading pairs (concurrently, or in one request if the exchange allows it),
+        and fetches again the funding info that could not be fetched until all the trading pairs have one.
+        """
+        pending_trading_pairs = list(self.trading_pairs)
+        while True:
+            funding_infos = await self._orderbook_ds.get_funding_infos(pending_trading_pairs)
+            for funding_info in funding_infos.values():
+                self._perpetual_trading.initialize_funding_info(funding_info)
+            pending_trading_pairs = [
+                trading_pair for trading_pair in pending_trading_pairs if trading_pair not in funding_infos
+            ]
+            if len(pending_trading_pairs) == 0:
+                break
+            self.logger().warning(f"Could not initialize the funding info for {', '.join(pending_trading_pairs)}. "
+                                  f"Retrying in {self.SHORT_POLL_INTERVAL} seconds.")
+            await self._sleep(self.SHORT_POLL_INTERVAL)
 
     async def _funding_payment_polling_loop(self):
         """
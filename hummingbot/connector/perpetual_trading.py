@@ -1,34 +1,45 @@
 import asyncio
-import copy
 import logging
+import time
 import warnings
-from collections import defaultdict
-from typing import Dict, List, Optional
+from collections import defaultdict, deque
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, List, Mapping, Optional
 
 from hummingbot.connector.derivative.position import Position
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionMode, PositionSide
-from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
+from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate, FundingRateRecord
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
 
 class PerpetualTrading:
-    """Keeps perpetual trading state."""
+    """
+    Keeps perpetual trading state.
+
+    The funding info of a trading pair is never modified once stored: updates replace it with a new FundingInfo, so
+    the funding info returned can be used without copying it. The last `funding_rate_history_size` funding rates of
+    every trading pair are kept as well.
+    """
+    FUNDING_RATE_HISTORY_SIZE = 1000
 
     _logger: Optional[HummingbotLogger] = None
 
-    def __init__(self, trading_pairs: List[str]):
+    def __init__(self, trading_pairs: List[str], funding_rate_history_size: int = FUNDING_RATE_HISTORY_SIZE):
         self._account_positions: Dict[str, Position] = {}
         self._position_mode: PositionMode = PositionMode.ONEWAY
         self._leverage: Dict[str, int] = defaultdict(lambda: 1)
         self._trading_pairs = trading_pairs
 
         self._funding_info: Dict[str, FundingInfo] = {}
+        self._funding_rate_history: Dict[str, Deque[FundingRateRecord]] = defaultdict(
+            lambda: deque(maxlen=funding_rate_history_size))
         self._funding_payment_span: List[int] = [0, 0]
         self._funding_info_stream = asyncio.Queue()
 
         self._funding_info_updater_task: Optional[asyncio.Task] = None
+        self._update_listeners: List[Callable[[str], None]] = []
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -44,11 +55,11 @@ class PerpetualTrading:
         return self._account_positions
 
     @property
-    def funding_info(self) -> Dict[str, FundingInfo]:
+    def funding_info(self) -> Mapping[str, FundingInfo]:
         """
-        The funding information per trading pair.
+        The funding information per trading pair, as a read-only view.
         """
-        return copy.deepcopy(self._funding_info)
+        return MappingProxyType(self._funding_info)
 
     @property
     def funding_info_stream(self) -> asyncio.Queue:
@@ -57,18 +68,35 @@ class PerpetualTrading:
         """
         return self._funding_info_stream
 
+    def add_update_listener(self, listener: Callable[[str], None]):
+        """
+        Adds a function called with the trading pair every time a position is set or removed, or the funding info is
+        updated.
+        """
+        self._update_listeners.append(listener)
+
+    def remove_update_listener(self, listener: Callable[[str], None]):
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
     def set_position(self, pos_key: str, position: Position):
         self.logger().debug(f"Setting position {pos_key} to {Position}")
         self._account_positions[pos_key] = position
+        self._notify_update(position.trading_pair)
 
     def remove_position(self, post_key: str) -> Optional[Position]:
-        return self._account_positions.pop(post_key, None)
+        position = self._account_positions.pop(post_key, None)
+        if position is not None:
+            self._notify_update(position.trading_pair)
+        return position
 
     def initialize_funding_info(self, funding_info: FundingInfo):
         """
         Initializes a single trading pair funding information.
         """
         self._funding_info[funding_info.trading_pair] = funding_info
+        self._record_funding_rate(funding_info)
+        self._notify_update(funding_info.trading_pair)
 
     def is_funding_info_initialized(self) -> bool:
         """
@@ -96,6 +124,7 @@ class PerpetualTrading:
             self._funding_info_updater_task.cancel()
             self._funding_info_updater_task = None
         self._funding_info.clear()
+        self._funding_rate_history.clear()
 
     def position_key(self, trading_pair: str, side: PositionSide = None, mode: PositionMode = None) -> str:
         """
@@ -167,13 +196,44 @@ class PerpetualTrading:
         """
         return self._funding_info[trading_pair]
 
+    def get_funding_rate_history(self, trading_pair: str) -> List[FundingRateRecord]:
+        """
+        Returns the funding rates received for a trading pair, oldest first. A funding rate is recorded every time the
+        rate or the next funding time changes.
+        :param trading_pair: the market trading pair
+        :return: the funding rate records
+        """
+        history = self._funding_rate_history.get(trading_pair)
+        return list(history) if history is not None else []
+
+    def _record_funding_rate(self, funding_info: FundingInfo):
+        history = self._funding_rate_history[funding_info.trading_pair]
+        if len(history) > 0:
+            last_record = history[-1]
+            if (last_record.rate == funding_info.rate
+                    and last_record.next_funding_utc_timestamp == funding_info.next_funding_utc_timestamp):
+                return
+        history.append(FundingRateRecord(
+            timestamp=time.time(),
+            rate=funding_info.rate,
+            next_funding_utc_timestamp=funding_info.next_funding_utc_timestamp,
+            mark_price=funding_info.mark_price,
+            index_price=funding_info.index_price,
+        ))
+
+    def _notify_update(self, trading_pair: str):
+        for listener in self._update_listeners:
+            listener(trading_pair)
+
     async def _funding_info_updater(self):
         while True:
             try:
                 funding_info_message: FundingInfoUpdate = await self._funding_info_stream.get()
                 trading_pair = funding_info_message.trading_pair
-                funding_info = self._funding_info[trading_pair]
-                funding_info.update(funding_info_message)
+                funding_info = self._funding_info[trading_pair].updated(funding_info_message)
+                self._funding_info[trading_pair] = funding_info
+                self._record_funding_rate(funding_info)
+                self._notify_update(trading_pair)
             except asyncio.CancelledError:
                 raise
             except Exception:
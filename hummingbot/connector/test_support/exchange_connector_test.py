@@ -953,6 +953,8 @@ class AbstractExchangeConnectorTests:
 
             self.exchange.cancel(trading_pair=self.trading_pair, client_order_id=self.client_order_id_prefix + "1")
             await (request_sent_event.wait())
+            # Let the cancel task process the response, connectors with batch cancels need a few more loop iterations
+            await asyncio.sleep(0.1)
 
             self.assertFalse(order.is_done)
             self.assertFalse(order.is_failure)
@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.utils import loop_profiler
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -88,7 +89,13 @@ class AsyncRequestContextBase(ABC):
             self._task_logs.extend(new_logs)
 
     async def __aenter__(self):
-        await self.acquire()
+        profiler = loop_profiler.active_profiler
+        if profiler is None:
+            await self.acquire()
+        else:
+            start_time = time.perf_counter()
+            await self.acquire()
+            profiler.observe_throttler_wait(self._rate_limit.limit_id, time.perf_counter() - start_time)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
@@ -10,3 +10,10 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        dict _tick_intervals
+        dict _next_tick_times
+        dict _tick_stats
+        double _min_tick_interval
+
+    cdef double c_next_tick_time(self, double now)
+    cdef c_tick_iterator(self, object iterator, double due_time, bint realtime)
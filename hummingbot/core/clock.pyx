@@ -3,17 +3,28 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import Dict, List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.tick_stats import TickStats
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+# Tolerance when comparing the back testing clock time with the iterators tick times, which are accumulated separately
+cdef double BACKTEST_TIME_TOLERANCE = 1e-9
 
 
 cdef class Clock:
+    """
+    Ticks the child iterators, in the order they were added. Every iterator is ticked at its own tick interval (the
+    clock tick size by default), on the multiples of the interval.
+
+    The time each tick takes is recorded in the iterator TickStats, with (in real time mode) the ticks taking longer
+    than the iterator tick interval (overruns) and the ticks skipped because the clock was late.
+    """
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global s_logger
@@ -24,7 +35,7 @@ cdef class Clock:
     def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
         """
         :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param tick_size: time interval of each tick, for the iterators without a specific tick interval
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
         """
@@ -36,6 +47,10 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_intervals = {}
+        self._next_tick_times = {}
+        self._tick_stats = {}
+        self._min_tick_interval = tick_size
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +72,31 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_stats(self) -> Dict[TimeIterator, TickStats]:
+        return self._tick_stats
+
+    def get_tick_stats(self, iterator: TimeIterator) -> TickStats:
+        return self._tick_stats[iterator]
+
+    def get_tick_interval(self, iterator: TimeIterator) -> float:
+        return self._tick_intervals[iterator]
+
+    def set_tick_interval(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        Changes the tick interval of a child iterator, from its next tick on.
+        :param tick_interval: the iterator tick interval in seconds, None for the clock tick size
+        """
+        if iterator not in self._tick_intervals:
+            raise ValueError(f"{iterator} is not a child iterator of the clock.")
+        tick_interval = self._tick_size if tick_interval is None else tick_interval
+        if tick_interval <= 0:
+            raise ValueError("The tick interval must be positive.")
+        self._tick_intervals[iterator] = tick_interval
+        self._min_tick_interval = min([self._tick_size] + list(self._tick_intervals.values()))
+        if iterator in self._next_tick_times:
+            self._schedule_next_tick(iterator, self._clock_mode is not ClockMode.BACKTEST)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -69,11 +109,18 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self, iterator: TimeIterator, tick_interval: Optional[float] = None):
+        """
+        :param tick_interval: the iterator tick interval in seconds, None for the clock tick size
+        """
         if self._current_context is not None:
             self._current_context.append(iterator)
+        self._tick_intervals[iterator] = self._tick_size
+        self._tick_stats[iterator] = TickStats()
+        self.set_tick_interval(iterator, tick_interval)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
+            self._schedule_next_tick(iterator, self._clock_mode is not ClockMode.BACKTEST)
         self._child_iterators.append(iterator)
 
     def remove_iterator(self, iterator: TimeIterator):
@@ -81,6 +128,46 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        if iterator not in self._child_iterators:
+            self._tick_intervals.pop(iterator, None)
+            self._next_tick_times.pop(iterator, None)
+            self._tick_stats.pop(iterator, None)
+            self._min_tick_interval = min([self._tick_size] + list(self._tick_intervals.values()))
+
+    def _schedule_next_tick(self, iterator: TimeIterator, realtime: bool):
+        cdef double tick_interval = self._tick_intervals[iterator]
+        if realtime:
+            self._next_tick_times[iterator] = ((self._current_tick // tick_interval) + 1) * tick_interval
+        else:
+            self._next_tick_times[iterator] = self._current_tick + tick_interval
+
+    cdef double c_next_tick_time(self, double now):
+        cdef:
+            double next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+        if len(self._current_context) > 0:
+            next_tick_time = min([self._next_tick_times[iterator] for iterator in self._current_context])
+        return next_tick_time
+
+    cdef c_tick_iterator(self, object iterator, double due_time, bint realtime):
+        cdef:
+            TimeIterator child_iterator = iterator
+            double tick_interval = self._tick_intervals[iterator]
+            double start = time.perf_counter()
+            double duration
+            double now
+            int skipped_ticks = 0
+        try:
+            child_iterator.c_tick(self._current_tick)
+        finally:
+            duration = time.perf_counter() - start
+            if realtime:
+                # The ticks due before the next one are skipped
+                now = time.time()
+                skipped_ticks = <int>max(0.0, (now // tick_interval) - round(due_time / tick_interval))
+                self._next_tick_times[iterator] = ((now // tick_interval) + 1) * tick_interval
+            else:
+                self._next_tick_times[iterator] = due_time + tick_interval
+            (<object>self._tick_stats[iterator]).record(duration, realtime and duration > tick_interval, skipped_ticks)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +177,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double due_time
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -100,6 +188,9 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
+        for ci in self._current_context:
+            if ci not in self._next_tick_times:
+                self._schedule_next_tick(ci, True)
 
         try:
             while True:
@@ -108,15 +199,17 @@ cdef class Clock:
                     return
 
                 # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                next_tick_time = self.c_next_tick_time(now)
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
+                # Run through the child iterators due
+                for ci in list(self._current_context):
+                    due_time = self._next_tick_times.get(ci, next_tick_time)
+                    if due_time > next_tick_time:
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci, due_time, True)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
@@ -128,21 +221,32 @@ cdef class Clock:
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        """
+        Advances the clock by the smallest tick interval of the iterators (or the tick size if it is smaller) at a time,
+        ticking the iterators due in the order they were added, so the back tests are deterministic.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double due_time
 
         if not self._started:
             for ci in self._child_iterators:
                 child_iterator = ci
                 child_iterator.c_start(self, self._start_time)
             self._started = True
+        for ci in self._child_iterators:
+            if ci not in self._next_tick_times:
+                self._schedule_next_tick(ci, False)
 
         try:
             while not (self._current_tick >= timestamp):
-                self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
+                self._current_tick += self._min_tick_interval
+                for ci in list(self._child_iterators):
+                    due_time = self._next_tick_times.get(ci, self._current_tick)
+                    if due_time - self._current_tick > BACKTEST_TIME_TOLERANCE:
+                        continue
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_iterator(ci, due_time, False)
                     except StopIteration:
                         raise
                     except Exception:
@@ -20,8 +20,9 @@ PyRef::~PyRef() {
 }
 
 PyRef &PyRef::operator=(const PyRef &other) {
+    Py_XINCREF(other.obj);
+    Py_XDECREF(this->obj);
     this->obj = other.obj;
-    Py_XINCREF(this->obj);
     return *this;
 }
 
@@ -1,6 +1,6 @@
 from dataclasses import asdict, dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 class FundingInfo:
@@ -64,6 +64,20 @@ class FundingInfo:
             if value is not None:
                 setattr(self, key, value)
 
+    def updated(self, info_update: "FundingInfoUpdate") -> "FundingInfo":
+        """
+        :return: a new funding info with the update applied, this one is left unchanged
+        """
+        funding_info = FundingInfo(
+            trading_pair=self._trading_pair,
+            index_price=self._index_price,
+            mark_price=self._mark_price,
+            next_funding_utc_timestamp=self._next_funding_utc_timestamp,
+            rate=self._rate,
+        )
+        funding_info.update(info_update)
+        return funding_info
+
 
 @dataclass
 class FundingInfoUpdate:
@@ -72,3 +86,15 @@ class FundingInfoUpdate:
     mark_price: Optional[Decimal] = None
     next_funding_utc_timestamp: Optional[int] = None
     rate: Optional[Decimal] = None
+
+
+class FundingRateRecord(NamedTuple):
+    """
+    A funding rate of a perpetual market, as known at `timestamp` (local time in seconds) for the funding at
+    `next_funding_utc_timestamp`.
+    """
+    timestamp: float
+    rate: Decimal
+    next_funding_utc_timestamp: int
+    mark_price: Decimal
+    index_price: Decimal
@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -45,6 +45,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._update_listeners: List[Callable[[str], None]] = []
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -75,6 +76,17 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def add_update_listener(self, listener: Callable[[str], None]):
+        """
+        Adds a function called with the trading pair every time a diff or a snapshot is applied to an order book. It is
+        called from the order book tracking tasks, so it should return quickly.
+        """
+        self._update_listeners.append(listener)
+
+    def remove_update_listener(self, listener: Callable[[str], None]):
+        if listener in self._update_listeners:
+            self._update_listeners.remove(listener)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -285,6 +297,8 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                for listener in self._update_listeners:
+                    listener(trading_pair)
             except asyncio.CancelledError:
                 raise
             except Exception:
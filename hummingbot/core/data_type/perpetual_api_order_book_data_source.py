@@ -7,6 +7,9 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 
 
 class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
+    # Maximum number of funding info requests in flight when fetching the funding info of several trading pairs
+    FUNDING_INFO_REQUESTS_CONCURRENCY = 10
+
     def __init__(self, trading_pairs: List[str]):
         super().__init__(trading_pairs)
         self._funding_info_messages_queue_key = "funding_info"
@@ -18,6 +21,33 @@ class PerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, ABC):
         """
         raise NotImplementedError
 
+    async def get_funding_infos(self, trading_pairs: List[str]) -> Dict[str, FundingInfo]:
+        """
+        Returns the funding information of several trading pairs. The trading pairs whose funding information could not
+        be fetched are left out (and the error logged).
+
+        By default the funding information of every trading pair is requested concurrently, with at most
+        FUNDING_INFO_REQUESTS_CONCURRENCY requests in flight (the requests still go through the connector throttler).
+        Exchanges returning the funding information of all the markets in one call should override this method.
+        """
+        semaphore = asyncio.Semaphore(self.FUNDING_INFO_REQUESTS_CONCURRENCY)
+
+        async def fetch(trading_pair: str) -> FundingInfo:
+            async with semaphore:
+                return await self.get_funding_info(trading_pair)
+
+        results = await asyncio.gather(*[fetch(trading_pair) for trading_pair in trading_pairs],
+                                       return_exceptions=True)
+        funding_infos = {}
+        for trading_pair, result in zip(trading_pairs, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                self.logger().error(f"Error fetching the funding info for {trading_pair}.", exc_info=result)
+            else:
+                funding_infos[trading_pair] = result
+        return funding_infos
+
     async def listen_for_funding_info(self, output: asyncio.Queue):
         """
         Reads the funding info events queue and updates the local funding info information.
@@ -63,6 +63,7 @@ class AccountEvent(Enum):
     PositionUpdate = 403
     MarginCall = 404
     LiquidationEvent = 405
+    LiquidationRisk = 406
 
 
 class ExecutorEvent(Enum):
@@ -351,3 +352,21 @@ class PositionUpdateEvent:
     entry_price: Decimal
     amount: Decimal
     leverage: Decimal
+
+
+@dataclass
+class PositionRiskEvent:
+    """
+    Triggered with AccountEvent.MarginCall when the margin ratio of a position reaches the maximum margin ratio, and
+    with AccountEvent.LiquidationRisk when the mark price gets closer to the estimated liquidation price than the
+    minimum liquidation distance.
+    """
+    timestamp: float
+    trading_pair: str
+    position_side: PositionSide
+    mark_price: float
+    unrealized_pnl: float
+    liquidation_price: float
+    liquidation_distance: float
+    margin_ratio: float
+    threshold: float
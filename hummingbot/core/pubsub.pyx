@@ -6,15 +6,9 @@ from cpython cimport(
     PyWeakref_NewRef,
     PyWeakref_GetObject
 )
-from cython.operator cimport(
-    postincrement as inc,
-    dereference as deref,
-    address
-)
-from libcpp.vector cimport vector
+from cython.operator cimport dereference as deref
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +18,38 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class _DeadListenerCallback:
+    """
+    Weak reference callback flagging the event tag of a dead listener, so the listener is removed lazily.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_ref
+        int64_t _event_tag
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag):
+        self._pubsub_ref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, listener_weakref):
+        pubsub = self._pubsub_ref()
+        if pubsub is not None:
+            (<PubSub>pubsub)._dead_listener_tags.add(self._event_tag)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem: a listener is only referenced weakly, and
+    is removed once it is garbage collected.
+
+    The listeners of every event tag are kept in a tuple snapshot (of weak references, in dispatch order), built again
+    only after a listener is added or removed. Triggering an event iterates the snapshot, without copying anything, and
+    listeners can add or remove listeners while being called since that replaces the snapshot instead of changing it.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    The weak reference callbacks only flag the event tags with dead listeners. The dead listeners are skipped when
+    triggering events, and removed the next time the event tag listeners are used.
+
+    The listeners are called by decreasing priority (0 by default), in the order they were added for the same priority.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,11 +58,18 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self):
+        # Initialized here since the subclasses don't always call __init__
+        self._listeners = {}
+        self._dead_listener_tags = set()
+        self._dead_listener_callbacks = {}
+        self._listener_sequence = 0
 
-    def add_listener(self, event_tag: Enum, listener: EventListener):
-        self.c_add_listener(event_tag.value, listener)
+    def add_listener(self, event_tag: Enum, listener: EventListener, priority: int = 0):
+        """
+        :param priority: the listeners with a higher priority are called first
+        """
+        self.c_add_listener(event_tag.value, listener, priority)
 
     def remove_listener(self, event_tag: Enum, listener: EventListener):
         self.c_remove_listener(event_tag.value, listener)
@@ -70,96 +83,118 @@ cdef class PubSub:
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
-    cdef c_add_listener(self, int64_t event_tag, EventListener listener):
+    cdef c_add_listener(self, int64_t event_tag, EventListener listener, int64_t priority=0):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
+            dict listeners = self._listeners.get(event_tag)
+            tuple entry
+            object callback
+        if listeners is None:
+            listeners = {}
+            self._listeners[event_tag] = listeners
+        entry = listeners.get(id(listener))
+        if entry is not None and entry[0]() is listener and entry[1] == priority:
+            return
 
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        callback = self._dead_listener_callbacks.get(event_tag)
+        if callback is None:
+            callback = _DeadListenerCallback(self, event_tag)
+            self._dead_listener_callbacks[event_tag] = callback
+        self._listener_sequence += 1
+        # The entry of a dead listener whose id is reused is replaced
+        listeners[id(listener)] = (PyWeakref_NewRef(listener, callback), priority, self._listener_sequence)
+        self.c_invalidate_snapshot(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
-        if it == self._events.end():
+            dict listeners = self._listeners.get(event_tag)
+            tuple entry
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
+        entry = listeners.get(id(listener))
+        if entry is not None and entry[0]() is listener:
+            del listeners[id(listener)]
+            self.c_invalidate_snapshot(event_tag)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weakref
-            EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
-        if it == self._events.end():
+            dict listeners
+        if event_tag not in self._dead_listener_tags:
+            return
+        self._dead_listener_tags.discard(event_tag)
+        listeners = self._listeners.get(event_tag)
+        if listeners is None:
             return
-        listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
-        if deref(listeners_ptr).size() < 1:
-            self._events.erase(it)
+        for listener_id, entry in list(listeners.items()):
+            if entry[0]() is None:
+                del listeners[listener_id]
+        self.c_invalidate_snapshot(event_tag)
+
+    cdef c_invalidate_snapshot(self, int64_t event_tag):
+        """
+        Drops the event tag snapshot after its listeners changed. It is built again (once) when the listeners are used.
+        """
+        cdef:
+            dict listeners = self._listeners.get(event_tag)
+        self._snapshots.erase(event_tag)
+        if listeners is None or len(listeners) == 0:
+            self._listeners.pop(event_tag, None)
+            self._dead_listener_callbacks.pop(event_tag, None)
+        else:
+            self._snapshots.insert(EventSnapshotsPair(event_tag, PyRef()))
 
-    cdef c_get_listeners(self, int64_t event_tag):
+    cdef tuple c_get_snapshot(self, int64_t event_tag):
+        cdef:
+            EventSnapshotsIterator it
+            dict listeners
+            tuple snapshot
         self.c_remove_dead_listeners(event_tag)
+        it = self._snapshots.find(event_tag)
+        if it == self._snapshots.end():
+            return ()
+        if deref(it).second.get() == NULL:
+            listeners = self._listeners[event_tag]
+            snapshot = tuple(entry[0] for entry in sorted(listeners.values(), key=lambda e: (-e[1], e[2])))
+            deref(it).second = PyRef(<PyObject *>snapshot)
+        return <tuple>deref(it).second.get()
 
+    cdef c_get_listeners(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
-        if it == self._events.end():
-            return []
-
+            object listener
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_snapshot(event_tag):
+            listener = listener_weakref()
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            EventSnapshotsIterator it = self._snapshots.find(event_tag)
+            PyObject *snapshot_ptr
+            tuple snapshot
+            PyObject *listener_ptr
             EventListener typed_listener
-        if it == self._events.end():
+        if it == self._snapshots.end():
             return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        if len(self._dead_listener_tags) > 0:
+            for dead_listener_tag in list(self._dead_listener_tags):
+                self.c_remove_dead_listeners(dead_listener_tag)
+            it = self._snapshots.find(event_tag)
+            if it == self._snapshots.end():
+                return
+        snapshot_ptr = deref(it).second.get()
+        if snapshot_ptr == NULL:
+            snapshot = self.c_get_snapshot(event_tag)
+        else:
+            snapshot = <tuple>snapshot_ptr
+
+        # The local reference keeps the snapshot alive if a listener adds or removes listeners
+        for listener_weakref in snapshot:
+            listener_ptr = PyWeakref_GetObject(listener_weakref)
+            if listener_ptr == <PyObject *>None:
+                continue
+            typed_listener = <EventListener>listener_ptr
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -0,0 +1,71 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class TickStats:
+    """
+    Timing statistics of the ticks of a clock child iterator.
+
+    Besides the counters, the durations of the last `window_size` ticks are kept in a circular array to build a
+    rolling latency histogram.
+    """
+    DEFAULT_WINDOW_SIZE = 1000
+    # Upper bounds (in seconds) of the latency histogram buckets, the last bucket holds the longer durations
+    HISTOGRAM_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    __slots__ = ("_durations", "_next_index", "tick_count", "overrun_count", "skipped_tick_count", "last_duration",
+                 "max_duration")
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        self._durations = np.full(window_size, np.nan)
+        self._next_index = 0
+        self.tick_count = 0
+        self.overrun_count = 0
+        self.skipped_tick_count = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+
+    def __repr__(self) -> str:
+        return (f"TickStats(tick_count={self.tick_count}, overrun_count={self.overrun_count}, "
+                f"skipped_tick_count={self.skipped_tick_count}, last_duration={self.last_duration}, "
+                f"max_duration={self.max_duration})")
+
+    def record(self, duration: float, overrun: bool = False, skipped_ticks: int = 0):
+        """
+        :param duration: the time the tick took, in seconds
+        :param overrun: if the tick took longer than the iterator tick interval
+        :param skipped_ticks: the ticks that could not happen on time and were skipped
+        """
+        self._durations[self._next_index] = duration
+        self._next_index = (self._next_index + 1) % len(self._durations)
+        self.tick_count += 1
+        self.overrun_count += overrun
+        self.skipped_tick_count += skipped_ticks
+        self.last_duration = duration
+        if duration > self.max_duration:
+            self.max_duration = duration
+
+    def recent_durations(self) -> np.ndarray:
+        """
+        :return: the durations of the last ticks, at most `window_size` of them, in no specific order
+        """
+        return self._durations[~np.isnan(self._durations)]
+
+    def latency_histogram(self) -> Dict[float, int]:
+        """
+        :return: the number of the last ticks per duration bucket, keyed by the bucket upper bound in seconds (inf for
+        the last bucket)
+        """
+        bounds = self.HISTOGRAM_BUCKETS + (float("inf"),)
+        indexes = np.searchsorted(self.HISTOGRAM_BUCKETS, self.recent_durations(), side="left")
+        counts = np.bincount(indexes, minlength=len(bounds))
+        return dict(zip(bounds, counts.tolist()))
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        :param percentile: the percentile, between 0 and 100
+        :return: the percentile of the durations of the last ticks, NaN if there was no tick
+        """
+        durations = self.recent_durations()
+        return float(np.percentile(durations, percentile)) if len(durations) > 0 else float("nan")
@@ -4,6 +4,7 @@ import inspect
 import logging
 import sys
 import time
+from decimal import Decimal
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
@@ -608,6 +609,22 @@ class TradingCore:
             'markets_recorder_active': self.markets_recorder is not None,
         }
 
+    async def calculate_profitability(self) -> Decimal:
+        """
+        Calculates the average return of the markets traded since the start, used by the kill switch. The performance
+        is kept up to date by the markets recorder as trades are filled.
+        """
+        if not self.markets_recorder or any(not market.ready for market in self.markets.values()):
+            return Decimal("0")
+        connectors = {connector.display_name: connector for connector in self.markets.values()}
+
+        async def market_balances(market: str) -> Optional[Dict[str, Decimal]]:
+            connector = connectors.get(market)
+            return connector.get_all_balances() if connector is not None else None
+
+        accumulator = self.markets_recorder.get_performance_accumulator(int(self.init_time * 1e3))
+        return await accumulator.average_return_pct(market_balances)
+
     def add_notifier(self, notifier: NotifierBase):
         """Add a notifier to the engine."""
         self.notifiers.append(notifier)
@@ -2,23 +2,82 @@
 
 import asyncio
 import logging
-from typing import Callable, Coroutine, NamedTuple, Optional
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, NamedTuple, Optional
 
 from async_timeout import timeout
 
 import hummingbot
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 
+DEFAULT_CALLER = "default"
+
 
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    coroutine: Awaitable
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    caller: str = DEFAULT_CALLER
+    # time.perf_counter() times
+    enqueue_time: float = 0.0
+    deadline: Optional[float] = None
+
+
+class FairCallQueue(asyncio.Queue):
+    """
+    Queue of scheduled calls, served round-robin between their callers: a caller queuing many calls doesn't delay the
+    calls of the other callers by more than one call each. The calls of a same caller are served in order.
+    """
+
+    def _init(self, maxsize: int):
+        # The callers with queued calls, in serving order. Named _queue since asyncio.Queue checks it to know if the
+        # queue is empty.
+        self._queue: Deque[str] = deque()
+        self._caller_queues: Dict[str, Deque[AsyncCallSchedulerItem]] = {}
+        self._size = 0
+
+    def _put(self, item: AsyncCallSchedulerItem):
+        caller_queue = self._caller_queues.get(item.caller)
+        if caller_queue is None:
+            caller_queue = deque()
+            self._caller_queues[item.caller] = caller_queue
+            self._queue.append(item.caller)
+        caller_queue.append(item)
+        self._size += 1
+
+    def _get(self) -> AsyncCallSchedulerItem:
+        caller = self._queue.popleft()
+        caller_queue = self._caller_queues[caller]
+        item = caller_queue.popleft()
+        if len(caller_queue) > 0:
+            self._queue.append(caller)
+        else:
+            del self._caller_queues[caller]
+        self._size -= 1
+        return item
+
+    def qsize(self) -> int:
+        return self._size
+
+    def caller_qsize(self, caller: str) -> int:
+        caller_queue = self._caller_queues.get(caller)
+        return len(caller_queue) if caller_queue is not None else 0
 
 
 class AsyncCallScheduler:
+    """
+    Runs the scheduled calls with a pool of `max_concurrency` workers, each one waiting `call_interval` seconds after
+    every call. The calls are queued per caller and served round-robin between the callers.
+
+    A call can have a maximum queue wait: if no worker picked it up in time, it is dropped and its caller gets an
+    asyncio.TimeoutError without the call being made. The queue wait and execution times of the calls are recorded.
+    """
+    DEFAULT_MAX_CONCURRENCY = 4
+
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -34,14 +93,21 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("The scheduler needs at least one worker.")
+        self._coro_queue: FairCallQueue = FairCallQueue()
         self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._queue_wait_latency = LatencyHistogram()
+        self._execution_latency = LatencyHistogram()
+        self._call_counts: Dict[str, int] = {"completed": 0, "failed": 0, "dropped": 0, "cancelled": 0}
+        self._running_calls = 0
         self.reset_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
+    def coro_queue(self) -> FairCallQueue:
         return self._coro_queue
 
     @property
@@ -52,6 +118,27 @@ class AsyncCallScheduler:
     def started(self) -> bool:
         return self._coro_scheduler_task is not None
 
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def queue_wait_latency(self) -> LatencyHistogram:
+        return self._queue_wait_latency
+
+    @property
+    def execution_latency(self) -> LatencyHistogram:
+        return self._execution_latency
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._call_counts,
+            "queued": self._coro_queue.qsize(),
+            "running": self._running_calls,
+            "queue_wait": self._queue_wait_latency.summary(),
+            "execution": self._execution_latency.summary(),
+        }
+
     def reset_event_loop(self):
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
@@ -71,32 +158,17 @@ class AsyncCallScheduler:
             self._coro_scheduler_task = None
 
     async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
-        while True:
-            app_warning_msg = "API call error."
-            try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
-            except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
-                raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
+        workers = [safe_ensure_future(self._worker(coro_queue, interval)) for _ in range(self._max_concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
 
+    async def _worker(self, coro_queue: asyncio.Queue, interval: float):
+        while True:
+            item = await coro_queue.get()
+            await self._run_call(item)
             try:
                 await asyncio.sleep(interval)
             except asyncio.CancelledError:
@@ -104,13 +176,80 @@ class AsyncCallScheduler:
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
+    async def _run_call(self, item: AsyncCallSchedulerItem):
+        fut, coro, timeout_seconds, app_warning_msg = item[:4]
+        if fut.done():
+            # The caller stopped waiting for the result
+            self._call_counts["cancelled"] += 1
+            self._discard_call(coro)
+            return
+        start_time = time.perf_counter()
+        queue_wait = start_time - item.enqueue_time if item.enqueue_time > 0 else 0.0
+        self._queue_wait_latency.observe(queue_wait)
+        if item.deadline is not None and start_time > item.deadline:
+            self._call_counts["dropped"] += 1
+            self._discard_call(coro)
+            self.logger().debug(f"{app_warning_msg} [[Dropped after waiting {queue_wait:.3f} seconds in the queue]]")
+            fut.set_exception(asyncio.TimeoutError(f"The call was dropped after waiting {queue_wait:.3f} seconds."))
+            return
+
+        self._running_calls += 1
+        try:
+            async with timeout(timeout_seconds):
+                result = await coro
+            fut.set_result(result)
+            self._call_counts["completed"] += 1
+        except asyncio.CancelledError:
+            try:
+                fut.cancel()
+            except Exception:
+                pass
+            raise
+        except asyncio.InvalidStateError:
+            # The future is already cancelled from outside. Ignore.
+            self._call_counts["cancelled"] += 1
+        except Exception as e:
+            self._call_counts["failed"] += 1
+            # Add exception information.
+            app_warning_msg += f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            try:
+                fut.set_exception(e)
+            except Exception:
+                pass
+        finally:
+            self._running_calls -= 1
+            self._execution_latency.observe(time.perf_counter() - start_time)
+
+    @staticmethod
+    def _discard_call(coro: Awaitable):
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        elif asyncio.isfuture(coro):
+            coro.cancel()
+
     async def schedule_async_call(self,
-                                  coro: Coroutine,
+                                  coro: Awaitable,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  caller: Optional[str] = None,
+                                  max_wait_seconds: Optional[float] = None) -> any:
+        """
+        :param caller: the name the calls are queued fairly by, the coroutine function name by default
+        :param max_wait_seconds: the time after which the call is dropped if it is still queued, no limit by default
+        """
         fut: asyncio.Future = self._ev_loop.create_future()
+        if caller is None:
+            caller = getattr(coro, "__qualname__", DEFAULT_CALLER)
+        enqueue_time = time.perf_counter()
+        deadline = enqueue_time + max_wait_seconds if max_wait_seconds is not None else None
         self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
+                                                           app_warning_msg=app_warning_msg,
+                                                           caller=caller,
+                                                           enqueue_time=enqueue_time,
+                                                           deadline=deadline))
         if self._coro_scheduler_task is None:
             self.start()
         return await fut
@@ -118,10 +257,23 @@ class AsyncCallScheduler:
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         caller: Optional[str] = None,
+                         max_wait_seconds: Optional[float] = None) -> any:
+        """
+        Runs the function in the executor once a worker picks the call up, so a dropped call never runs. The calls are
+        queued fairly by function name unless a caller is given.
+        """
+        if caller is None:
+            caller = getattr(func, "__qualname__", DEFAULT_CALLER)
+
+        async def run_in_executor():
+            return await self._ev_loop.run_in_executor(
+                hummingbot.get_executor(),
+                func,
+                *args,
+            )
+
+        coro: Awaitable = run_in_executor()
+        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg,
+                                              caller=caller, max_wait_seconds=max_wait_seconds)
@@ -3,6 +3,8 @@ import inspect
 import logging
 import time
 
+from hummingbot.core.utils import loop_profiler
+
 
 async def safe_wrapper(c):
     try:
@@ -14,10 +16,16 @@ async def safe_wrapper(c):
 
 
 def safe_ensure_future(coro, *args, **kwargs):
+    profiler = loop_profiler.active_profiler
+    if profiler is not None and asyncio.iscoroutine(coro):
+        coro = profiler.profile_coroutine(coro)
     return asyncio.ensure_future(safe_wrapper(coro), *args, **kwargs)
 
 
 async def safe_gather(*args, **kwargs):
+    profiler = loop_profiler.active_profiler
+    if profiler is not None:
+        args = [profiler.profile_coroutine(arg) if asyncio.iscoroutine(arg) else arg for arg in args]
     try:
         return await asyncio.gather(*args, **kwargs)
     except Exception as e:
@@ -0,0 +1,95 @@
+import math
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies (in seconds) with fixed bucket bounds, so recording a latency is O(log(buckets)) and the
+    memory used doesn't grow with the number of latencies recorded. The percentiles are estimated by linear
+    interpolation inside the bucket they fall in.
+    """
+    # 100 microseconds to ~105 seconds, doubling at every bucket
+    DEFAULT_BUCKET_BOUNDS = tuple(0.0001 * 2 ** i for i in range(21))
+
+    def __init__(self, bucket_bounds: Optional[Sequence[float]] = None):
+        bucket_bounds = list(bucket_bounds) if bucket_bounds is not None else list(self.DEFAULT_BUCKET_BOUNDS)
+        if len(bucket_bounds) == 0 or bucket_bounds != sorted(set(bucket_bounds)):
+            raise ValueError("The latency histogram bucket bounds should be strictly increasing.")
+        self._bucket_bounds: List[float] = bucket_bounds
+        # The last bucket holds the latencies above the highest bound
+        self._bucket_counts: List[int] = [0] * (len(bucket_bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def bucket_bounds(self) -> List[float]:
+        return list(self._bucket_bounds)
+
+    @property
+    def bucket_counts(self) -> List[int]:
+        return list(self._bucket_counts)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else math.nan
+
+    @property
+    def min(self) -> float:
+        return self._min if self._count > 0 else math.nan
+
+    @property
+    def max(self) -> float:
+        return self._max if self._count > 0 else math.nan
+
+    def observe(self, latency: float):
+        self._bucket_counts[bisect_left(self._bucket_bounds, latency)] += 1
+        self._count += 1
+        self._sum += latency
+        self._min = min(self._min, latency)
+        self._max = max(self._max, latency)
+
+    def percentile(self, percent: float) -> float:
+        """
+        :param percent: the percentile to estimate, between 0 and 100
+        :return: the estimated latency, NaN if no latency has been recorded
+        """
+        if self._count == 0:
+            return math.nan
+        rank = percent / 100 * self._count
+        cumulative_count = 0
+        for i, bucket_count in enumerate(self._bucket_counts):
+            if bucket_count > 0 and cumulative_count + bucket_count >= rank:
+                lower_bound = max(self._bucket_bounds[i - 1] if i > 0 else 0.0, self._min)
+                upper_bound = min(self._bucket_bounds[i] if i < len(self._bucket_bounds) else math.inf, self._max)
+                fraction = max(rank - cumulative_count, 0) / bucket_count
+                return lower_bound + (upper_bound - lower_bound) * fraction
+            cumulative_count += bucket_count
+        return self._max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def reset(self):
+        self._bucket_counts = [0] * (len(self._bucket_bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
@@ -0,0 +1,395 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Coroutine
+from typing import Any, Callable, Dict, List, Optional
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+# The profiler collecting the metrics, None while profiling is off. The instrumented code checks it before measuring
+# anything, so the instrumentation costs a global lookup when the profiler is not running.
+active_profiler: Optional["LoopProfiler"] = None
+
+
+class TaskProfile:
+    """
+    The time spent running the steps (the code between two awaits yielding to the event loop) of the tasks of a
+    coroutine function.
+    """
+    __slots__ = ("name", "started", "finished", "steps", "busy_time", "cpu_time", "max_step_time")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = 0
+        self.finished = 0
+        self.steps = 0
+        self.busy_time = 0.0
+        self.cpu_time = 0.0
+        self.max_step_time = 0.0
+
+    @property
+    def running(self) -> int:
+        return self.started - self.finished
+
+    def record_step(self, wall_time: float, cpu_time: float):
+        self.steps += 1
+        self.busy_time += wall_time
+        self.cpu_time += cpu_time
+        if wall_time > self.max_step_time:
+            self.max_step_time = wall_time
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started": self.started,
+            "finished": self.finished,
+            "running": self.running,
+            "steps": self.steps,
+            "busy_time": self.busy_time,
+            "cpu_time": self.cpu_time,
+            "max_step_time": self.max_step_time,
+        }
+
+
+class ProfiledCoroutine(Coroutine):
+    """
+    Drives a coroutine, timing every step it runs in the event loop. It is a coroutine itself, so it can be passed to
+    `asyncio.ensure_future` and `asyncio.gather` in place of the profiled coroutine.
+    """
+    __slots__ = ("_coro", "_profile", "_done")
+
+    def __init__(self, coro, profile: TaskProfile):
+        self._coro = coro
+        self._profile = profile
+        self._done = False
+        profile.started += 1
+
+    def __await__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args):
+        return self._step(self._coro.throw, *args)
+
+    def close(self):
+        try:
+            self._coro.close()
+        finally:
+            self._finish()
+
+    def _step(self, method: Callable, *args):
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.thread_time()
+        try:
+            return method(*args)
+        except BaseException:
+            # StopIteration included, the coroutine is done
+            self._finish()
+            raise
+        finally:
+            self._profile.record_step(time.perf_counter() - start_wall_time, time.thread_time() - start_cpu_time)
+
+    def _finish(self):
+        if not self._done:
+            self._done = True
+            self._profile.finished += 1
+
+
+class LoopProfiler:
+    """
+    Opt-in instrumentation of the event loop, to find out why the bot lags under load. While it is running, the
+    profiler collects:
+
+    - the event loop lag: how late a sleeping sampler task wakes up, every `lag_sample_interval` seconds
+    - the wall and CPU time spent in the steps of the tasks created with `safe_ensure_future` and `safe_gather`, per
+      coroutine function (its qualified name)
+    - the time spent waiting for the API throttler, per rate limit id
+    - gauges, such as the size of the connector message queues, sampled with the event loop lag
+
+    The metrics can be exported as Prometheus text (to be collected by the node exporter textfile collector, for
+    example) or JSON, and written periodically to a file.
+    """
+    DEFAULT_LAG_SAMPLE_INTERVAL = 0.5
+    DEFAULT_EXPORT_INTERVAL = 10.0
+    METRIC_PREFIX = "hummingbot"
+
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["LoopProfiler"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "LoopProfiler":
+        if cls._shared_instance is None:
+            cls._shared_instance = LoopProfiler()
+        return cls._shared_instance
+
+    def __init__(self, lag_sample_interval: float = DEFAULT_LAG_SAMPLE_INTERVAL):
+        self._lag_sample_interval = lag_sample_interval
+        self._loop_lag = LatencyHistogram()
+        self._last_loop_lag = 0.0
+        self._task_profiles: Dict[str, TaskProfile] = {}
+        self._throttler_waits: Dict[str, LatencyHistogram] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+        self._gauge_values: Dict[str, float] = {}
+        self._gauge_max_values: Dict[str, float] = {}
+        self._export_file_path: Optional[str] = None
+        self._export_interval = self.DEFAULT_EXPORT_INTERVAL
+        self._last_export_time = 0.0
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._start_time = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return active_profiler is self
+
+    @property
+    def loop_lag(self) -> LatencyHistogram:
+        return self._loop_lag
+
+    @property
+    def task_profiles(self) -> Dict[str, TaskProfile]:
+        return self._task_profiles
+
+    @property
+    def throttler_waits(self) -> Dict[str, LatencyHistogram]:
+        return self._throttler_waits
+
+    @property
+    def export_file_path(self) -> Optional[str]:
+        return self._export_file_path
+
+    def start(self,
+              lag_sample_interval: Optional[float] = None,
+              export_file_path: Optional[str] = None,
+              export_interval: float = DEFAULT_EXPORT_INTERVAL):
+        """
+        Starts collecting the metrics. It is called from the event loop thread.
+
+        :param lag_sample_interval: the seconds between two event loop lag samples
+        :param export_file_path: if set, the metrics are written to this file every `export_interval` seconds, as JSON
+        if its extension is .json and as Prometheus text otherwise
+        """
+        global active_profiler
+        if lag_sample_interval is not None:
+            self._lag_sample_interval = lag_sample_interval
+        self._export_file_path = export_file_path
+        self._export_interval = export_interval
+        if self.is_running:
+            return
+        if active_profiler is not None:
+            active_profiler.stop()
+        active_profiler = self
+        self._start_time = time.time()
+        self._last_export_time = time.perf_counter()
+        # Not created with safe_ensure_future, to keep the sampler out of the task profiles
+        self._sampler_task = asyncio.ensure_future(self._sample_loop())
+
+    def stop(self):
+        global active_profiler
+        if not self.is_running:
+            return
+        active_profiler = None
+        if self._sampler_task is not None:
+            self._sampler_task.cancel()
+            self._sampler_task = None
+        if self._export_file_path is not None:
+            self._write_export_file()
+
+    def reset(self):
+        self._loop_lag.reset()
+        self._last_loop_lag = 0.0
+        self._task_profiles.clear()
+        self._throttler_waits.clear()
+        self._gauge_values.clear()
+        self._gauge_max_values.clear()
+        self._start_time = time.time()
+
+    def profile_coroutine(self, coro) -> ProfiledCoroutine:
+        name = getattr(coro, "__qualname__", None) or type(coro).__name__
+        profile = self._task_profiles.get(name)
+        if profile is None:
+            profile = TaskProfile(name)
+            self._task_profiles[name] = profile
+        return ProfiledCoroutine(coro, profile)
+
+    def observe_throttler_wait(self, limit_id: str, wait_time: float):
+        histogram = self._throttler_waits.get(limit_id)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self._throttler_waits[limit_id] = histogram
+        histogram.observe(wait_time)
+
+    def register_gauge(self, name: str, value_function: Callable[[], float]):
+        self._gauges[name] = value_function
+
+    def unregister_gauge(self, name: str):
+        self._gauges.pop(name, None)
+        self._gauge_values.pop(name, None)
+        self._gauge_max_values.pop(name, None)
+
+    def register_queue(self, name: str, queue: Optional[asyncio.Queue]):
+        if queue is not None:
+            self.register_gauge(name, queue.qsize)
+
+    def register_connector_queues(self, connector_name: str, connector: Any):
+        """
+        Registers the size of the known message queues of a connector as gauges, named after the connector name.
+        """
+        order_book_tracker = getattr(connector, "order_book_tracker", None)
+        user_stream_tracker = getattr(connector, "_user_stream_tracker", None)
+        perpetual_trading = getattr(connector, "_perpetual_trading", None)
+        queues = {
+            "order_book_diff_stream": getattr(order_book_tracker, "_order_book_diff_stream", None),
+            "order_book_snapshot_stream": getattr(order_book_tracker, "_order_book_snapshot_stream", None),
+            "order_book_trade_stream": getattr(order_book_tracker, "_order_book_trade_stream", None),
+            "user_stream": getattr(user_stream_tracker, "user_stream", None),
+            "funding_info_stream": getattr(perpetual_trading, "funding_info_stream", None),
+        }
+        for queue_name, queue in queues.items():
+            if isinstance(queue, asyncio.Queue):
+                self.register_queue(f"{connector_name}.{queue_name}", queue)
+
+    def unregister_connector_queues(self, connector_name: str):
+        for name in [name for name in self._gauges if name.startswith(f"{connector_name}.")]:
+            self.unregister_gauge(name)
+
+    def sample_gauges(self):
+        for name, value_function in list(self._gauges.items()):
+            try:
+                value = float(value_function())
+            except Exception:
+                self.logger().debug(f"Error sampling the {name} gauge, removing it.", exc_info=True)
+                self.unregister_gauge(name)
+                continue
+            self._gauge_values[name] = value
+            self._gauge_max_values[name] = max(value, self._gauge_max_values.get(name, value))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start_time": self._start_time,
+            "time": time.time(),
+            "loop_lag": {**self._loop_lag.summary(), "last": self._last_loop_lag},
+            "tasks": {name: profile.to_dict() for name, profile in sorted(self._task_profiles.items())},
+            "throttler_waits": {limit_id: histogram.summary()
+                                for limit_id, histogram in sorted(self._throttler_waits.items())},
+            "gauges": {name: {"value": value, "max": self._gauge_max_values[name]}
+                       for name, value in sorted(self._gauge_values.items())},
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self._json_safe(self.to_dict()), indent=2)
+
+    def to_prometheus_text(self) -> str:
+        prefix = self.METRIC_PREFIX
+        lines: List[str] = []
+        self._append_histogram(lines, f"{prefix}_loop_lag_seconds", "Event loop lag.", {None: self._loop_lag})
+        self._append_histogram(lines, f"{prefix}_throttler_wait_seconds", "Time waited for the API rate limits.",
+                               {("limit_id", limit_id): histogram
+                                for limit_id, histogram in sorted(self._throttler_waits.items())})
+        profiles = sorted(self._task_profiles.items())
+        task_metrics = [
+            ("tasks_started_total", "counter", "Tasks started.", lambda p: p.started),
+            ("tasks_finished_total", "counter", "Tasks finished.", lambda p: p.finished),
+            ("tasks_running", "gauge", "Tasks running.", lambda p: p.running),
+            ("task_steps_total", "counter", "Task steps run by the event loop.", lambda p: p.steps),
+            ("task_busy_seconds_total", "counter", "Wall time spent running the task steps.", lambda p: p.busy_time),
+            ("task_cpu_seconds_total", "counter", "CPU time spent running the task steps.", lambda p: p.cpu_time),
+            ("task_max_step_seconds", "gauge", "Longest task step.", lambda p: p.max_step_time),
+        ]
+        for metric_name, metric_type, description, value_function in task_metrics:
+            self._append_header(lines, f"{prefix}_{metric_name}", metric_type, description)
+            for name, profile in profiles:
+                lines.append(f"{prefix}_{metric_name}{self._labels(('task', name))} {value_function(profile)}")
+        gauges = sorted(self._gauge_values.items())
+        self._append_header(lines, f"{prefix}_queue_size", "gauge", "Queue size.")
+        for name, value in gauges:
+            lines.append(f"{prefix}_queue_size{self._labels(('queue', name))} {value}")
+        self._append_header(lines, f"{prefix}_queue_size_max", "gauge", "Largest sampled queue size.")
+        for name, _ in gauges:
+            lines.append(f"{prefix}_queue_size_max{self._labels(('queue', name))} {self._gauge_max_values[name]}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, file_path: str, export_format: Optional[str] = None):
+        """
+        Writes the metrics to a file, replacing it atomically so a collector never reads a partial file.
+
+        :param export_format: "json" or "prometheus", deduced from the file extension if not set
+        """
+        if export_format is None:
+            export_format = "json" if file_path.endswith(".json") else "prometheus"
+        content = self.to_json() if export_format == "json" else self.to_prometheus_text()
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        temp_file_path = f"{file_path}.tmp"
+        with open(temp_file_path, "w") as f:
+            f.write(content)
+        os.replace(temp_file_path, file_path)
+
+    async def _sample_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected_time = loop.time() + self._lag_sample_interval
+            await asyncio.sleep(self._lag_sample_interval)
+            self._last_loop_lag = max(0.0, loop.time() - expected_time)
+            self._loop_lag.observe(self._last_loop_lag)
+            self.sample_gauges()
+            if (self._export_file_path is not None
+                    and time.perf_counter() - self._last_export_time >= self._export_interval):
+                self._write_export_file()
+
+    def _write_export_file(self):
+        self._last_export_time = time.perf_counter()
+        try:
+            self.write(self._export_file_path)
+        except Exception:
+            self.logger().error(f"Error writing the profiling metrics to {self._export_file_path}.", exc_info=True)
+
+    @classmethod
+    def _append_header(cls, lines: List[str], name: str, metric_type: str, description: str):
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    @classmethod
+    def _append_histogram(cls, lines: List[str], name: str, description: str, histograms: Dict[Any, LatencyHistogram]):
+        cls._append_header(lines, name, "histogram", description)
+        for label, histogram in histograms.items():
+            labels = (label,) if label is not None else ()
+            cumulative_count = 0
+            bounds = [repr(bound) for bound in histogram.bucket_bounds] + ["+Inf"]
+            for bound, bucket_count in zip(bounds, histogram.bucket_counts):
+                cumulative_count += bucket_count
+                lines.append(f"{name}_bucket{cls._labels(*labels, ('le', bound))} {cumulative_count}")
+            lines.append(f"{name}_sum{cls._labels(*labels)} {histogram.sum}")
+            lines.append(f"{name}_count{cls._labels(*labels)} {histogram.count}")
+
+    @staticmethod
+    def _labels(*labels) -> str:
+        if len(labels) == 0:
+            return ""
+        escaped_labels = []
+        for key, value in labels:
+            value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            escaped_labels.append(f'{key}="{value}"')
+        return "{" + ",".join(escaped_labels) + "}"
+
+    @classmethod
+    def _json_safe(cls, value: Any) -> Any:
+        # NaN and infinity are not valid JSON
+        if isinstance(value, dict):
+            return {key: cls._json_safe(item) for key, item in value.items()}
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return value
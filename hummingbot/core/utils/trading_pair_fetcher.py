@@ -1,6 +1,11 @@
+import asyncio
+import json
 import logging
+import os
+import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from hummingbot import data_path, get_executor
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
@@ -10,6 +15,18 @@ from .async_utils import safe_ensure_future
 
 
 class TradingPairFetcher:
+    """
+    Fetches the trading pairs of the connectors, for the trading pairs autocompletion and validation.
+
+    The trading pairs are kept in a catalog file, and served from it at startup. Only the connectors without trading
+    pairs in the catalog, or with trading pairs older than `catalog_ttl` seconds, are instantiated to fetch them, at
+    most `max_concurrent_fetches` at a time. The fetcher is ready once the connectors missing from the catalog are
+    fetched, the outdated ones are refreshed in the background.
+    """
+    CATALOG_FILE_NAME = "trading_pairs_catalog.json"
+    CATALOG_TTL = 24 * 60 * 60
+    MAX_CONCURRENT_FETCHES = 8
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -26,53 +43,127 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher(client_config_map)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 catalog_ttl: float = CATALOG_TTL,
+                 max_concurrent_fetches: int = MAX_CONCURRENT_FETCHES):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.hb_config.fetch_pairs_from_all_exchanges
+        self._catalog_ttl = catalog_ttl
+        self._catalog: Dict[str, Dict[str, Any]] = {}
+        self._catalog_loaded = False
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
             self,
             connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            connector_names: Optional[List[str]] = None) -> asyncio.Task:
+        connector_names = connector_names or [connector_setting.name]
+        return safe_ensure_future(self._fetch_pairs_with_limit(connector_setting, connector_names))
 
-    async def fetch_all(self, client_config_map: ClientConfigAdapter):
-        await Security.wait_til_decryption_done()
-        connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
+    async def _fetch_pairs_with_limit(self, connector_setting: ConnectorSetting, connector_names: List[str]):
+        async with self._fetch_semaphore:
+            # The connector is only instantiated once a fetch slot is available.
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                connector = connector_setting.non_trading_connector_instance_with_default_configuration()
             except ModuleNotFoundError:
-                continue
+                return
             except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_setting.name}."
                                         "Please check the logs")
+                return
+            await self.call_fetch_pairs(connector.all_trading_pairs(), connector_setting.name, connector_names)
+
+    async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        await Security.wait_til_decryption_done()
+        if not self._catalog_loaded:
+            self._catalog = await asyncio.get_event_loop().run_in_executor(get_executor(), self._load_catalog)
+            self._catalog_loaded = True
+        connector_settings = self._all_connector_settings()
+        # The paper trade connectors get the trading pairs of the connector they are based on
+        names_by_source: Dict[str, List[str]] = {}
+        for setting_key, conn_setting in connector_settings.items():
+            if conn_setting.base_name().endswith("paper_trade"):
+                source_key = conn_setting.parent_name
+            elif not self.fetch_pairs_from_all_exchanges and not conn_setting.connector_connected():
+                continue
+            else:
+                source_key = setting_key
+            names_by_source.setdefault(source_key, []).append(conn_setting.name)
+
+        now = time.time()
+        missing_fetches = []
+        outdated_fetches = []
+        for source_key, connector_names in names_by_source.items():
+            source_setting = connector_settings.get(source_key)
+            if source_setting is None:
+                continue
+            catalog_entry = self._catalog.get(source_setting.name)
+            if catalog_entry is not None:
+                for connector_name in connector_names:
+                    self.trading_pairs[connector_name] = catalog_entry["trading_pairs"]
+                if now - catalog_entry["timestamp"] < self._catalog_ttl:
+                    continue
+            task = self._fetch_pairs_from_connector_setting(connector_setting=source_setting,
+                                                            connector_names=connector_names)
+            (outdated_fetches if catalog_entry is not None else missing_fetches).append(task)
+
+        await asyncio.gather(*missing_fetches)
         self.ready = True
+        await asyncio.gather(*outdated_fetches)
+        if missing_fetches or outdated_fetches:
+            await asyncio.get_event_loop().run_in_executor(get_executor(), self._save_catalog, dict(self._catalog))
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    async def call_fetch_pairs(self,
+                               fetch_fn: Callable[[], Awaitable[List[str]]],
+                               exchange_name: str,
+                               connector_names: Optional[List[str]] = None):
+        """
+        :param exchange_name: the connector the trading pairs are fetched from
+        :param connector_names: the connectors getting the trading pairs, defaults to the exchange_name connector
+        """
+        connector_names = connector_names or [exchange_name]
         try:
             pairs = await fetch_fn
-            self.trading_pairs[exchange_name] = pairs
+            self._catalog[exchange_name] = {"timestamp": time.time(), "trading_pairs": pairs}
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            # In case of error keep the trading pairs from the catalog or assign an empty list, this is st. the bot
+            # won't stop working
+            pairs = self._catalog.get(exchange_name, {}).get("trading_pairs", [])
+        for connector_name in connector_names:
+            self.trading_pairs[connector_name] = pairs
+
+    def _load_catalog(self) -> Dict[str, Dict[str, Any]]:
+        file_path = self._catalog_file_path()
+        if not os.path.exists(file_path):
+            return {}
+        try:
+            with open(file_path) as catalog_file:
+                return json.load(catalog_file)
+        except Exception:
+            self.logger().warning(f"Could not read the trading pairs catalog {file_path}, it will be rebuilt.",
+                                  exc_info=True)
+            return {}
+
+    def _save_catalog(self, catalog: Dict[str, Dict[str, Any]]):
+        file_path = self._catalog_file_path()
+        temp_file_path = f"{file_path}.tmp"
+        try:
+            with open(temp_file_path, "w") as catalog_file:
+                json.dump(catalog, catalog_file)
+            os.replace(temp_file_path, file_path)
+        except Exception:
+            self.logger().warning(f"Could not write the trading pairs catalog {file_path}.", exc_info=True)
+
+    def _catalog_file_path(self) -> str:
+        # Method created to enabling patching in unit tests
+        return os.path.join(data_path(), self.CATALOG_FILE_NAME)
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import StreamingIndicatorBase
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a columnar ring buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,7 +52,10 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(len(self.columns), max_records)
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_cache_version: Optional[int] = None
+        self._indicators: Dict[str, StreamingIndicatorBase] = {}
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +95,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,13 +145,80 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns a copy of the candles stored in the _candles buffer as a Pandas DataFrame.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self.cached_candles_df.copy()
+
+    @property
+    def cached_candles_df(self) -> pd.DataFrame:
+        """
+        This property returns the candles as a Pandas DataFrame that is only rebuilt when a candle is added or updated.
+        The same DataFrame is returned until then, so it must not be modified.
+        """
+        if self._candles_df_cache is None or self._candles_df_cache_version != self._candles.version:
+            self._candles_df_cache = self._build_candles_df()
+            self._candles_df_cache_version = self._candles.version
+        return self._candles_df_cache
+
+    def _build_candles_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self._candles.to_array(), columns=self.columns, dtype=float)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Returns the columns of the stored candles as read-only NumPy views, without copying them. The views are only
+        valid until the next candle is added or updated.
+        """
+        return {column: self._candles.column(i) for i, column in enumerate(self.columns)}
+
+    def get_array(self, column: str) -> np.ndarray:
+        """
+        Returns a column of the stored candles as a read-only NumPy view, see arrays().
+        """
+        return self._candles.column(self.columns.index(column))
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
 
+    @property
+    def indicators(self) -> Dict[str, StreamingIndicatorBase]:
+        return self._indicators
+
+    def add_indicator(self, indicator: StreamingIndicatorBase) -> StreamingIndicatorBase:
+        """
+        Attaches a streaming indicator to the feed. The indicator is calculated with the stored candles and then
+        updated incrementally with every new or updated candle. If an indicator with the same name is already attached,
+        that one is returned instead.
+        :param indicator: the indicator to attach
+        :return: the indicator attached to the feed
+        """
+        existing_indicator = self._indicators.get(indicator.name)
+        if existing_indicator is not None:
+            return existing_indicator
+        indicator.reset(max_records=self.max_records)
+        for candle in self._candles:
+            indicator.update(candle)
+        self._indicators[indicator.name] = indicator
+        return indicator
+
+    def get_indicator(self, name: str) -> Optional[StreamingIndicatorBase]:
+        return self._indicators.get(name)
+
+    def remove_indicator(self, name: str):
+        self._indicators.pop(name, None)
+
+    def _update_indicators(self, candle: np.ndarray, is_new: bool):
+        for indicator in self._indicators.values():
+            indicator.update(candle, is_new=is_new)
+
+    def _recalculate_indicators(self):
+        """
+        Recalculates the indicators from the stored candles. Only needed when older candles are added to the feed.
+        """
+        for indicator in self._indicators.values():
+            indicator.reset()
+            for candle in self._candles:
+                indicator.update(candle)
+
     def load_candles_from_csv(self, data_path: str):
         """
         This method loads the candles from a CSV file.
@@ -160,6 +231,7 @@ class CandlesBase(NetworkBase):
         df = pd.read_csv(file_path)
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
+        self._recalculate_indicators()
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
         candles_df = pd.DataFrame()
@@ -214,6 +286,7 @@ class CandlesBase(NetworkBase):
     def _reset_candles(self):
         self._ws_candle_available.clear()
         self._candles.clear()
+        self._recalculate_indicators()
 
     def _rest_payload(self, **kwargs) -> Optional[dict]:
         return None
@@ -321,7 +394,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -332,6 +405,7 @@ class CandlesBase(NetworkBase):
                 candles = candles[candles[:, 0] < end_time]
                 records_to_add = min(missing_records, len(candles))
                 self._candles.extendleft(candles[-records_to_add:][::-1])
+                self._recalculate_indicators()
             except asyncio.CancelledError:
                 raise
             except ValueError:
@@ -420,6 +494,7 @@ class CandlesBase(NetworkBase):
                                         parsed_message["taker_buy_quote_volume"]]).astype(float)
                 if len(self._candles) == 0:
                     self._candles.append(candles_row)
+                    self._update_indicators(candles_row, is_new=True)
                     self._ws_candle_available.set()
                     safe_ensure_future(self.fill_historical_candles())
                 else:
@@ -427,8 +502,10 @@ class CandlesBase(NetworkBase):
                     current_timestamp = int(parsed_message["timestamp"])
                     if current_timestamp > latest_timestamp:
                         self._candles.append(candles_row)
+                        self._update_indicators(candles_row, is_new=True)
                     elif current_timestamp == latest_timestamp:
                         self._candles[-1] = candles_row
+                        self._update_indicators(candles_row, is_new=False)
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         while True:
@@ -472,6 +549,7 @@ class CandlesBase(NetworkBase):
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
         self._candles.clear()
+        self._recalculate_indicators()
 
     def get_seconds_from_interval(self, interval: str) -> int:
         """
@@ -0,0 +1,118 @@
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Stores up to `maxlen` candles in a preallocated columnar NumPy array, with the subset of the `deque` interface used
+    by the candle feeds (append, appendleft, extend, extendleft, indexing, iteration and clear). Like a deque with a
+    `maxlen`, adding a candle to a full buffer discards a candle from the other end.
+
+    The array has room for twice `maxlen` candles, and the stored candles are kept contiguous in it (they are moved
+    back to the middle of the array when they reach one of its ends, which happens at most once every `maxlen`
+    additions). So every column of the stored candles is available as a view without copying anything.
+
+    `version` changes every time the candles change, so derived data can be cached until then.
+    """
+
+    def __init__(self, columns_count: int, maxlen: int):
+        self._maxlen = maxlen
+        self._data = np.full((columns_count, 2 * max(maxlen, 1)), np.nan)
+        self._start = self._end = max(maxlen, 1)
+        self._version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._data[:, self._start + self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle: Any):
+        self._data[:, self._start + self._position(index)] = candle
+        self._version += 1
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.to_array())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"CandlesBuffer({self.to_array().tolist()}, maxlen={self._maxlen})"
+
+    def append(self, candle: Any):
+        if self._maxlen == 0:
+            return
+        if self._end == self._data.shape[1]:
+            self._recenter()
+        self._data[:, self._end] = candle
+        self._end += 1
+        if len(self) > self._maxlen:
+            self._start += 1
+        self._version += 1
+
+    def appendleft(self, candle: Any):
+        if self._maxlen == 0:
+            return
+        if len(self) == self._maxlen:
+            self._end -= 1
+        if self._start == 0:
+            self._recenter()
+        self._start -= 1
+        self._data[:, self._start] = candle
+        self._version += 1
+
+    def extend(self, candles: Iterable[Any]):
+        for candle in candles:
+            self.append(candle)
+
+    def extendleft(self, candles: Iterable[Any]):
+        for candle in candles:
+            self.appendleft(candle)
+
+    def clear(self):
+        self._start = self._end = max(self._maxlen, 1)
+        self._version += 1
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        :return: a read-only view of a column of the stored candles, valid until the next change of the candles
+        """
+        view = self._data[index, self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def to_array(self, start: Optional[int] = None) -> np.ndarray:
+        """
+        :param start: index of the first candle to include, negative values count from the last candle
+        :return: a copy of the stored candles as a (candles, columns) array
+        """
+        return self._data[:, self._start:self._end][:, start:].T.copy()
+
+    def _position(self, index: int) -> int:
+        length = len(self)
+        position = index + length if index < 0 else index
+        if not 0 <= position < length:
+            raise IndexError("CandlesBuffer index out of range")
+        return position
+
+    def _recenter(self):
+        """
+        Moves the stored candles s.t. they end in the middle of the array, leaving room for at least `maxlen` candles
+        on the right and for the missing candles on the left.
+        """
+        length = len(self)
+        new_end = max(self._maxlen, 1)
+        new_start = new_end - length
+        self._data[:, new_start:new_end] = self._data[:, self._start:self._end].copy()
+        self._start, self._end = new_start, new_end
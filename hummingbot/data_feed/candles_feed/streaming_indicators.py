@@ -0,0 +1,526 @@
+import math
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Positions of the fields used by the indicators in a candle row (see CandlesBase.columns)
+HIGH_INDEX = 2
+LOW_INDEX = 3
+CLOSE_INDEX = 4
+
+NaN = float("nan")
+
+
+class _ValuesBuffer:
+    """
+    Keeps the last `max_records` rows of values of an indicator in a contiguous NumPy array, so they can be exposed as
+    a view without copying. The array has room for twice the records, and the rows are moved back to the beginning only
+    when the end is reached, which keeps the appends O(1) amortized.
+    """
+
+    def __init__(self, max_records: int, columns_count: int):
+        self._max_records = max_records
+        self._array = np.full((2 * max_records, columns_count), np.nan)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def values(self) -> np.ndarray:
+        view = self._array[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def append(self, row: Tuple[float, ...]):
+        if self._end == len(self._array):
+            kept_records = self._max_records - 1
+            self._array[:kept_records] = self._array[self._end - kept_records:self._end]
+            self._start, self._end = 0, kept_records
+        self._array[self._end] = row
+        self._end += 1
+        if self._end - self._start > self._max_records:
+            self._start += 1
+
+    def replace_last(self, row: Tuple[float, ...]):
+        self._array[self._end - 1] = row
+
+
+class _ExponentialAverage:
+    """
+    Exponential average seeded with the simple average of the first `length` values (the pandas-ta `presma` and TA-Lib
+    convention). NaN values are skipped.
+    """
+
+    def __init__(self, length: int, alpha: float):
+        self._length = length
+        self._alpha = alpha
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value = NaN
+        self._pending: Optional[Tuple[float, float]] = None
+
+    def compute(self, value: float) -> float:
+        if math.isnan(value):
+            self._pending = None
+            return NaN
+        count = self._count + 1
+        if count < self._length:
+            average = NaN
+        elif count == self._length:
+            average = (self._seed_sum + value) / self._length
+        else:
+            average = self._value + self._alpha * (value - self._value)
+        self._pending = (value, average)
+        return average
+
+    def commit(self):
+        if self._pending is None:
+            return
+        value, average = self._pending
+        self._count += 1
+        if self._count < self._length:
+            self._seed_sum += value
+        self._value = average
+        self._pending = None
+
+
+class _RollingWindow:
+    """
+    Mean and population variance of the last `length` values. The sums are kept relative to a reference value close to
+    the data to avoid the cancellation of the naive sum of squares, and are recalculated every time the window turns
+    over to discard the accumulated rounding errors.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._window = deque(maxlen=length - 1)
+        self._reference = 0.0
+        self._sum = 0.0
+        self._squares_sum = 0.0
+        self._commits_since_resync = 0
+        self._pending: Optional[float] = None
+
+    def compute(self, value: float) -> Tuple[float, float]:
+        self._pending = value
+        if len(self._window) < self._length - 1:
+            return NaN, NaN
+        deviation = value - self._reference
+        mean_deviation = (self._sum + deviation) / self._length
+        variance = (self._squares_sum + deviation * deviation) / self._length - mean_deviation * mean_deviation
+        return self._reference + mean_deviation, max(variance, 0.0)
+
+    def commit(self):
+        if self._pending is None:
+            return
+        value, self._pending = self._pending, None
+        if self._window.maxlen == 0:
+            return
+        if len(self._window) == self._window.maxlen:
+            deviation = self._window[0] - self._reference
+            self._sum -= deviation
+            self._squares_sum -= deviation * deviation
+        self._window.append(value)
+        deviation = value - self._reference
+        self._sum += deviation
+        self._squares_sum += deviation * deviation
+        self._commits_since_resync += 1
+        if self._commits_since_resync >= self._length:
+            self._resync()
+
+    def _resync(self):
+        self._reference = sum(self._window) / len(self._window)
+        deviations = [value - self._reference for value in self._window]
+        self._sum = sum(deviations)
+        self._squares_sum = sum(deviation * deviation for deviation in deviations)
+        self._commits_since_resync = 0
+
+
+class _AverageTrueRange:
+    """
+    Wilder's average of the true range, seeded with the average of the first `length` true ranges. The true range of
+    the first candle is its high - low range.
+    """
+
+    def __init__(self, length: int):
+        self._average = _ExponentialAverage(length, alpha=1 / length)
+        self._previous_close = NaN
+        self._pending_close = NaN
+
+    def compute(self, candle: np.ndarray) -> float:
+        high = float(candle[HIGH_INDEX])
+        low = float(candle[LOW_INDEX])
+        self._pending_close = float(candle[CLOSE_INDEX])
+        true_range = high - low
+        if not math.isnan(self._previous_close):
+            true_range = max(true_range, abs(high - self._previous_close), abs(low - self._previous_close))
+        return self._average.compute(true_range)
+
+    def commit(self):
+        self._average.commit()
+        self._previous_close = self._pending_close
+
+
+class StreamingIndicatorBase:
+    """
+    Base class for the indicators calculated incrementally from a candles feed.
+
+    The values of the last candle are recalculated from the state saved after the previous candle each time the candle
+    is updated, and that state is moved forward when a new candle starts. Every update is O(1), and the values of the
+    last `max_records` candles are exposed as a NumPy array view, without building a DataFrame.
+
+    Subclasses implement `name`, `columns`, `_parameters` (the constructor arguments, used by `reset`), `_compute`
+    (values for the last candle) and `_commit` (fold the last candle into the saved state).
+    """
+
+    def __init__(self, max_records: int = 150):
+        self._max_records = max_records
+        self._has_pending_candle = False
+        self._last_candle: Optional[np.ndarray] = None
+        self._values = _ValuesBuffer(max_records, len(self.columns))
+
+    @property
+    def name(self) -> str:
+        """
+        Unique name of the indicator with its parameters, used to register it in the candles feed.
+        """
+        raise NotImplementedError
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of the values calculated for each candle, following the pandas-ta naming.
+        """
+        raise NotImplementedError
+
+    @property
+    def max_records(self) -> int:
+        return self._max_records
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only array with one row per candle (oldest first) and one column per value. It is a view of the
+        indicator buffer, so it should be read again after the indicator is updated.
+        """
+        return self._values.values
+
+    @property
+    def last(self) -> Dict[str, float]:
+        """
+        Values of the last candle by column name.
+        """
+        if len(self._values) == 0:
+            return {column: NaN for column in self.columns}
+        return dict(zip(self.columns, self.values[-1].tolist()))
+
+    @property
+    def last_candle(self) -> Optional[np.ndarray]:
+        """
+        The last candle used to update the indicator.
+        """
+        return self._last_candle
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get_values(self, column: str) -> np.ndarray:
+        """
+        Returns the values of one of the indicator columns.
+
+        :param column: the column name
+        :return: read-only array with one value per candle
+        """
+        return self.values[:, self.columns.index(column)]
+
+    def update(self, candle: np.ndarray, is_new: bool = True):
+        """
+        Updates the indicator with a candle.
+
+        :param candle: the candle row, with the fields in the order of CandlesBase.columns
+        :param is_new: True if the candle starts a new interval, False if it updates the last candle
+        """
+        self._last_candle = candle
+        if is_new:
+            if self._has_pending_candle:
+                self._commit()
+            self._values.append(self._compute(candle))
+            self._has_pending_candle = True
+        elif self._has_pending_candle:
+            self._values.replace_last(self._compute(candle))
+        else:
+            self.update(candle, is_new=True)
+
+    def reset(self, max_records: Optional[int] = None):
+        """
+        Clears all the calculated values and the indicator state.
+
+        :param max_records: the new number of values to keep, if it should change
+        """
+        parameters = self._parameters()
+        if max_records is not None:
+            parameters["max_records"] = max_records
+        self.__init__(**parameters)
+
+    def _parameters(self) -> Dict:
+        raise NotImplementedError
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        raise NotImplementedError
+
+    def _commit(self):
+        raise NotImplementedError
+
+
+class SMAIndicator(StreamingIndicatorBase):
+    def __init__(self, length: int = 10, max_records: int = 150):
+        self._length = length
+        self._window = _RollingWindow(length)
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"SMA_{self._length}"
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"SMA_{self._length}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        mean, _ = self._window.compute(float(candle[CLOSE_INDEX]))
+        return (mean,)
+
+    def _commit(self):
+        self._window.commit()
+
+
+class EMAIndicator(StreamingIndicatorBase):
+    def __init__(self, length: int = 10, max_records: int = 150):
+        self._length = length
+        self._average = _ExponentialAverage(length, alpha=2 / (length + 1))
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"EMA_{self._length}"
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self._length}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        return (self._average.compute(float(candle[CLOSE_INDEX])),)
+
+    def _commit(self):
+        self._average.commit()
+
+
+class BollingerBandsIndicator(StreamingIndicatorBase):
+    """
+    Bollinger Bands over a simple moving average with the population standard deviation (ddof=0). The columns are
+    the lower, middle and upper bands, the bandwidth (in percent of the middle band) and the position of the close
+    between the bands (BBP).
+    """
+
+    def __init__(self, length: int = 20, std: float = 2.0, max_records: int = 150):
+        self._length = length
+        self._std = std
+        self._window = _RollingWindow(length)
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"BBANDS_{self._length}_{self._std}"
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._length}_{self._std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "std": self._std, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        close = float(candle[CLOSE_INDEX])
+        mid, variance = self._window.compute(close)
+        deviation = self._std * math.sqrt(variance) if not math.isnan(variance) else NaN
+        lower = mid - deviation
+        upper = mid + deviation
+        bands_range = upper - lower
+        bandwidth = 100 * bands_range / mid if mid else NaN
+        percent = (close - lower) / bands_range if bands_range else NaN
+        return lower, mid, upper, bandwidth, percent
+
+    def _commit(self):
+        self._window.commit()
+
+
+class MACDIndicator(StreamingIndicatorBase):
+    """
+    MACD line (difference between the fast and slow EMAs), histogram and signal line. The signal EMA starts with the
+    first valid MACD value.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, max_records: int = 150):
+        self._fast = fast
+        self._slow = slow
+        self._signal = signal
+        self._fast_average = _ExponentialAverage(fast, alpha=2 / (fast + 1))
+        self._slow_average = _ExponentialAverage(slow, alpha=2 / (slow + 1))
+        self._signal_average = _ExponentialAverage(signal, alpha=2 / (signal + 1))
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"MACD_{self._fast}_{self._slow}_{self._signal}"
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._fast}_{self._slow}_{self._signal}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def _parameters(self) -> Dict:
+        return {"fast": self._fast, "slow": self._slow, "signal": self._signal, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        close = float(candle[CLOSE_INDEX])
+        macd = self._fast_average.compute(close) - self._slow_average.compute(close)
+        signal = self._signal_average.compute(macd)
+        return macd, macd - signal, signal
+
+    def _commit(self):
+        self._fast_average.commit()
+        self._slow_average.commit()
+        self._signal_average.commit()
+
+
+class RSIIndicator(StreamingIndicatorBase):
+    """
+    Relative Strength Index with Wilder's smoothing of the average gains and losses.
+    """
+
+    def __init__(self, length: int = 14, max_records: int = 150):
+        self._length = length
+        self._gains_average = _ExponentialAverage(length, alpha=1 / length)
+        self._losses_average = _ExponentialAverage(length, alpha=1 / length)
+        self._previous_close = NaN
+        self._pending_close = NaN
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"RSI_{self._length}"
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self._length}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        self._pending_close = float(candle[CLOSE_INDEX])
+        change = self._pending_close - self._previous_close
+        gains = self._gains_average.compute(max(change, 0.0) if not math.isnan(change) else NaN)
+        losses = self._losses_average.compute(max(-change, 0.0) if not math.isnan(change) else NaN)
+        total = gains + losses
+        return (100 * gains / total if total else NaN,)
+
+    def _commit(self):
+        self._gains_average.commit()
+        self._losses_average.commit()
+        self._previous_close = self._pending_close
+
+
+class ATRIndicator(StreamingIndicatorBase):
+    def __init__(self, length: int = 14, max_records: int = 150):
+        self._length = length
+        self._average_true_range = _AverageTrueRange(length)
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"ATRr_{self._length}"
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"ATRr_{self._length}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        return (self._average_true_range.compute(candle),)
+
+    def _commit(self):
+        self._average_true_range.commit()
+
+
+class SuperTrendIndicator(StreamingIndicatorBase):
+    """
+    SuperTrend over the bands at `multiplier` ATRs from the (high + low) / 2 price. The columns are the trend, the
+    direction (1 or -1) and the trend split in long and short values.
+    """
+
+    def __init__(self, length: int = 7, multiplier: float = 3.0, max_records: int = 150):
+        self._length = length
+        self._multiplier = multiplier
+        self._average_true_range = _AverageTrueRange(length)
+        self._candles_count = 0
+        self._previous_lower_band = NaN
+        self._previous_upper_band = NaN
+        self._previous_direction = 1
+        self._pending: Tuple[float, float, int] = (NaN, NaN, 1)
+        super().__init__(max_records)
+
+    @property
+    def name(self) -> str:
+        return f"SUPERT_{self._length}_{self._multiplier}"
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self._length}_{self._multiplier}"
+        return [f"SUPERT_{suffix}", f"SUPERTd_{suffix}", f"SUPERTl_{suffix}", f"SUPERTs_{suffix}"]
+
+    def _parameters(self) -> Dict:
+        return {"length": self._length, "multiplier": self._multiplier, "max_records": self._max_records}
+
+    def _compute(self, candle: np.ndarray) -> Tuple[float, ...]:
+        close = float(candle[CLOSE_INDEX])
+        median_price = (float(candle[HIGH_INDEX]) + float(candle[LOW_INDEX])) / 2
+        band_width = self._multiplier * self._average_true_range.compute(candle)
+        lower_band = median_price - band_width
+        upper_band = median_price + band_width
+        if self._candles_count == 0:
+            self._pending = (lower_band, upper_band, 1)
+            return NaN, NaN, NaN, NaN
+
+        if close > self._previous_upper_band:
+            direction = 1
+        elif close < self._previous_lower_band:
+            direction = -1
+        else:
+            direction = self._previous_direction
+            if direction > 0 and lower_band < self._previous_lower_band:
+                lower_band = self._previous_lower_band
+            if direction < 0 and upper_band > self._previous_upper_band:
+                upper_band = self._previous_upper_band
+        self._pending = (lower_band, upper_band, direction)
+
+        direction_value = float(direction) if self._candles_count >= self._length else NaN
+        if direction > 0:
+            return lower_band, direction_value, lower_band, NaN
+        return upper_band, direction_value, NaN, upper_band
+
+    def _commit(self):
+        self._average_true_range.commit()
+        self._previous_lower_band, self._previous_upper_band, self._previous_direction = self._pending
+        self._candles_count += 1
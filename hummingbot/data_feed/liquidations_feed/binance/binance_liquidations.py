@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Iterable, Optional, Set
 
 from bidict import bidict
 
@@ -9,7 +9,7 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.data_feed.liquidations_feed.binance import constants as CONSTANTS
-from hummingbot.data_feed.liquidations_feed.liquidations_base import Liquidation, LiquidationsBase, LiquidationSide
+from hummingbot.data_feed.liquidations_feed.liquidations_base import LiquidationsBase, LiquidationSide
 from hummingbot.logger import HummingbotLogger
 
 
@@ -22,8 +22,11 @@ class BinancePerpetualLiquidations(LiquidationsBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int):
-        super().__init__(trading_pairs=trading_pairs, max_retention_seconds=max_retention_seconds)
+    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int,
+                 aggregation_windows: Optional[Iterable[float]] = None):
+        super().__init__(trading_pairs=trading_pairs,
+                         max_retention_seconds=max_retention_seconds,
+                         aggregation_windows=aggregation_windows)
 
     @property
     def name(self):
@@ -161,12 +164,8 @@ class BinancePerpetualLiquidations(LiquidationsBase):
                 # SELL-Side means here, that a long position was forcefully liquidated and the other way round
                 liquidation_side = LiquidationSide.LONG if side == "SELL" else LiquidationSide.SHORT
 
-                if trading_pair not in self._liquidations:
-                    self._liquidations[trading_pair] = []
-
-                self._liquidations[trading_pair].append(Liquidation(
-                    timestamp=timestamp,
-                    trading_pair=trading_pair,
-                    quantity=quantity,
-                    price=price,
-                    side=liquidation_side))
+                self._add_liquidation(trading_pair=trading_pair,
+                                      timestamp=timestamp,
+                                      quantity=quantity,
+                                      price=price,
+                                      side=liquidation_side)
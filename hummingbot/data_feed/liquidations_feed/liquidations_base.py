@@ -2,8 +2,9 @@ import asyncio
 import time
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Optional, Set
+from typing import Dict, Iterable, Optional, Set
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 from pandas import DataFrame
@@ -14,6 +15,7 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.liquidations_feed.liquidations_storage import LiquidationsStorage, LiquidationsWindowStats
 
 
 class LiquidationSide(Enum):
@@ -41,15 +43,21 @@ class LiquidationsBase(NetworkBase):
     This class serves as a base class for fetching and storing liquidation data from crypto exchanges. The storage
     is done in a time based manner - meaning an aggregation happens and you can decide how much history you wanto to keep.
     The class uses the WS Assistants for all the IO operations,
+
+    The liquidations of each trading pair are kept in a LiquidationsStorage, ordered by timestamp, which also keeps
+    the count and notional by side over the `aggregation_windows` (in seconds) up to date as liquidations come in.
     """
 
-    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int):
+    def __init__(self, trading_pairs: Set[str], max_retention_seconds: int,
+                 aggregation_windows: Optional[Iterable[float]] = None):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._max_retention_seconds = max_retention_seconds
+        self._aggregation_windows = list(aggregation_windows or [])
         self._trading_pairs = trading_pairs
-        self._liquidations = {}
+        self._liquidations: Dict[str, LiquidationsStorage] = {}
+        self._liquidations_dfs: Dict[str, tuple] = {}
         self._listen_liquidations_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._subscribed_to_channels = False
@@ -117,12 +125,8 @@ class LiquidationsBase(NetworkBase):
     def _cleanup_old_liquidations(self):
         try:
             current_time_ms = int(time.time() * 1000)
-            if self._liquidations:
-                for trading_pair, liquidations in list(self._liquidations.items()):
-                    self._liquidations[trading_pair] = [
-                        liq for liq in liquidations if
-                        current_time_ms - liq.timestamp < self._max_retention_seconds * 1000
-                    ]
+            for liquidations in self._liquidations.values():
+                liquidations.remove_older_than(current_time_ms - self._max_retention_seconds * 1000)
         except Exception:
             self.logger().exception(
                 "Unexpected error occurred when cleaning up outdated liquidations. Retrying in 1 seconds...",
@@ -133,30 +137,30 @@ class LiquidationsBase(NetworkBase):
         This method returns the liquidations stored as a Pandas DataFrame.
         If no trading_pair is specified, all liquidations are returned in a single DataFrame.
         If the specified trading_pair has no data, an empty DataFrame is returned.
+        The DataFrames are cached until new liquidations are stored or old ones are removed.
         """
-        # Dynamically retrieve column names from the Liquidation dataclass
-        column_names = [f.name for f in fields(Liquidation)]
-
-        # Check if a specific trading pair is requested
         if trading_pair:
-            # Retrieve the list of Liquidation objects for the specified trading pair
-            liquidations = self._liquidations.get(trading_pair)
-            # If no liquidations are found for the trading pair, return an empty DataFrame
-            if not liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of dataclass instances to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in liquidations])
-        else:
-            # No specific trading pair is requested, combine all pairs
-            all_liquidations = []
-            # Iterate over all trading pairs and collect their liquidations
-            for pair_liquidations in self._liquidations.values():
-                all_liquidations.extend(pair_liquidations)
-            # If no liquidations are collected, return an empty DataFrame
-            if not all_liquidations:
-                return pd.DataFrame(columns=column_names)
-            # Convert the list of all liquidations to a DataFrame
-            return pd.DataFrame([liq.__dict__ for liq in all_liquidations])
+            return self._cached_liquidations_df(trading_pair).copy()
+        # No specific trading pair is requested, combine all pairs
+        dfs = [self._cached_liquidations_df(pair) for pair, liquidations in self._liquidations.items()
+               if len(liquidations) > 0]
+        if not dfs:
+            return self._empty_liquidations_df()
+        return pd.concat(dfs, ignore_index=True)
+
+    def liquidations_stats(self, trading_pair: str, window_seconds: float,
+                           current_timestamp: Optional[int] = None) -> LiquidationsWindowStats:
+        """
+        Returns the count and the notional (quantity * price) by side of the liquidations of a trading pair over the
+        last window_seconds. This is O(1) for the aggregation windows the feed was created with.
+        :param current_timestamp: the end of the window in milliseconds, defaults to the current time
+        """
+        if current_timestamp is None:
+            current_timestamp = int(time.time() * 1000)
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None:
+            return LiquidationsWindowStats(window_seconds=window_seconds)
+        return liquidations.window_stats(window_seconds, current_timestamp)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -208,6 +212,35 @@ class LiquidationsBase(NetworkBase):
         """
         raise NotImplementedError
 
+    def _add_liquidation(self, trading_pair: str, timestamp: int, quantity: float, price: float,
+                         side: LiquidationSide):
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None:
+            liquidations = LiquidationsStorage(windows_seconds=self._aggregation_windows)
+            self._liquidations[trading_pair] = liquidations
+        liquidations.append(timestamp, quantity, price, side == LiquidationSide.LONG)
+
+    def _cached_liquidations_df(self, trading_pair: str) -> DataFrame:
+        liquidations = self._liquidations.get(trading_pair)
+        if liquidations is None or len(liquidations) == 0:
+            return self._empty_liquidations_df()
+        version, df = self._liquidations_dfs.get(trading_pair, (None, None))
+        if version != liquidations.version:
+            df = pd.DataFrame({
+                "timestamp": liquidations.timestamps.copy(),
+                "trading_pair": trading_pair,
+                "quantity": liquidations.quantities.copy(),
+                "price": liquidations.prices.copy(),
+                "side": np.where(liquidations.is_long, LiquidationSide.LONG, LiquidationSide.SHORT),
+            })
+            self._liquidations_dfs[trading_pair] = (liquidations.version, df)
+        return df
+
+    @staticmethod
+    def _empty_liquidations_df() -> DataFrame:
+        # Dynamically retrieve column names from the Liquidation dataclass
+        return pd.DataFrame(columns=[f.name for f in fields(Liquidation)])
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
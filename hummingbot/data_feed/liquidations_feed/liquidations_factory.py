@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Set, Type
+from typing import Dict, List, Optional, Set, Type
 
 from pydantic import BaseModel
 
@@ -26,10 +26,13 @@ class LiquidationsConfig(BaseModel):
                                   subscriptions will be made to all liquidations available on the exchange.
         max_retention_seconds (int): The maximum duration in seconds that liquidation data should be retained.
                                      Defaults to 60 seconds if not specified.
+        aggregation_windows (List[float]): The windows in seconds over which the liquidations count and notional by
+                                           side are kept up to date as liquidations come in.
     """
     connector: str
     trading_pairs: Optional[Set[str]] = None  # Optional, defaults to subscribing to all liquidations on that exchange
     max_retention_seconds: int = 60  # Default value set to 60 seconds
+    aggregation_windows: Optional[List[float]] = None
 
 
 class LiquidationsFactory:
@@ -54,7 +57,8 @@ class LiquidationsFactory:
         if connector_class:
             return connector_class(
                 liquidations_config.trading_pairs,
-                liquidations_config.max_retention_seconds
+                liquidations_config.max_retention_seconds,
+                liquidations_config.aggregation_windows
             )
         else:
             raise UnsupportedConnectorException(liquidations_config.connector)
@@ -0,0 +1,247 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class LiquidationsWindowStats:
+    """
+    Aggregates of the liquidations of a trading pair over a time window. The notional is quantity * price, in quote
+    asset. Long liquidations are the liquidations of long positions (sells), short liquidations the other way round.
+    """
+    window_seconds: float
+    long_count: int = 0
+    short_count: int = 0
+    long_notional: float = 0.0
+    short_notional: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self.long_count + self.short_count
+
+    @property
+    def notional(self) -> float:
+        return self.long_notional + self.short_notional
+
+
+class _WindowAggregates:
+    """
+    Running aggregates of the liquidations stored from index `start` on, all of them more recent than `cutoff`.
+    """
+    __slots__ = ("window_ms", "start", "cutoff", "long_count", "short_count", "long_notional", "short_notional")
+
+    def __init__(self, window_ms: int, start: int):
+        self.window_ms = window_ms
+        self.start = start
+        self.cutoff = -np.inf
+        self.reset()
+
+    def reset(self):
+        self.long_count = 0
+        self.short_count = 0
+        self.long_notional = 0.0
+        self.short_notional = 0.0
+
+    def add(self, is_long: bool, notional: float, sign: int = 1):
+        if is_long:
+            self.long_count += sign
+            self.long_notional += sign * notional
+        else:
+            self.short_count += sign
+            self.short_notional += sign * notional
+
+
+class LiquidationsStorage:
+    """
+    Stores the liquidations of a trading pair ordered by timestamp (in milliseconds), in columnar NumPy arrays.
+
+    The arrays are preallocated with room to spare: the oldest liquidations are removed by moving the start index
+    (found with a binary search), and the stored liquidations are only moved back to the start of the arrays, or to
+    bigger arrays, once the free room at the end is used up. So adding and expiring liquidations takes amortized
+    constant time, and the columns are available as views without copying anything.
+
+    The aggregates over the `windows_seconds` windows (ending at the most recent timestamp seen) are updated when a
+    liquidation is added, and advanced to the current time when requested. The aggregates over other windows are
+    calculated from the arrays, in O(log n) plus the liquidations in the window.
+    """
+
+    def __init__(self, windows_seconds: Iterable[float] = (), initial_capacity: int = 1024):
+        capacity = max(initial_capacity, 1)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._quantities = np.empty(capacity, dtype=np.float64)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._is_long = np.empty(capacity, dtype=np.bool_)
+        self._start = 0
+        self._end = 0
+        self._version = 0
+        self._windows: Dict[float, _WindowAggregates] = {
+            window_seconds: _WindowAggregates(int(window_seconds * 1000), 0) for window_seconds in windows_seconds
+        }
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def version(self) -> int:
+        """
+        Changes every time liquidations are added or removed, so derived data can be cached until then.
+        """
+        return self._version
+
+    @property
+    def windows_seconds(self) -> List[float]:
+        return list(self._windows)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._view(self._timestamps)
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self._view(self._quantities)
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._view(self._prices)
+
+    @property
+    def is_long(self) -> np.ndarray:
+        return self._view(self._is_long)
+
+    def append(self, timestamp: int, quantity: float, price: float, is_long: bool):
+        """
+        Adds a liquidation. Liquidations older than the most recent one are inserted at their place, which takes
+        linear time, but the exchanges send them (almost) in order.
+        """
+        if self._end == len(self._timestamps):
+            self._make_room()
+        notional = quantity * price
+        if self._end == self._start or timestamp >= self._timestamps[self._end - 1]:
+            index = self._end
+        else:
+            index = self._start + int(np.searchsorted(self.timestamps, timestamp, side="right"))
+            for column in (self._timestamps, self._quantities, self._prices, self._is_long):
+                column[index + 1:self._end + 1] = column[index:self._end]
+        self._timestamps[index] = timestamp
+        self._quantities[index] = quantity
+        self._prices[index] = price
+        self._is_long[index] = is_long
+        self._end += 1
+        self._version += 1
+
+        for window in self._windows.values():
+            if timestamp > window.cutoff:
+                window.add(is_long, notional)
+            elif index <= window.start:
+                window.start += 1
+            self._advance_window(window, timestamp - window.window_ms)
+
+    def remove_older_than(self, timestamp: int):
+        """
+        Removes the liquidations with a timestamp lower than or equal to the given timestamp.
+        """
+        new_start = self._start + int(np.searchsorted(self.timestamps, timestamp, side="right"))
+        if new_start == self._start:
+            return
+        for window in self._windows.values():
+            if window.start < new_start:
+                # Only happens for windows longer than the retention
+                self._remove_from_window(window, new_start)
+            window.cutoff = max(window.cutoff, timestamp)
+        self._start = new_start
+        if self._start == self._end:
+            self._start = self._end = 0
+            for window in self._windows.values():
+                window.start = 0
+                window.reset()
+        self._version += 1
+
+    def clear(self):
+        self.remove_older_than(np.iinfo(np.int64).max)
+
+    def window_stats(self, window_seconds: float, current_timestamp: Optional[int] = None) -> LiquidationsWindowStats:
+        """
+        :param window_seconds: the window length in seconds
+        :param current_timestamp: the end of the window in milliseconds, defaults to the most recent liquidation
+        timestamp
+        :return: the aggregates of the liquidations more recent than current_timestamp - window_seconds, up to
+        current_timestamp
+        """
+        last_timestamp = self._timestamps[self._end - 1] if len(self) > 0 else 0
+        if current_timestamp is None:
+            current_timestamp = last_timestamp
+        cutoff = current_timestamp - int(window_seconds * 1000)
+        window = self._windows.get(window_seconds)
+        if window is not None and current_timestamp >= last_timestamp and cutoff >= window.cutoff:
+            self._advance_window(window, cutoff)
+            return LiquidationsWindowStats(window_seconds=window_seconds,
+                                           long_count=window.long_count,
+                                           short_count=window.short_count,
+                                           long_notional=window.long_notional,
+                                           short_notional=window.short_notional)
+
+        start = self._start + int(np.searchsorted(self.timestamps, cutoff, side="right"))
+        end = self._start + int(np.searchsorted(self.timestamps, current_timestamp, side="right"))
+        is_long = self._is_long[start:end]
+        notionals = self._quantities[start:end] * self._prices[start:end]
+        long_count = int(np.count_nonzero(is_long))
+        return LiquidationsWindowStats(window_seconds=window_seconds,
+                                       long_count=long_count,
+                                       short_count=len(is_long) - long_count,
+                                       long_notional=float(notionals[is_long].sum()),
+                                       short_notional=float(notionals[~is_long].sum()))
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def _advance_window(self, window: _WindowAggregates, cutoff: int):
+        if cutoff <= window.cutoff:
+            return
+        window.cutoff = cutoff
+        new_start = window.start
+        while new_start < self._end and self._timestamps[new_start] <= cutoff:
+            new_start += 1
+        if new_start == window.start:
+            return
+        if new_start == self._end:
+            # Resetting the window avoids accumulating floating point errors
+            window.start = new_start
+            window.reset()
+        else:
+            self._remove_from_window(window, new_start)
+
+    def _remove_from_window(self, window: _WindowAggregates, new_start: int):
+        if new_start - window.start == 1:
+            index = window.start
+            window.add(bool(self._is_long[index]), float(self._quantities[index] * self._prices[index]), sign=-1)
+        else:
+            is_long = self._is_long[window.start:new_start]
+            notionals = self._quantities[window.start:new_start] * self._prices[window.start:new_start]
+            long_count = int(np.count_nonzero(is_long))
+            window.long_count -= long_count
+            window.short_count -= len(is_long) - long_count
+            window.long_notional -= float(notionals[is_long].sum())
+            window.short_notional -= float(notionals[~is_long].sum())
+        window.start = new_start
+
+    def _make_room(self):
+        """
+        Moves the stored liquidations to the start of the arrays, doubling their size if they are more than half full.
+        """
+        length = len(self)
+        capacity = len(self._timestamps)
+        if length > capacity // 2:
+            capacity *= 2
+        offset = self._start
+        for name in ("_timestamps", "_quantities", "_prices", "_is_long"):
+            column = getattr(self, name)
+            new_column = np.empty(capacity, dtype=column.dtype) if capacity != len(column) else column
+            new_column[:length] = column[self._start:self._end]
+            setattr(self, name, new_column)
+        self._start = 0
+        self._end = length
+        for window in self._windows.values():
+            window.start -= offset
@@ -2,16 +2,10 @@ import asyncio
 import logging
 import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
-from hummingbot.client.config.client_config_map import ClientConfigMap
-from hummingbot.client.config.config_helpers import (
-    ClientConfigAdapter,
-    api_keys_from_connector_config_map,
-    get_connector_class,
-)
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import GroupedSetDict, LazyDict, PriceType, TradeType
@@ -21,6 +15,8 @@ from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.streaming_indicators import StreamingIndicatorBase
+from hummingbot.data_feed.non_trading_connector_pool import NonTradingConnectorPool, public_api_keys
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
 
@@ -36,12 +32,16 @@ class MarketDataProvider:
 
     def __init__(self,
                  connectors: Dict[str, ConnectorBase],
-                 rates_update_interval: int = 60):
+                 rates_update_interval: int = 60,
+                 rates_update_timeout: float = 10):
         self.candles_feeds = {}  # Stores instances of candle feeds
         self.connectors = connectors  # Stores instances of connectors
         self._rates_update_task = None
         self._rates_update_interval = rates_update_interval
+        self._rates_update_timeout = rates_update_timeout
         self._rates = {}
+        self._connector_pool = NonTradingConnectorPool.get_instance()
+        self._non_trading_connectors: Dict[str, ConnectorBase] = {}
         self._rate_sources = LazyDict[str, ConnectorBase](self.get_non_trading_connector)
         self._rates_required = GroupedSetDict[str, ConnectorPair]()
         self.conn_settings = AllConnectorSettings.get_connector_settings()
@@ -54,6 +54,10 @@ class MarketDataProvider:
             self._rates_update_task = None
         self.candles_feeds.clear()
         self._rates_required.clear()
+        self._rate_sources.clear()
+        for connector_name in self._non_trading_connectors:
+            self._connector_pool.release(connector_name)
+        self._non_trading_connectors.clear()
 
     @property
     def ready(self) -> bool:
@@ -106,30 +110,11 @@ class MarketDataProvider:
                     break
 
                 rate_oracle = RateOracle.get_instance()
-                for connector, connector_pairs in self._rates_required.items():
-                    if connector == "gateway":
-                        tasks = []
-                        gateway_client = GatewayHttpClient.get_instance()
-                        for connector_pair in connector_pairs:
-                            connector, chain, network = connector_pair.connector_name.split("_")
-                            base, quote = connector_pair.trading_pair.split("-")
-                            tasks.append(
-                                gateway_client.get_price(
-                                    chain=chain, network=network, connector=connector,
-                                    base_asset=base, quote_asset=quote, amount=Decimal("1"),
-                                    side=TradeType.BUY))
-                        try:
-                            results = await asyncio.gather(*tasks)
-                            for connector_pair, rate in zip(connector_pairs, results):
-                                rate_oracle.set_price(connector_pair.trading_pair, Decimal(rate["price"]))
-                        except Exception as e:
-                            self.logger().error(f"Error fetching prices from {connector_pairs}: {e}", exc_info=True)
-                    else:
-                        connector_instance = self._rate_sources[connector]
-                        prices = await self._safe_get_last_traded_prices(connector_instance,
-                                                                         [pair.trading_pair for pair in connector_pairs])
-                        for pair, rate in prices.items():
-                            rate_oracle.set_price(pair, rate)
+                # The rates of every connector are updated concurrently, a slow connector only delays its own rates
+                await asyncio.gather(*[
+                    self._update_connector_rates(connector, connector_pairs, rate_oracle)
+                    for connector, connector_pairs in list(self._rates_required.items())
+                ])
 
                 await asyncio.sleep(self._rates_update_interval)
         except asyncio.CancelledError:
@@ -137,6 +122,37 @@ class MarketDataProvider:
         finally:
             self._rates_update_task = None
 
+    async def _update_connector_rates(self, connector: str, connector_pairs: Set[ConnectorPair],
+                                      rate_oracle: RateOracle):
+        if connector == "gateway":
+            tasks = []
+            gateway_client = GatewayHttpClient.get_instance()
+            for connector_pair in connector_pairs:
+                connector, chain, network = connector_pair.connector_name.split("_")
+                base, quote = connector_pair.trading_pair.split("-")
+                tasks.append(
+                    gateway_client.get_price(
+                        chain=chain, network=network, connector=connector,
+                        base_asset=base, quote_asset=quote, amount=Decimal("1"),
+                        side=TradeType.BUY))
+            try:
+                results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=self._rates_update_timeout)
+                for connector_pair, rate in zip(connector_pairs, results):
+                    rate_oracle.set_price(connector_pair.trading_pair, Decimal(rate["price"]))
+            except Exception as e:
+                self.logger().error(f"Error fetching prices from {connector_pairs}: {e}", exc_info=True)
+        else:
+            try:
+                connector_instance = self._rate_sources[connector]
+            except Exception as e:
+                self.logger().error(f"Error creating the rate source {connector}: {e}")
+                return
+            prices = await self._safe_get_last_traded_prices(connector_instance,
+                                                             [pair.trading_pair for pair in connector_pairs],
+                                                             timeout=self._rates_update_timeout)
+            for pair, rate in prices.items():
+                rate_oracle.set_price(pair, rate)
+
     def initialize_candles_feed(self, config: CandlesConfig):
         """
         Initializes a candle feed based on the given configuration.
@@ -209,30 +225,21 @@ class MarketDataProvider:
         return connector
 
     def get_non_trading_connector(self, connector_name: str):
-        conn_setting = self.conn_settings.get(connector_name)
-        if conn_setting is None:
-            self.logger().error(f"Connector {connector_name} not found")
-            raise ValueError(f"Connector {connector_name} not found")
-
-        client_config_map = ClientConfigAdapter(ClientConfigMap())
-        init_params = conn_setting.conn_init_parameters(
-            trading_pairs=[],
-            trading_required=False,
-            api_keys=self.get_connector_config_map(connector_name),
-            client_config_map=client_config_map,
-        )
-        connector_class = get_connector_class(connector_name)
-        connector = connector_class(**init_params)
+        """
+        Retrieves a connector for public market data, shared with the other market data providers. It is released when
+        the provider stops.
+        :param connector_name: str
+        :return: ConnectorBase
+        """
+        connector = self._non_trading_connectors.get(connector_name)
+        if connector is None:
+            connector = self._connector_pool.acquire(connector_name)
+            self._non_trading_connectors[connector_name] = connector
         return connector
 
     @staticmethod
     def get_connector_config_map(connector_name: str):
-        connector_config = AllConnectorSettings.get_connector_config_keys(connector_name)
-        if getattr(connector_config, "use_auth_for_public_endpoints", False):
-            api_keys = api_keys_from_connector_config_map(ClientConfigAdapter(connector_config))
-        else:
-            api_keys = {key: "" for key in connector_config.__class__.model_fields.keys() if key != "connector"}
-        return api_keys
+        return public_api_keys(connector_name)
 
     def get_balance(self, connector_name: str, asset: str):
         connector = self.get_connector(connector_name)
@@ -269,6 +276,16 @@ class MarketDataProvider:
         connector = self.get_connector(connector_name)
         return connector.get_funding_info(trading_pair)
 
+    def get_funding_rate_history(self, connector_name: str, trading_pair: str):
+        """
+        Retrieves the funding rates received for a trading pair from the specified connector, oldest first.
+        :param connector_name: str
+        :param trading_pair: str
+        :return: List of funding rate records.
+        """
+        connector = self.get_connector(connector_name)
+        return connector.get_funding_rate_history(trading_pair)
+
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
         """
         Retrieves the candles for a trading pair from the specified connector.
@@ -284,7 +301,27 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
-        return candles.candles_df.iloc[-max_records:]
+        return candles.cached_candles_df.iloc[-max_records:].copy()
+
+    def get_candles_indicator(self, connector_name: str, trading_pair: str, interval: str,
+                              indicator: StreamingIndicatorBase, max_records: int = 500) -> StreamingIndicatorBase:
+        """
+        Retrieves a streaming indicator attached to the candles feed, attaching it first if needed. The indicator is
+        updated incrementally by the feed, so reading its values does not rebuild the candles dataframe.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param indicator: StreamingIndicatorBase
+        :param max_records: int
+        :return: The indicator attached to the candles feed.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.add_indicator(indicator)
 
     def get_trading_pairs(self, connector_name: str):
         """
@@ -406,7 +443,8 @@ class MarketDataProvider:
 
     async def _safe_get_last_traded_prices(self, connector, trading_pairs, timeout=5):
         try:
-            last_traded = await connector.get_last_traded_prices(trading_pairs=trading_pairs)
+            last_traded = await asyncio.wait_for(connector.get_last_traded_prices(trading_pairs=trading_pairs),
+                                                 timeout=timeout)
             return {pair: Decimal(rate) for pair, rate in last_traded.items()}
         except Exception as e:
             logging.error(
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Optional, Set
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    api_keys_from_connector_config_map,
+    get_connector_class,
+)
+from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+def public_api_keys(connector_name: str) -> Dict[str, str]:
+    """
+    :return: the api keys a non trading connector is initialized with, empty unless the connector requires
+    authentication for its public endpoints
+    """
+    connector_config = AllConnectorSettings.get_connector_config_keys(connector_name)
+    if getattr(connector_config, "use_auth_for_public_endpoints", False):
+        api_keys = api_keys_from_connector_config_map(ClientConfigAdapter(connector_config))
+    else:
+        api_keys = {key: "" for key in connector_config.__class__.model_fields.keys() if key != "connector"}
+    return api_keys
+
+
+class NonTradingConnectorPool:
+    """
+    Shares the non trading connectors (connectors used only for public market data) between their users, keyed by
+    connector name.
+
+    A connector is created on its first `acquire`, and its network is only started if a user requires it. Every
+    `acquire` has to be matched by a `release`: once a connector has no users left for `idle_timeout` seconds its
+    network is stopped and it is removed from the pool.
+    """
+    DEFAULT_IDLE_TIMEOUT = 300.0
+
+    _shared_instance: Optional["NonTradingConnectorPool"] = None
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "NonTradingConnectorPool":
+        if cls._shared_instance is None:
+            cls._shared_instance = NonTradingConnectorPool()
+        return cls._shared_instance
+
+    def __init__(self,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 connector_factory: Optional[Callable[[str], ConnectorBase]] = None):
+        self._idle_timeout = idle_timeout
+        self._connector_factory = connector_factory or self._create_connector
+        self._client_config_map: Optional[ClientConfigAdapter] = None
+        self._connectors: Dict[str, ConnectorBase] = {}
+        self._reference_counts: Dict[str, int] = {}
+        self._idle_since: Dict[str, float] = {}
+        self._started: Set[str] = set()
+
+    @property
+    def connector_names(self) -> Set[str]:
+        return set(self._connectors)
+
+    def reference_count(self, connector_name: str) -> int:
+        return self._reference_counts.get(connector_name, 0)
+
+    def acquire(self, connector_name: str, start_network: bool = False) -> ConnectorBase:
+        """
+        Returns the pooled connector for the connector name, creating it if needed.
+        :param start_network: if the connector network should be started (if it isn't already), required to use its
+        order books
+        :raises ValueError: if there is no connector with that name
+        """
+        self.close_idle_connectors()
+        connector = self._connectors.get(connector_name)
+        if connector is None:
+            connector = self._connector_factory(connector_name)
+            self._connectors[connector_name] = connector
+        self._reference_counts[connector_name] = self._reference_counts.get(connector_name, 0) + 1
+        self._idle_since.pop(connector_name, None)
+        if start_network and connector_name not in self._started:
+            self._started.add(connector_name)
+            safe_ensure_future(connector.start_network())
+        return connector
+
+    def release(self, connector_name: str):
+        """
+        Releases a connector returned by `acquire`. It is closed after `idle_timeout` seconds without users.
+        """
+        reference_count = self._reference_counts.get(connector_name, 0)
+        if reference_count == 0:
+            return
+        if reference_count > 1:
+            self._reference_counts[connector_name] = reference_count - 1
+            return
+        self._reference_counts[connector_name] = 0
+        self._idle_since[connector_name] = time.time()
+        try:
+            asyncio.get_running_loop().call_later(self._idle_timeout, self.close_idle_connectors)
+        except RuntimeError:
+            # Without a running event loop the idle connectors are closed on the next acquire
+            pass
+
+    def close_idle_connectors(self, force: bool = False):
+        """
+        Closes the connectors without users for at least `idle_timeout` seconds.
+        :param force: closes all the connectors without users, whatever the time they have been idle
+        """
+        now = time.time()
+        for connector_name, idle_since in list(self._idle_since.items()):
+            if force or now - idle_since >= self._idle_timeout:
+                self._close(connector_name)
+
+    def _close(self, connector_name: str):
+        connector = self._connectors.pop(connector_name)
+        del self._reference_counts[connector_name]
+        del self._idle_since[connector_name]
+        if connector_name in self._started:
+            self._started.discard(connector_name)
+            safe_ensure_future(connector.stop_network())
+
+    def _create_connector(self, connector_name: str) -> ConnectorBase:
+        conn_setting = AllConnectorSettings.get_connector_settings().get(connector_name)
+        if conn_setting is None:
+            self.logger().error(f"Connector {connector_name} not found")
+            raise ValueError(f"Connector {connector_name} not found")
+
+        if self._client_config_map is None:
+            self._client_config_map = ClientConfigAdapter(ClientConfigMap())
+        init_params = conn_setting.conn_init_parameters(
+            trading_pairs=[],
+            trading_required=False,
+            api_keys=public_api_keys(connector_name),
+            client_config_map=self._client_config_map,
+        )
+        connector_class = get_connector_class(connector_name)
+        return connector_class(**init_params)
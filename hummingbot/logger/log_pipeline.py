@@ -0,0 +1,378 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from hummingbot.logger import NETWORK, log_encoder
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_SAMPLE_THRESHOLD = 0.8
+DEFAULT_SAMPLE_RATE = 10
+DEFAULT_PRESERVE_LEVEL = logging.ERROR
+DEFAULT_DUPLICATE_INTERVAL = 10.0
+DEFAULT_DUPLICATE_BURST = 5
+
+_log_pipeline: Optional["LogPipeline"] = None
+_atexit_registered = False
+
+
+def _level_number(level: Union[int, str]) -> int:
+    if isinstance(level, int):
+        return level
+    level_number = logging.getLevelName(level.upper())
+    if not isinstance(level_number, int):
+        raise ValueError(f"Unknown log level {level}.")
+    return level_number
+
+
+class DuplicateMessageFilter(logging.Filter):
+    """
+    Rate limits the duplicate messages of a call site: only `burst` records with the same message, logged from the
+    same line at the same level, pass every `interval` seconds. `check` tells how many were suppressed before the first
+    record passing again, the filter never changes the records.
+
+    The records below `min_level` (the event and metric logs, the debug logs) and the records at or above `max_level`
+    (the errors) are never filtered.
+    """
+    MAX_TRACKED_MESSAGES = 10000
+
+    def __init__(self,
+                 interval: float = DEFAULT_DUPLICATE_INTERVAL,
+                 burst: int = DEFAULT_DUPLICATE_BURST,
+                 min_level: Union[int, str] = NETWORK,
+                 max_level: Union[int, str] = DEFAULT_PRESERVE_LEVEL):
+        super().__init__()
+        self._interval = interval
+        self._burst = burst
+        self._min_level = _level_number(min_level)
+        self._max_level = _level_number(max_level)
+        # Message key -> [window start time, records passed in the window, records suppressed in the window]
+        self._messages: Dict[Tuple, List] = {}
+        self._lock = threading.Lock()
+        self.suppressed_count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        passes, _ = self.check(record)
+        return passes
+
+    def check(self, record: logging.LogRecord) -> Tuple[bool, int]:
+        """
+        :return: whether the record passes, and the number of its duplicates suppressed since the last one passing
+        """
+        if record.levelno < self._min_level or record.levelno >= self._max_level:
+            return True, 0
+        message = record.getMessage()
+        key = (record.pathname, record.lineno, record.levelno, message)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._messages.get(key)
+            if entry is None or now - entry[0] >= self._interval:
+                suppressed = entry[2] if entry is not None else 0
+                if len(self._messages) >= self.MAX_TRACKED_MESSAGES:
+                    self._purge(now)
+                self._messages[key] = [now, 1, 0]
+                return True, suppressed
+            if entry[1] < self._burst:
+                entry[1] += 1
+                return True, 0
+            entry[2] += 1
+            self.suppressed_count += 1
+            return False, 0
+
+    def _purge(self, now: float):
+        self._messages = {key: entry for key, entry in self._messages.items() if now - entry[0] < self._interval}
+        if len(self._messages) >= self.MAX_TRACKED_MESSAGES:
+            self._messages.clear()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats the records as JSON objects, one per line. The structured records (event logs) keep their dict message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        dict_msg = record.__dict__.get("dict_msg")
+        if isinstance(dict_msg, dict):
+            entry["message"] = dict_msg
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=log_encoder)
+
+
+class LogPipelineHandler(QueueHandler):
+    """
+    Replaces the handlers of a logger: the records are queued with the replaced handlers, to be handled by them in the
+    pipeline listener thread. The duplicate messages are rate limited by `duplicate_filter`.
+    """
+
+    def __init__(self,
+                 pipeline: "LogPipeline",
+                 handlers: Sequence[logging.Handler],
+                 duplicate_filter: Optional[DuplicateMessageFilter] = None):
+        super().__init__(pipeline.queue)
+        self._pipeline = pipeline
+        self._duplicate_filter = duplicate_filter
+        self.handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if self._duplicate_filter is not None:
+            passes, suppressed = self._duplicate_filter.check(record)
+            if not passes:
+                return False
+            if suppressed > 0:
+                # The record is shared with the other handlers of the logger and of its parents, a copy is annotated
+                record = copy.copy(record)
+                record.msg = f"{record.getMessage()} ({suppressed} duplicate messages suppressed)"
+                record.args = None
+        return super().handle(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the message of a copy is merged (its arguments could change later), like QueueHandler. Unlike it, the
+        # record is not formatted, and the exception traceback is formatted by the handlers in the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self._pipeline.enqueue(record, self.handlers)
+
+
+class LogPipelineListener(QueueListener):
+    """
+    Handles every queued record with the handlers it was queued with.
+    """
+
+    def handle(self, item: Tuple[logging.LogRecord, Tuple[logging.Handler, ...]]):
+        record, handlers = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self):
+        # Waits for room in the bounded queue, the sentinel can't be dropped
+        self.queue.put(self._sentinel)
+
+
+class LogPipeline:
+    """
+    Moves the formatting and writing of the log records out of the logging thread (the event loop): the handlers of
+    the loggers are replaced with a LogPipelineHandler queuing the records in a bounded queue, and the replaced
+    handlers handle them in a listener thread.
+
+    Under overload the pipeline sheds the records below `preserve_level`: once the queue is `sample_threshold` full,
+    only one out of `sample_rate` of them is queued, and they are dropped when the queue is full. The records at or
+    above `preserve_level` replace the oldest queued record when the queue is full. The number of records lost is
+    logged once the queue has room again.
+    """
+
+    def __init__(self,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 sample_threshold: float = DEFAULT_SAMPLE_THRESHOLD,
+                 sample_rate: int = DEFAULT_SAMPLE_RATE,
+                 preserve_level: Union[int, str] = DEFAULT_PRESERVE_LEVEL,
+                 duplicate_interval: Optional[float] = DEFAULT_DUPLICATE_INTERVAL,
+                 duplicate_burst: int = DEFAULT_DUPLICATE_BURST,
+                 duplicate_min_level: Union[int, str] = NETWORK):
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._queue_size = queue_size
+        self._sample_size = max(1, int(queue_size * sample_threshold))
+        self._sample_rate = max(1, sample_rate)
+        self._preserve_level = _level_number(preserve_level)
+        self._duplicate_filter: Optional[DuplicateMessageFilter] = (
+            DuplicateMessageFilter(duplicate_interval, duplicate_burst, duplicate_min_level, self._preserve_level)
+            if duplicate_interval else None
+        )
+        self._listener = LogPipelineListener(self._queue, respect_handler_level=True)
+        self._handlers: Dict[str, LogPipelineHandler] = {}
+        self._lock = threading.Lock()
+        self._sample_counter = 0
+        self._lost_count = 0
+        self.dropped_count = 0
+        self.sampled_out_count = 0
+
+    @property
+    def queue(self) -> queue.Queue:
+        return self._queue
+
+    @property
+    def suppressed_count(self) -> int:
+        return self._duplicate_filter.suppressed_count if self._duplicate_filter is not None else 0
+
+    def start(self):
+        self._listener.start()
+
+    def stop(self):
+        """
+        Handles the queued records and stops the listener thread.
+        """
+        if self._listener._thread is not None:
+            self._listener.stop()
+
+    def attach(self, logger: logging.Logger):
+        """
+        Moves the handlers of the logger to the pipeline.
+        """
+        if len(logger.handlers) == 0 or self.pipeline_handler(logger) is not None:
+            return
+        handler = LogPipelineHandler(self, logger.handlers, self._duplicate_filter)
+        for replaced_handler in list(logger.handlers):
+            logger.removeHandler(replaced_handler)
+        logger.addHandler(handler)
+        self._handlers[logger.name] = handler
+
+    def detach(self, logger: logging.Logger):
+        """
+        Puts back the handlers of the logger.
+        """
+        handler = self._handlers.pop(logger.name, None)
+        if handler is not None:
+            logger.removeHandler(handler)
+            for replaced_handler in handler.handlers:
+                logger.addHandler(replaced_handler)
+
+    def pipeline_handler(self, logger: logging.Logger) -> Optional[LogPipelineHandler]:
+        handler = self._handlers.get(logger.name)
+        return handler if handler is not None and handler in logger.handlers else None
+
+    def add_handler(self, logger: logging.Logger, handler: logging.Handler):
+        """
+        Adds a handler to a logger, run in the listener thread if the logger handlers are in the pipeline.
+        """
+        pipeline_handler = self.pipeline_handler(logger)
+        if pipeline_handler is None:
+            logger.addHandler(handler)
+        elif handler not in pipeline_handler.handlers:
+            pipeline_handler.handlers = pipeline_handler.handlers + (handler,)
+
+    def remove_handler(self, logger: logging.Logger, handler: logging.Handler):
+        pipeline_handler = self.pipeline_handler(logger)
+        if pipeline_handler is not None:
+            pipeline_handler.handlers = tuple(h for h in pipeline_handler.handlers if h is not handler)
+        logger.removeHandler(handler)
+
+    def enqueue(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...]):
+        preserved = record.levelno >= self._preserve_level
+        with self._lock:
+            queued_count = self._queue.qsize()
+            if not preserved and queued_count >= self._sample_size:
+                self._sample_counter += 1
+                if self._sample_counter % self._sample_rate != 0:
+                    self.sampled_out_count += 1
+                    self._lost_count += 1
+                    return
+            if self._lost_count > 0 and queued_count < self._sample_size:
+                self._put(self._lost_records_record(), handlers, False)
+            self._put(record, handlers, preserved)
+
+    def _put(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...], preserved: bool):
+        try:
+            self._queue.put_nowait((record, handlers))
+            return
+        except queue.Full:
+            pass
+        if preserved:
+            try:
+                self._queue.get_nowait()
+                self.dropped_count += 1
+                self._lost_count += 1
+                self._queue.put_nowait((record, handlers))
+                return
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped_count += 1
+        self._lost_count += 1
+
+    def _lost_records_record(self) -> logging.LogRecord:
+        record = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"{self._lost_count} log records were dropped, the logging queue was overloaded.",
+            args=None,
+            exc_info=None,
+        )
+        self._lost_count = 0
+        return record
+
+
+def install_log_pipeline(settings: Optional[Dict[str, Any]] = None,
+                         logger_names: Optional[Sequence[str]] = None) -> Optional[LogPipeline]:
+    """
+    Moves the handlers of the root logger and of the named loggers to a new log pipeline, stopping the current one.
+
+    :param settings: the `async_logging` section of the logging configuration (LogPipeline arguments, and `enabled`)
+    :return: the log pipeline, None unless it is enabled in the settings
+    """
+    global _log_pipeline, _atexit_registered
+    shutdown_log_pipeline()
+    settings = dict(settings or {})
+    if not settings.pop("enabled", False):
+        return None
+    pipeline = LogPipeline(**settings)
+    pipeline.attach(logging.getLogger())
+    for logger_name in logger_names or []:
+        pipeline.attach(logging.getLogger(logger_name))
+    pipeline.start()
+    _log_pipeline = pipeline
+    if not _atexit_registered:
+        atexit.register(shutdown_log_pipeline)
+        _atexit_registered = True
+    return pipeline
+
+
+def get_log_pipeline() -> Optional[LogPipeline]:
+    return _log_pipeline
+
+
+def shutdown_log_pipeline():
+    """
+    Handles the queued records and puts back the handlers of the loggers.
+    """
+    global _log_pipeline
+    pipeline = _log_pipeline
+    if pipeline is None:
+        return
+    _log_pipeline = None
+    pipeline.stop()
+    for logger_name in list(pipeline._handlers):
+        pipeline.detach(logging.getLogger(logger_name) if logger_name != "root" else logging.getLogger())
+
+
+def add_log_handler(logger: logging.Logger, handler: logging.Handler):
+    """
+    Adds a handler to a logger, through the log pipeline if there is one.
+    """
+    if _log_pipeline is not None:
+        _log_pipeline.add_handler(logger, handler)
+    else:
+        logger.addHandler(handler)
+
+
+def remove_log_handler(logger: logging.Logger, handler: logging.Handler):
+    if _log_pipeline is not None:
+        _log_pipeline.remove_handler(logger, handler)
+    else:
+        logger.removeHandler(handler)
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import logging
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Type
+
+import msgpack
+from commlib.node import Node, NodeState
+from commlib.serializer import Serializer
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+BATCH_ENCODINGS = ("msgpack", "zlib_json")
+BATCH_TOPIC_SUFFIX = "/batch/{encoding}"
+
+bp_logger = None
+
+
+def encode_batch(messages: List[Dict[str, Any]], encoding: str) -> bytes:
+    """
+    :param encoding: "msgpack" for a MessagePack array of the messages, or "zlib_json" for a zlib compressed JSON
+    array of the messages
+    """
+    if encoding == "msgpack":
+        return msgpack.packb(messages, use_bin_type=True, default=str)
+    elif encoding == "zlib_json":
+        return zlib.compress(json.dumps(messages, default=str, separators=(",", ":")).encode())
+    raise ValueError(f"Invalid batch encoding {encoding}, it should be one of {BATCH_ENCODINGS}.")
+
+
+def decode_batch(payload: bytes, encoding: str) -> List[Dict[str, Any]]:
+    if encoding == "msgpack":
+        return msgpack.unpackb(payload, raw=False)
+    elif encoding == "zlib_json":
+        return json.loads(zlib.decompress(payload))
+    raise ValueError(f"Invalid batch encoding {encoding}, it should be one of {BATCH_ENCODINGS}.")
+
+
+class BatchSerializer(Serializer):
+    """
+    Encodes the batches, published as {"messages": [...]}, in the payload of the batch encoding.
+    """
+    ENCODING: str = "msgpack"
+    CONTENT_TYPE: str = "application/octet-stream"
+    CONTENT_ENCODING: str = "binary"
+
+    @classmethod
+    def serialize(cls, data: Dict[str, Any]) -> bytes:
+        return encode_batch(data["messages"], cls.ENCODING)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Dict[str, Any]:
+        return {"messages": decode_batch(data, cls.ENCODING)}
+
+
+class MsgpackBatchSerializer(BatchSerializer):
+    ENCODING: str = "msgpack"
+
+
+class ZlibJSONBatchSerializer(BatchSerializer):
+    ENCODING: str = "zlib_json"
+
+
+BATCH_SERIALIZERS: Dict[str, Type[BatchSerializer]] = {
+    "msgpack": MsgpackBatchSerializer,
+    "zlib_json": ZlibJSONBatchSerializer,
+}
+
+
+class MQTTBatchPublisher:
+    """
+    Aggregates the messages of a topic and publishes them in batches on the `<topic>/batch/<encoding>` topic, from a
+    background task. A batch is published once it has `max_batch_size` messages, or `max_batch_interval` seconds after
+    its first message.
+
+    The messages wait in a queue of `max_queue_size` messages. While the broker connection is down, the batches are
+    held and the queue fills up: `publish` then drops the new messages, and `put` waits for room in the queue.
+    """
+    DEFAULT_MAX_BATCH_SIZE = 100
+    DEFAULT_MAX_BATCH_INTERVAL = 0.1
+    DEFAULT_MAX_QUEUE_SIZE = 10000
+    RECONNECT_CHECK_INTERVAL = 0.5
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global bp_logger
+        if bp_logger is None:
+            bp_logger = logging.getLogger(__name__)
+        return bp_logger
+
+    def __init__(self,
+                 node: Node,
+                 topic: str,
+                 ev_loop: asyncio.AbstractEventLoop,
+                 encoding: str = "msgpack",
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_batch_interval: float = DEFAULT_MAX_BATCH_INTERVAL,
+                 max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        if encoding not in BATCH_ENCODINGS:
+            raise ValueError(f"Invalid batch encoding {encoding}, it should be one of {BATCH_ENCODINGS}.")
+        self._node = node
+        self._ev_loop = ev_loop
+        self._encoding = encoding
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_batch_interval = max_batch_interval
+        self._topic = f"{topic}{BATCH_TOPIC_SUFFIX.format(encoding=encoding)}"
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_full = asyncio.Event()
+        # The batch taken from the queue by the publishing task, not published yet
+        self._pending_batch: List[Dict[str, Any]] = []
+        self._publish_task: Optional[asyncio.Task] = None
+        self._publisher = self._node.create_publisher(topic=self._topic,
+                                                      msg_type=None,
+                                                      serializer=BATCH_SERIALIZERS[encoding])
+        self.published_batch_count = 0
+        self.published_message_count = 0
+        self.dropped_message_count = 0
+
+    @property
+    def topic(self) -> str:
+        return self._topic
+
+    @property
+    def encoding(self) -> str:
+        return self._encoding
+
+    @property
+    def publisher(self):
+        return self._publisher
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self.start)
+            return
+        if self._node.state == NodeState.RUNNING:
+            self._publisher.run()
+        if self._publish_task is None:
+            self._publish_task = safe_ensure_future(self._publish_loop(), loop=self._ev_loop)
+
+    def stop(self):
+        """
+        Publishes the queued messages (if the broker connection is up) and stops the background task.
+        """
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self.stop)
+            return
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+        batch, self._pending_batch = self._pending_batch, []
+        while len(batch) > 0 or not self._queue.empty():
+            batch = self._next_batch(batch)
+            if not self._is_connected():
+                self.dropped_message_count += len(batch) + self._queue.qsize()
+                self._clear_queue()
+                break
+            self._publish_batch(batch)
+            batch = []
+
+    def publish(self, message: Dict[str, Any]) -> bool:
+        """
+        Queues a message without waiting, it can be called from any thread.
+
+        :return: False if the message was dropped since the queue is full
+        """
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self.publish, message)
+            return True
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped_message_count += 1
+            return False
+        if self._queue.qsize() >= self._max_batch_size:
+            self._batch_full.set()
+        return True
+
+    async def put(self, message: Dict[str, Any]):
+        """
+        Queues a message, waiting for room in the queue.
+        """
+        await self._queue.put(message)
+        if self._queue.qsize() >= self._max_batch_size:
+            self._batch_full.set()
+
+    async def _publish_loop(self):
+        while True:
+            try:
+                self._pending_batch = [await self._queue.get()]
+                if self._queue.qsize() + 1 < self._max_batch_size:
+                    self._batch_full.clear()
+                    try:
+                        await asyncio.wait_for(self._batch_full.wait(), self._max_batch_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._next_batch(self._pending_batch)
+                while not self._is_connected():
+                    await asyncio.sleep(self.RECONNECT_CHECK_INTERVAL)
+                batch, self._pending_batch = self._pending_batch, []
+                self._publish_batch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Unexpected error publishing the {self._topic} batch.", exc_info=True)
+
+    def _next_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        while len(batch) < self._max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    def _publish_batch(self, batch: List[Dict[str, Any]]):
+        self._publisher.publish({"messages": batch})
+        self.published_batch_count += 1
+        self.published_message_count += len(batch)
+
+    def _is_connected(self) -> bool:
+        # The MQTT gateway monitors the health of its broker connections, and restarts when they are down
+        return self._node.state == NodeState.RUNNING and getattr(self._node, "health", True)
+
+    def _clear_queue(self):
+        while not self._queue.empty():
+            self._queue.get_nowait()
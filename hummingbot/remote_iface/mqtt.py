@@ -16,6 +16,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.logger import HummingbotLogger
+from hummingbot.logger.log_pipeline import add_log_handler, remove_log_handler
 
 if TYPE_CHECKING:  # pragma: no cover
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -30,6 +31,7 @@ from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
 from hummingbot.notifier.notifier_base import NotifierBase
+from hummingbot.remote_iface.batch_publisher import MQTTBatchPublisher
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
     BalanceLimitCommandMessage,
@@ -50,6 +52,23 @@ from hummingbot.remote_iface.messages import (
 mqtts_logger: HummingbotLogger = None
 
 
+def create_batch_publisher(hb_app: "HummingbotApplication", node: Node, topic: str) -> Optional[MQTTBatchPublisher]:
+    """
+    Creates the batch publisher of a topic if batching is enabled in the mqtt_bridge configuration.
+    """
+    mqtt_conf = hb_app.client_config_map.mqtt_bridge
+    if not mqtt_conf.mqtt_batching:
+        return None
+    return MQTTBatchPublisher(
+        node=node,
+        topic=topic,
+        ev_loop=hb_app.ev_loop,
+        encoding=mqtt_conf.mqtt_batch_encoding,
+        max_batch_size=mqtt_conf.mqtt_batch_max_size,
+        max_batch_interval=mqtt_conf.mqtt_batch_interval,
+    )
+
+
 class CommandTopicSpecs:
     START: str = '/start'
     STOP: str = '/stop'
@@ -391,8 +410,17 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+        self._batch_publisher: Optional[MQTTBatchPublisher] = create_batch_publisher(
+            self._hb_app, self._node, self._topic
+        )
+        if self._batch_publisher is not None:
+            self._batch_publisher.start()
         self._start_event_listeners()
 
+    @property
+    def batch_publisher(self) -> Optional[MQTTBatchPublisher]:
+        return self._batch_publisher
+
     def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
         if threading.current_thread() != threading.main_thread():  # pragma: no cover
             self._ev_loop.call_soon_threadsafe(
@@ -441,6 +469,13 @@ class MQTTMarketEventForwarder:
 
         event_data = self._make_event_payload(event_data)
 
+        if self._batch_publisher is not None:
+            self._batch_publisher.publish({
+                'timestamp': int(timestamp),
+                'type': event_type,
+                'data': event_data
+            })
+            return
         self.event_fw_pub.publish(
             InternalEventMessage(
                 timestamp=int(timestamp),
@@ -482,6 +517,11 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self.stop_batching()
+
+    def stop_batching(self):
+        if self._batch_publisher is not None:
+            self._batch_publisher.stop()
 
 
 class MQTTNotifier(NotifierBase):
@@ -670,10 +710,10 @@ class MQTTGateway(Node):
         return logging.getLogger()
 
     def remove_log_handler(self, logger: HummingbotLogger):
-        logger.removeHandler(self._logh)
+        remove_log_handler(logger, self._logh)
 
     def add_log_handler(self, logger: HummingbotLogger):
-        logger.addHandler(self._logh)
+        add_log_handler(logger, self._logh)
 
     def _init_notifier(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_notifier:
@@ -838,6 +878,8 @@ class MQTTGateway(Node):
 
     def stop(self, with_health: bool = True):
         self.broadcast_status_update("offline", msg_type="availability")
+        # The queued batches are published while the connection is still up
+        self._stop_batching()
         super().stop()
         if self._hb_thread:
             self._hb_thread.stop()
@@ -849,6 +891,12 @@ class MQTTGateway(Node):
         if with_health:
             self._stop_health_monitoring_loop()
 
+    def _stop_batching(self):
+        if self._market_events is not None:
+            self._market_events.stop_batching()
+        if self._logh is not None:
+            self._logh.stop_batching()
+
     def __del__(self):
         self.stop()
 
@@ -875,12 +923,38 @@ class MQTTLogHandler(logging.Handler):
         self.name = self.__class__.__name__
         self.log_pub = self._node.create_publisher(topic=self._topic,
                                                    msg_type=LogMessage)
+        self._batch_publisher: Optional[MQTTBatchPublisher] = create_batch_publisher(
+            self._hb_app, self._node, self._topic
+        )
+        if self._batch_publisher is not None:
+            self._batch_publisher.start()
+
+    @property
+    def batch_publisher(self) -> Optional[MQTTBatchPublisher]:
+        return self._batch_publisher
+
+    def stop_batching(self):
+        if self._batch_publisher is not None:
+            self._batch_publisher.stop()
+
+    def close(self):
+        self.stop_batching()
+        super().close()
 
     def emit(self, record: logging.LogRecord):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(self.emit, record)
-            return
+        # Formatted in the calling thread (the log pipeline listener thread, when it is enabled), only the message
+        # is published from the main thread
         msg_str = self.format(record)
+        if self._batch_publisher is not None:
+            # Queued from any thread, the batches are published from the main thread
+            self._batch_publisher.publish({
+                'timestamp': time.time(),
+                'msg': msg_str,
+                'level_no': record.levelno,
+                'level_name': record.levelname,
+                'logger_name': record.name
+            })
+            return
         msg = LogMessage(
             timestamp=time.time(),
             msg=msg_str,
@@ -889,6 +963,9 @@ class MQTTLogHandler(logging.Handler):
             logger_name=record.name
 
         )
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self.log_pub.publish, msg)
+            return
         self.log_pub.publish(msg)
 
 
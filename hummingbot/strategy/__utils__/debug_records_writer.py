@@ -0,0 +1,168 @@
+import logging
+import os
+from concurrent.futures import Future
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import get_executor
+
+drw_logger = None
+
+
+class DebugRecordsWriter:
+    """
+    Collects debug records (one per tick) in a columnar ring buffer of floats, and appends them to a file from the
+    shared worker thread pool. Adding a record never waits for the disk: the buffer is handed over to the worker every
+    `flush_interval` seconds, or sooner when it is full. If the worker is still writing when the buffer is full, the
+    oldest records are overwritten and counted as dropped.
+
+    The file is a CSV, or a Parquet file (requires pyarrow). It is rotated the way `RotatingFileHandler` rotates logs:
+    once it exceeds `max_file_size` bytes it is renamed with a `.1` suffix, `.1` becomes `.2` and so on up to
+    `backup_count`.
+    """
+    FORMATS = ("csv", "parquet")
+
+    @classmethod
+    def logger(cls):
+        global drw_logger
+        if drw_logger is None:
+            drw_logger = logging.getLogger(__name__)
+        return drw_logger
+
+    def __init__(self,
+                 file_path: str,
+                 columns: Sequence[str],
+                 file_format: str = "csv",
+                 buffer_size: int = 10000,
+                 flush_interval: float = 10.0,
+                 max_file_size: int = 50 * 1024 * 1024,
+                 backup_count: int = 5):
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Invalid debug file format {file_format}, it should be one of {self.FORMATS}.")
+        if buffer_size <= 0:
+            raise ValueError("The debug records buffer size should be positive.")
+        self._file_path = file_path
+        self._columns = ["timestamp"] + list(columns)
+        self._file_format = file_format
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._max_file_size = max_file_size
+        self._backup_count = backup_count
+
+        self._buffer = self._new_buffer()
+        self._start = 0
+        self._size = 0
+        self._next_flush_timestamp = None
+        self._dropped_records_count = 0
+        self._write_future: Optional[Future] = None
+        self._parquet_writer = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    @property
+    def pending_records_count(self) -> int:
+        return self._size
+
+    @property
+    def dropped_records_count(self) -> int:
+        return self._dropped_records_count
+
+    def add_record(self, timestamp: float, values: Sequence[Any]):
+        """
+        Adds a record to the buffer, and flushes the buffer if it is due.
+        :param timestamp: the record timestamp
+        :param values: the record values, in the columns order. They are stored as floats, None as NaN.
+        """
+        index = (self._start + self._size) % self._buffer_size
+        self._buffer[0, index] = timestamp
+        self._buffer[1:, index] = values
+        if self._size == self._buffer_size:
+            self._start = (self._start + 1) % self._buffer_size
+            self._dropped_records_count += 1
+        else:
+            self._size += 1
+
+        if self._next_flush_timestamp is None:
+            self._next_flush_timestamp = timestamp + self._flush_interval
+        if timestamp >= self._next_flush_timestamp or self._size == self._buffer_size:
+            self.flush()
+            self._next_flush_timestamp = timestamp + self._flush_interval
+
+    def flush(self) -> bool:
+        """
+        Hands the buffered records over to the worker thread pool.
+        :return: False if the previous records are still being written, the records are kept in the buffer then
+        """
+        if self._write_future is not None:
+            if not self._write_future.done():
+                return False
+            self._collect_write_result()
+        if self._size == 0:
+            return True
+        records = np.roll(self._buffer, -self._start, axis=1)[:, :self._size] if self._start else \
+            self._buffer[:, :self._size]
+        self._buffer = self._new_buffer()
+        self._start = 0
+        self._size = 0
+        self._write_future = get_executor().submit(self._write, records)
+        return True
+
+    def close(self):
+        """
+        Writes all the buffered records, waiting for the writes to complete, and closes the file.
+        """
+        if self._write_future is not None:
+            self._collect_write_result()
+        self.flush()
+        if self._write_future is not None:
+            self._collect_write_result()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def _new_buffer(self) -> np.ndarray:
+        return np.full((len(self._columns), self._buffer_size), np.nan)
+
+    def _collect_write_result(self):
+        exception = self._write_future.exception()
+        self._write_future = None
+        if exception is not None:
+            self.logger().error(f"Error writing debug records to {self._file_path}.", exc_info=exception)
+
+    def _write(self, records: np.ndarray):
+        if os.path.exists(self._file_path) and os.path.getsize(self._file_path) >= self._max_file_size:
+            self._rotate()
+        df = pd.DataFrame(dict(zip(self._columns, records)))
+        if self._file_format == "csv":
+            df.to_csv(self._file_path, mode="a", header=not os.path.exists(self._file_path), index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                if os.path.exists(self._file_path):
+                    # A Parquet file can't be appended to once closed
+                    self._rotate()
+                self._parquet_writer = pq.ParquetWriter(self._file_path, table.schema)
+            self._parquet_writer.write_table(table)
+
+    def _rotate(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._backup_count <= 0:
+            os.remove(self._file_path)
+            return
+        for i in range(self._backup_count - 1, 0, -1):
+            source = f"{self._file_path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._file_path}.{i + 1}")
+        os.replace(self._file_path, f"{self._file_path}.1")
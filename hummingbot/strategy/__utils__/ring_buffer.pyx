@@ -1,11 +1,22 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last added values.
+
+    Every value is written twice, at its position and at its position plus the buffer length, so the values are
+    always available in insertion order as a contiguous slice of the storage (`get_as_numpy_view`) without copies.
+    The sum of the values (with Kahan compensation) and the sum of squared deviations (Welford) are updated with each
+    added value, so the mean, variance and standard deviation are calculated in constant time. Both sums are
+    recalculated from the stored values every time the buffer wraps around to discard the accumulated rounding errors.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,31 +24,86 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
+        self._delimiter = 0
+        self._is_full = False
+        self._sum = 0
+        self._sum_compensation = 0
+        self._squared_deviations_sum = 0
+        self._last_removed_value = np.nan
+
+    cdef void c_add_value(self, double val):
+        cdef:
+            double added_value = val
+            double removed_value = np.nan
+            double previous_mean
+            double mean
+            bint is_replacement = self._is_full
+            int64_t size = self.c_get_size()
+
+        if is_replacement:
+            removed_value = self._buffer[self._delimiter]
+        self._buffer[self._delimiter] = added_value
+        self._buffer[self._delimiter + self._length] = added_value
+        self._last_removed_value = removed_value
         self.c_increment_delimiter()
 
+        if self._delimiter == 0:
+            self.c_recalculate_statistics()
+        elif is_replacement:
+            previous_mean = self._sum / size
+            self.c_add_to_sum(added_value)
+            self.c_add_to_sum(-removed_value)
+            mean = self._sum / size
+            self._squared_deviations_sum += ((added_value - removed_value)
+                                             * (added_value - mean + removed_value - previous_mean))
+        else:
+            previous_mean = self._sum / size if size > 0 else 0
+            self.c_add_to_sum(added_value)
+            mean = self._sum / (size + 1)
+            self._squared_deviations_sum += (added_value - previous_mean) * (added_value - mean)
+        if self._squared_deviations_sum < 0:
+            self._squared_deviations_sum = 0
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_add_to_sum(self, double value):
+        cdef:
+            double compensated_value = value - self._sum_compensation
+            double new_sum = self._sum + compensated_value
+        self._sum_compensation = (new_sum - self._sum) - compensated_value
+        self._sum = new_sum
+
+    cdef void c_recalculate_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_view()
+        self._sum_compensation = 0
+        self._sum = np.sum(values)
+        self._squared_deviations_sum = np.sum(np.square(values - self._sum / values.size)) if values.size > 0 else 0
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter - 1 + self._length]
+
+    cdef double c_get_last_removed_value(self):
+        return self._last_removed_value
+
+    cdef int64_t c_get_size(self):
+        return self._length if self._is_full else self._delimiter
 
     cdef bint c_is_full(self):
         return self._is_full
@@ -45,36 +111,47 @@ cdef class RingBuffer:
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_window_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_window_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_window_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef double c_window_mean(self):
+        cdef int64_t size = self.c_get_size()
+        if size == 0:
+            return np.nan
+        return self._sum / size
+
+    cdef double c_window_variance(self):
+        cdef int64_t size = self.c_get_size()
+        if size == 0:
+            return np.nan
+        return self._squared_deviations_sum / size
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef np.ndarray[np.double_t, ndim=1] view
+        if self._is_full:
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[:self._delimiter]
+        view.flags.writeable = False
+        return view
 
-    def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
+
+    def __len__(self):
+        return self.c_get_size()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,9 +159,23 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Returns the values in insertion order as a read only view of the buffer storage. The view is only valid until
+        the next value is added.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_last_removed_value(self):
+        """
+        Returns the value that was dropped from the buffer when the last value was added (NaN if the buffer was not
+        full).
+        """
+        return self.c_get_last_removed_value()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -101,6 +192,20 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def window_mean(self):
+        """
+        Mean of the values in the buffer, even if it is not full yet (NaN if it is empty)
+        """
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self):
+        """
+        Population variance of the values in the buffer, even if it is not full yet (NaN if it is empty)
+        """
+        return self.c_window_variance()
+
     @property
     def length(self) -> int:
         return self._length
@@ -109,10 +214,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
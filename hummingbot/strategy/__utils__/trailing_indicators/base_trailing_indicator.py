@@ -30,12 +30,18 @@ class BaseTrailingIndicator(ABC):
     def _indicator_calculation(self) -> float:
         raise NotImplementedError
 
+    def _on_sampling_length_change(self):
+        """
+        Called after the sampling buffer is resized, to rebuild any state the indicator keeps about its samples.
+        """
+        pass
+
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return np.mean(self._processing_buffer.get_as_numpy_view())
 
     @property
     def current_value(self) -> float:
@@ -51,7 +57,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = len(self._sampling_buffer)
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +69,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._on_sampling_length_change()
 
     @property
     def processing_length(self) -> int:
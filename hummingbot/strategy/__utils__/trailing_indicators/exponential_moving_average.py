@@ -1,17 +1,39 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the samples in the sampling buffer, with the same weights as pandas
+    `ewm(span=sampling_length, adjust=True)`. The weighted sum of the samples is updated recursively: it decays with
+    each new sample and the weight of the sample leaving the buffer is subtracted.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._reset_weighted_sum()
+
+    def _reset_weighted_sum(self):
+        self._decay = 1 - 2 / (self.sampling_length + 1)
+        self._removed_sample_weight = self._decay ** self.sampling_length
+        self._weighted_sum = 0.0
+
+    def _add_to_weighted_sum(self, value: float, removed_value: float):
+        self._weighted_sum = value + self._decay * self._weighted_sum
+        if not np.isnan(removed_value):
+            self._weighted_sum -= self._removed_sample_weight * removed_value
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        self._add_to_weighted_sum(self._sampling_buffer.get_last_value(),
+                                  self._sampling_buffer.get_last_removed_value())
+        weights_sum = (1 - self._decay ** len(self._sampling_buffer)) / (1 - self._decay)
+        return self._weighted_sum / weights_sum
+
+    def _on_sampling_length_change(self):
+        self._reset_weighted_sum()
+        for value in self._sampling_buffer.get_as_numpy_view():
+            self._add_to_weighted_sum(value, np.nan)
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -1,18 +1,28 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._log_returns_buffer = RingBuffer(max(sampling_length - 1, 1))
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        # The log returns between consecutive samples are kept in their own buffer, which updates their variance
+        # with each sample instead of recalculating it over the whole sampling buffer
+        prices = self._sampling_buffer.get_as_numpy_view()
+        if prices.size > 1:
+            self._log_returns_buffer.add_value(np.log(prices[-1]) - np.log(prices[-2]))
+        return self._log_returns_buffer.window_variance
+
+    def _on_sampling_length_change(self):
+        prices = self._sampling_buffer.get_as_numpy_view()
+        self._log_returns_buffer = RingBuffer(max(self.sampling_length - 1, 1))
+        for log_return in np.diff(np.log(prices)):
+            self._log_returns_buffer.add_value(log_return)
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
+        processing_array = self._processing_buffer.get_as_numpy_view()
         if processing_array.size > 0:
             return np.sqrt(np.mean(np.nan_to_num(processing_array)))
@@ -1,19 +1,32 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._squared_changes_buffer = RingBuffer(max(sampling_length - 1, 1))
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        # The squared changes between consecutive samples are kept in their own buffer, one for each pair of samples in
+        # the sampling buffer, so their sum is updated with each sample instead of recalculated over the whole buffer
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_view()
+        if np_sampling_buffer.size > 1:
+            self._squared_changes_buffer.add_value((np_sampling_buffer[-1] - np_sampling_buffer[-2]) ** 2)
+        squared_changes_sum = self._squared_changes_buffer.window_mean * len(self._squared_changes_buffer)
+        vol = np.sqrt(np.nan_to_num(squared_changes_sum) / np_sampling_buffer.size)
         return vol
 
+    def _on_sampling_length_change(self):
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_view()
+        self._squared_changes_buffer = RingBuffer(max(self.sampling_length - 1, 1))
+        for squared_change in np.square(np.diff(np_sampling_buffer)):
+            self._squared_changes_buffer.add_value(squared_change)
+
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
@@ -13,17 +13,27 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        dict _amounts_by_price_level
+        dict _trades_count_by_price_level
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _last_quotes
         int _sampling_length
         int _samples_length
+        bint _fast_estimation
+        bint _estimate_in_background
+        object _estimation_future
+        bint _is_estimation_outdated
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount)
+    cdef c_remove_sample(self, object sample_timestamp)
     cdef c_estimate_intensity(self)
+    cdef c_collect_estimation(self)
+    cdef c_set_estimation(self, object estimation)
 
 cdef class TradesForwarder(EventListener):
     cdef:
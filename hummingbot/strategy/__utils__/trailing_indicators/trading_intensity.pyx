@@ -2,13 +2,14 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
-from typing import Tuple
+from collections import deque
+from typing import Optional, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
 from scipy.optimize import OptimizeWarning
 
+from hummingbot import get_executor
 from hummingbot.core.data_type.common import (
     PriceType,
 )
@@ -17,6 +18,59 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+
+def intensity_curve(t, a, b):
+    return a * np.exp(-b * t)
+
+
+def estimate_intensity_log_linear(price_levels: np.ndarray, lambdas: np.ndarray) -> Optional[Tuple[float, float]]:
+    """
+    Closed form least squares fit of log(lambda) = log(alpha) - kappa * price_level.
+    Returns None if the price levels don't allow a fit (less than two different levels).
+    """
+    if price_levels.size < 2:
+        return None
+    log_lambdas = np.log(lambdas)
+    price_levels_deviations = price_levels - np.mean(price_levels)
+    price_levels_squared_deviations_sum = np.dot(price_levels_deviations, price_levels_deviations)
+    if price_levels_squared_deviations_sum == 0:
+        return None
+    slope = np.dot(price_levels_deviations, log_lambdas) / price_levels_squared_deviations_sum
+    intercept = np.mean(log_lambdas) - slope * np.mean(price_levels)
+    return float(np.exp(intercept)), float(max(-slope, 0))
+
+
+def estimate_intensity_curve_fit(price_levels: np.ndarray,
+                                 lambdas: np.ndarray,
+                                 initial_values: Tuple[float, float]) -> Optional[Tuple[float, float]]:
+    """
+    Non linear least squares fit of lambda = alpha * exp(-kappa * price_level), starting from the initial values.
+    Returns None if the fit fails.
+    """
+    try:
+        params = curve_fit(intensity_curve,
+                           price_levels,
+                           lambdas,
+                           p0=initial_values,
+                           method='dogbox',
+                           bounds=([0, 0], [np.inf, np.inf]))
+        return float(params[0][0]), float(params[0][1])
+    except (RuntimeError, ValueError):
+        return None
+
+
+def estimate_intensity(price_levels: np.ndarray,
+                       lambdas: np.ndarray,
+                       initial_values: Tuple[float, float],
+                       fast_estimation: bool) -> Optional[Tuple[float, float]]:
+    if fast_estimation:
+        return estimate_intensity_log_linear(price_levels, lambdas)
+    if initial_values == (0, 0):
+        # Without a previous estimation, the log linear fit is a better starting point than the origin
+        initial_values = estimate_intensity_log_linear(price_levels, lambdas) or initial_values
+    return estimate_intensity_curve_fit(price_levels, lambdas, initial_values)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +80,32 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity (alpha, kappa) of the market from the trades registered in the last
+    `sampling_length` samples.
+
+    The traded amounts are consolidated by price level (the distance between the trade price and the mid price
+    before the trade) as trades are added to and removed from the samples, so every estimation only has to fit the
+    consolidated levels. The estimation is done again only when the samples change, and it starts from the last
+    estimated values.
+
+    :param fast_estimation: If True, the intensity is estimated with a closed form log linear least squares fit
+        instead of the non linear curve fit.
+    :param estimate_in_background: If True, the estimation runs in a worker thread. Its result becomes the
+        current value once it is finished.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fast_estimation: bool = False,
+                 estimate_in_background: bool = False):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._amounts_by_price_level = {}
+        self._trades_count_by_price_level = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,12 +113,17 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._last_quotes = deque()
+        self._fast_estimation = fast_estimation
+        self._estimate_in_background = estimate_in_background
+        self._estimation_future = None
+        self._is_estimation_outdated = False
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
     @property
     def current_value(self) -> Tuple[float, float]:
+        self.c_collect_estimation()
         return self._alpha, self._kappa
 
     @property
@@ -67,21 +147,27 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return list(self._last_quotes)
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._last_quotes = deque(value)
+
+    @property
+    def is_estimating(self) -> bool:
+        return self._estimation_future is not None and not self._estimation_future.done()
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        self.c_collect_estimation()
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
         # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._last_quotes.appendleft({'timestamp': timestamp, 'price': price})
 
         latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
@@ -89,31 +175,24 @@ cdef class TradingIntensityIndicator:
                 if quote["timestamp"] < trade.timestamp:
                     if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
                         latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    self.c_add_trade_to_sample(quote["timestamp"] + 1,
+                                               abs(trade.price - float(quote["price"])),
+                                               trade.amount)
                     break
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
         if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+            while len(self._last_quotes) > latest_processed_quote_idx + 1:
+                self._last_quotes.pop()
 
         if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
-
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+            timestamps = sorted(self._trade_samples.keys())
+            for timestamp in timestamps[:len(timestamps) - self._sampling_length]:
+                self.c_remove_sample(timestamp)
 
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._is_estimation_outdated:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,44 +202,57 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+        self._trade_samples[sample_timestamp].append({"price_level": price_level, "amount": amount})
+        self._amounts_by_price_level[price_level] = self._amounts_by_price_level.get(price_level, 0) + amount
+        self._trades_count_by_price_level[price_level] = self._trades_count_by_price_level.get(price_level, 0) + 1
+        self._is_estimation_outdated = True
+
+    cdef c_remove_sample(self, object sample_timestamp):
+        for trade in self._trade_samples.pop(sample_timestamp):
+            price_level = trade["price_level"]
+            trades_count = self._trades_count_by_price_level[price_level] - 1
+            if trades_count == 0:
+                del self._trades_count_by_price_level[price_level]
+                del self._amounts_by_price_level[price_level]
+            else:
+                self._trades_count_by_price_level[price_level] = trades_count
+                self._amounts_by_price_level[price_level] -= trade["amount"]
+        self._is_estimation_outdated = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
+            int price_levels_count = len(self._amounts_by_price_level)
+            object price_levels
+            object lambdas
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        if self.is_estimating:
+            # The samples will be estimated again once the running estimation is collected
+            return
 
+        price_levels = np.fromiter(self._amounts_by_price_level.keys(), dtype=float, count=price_levels_count)
+        lambdas = np.fromiter(self._amounts_by_price_level.values(), dtype=float, count=price_levels_count)
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10**-10
+        self._is_estimation_outdated = False
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        if self._estimate_in_background:
+            self._estimation_future = get_executor().submit(
+                estimate_intensity, price_levels, lambdas, (self._alpha, self._kappa), self._fast_estimation)
+        else:
+            self.c_set_estimation(
+                estimate_intensity(price_levels, lambdas, (self._alpha, self._kappa), self._fast_estimation))
+
+    cdef c_collect_estimation(self):
+        if self._estimation_future is None or not self._estimation_future.done():
+            return
+        future = self._estimation_future
+        self._estimation_future = None
+        self.c_set_estimation(future.result())
+
+    cdef c_set_estimation(self, object estimation):
+        if estimation is not None:
+            self._alpha, self._kappa = estimation
@@ -50,6 +50,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         object _optimal_bid
         object _optimal_ask
         str _debug_csv_path
+        object _debug_writer
         object _avg_vol
         TradingIntensityIndicator _trading_intensity
         bint _should_wait_order_cancel_confirmation
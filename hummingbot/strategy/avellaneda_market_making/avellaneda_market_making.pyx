@@ -23,6 +23,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
+from hummingbot.strategy.__utils__.debug_records_writer import DebugRecordsWriter
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
@@ -55,6 +56,26 @@ s_decimal_zero = Decimal(0)
 s_decimal_neg_one = Decimal(-1)
 s_decimal_one = Decimal(1)
 pmm_logger = None
+DEBUG_COLUMNS = ('mid_price',
+                 'best_bid',
+                 'best_ask',
+                 'reservation_price',
+                 'optimal_spread',
+                 'optimal_bid',
+                 'optimal_ask',
+                 'optimal_bid_to_mid_%',
+                 'optimal_ask_to_mid_%',
+                 'current_inv',
+                 'target_inv',
+                 'time_left_fraction',
+                 'mid_price std_dev',
+                 'gamma',
+                 'alpha',
+                 'kappa',
+                 'eta',
+                 'volatility',
+                 'mid_price_variance',
+                 'inventory_target_pct')
 
 
 cdef class AvellanedaMarketMakingStrategy(StrategyBase):
@@ -78,6 +99,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                     hb_app_notification: bool = False,
                     debug_csv_path: str = '',
                     is_debug: bool = False,
+                    debug_file_format: str = "csv",
                     ):
         self._sb_order_tracker = OrderTracker()
         self._config_map = config_map
@@ -125,6 +147,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 os.unlink(self._debug_csv_path)
         except FileNotFoundError:
             pass
+        self._debug_writer = (DebugRecordsWriter(self._debug_csv_path, DEBUG_COLUMNS, file_format=debug_file_format)
+                              if self._is_debug else None)
 
         self.get_config_map_execution_mode()
         self.get_config_map_hanging_orders()
@@ -588,6 +612,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
     cdef c_stop(self, Clock clock):
         self._hanging_orders_tracker.unregister_events(self.active_markets)
+        if self._debug_writer is not None:
+            self._debug_writer.close()
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
@@ -1354,53 +1380,30 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         vol = self.get_volatility()
         mid_price_variance = vol ** 2
 
-        if not os.path.exists(self._debug_csv_path):
-            df_header = pd.DataFrame([('mid_price',
-                                       'best_bid',
-                                       'best_ask',
-                                       'reservation_price',
-                                       'optimal_spread',
-                                       'optimal_bid',
-                                       'optimal_ask',
-                                       'optimal_bid_to_mid_%',
-                                       'optimal_ask_to_mid_%',
-                                       'current_inv',
-                                       'target_inv',
-                                       'time_left_fraction',
-                                       'mid_price std_dev',
-                                       'risk_factor',
-                                       'gamma',
-                                       'alpha',
-                                       'kappa',
-                                       'eta',
-                                       'volatility',
-                                       'mid_price_variance',
-                                       'inventory_target_pct')])
-            df_header.to_csv(self._debug_csv_path, mode='a', header=False, index=False)
-
         if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
             time_left_fraction = self._execution_state.time_left / self._execution_state.closing_time
         else:
             time_left_fraction = None
 
-        df = pd.DataFrame([(mid_price,
-                            best_bid,
-                            best_ask,
-                            self._reservation_price,
-                            self._optimal_spread,
-                            self._optimal_bid,
-                            self._optimal_ask,
-                            (mid_price - (self._reservation_price - self._optimal_spread / 2)) / mid_price,
-                            ((self._reservation_price + self._optimal_spread / 2) - mid_price) / mid_price,
-                            market.get_balance(self.base_asset),
-                            self.c_calculate_target_inventory(),
-                            time_left_fraction,
-                            self._avg_vol.current_value,
-                            self.gamma,
-                            self._alpha,
-                            self._kappa,
-                            self.eta,
-                            vol,
-                            mid_price_variance,
-                            self.inventory_target_base_pct)])
-        df.to_csv(self._debug_csv_path, mode='a', header=False, index=False)
+        # The record is only buffered here, the debug writer appends it to the file from a worker thread
+        self._debug_writer.add_record(self._current_timestamp,
+                                      (mid_price,
+                                       best_bid,
+                                       best_ask,
+                                       self._reservation_price,
+                                       self._optimal_spread,
+                                       self._optimal_bid,
+                                       self._optimal_ask,
+                                       (mid_price - (self._reservation_price - self._optimal_spread / 2)) / mid_price,
+                                       ((self._reservation_price + self._optimal_spread / 2) - mid_price) / mid_price,
+                                       market.get_balance(self.base_asset),
+                                       self.c_calculate_target_inventory(),
+                                       time_left_fraction,
+                                       self._avg_vol.current_value,
+                                       self.gamma,
+                                       self._alpha,
+                                       self._kappa,
+                                       self.eta,
+                                       vol,
+                                       mid_price_variance,
+                                       self.inventory_target_base_pct))
@@ -1,10 +1,11 @@
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 from bidict import bidict
@@ -26,6 +27,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
     CrossExchangeMarketMakingConfigMap,
     PassiveOrderRefreshMode,
@@ -122,6 +124,15 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._main_task = None
         self._gateway_quotes_task = None
         self._hedge_maker_order_tasks = []
+        # Hedging task of each market pair, and the maker order of the last fill it still has to hedge
+        self._hedge_fills_tasks = {}
+        self._pending_hedge_maker_order_ids = {}
+
+        # Reception time (time.perf_counter()) of the maker fills not hedged yet, by exchange trade id
+        self._fill_reception_times = {}
+        self._hedge_submitted_trade_ids = set()
+        self.fill_to_hedge_submit_latency = LatencyHistogram()
+        self.fill_to_hedge_fill_latency = LatencyHistogram()
 
         self._last_conv_rates_logged = 0
         self._hb_app_notification = hb_app_notification
@@ -349,15 +360,41 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
             warning_lines.extend(self.balance_warning([market_pair.maker, market_pair.taker]))
 
+        if self.fill_to_hedge_submit_latency.count > 0:
+            latency_df = self.hedge_latency_data_frame()
+            lines.extend(["", "  Hedge latency (ms):"] +
+                         ["    " + line for line in str(latency_df).split("\n")])
+
         if len(warning_lines) > 0:
             lines.extend(["", "  *** WARNINGS ***"] + warning_lines)
 
         return "\n".join(lines)
 
+    def hedge_latency_data_frame(self) -> pd.DataFrame:
+        columns = ["Latency", "Count", "Mean", "p50", "p90", "p99", "Max"]
+        data = []
+        for name, histogram in (("Fill to hedge submit", self.fill_to_hedge_submit_latency),
+                                ("Fill to hedge fill", self.fill_to_hedge_fill_latency)):
+            summary = histogram.summary()
+            data.append([name, summary["count"]] +
+                        [round(summary[key] * 1e3, 3) for key in ("mean", "p50", "p90", "p99", "max")])
+        return pd.DataFrame(data=data, columns=columns)
+
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def stop(self, clock: Clock):
+        super().stop(clock)
+        # A hedge still waiting (e.g. for a gateway price) must not place its taker order after the stop
+        for task in list(self._hedge_fills_tasks.values()) + self._hedge_maker_order_tasks:
+            task.cancel()
+        self._hedge_fills_tasks.clear()
+        self._hedge_maker_order_tasks = []
+        self._pending_hedge_maker_order_ids.clear()
+        self._fill_reception_times.clear()
+        self._hedge_submitted_trade_ids.clear()
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -555,49 +592,63 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         # See if it's profitable to place a limit order on maker market.
         await self.check_and_create_new_orders(market_pair, has_active_bid, has_active_ask)
 
-    async def hedge_filled_maker_order(self,
-                                       maker_order_id: str,
-                                       order_filled_event: OrderFilledEvent):
+    def record_maker_fill(self, order_filled_event: OrderFilledEvent) -> Optional[MakerTakerMarketPair]:
         """
-        If a limit order previously made to the maker side has been filled, hedge it on the taker side.
+        Stores a maker order fill, s.t. it can be hedged by check_and_hedge_orders().
         :param order_filled_event: event object
+        :return: the market pair of the order, None if the fill doesn't need to be hedged
         """
         order_id = order_filled_event.order_id
         market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
 
         # Make sure to only hedge limit orders.
-        if market_pair is not None and order_id not in self._taker_to_maker_order_ids.keys():
-            limit_order_record = self._sb_order_tracker.get_shadow_limit_order(order_id)
-            order_fill_record = (limit_order_record, order_filled_event)
-
-            # Store the limit order fill event in a map, s.t. it can be processed in check_and_hedge_orders()
-            # later.
-            if order_filled_event.trade_type is TradeType.BUY:
-                if market_pair not in self._order_fill_buy_events:
-                    self._order_fill_buy_events[market_pair] = [order_fill_record]
-                else:
-                    self._order_fill_buy_events[market_pair].append(order_fill_record)
+        if market_pair is None or order_id in self._taker_to_maker_order_ids.keys():
+            return None
 
-                if LogOption.MAKER_ORDER_FILLED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Maker buy order of "
-                        f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
-                    )
+        limit_order_record = self._sb_order_tracker.get_shadow_limit_order(order_id)
+        order_fill_record = (limit_order_record, order_filled_event)
 
+        if order_filled_event.trade_type is TradeType.BUY:
+            if market_pair not in self._order_fill_buy_events:
+                self._order_fill_buy_events[market_pair] = [order_fill_record]
             else:
-                if market_pair not in self._order_fill_sell_events:
-                    self._order_fill_sell_events[market_pair] = [order_fill_record]
-                else:
-                    self._order_fill_sell_events[market_pair].append(order_fill_record)
+                self._order_fill_buy_events[market_pair].append(order_fill_record)
 
-                if LogOption.MAKER_ORDER_FILLED in self.logging_options:
-                    self.log_with_clock(
-                        logging.INFO,
-                        f"({market_pair.maker.trading_pair}) Maker sell order of "
-                        f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
-                    )
+            if LogOption.MAKER_ORDER_FILLED in self.logging_options:
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_pair.maker.trading_pair}) Maker buy order of "
+                    f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
+                )
+
+        else:
+            if market_pair not in self._order_fill_sell_events:
+                self._order_fill_sell_events[market_pair] = [order_fill_record]
+            else:
+                self._order_fill_sell_events[market_pair].append(order_fill_record)
 
+            if LogOption.MAKER_ORDER_FILLED in self.logging_options:
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_pair.maker.trading_pair}) Maker sell order of "
+                    f"{order_filled_event.amount} {market_pair.maker.base_asset} filled."
+                )
+        return market_pair
+
+    def schedule_hedge(self, maker_order_id: str, market_pair: MakerTakerMarketPair):
+        """
+        Schedules the hedge of the stored maker fills of the market pair. The hedging task only starts in the next
+        event loop iteration, so all the fills received in the current one are hedged together. If a hedging task is
+        already running for the market pair, it hedges the new fills once it is done.
+        """
+        self._pending_hedge_maker_order_ids[market_pair] = maker_order_id
+        hedge_task = self._hedge_fills_tasks.get(market_pair)
+        if hedge_task is None or hedge_task.done():
+            self._hedge_fills_tasks[market_pair] = safe_ensure_future(self.hedge_pending_fills(market_pair))
+
+    async def hedge_pending_fills(self, market_pair: MakerTakerMarketPair):
+        while market_pair in self._pending_hedge_maker_order_ids:
+            maker_order_id = self._pending_hedge_maker_order_ids.pop(market_pair)
             # Call check_and_hedge_orders() to emit the orders on the taker side.
             try:
                 await self.check_and_hedge_orders(maker_order_id, market_pair)
@@ -615,6 +666,9 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         order_id = order_event.order_id
         market_pair = self._market_pair_tracker.get_market_pair_from_order_id(order_id)
 
+        # The fills hedged by the taker order are hedged again, their latency is not tracked anymore
+        self.discard_hedge_latency_tracking(self._ongoing_hedging.inverse.get(order_id, ()))
+
         # Resubmit hedging order
         self.hedge_tasks_cleanup()
         self._hedge_maker_order_tasks += [safe_ensure_future(
@@ -638,10 +692,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
                 self._maker_to_hedging_trades[maker_order_id] += [exchange_trade_id]
 
-                self.hedge_tasks_cleanup()
-                self._hedge_maker_order_task = safe_ensure_future(
-                    self.hedge_filled_maker_order(maker_order_id, order_filled_event)
-                )
+                # The fill is stored right away, and hedged with the other fills received in the same event loop
+                # iteration, without waiting for the next tick
+                market_pair = self.record_maker_fill(order_filled_event)
+                if market_pair is not None:
+                    self._fill_reception_times[exchange_trade_id] = time.perf_counter()
+                    self.schedule_hedge(maker_order_id, market_pair)
 
     def did_cancel_order(self, order_canceled_event: OrderCancelledEvent):
         if order_canceled_event.order_id in self._taker_to_maker_order_ids.keys():
@@ -705,6 +761,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         del self._maker_to_taker_order_ids[maker_order_id]
                         del self._maker_to_hedging_trades[maker_order_id]
 
+                self.record_hedge_fill(order_id)
                 try:
                     self.del_order_from_ongoing_hedging(order_id)
                 except KeyError:
@@ -772,6 +829,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                         del self._maker_to_taker_order_ids[maker_order_id]
                         del self._maker_to_hedging_trades[maker_order_id]
 
+                self.record_hedge_fill(order_id)
                 try:
                     self.del_order_from_ongoing_hedging(order_id)
                 except KeyError:
@@ -869,6 +927,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     quantized_hedge_amount)
                 if order_price is None:
                     self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                    self.discard_hedge_latency_tracking(r.exchange_trade_id for _, r in buy_fill_records + sell_fill_records)
                     return
                 taker_top = order_price
             else:
@@ -907,6 +966,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     f"{buy_fill_quantity} {market_pair.maker.base_asset} is less than the minimum order amount "
                     f"allowed on the taker market. No hedging possible yet."
                 )
+                self.discard_hedge_latency_tracking(r.exchange_trade_id for _, r in buy_fill_records)
 
         if sell_fill_quantity > 0:
             # Maker sell
@@ -921,6 +981,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                 )
                 if taker_price is None:
                     self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                    self.discard_hedge_latency_tracking(r.exchange_trade_id for _, r in sell_fill_records)
                     return
             else:
                 taker_price = taker_market.get_price_for_volume(
@@ -950,6 +1011,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     quantized_hedge_amount)
                 if order_price is None:
                     self.logger().warning("Gateway: failed to obtain order price. No hedging order will be submitted.")
+                    self.discard_hedge_latency_tracking(r.exchange_trade_id for _, r in sell_fill_records)
                     return
                 taker_top = order_price
             else:
@@ -988,6 +1050,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
                     f"{sell_fill_quantity} {market_pair.maker.base_asset} is less than the minimum order amount "
                     f"allowed on the taker market. No hedging possible yet."
                 )
+                self.discard_hedge_latency_tracking(r.exchange_trade_id for _, r in sell_fill_records)
 
     def get_adjusted_limit_order_size(self, market_pair: MakerTakerMarketPair) -> Tuple[Decimal, Decimal]:
         """
@@ -1725,6 +1788,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             self._taker_to_maker_order_ids[order_id] = maker_order_id
             self._maker_to_taker_order_ids[maker_order_id] += [order_id]
             self.set_ongoing_hedging(fill_records, order_id)
+            self.record_hedge_submit(fill_records)
         return order_id
 
     def cancel_maker_order(self, market_pair: MakerTakerMarketPair, order_id: str):
@@ -1798,6 +1862,29 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         maker_exchange_trade_ids = tuple(r.exchange_trade_id for _, r in fill_records)
         self._ongoing_hedging[maker_exchange_trade_ids] = order_id
 
+    def record_hedge_submit(self, fill_records: List[OrderFilledEvent]):
+        now = time.perf_counter()
+        for _, fill_event in fill_records:
+            trade_id = fill_event.exchange_trade_id
+            # Only the first hedge of a fill counts, not the ones resubmitted after a failed hedge
+            if trade_id in self._fill_reception_times and trade_id not in self._hedge_submitted_trade_ids:
+                self._hedge_submitted_trade_ids.add(trade_id)
+                self.fill_to_hedge_submit_latency.observe(now - self._fill_reception_times[trade_id])
+
+    def record_hedge_fill(self, taker_order_id: str):
+        now = time.perf_counter()
+        for trade_id in self._ongoing_hedging.inverse.get(taker_order_id, ()):
+            reception_time = self._fill_reception_times.pop(trade_id, None)
+            self._hedge_submitted_trade_ids.discard(trade_id)
+            if reception_time is not None:
+                self.fill_to_hedge_fill_latency.observe(now - reception_time)
+
+    def discard_hedge_latency_tracking(self, trade_ids: Iterable[str]):
+        # The fills not hedged are not tracked either, so that their reception times don't pile up
+        for trade_id in trade_ids:
+            self._fill_reception_times.pop(trade_id, None)
+            self._hedge_submitted_trade_ids.discard(trade_id)
+
     def del_order_from_ongoing_hedging(self, taker_order_id: str):
         maker_exchange_trade_ids = self._ongoing_hedging.inverse[taker_order_id]
         del self._ongoing_hedging[maker_exchange_trade_ids]
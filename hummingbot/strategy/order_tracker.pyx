@@ -1,3 +1,4 @@
+import heapq
 from collections import (
     deque,
     OrderedDict
@@ -20,6 +21,14 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 NaN = float("nan")
 
 cdef class OrderTracker(TimeIterator):
+    """
+    Tracks the orders placed by a strategy.
+
+    The tracked limit orders are also indexed by side, and the active ones (without an in flight cancel) by side and
+    market pair, so the order lists used by the strategies are served without scanning every tracked order. The in
+    flight cancels are kept in a min-heap by cancel timestamp, so expired cancels are purged (and their orders become
+    active again) without scanning every in flight cancel.
+    """
     # ETH confirmation requirement of Binance has shortened to 12 blocks as of 7/15/2019.
     # 12 * 15 / 60 = 3 minutes
     SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION = 60.0 * 3
@@ -36,16 +45,19 @@ cdef class OrderTracker(TimeIterator):
         self._shadow_gc_requests = deque()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        self._in_flight_cancel_expiries = []
+        self._tracked_limit_order_entries = {}
+        self._tracked_bids = {}
+        self._tracked_asks = {}
+        self._active_limit_order_entries = {}
+        self._active_bids = {}
+        self._active_asks = {}
+        self._active_limit_orders_by_market_pair = {}
 
     @property
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        limit_orders = []
-        for market_pair, orders_map in self._tracked_limit_orders.items():
-            for limit_order in orders_map.values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append((market_pair.market, limit_order))
-        return limit_orders
+        self.c_expire_in_flight_cancels()
+        return list(self._active_limit_order_entries.values())
 
     @property
     def shadow_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
@@ -59,30 +71,31 @@ cdef class OrderTracker(TimeIterator):
 
     @property
     def market_pair_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
-        market_pair_to_orders = {}
-        market_pairs = self._tracked_limit_orders.keys()
-        for market_pair in market_pairs:
-            limit_orders = []
-            for limit_order in self._tracked_limit_orders[market_pair].values():
-                if self.c_has_in_flight_cancel(limit_order.client_order_id):
-                    continue
-                limit_orders.append(limit_order)
-            market_pair_to_orders[market_pair] = limit_orders
-        return market_pair_to_orders
+        self.c_expire_in_flight_cancels()
+        return {market_pair: list(self._active_limit_orders_by_market_pair.get(market_pair, {}).values())
+                for market_pair in self._tracked_limit_orders.keys()}
 
     @property
     def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if limit_order.is_buy]
+        self.c_expire_in_flight_cancels()
+        return list(self._active_bids.values())
 
     @property
     def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market, limit_order) for market, limit_order in self.active_limit_orders if not limit_order.is_buy]
+        self.c_expire_in_flight_cancels()
+        return list(self._active_asks.values())
 
     @property
     def tracked_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
-        return [(market_trading_pair_tuple[0], order) for market_trading_pair_tuple, order_map in
-                self._tracked_limit_orders.items()
-                for order in order_map.values()]
+        return list(self._tracked_limit_order_entries.values())
+
+    @property
+    def tracked_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
+        return list(self._tracked_bids.values())
+
+    @property
+    def tracked_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
+        return list(self._tracked_asks.values())
 
     @property
     def tracked_limit_orders_map(self) -> Dict[ConnectorBase, Dict[str, LimitOrder]]:
@@ -126,6 +139,7 @@ cdef class OrderTracker(TimeIterator):
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self.c_check_and_cleanup_shadow_records()
+        self.c_expire_in_flight_cancels()
 
     cdef dict c_get_limit_orders(self):
         return self._tracked_limit_orders
@@ -156,24 +170,20 @@ cdef class OrderTracker(TimeIterator):
         :param order_id: the order id to be canceled
         :return: True if there's no existing in flight cancel for the order id, False otherwise.
         """
-        cdef:
-            list keys_to_delete = []
-
         if order_id in self._in_flight_pending_created:  # Checks if a Buy/SellOrderCreatedEvent has been received
             return False
 
         # Maintain the cancel expiry time invariant.
-        for k, cancel_timestamp in self._in_flight_cancels.items():
-            if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
-                keys_to_delete.append(k)
-        for k in keys_to_delete:
-            del self._in_flight_cancels[k]
+        self.c_expire_in_flight_cancels()
 
-        if order_id in self.in_flight_cancels:
+        if order_id in self._in_flight_cancels:
             return False
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        heapq.heappush(self._in_flight_cancel_expiries, (self._current_timestamp, order_id))
+        if self.c_has_in_flight_cancel(order_id):
+            self.c_remove_active_limit_order(order_id)
         return True
 
     def check_and_track_cancel(self, order_id: str) -> bool:
@@ -233,12 +243,22 @@ cdef class OrderTracker(TimeIterator):
         self._order_id_to_market_pair[order_id] = market_pair
         self._shadow_order_id_to_market_pair[order_id] = market_pair
 
+        entry = (market_pair.market, limit_order)
+        self._tracked_limit_order_entries[order_id] = entry
+        (self._tracked_bids if is_buy else self._tracked_asks)[order_id] = entry
+        if not self.c_has_in_flight_cancel(order_id):
+            self.c_add_active_limit_order(order_id)
+
     def start_tracking_limit_order(self, market_pair: MarketTradingPairTuple, order_id: str, is_buy: bool, price: Decimal,
                                    quantity: Decimal):
         return self.c_start_tracking_limit_order(market_pair, order_id, is_buy, price, quantity)
 
     cdef c_stop_tracking_limit_order(self, object market_pair, str order_id):
         if market_pair in self._tracked_limit_orders and order_id in self._tracked_limit_orders[market_pair]:
+            self.c_remove_active_limit_order(order_id)
+            self._tracked_limit_order_entries.pop(order_id, None)
+            self._tracked_bids.pop(order_id, None)
+            self._tracked_asks.pop(order_id, None)
             del self._tracked_limit_orders[market_pair][order_id]
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
@@ -312,3 +332,50 @@ cdef class OrderTracker(TimeIterator):
 
     def remove_create_order_pending(self, order_id: str):
         self.c_remove_create_order_pending(order_id)
+
+    cdef c_add_active_limit_order(self, str order_id):
+        cdef:
+            tuple entry = self._tracked_limit_order_entries.get(order_id)
+            object market_pair
+
+        if entry is None:
+            return
+        market_pair = self._order_id_to_market_pair[order_id]
+        limit_order = entry[1]
+        self._active_limit_order_entries[order_id] = entry
+        (self._active_bids if limit_order.is_buy else self._active_asks)[order_id] = entry
+        if market_pair not in self._active_limit_orders_by_market_pair:
+            self._active_limit_orders_by_market_pair[market_pair] = {}
+        self._active_limit_orders_by_market_pair[market_pair][order_id] = limit_order
+
+    cdef c_remove_active_limit_order(self, str order_id):
+        cdef:
+            object market_pair
+
+        if self._active_limit_order_entries.pop(order_id, None) is None:
+            return
+        self._active_bids.pop(order_id, None)
+        self._active_asks.pop(order_id, None)
+        market_pair = self._order_id_to_market_pair.get(order_id)
+        market_pair_orders = self._active_limit_orders_by_market_pair.get(market_pair)
+        if market_pair_orders is not None:
+            market_pair_orders.pop(order_id, None)
+            if len(market_pair_orders) < 1:
+                del self._active_limit_orders_by_market_pair[market_pair]
+
+    cdef c_expire_in_flight_cancels(self):
+        """
+        Removes the in flight cancels that are older than the cancel expiry duration. The orders still tracked become
+        active again.
+        """
+        cdef:
+            list expiries = self._in_flight_cancel_expiries
+
+        # Same condition used by c_has_in_flight_cancel, so the active orders indexes are consistent with it
+        while len(expiries) > 0 and not (expiries[0][0] + self.CANCEL_EXPIRY_DURATION > self._current_timestamp):
+            cancel_timestamp, order_id = heapq.heappop(expiries)
+            # Stale entries of cancels already removed or tracked again later are ignored
+            if self._in_flight_cancels.get(order_id) != cancel_timestamp:
+                continue
+            del self._in_flight_cancels[order_id]
+            self.c_add_active_limit_order(order_id)
@@ -20,6 +20,14 @@ class PerpetualMarketMakingOrderTracker(OrderTracker):
     def active_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
         return self.tracked_limit_orders
 
+    @property
+    def active_bids(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
+        return self.tracked_bids
+
+    @property
+    def active_asks(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
+        return self.tracked_asks
+
     @property
     def shadow_limit_orders(self) -> List[Tuple[ConnectorBase, LimitOrder]]:
         limit_orders = []
@@ -3,6 +3,7 @@
 from libc.stdint cimport int64_t
 
 from hummingbot.strategy.strategy_base cimport StrategyBase
+from .tick_proposal cimport TickProposal
 
 
 cdef class PureMarketMakingStrategy(StrategyBase):
@@ -58,8 +59,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        bint _float_proposal_enabled
+        tuple _level_size_ticks_key
+        list _level_size_ticks
 
     cdef object c_get_mid_price(self)
+    cdef object c_create_proposal(self)
+    cdef tuple c_get_reference_prices(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
@@ -81,3 +87,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
+    cdef tuple c_get_inventory_skew_ratios(self)
+    cdef bint c_is_float_proposal_supported(self)
+    cdef list c_get_level_size_ticks(self, object size_quantum)
+    cdef TickProposal c_create_base_tick_proposal(self)
+    cdef bint c_add_level_ticks(self, TickProposal proposal, bint is_buy, object reference_price, list level_sizes)
+    cdef bint c_apply_add_transaction_costs_to_ticks(self, TickProposal proposal)
+    cdef bint c_apply_inventory_skew_to_ticks(self, TickProposal proposal)
+    cdef bint c_apply_budget_constraint_to_ticks(self, TickProposal proposal)
+    cdef bint c_filter_out_takers_from_ticks(self, TickProposal proposal)
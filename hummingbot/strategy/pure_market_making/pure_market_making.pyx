@@ -3,11 +3,14 @@ from decimal import Decimal
 from math import ceil, floor
 from typing import Dict, List, Optional
 
+from libcpp.vector cimport vector
+
 import numpy as np
 import pandas as pd
 
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
@@ -27,6 +30,8 @@ from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_ass
 from .inventory_skew_calculator import calculate_total_order_size
 from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
 from .moving_price_band import MovingPriceBand
+from .tick_proposal cimport TickOrder, TickProposal, c_multiply_ticks
+from .tick_proposal import MAX_INT64, MAX_TICKS, TickProposal, as_fraction
 
 
 NaN = float("nan")
@@ -35,6 +40,14 @@ s_decimal_neg_one = Decimal(-1)
 pmm_logger = None
 
 
+cdef bint c_is_exactly_subtracted(object balance, object unit):
+    """
+    Checks that subtracting multiples of unit from balance (down to zero) never needs more digits than the Decimal
+    precision, i.e. that Decimal calculates it exactly.
+    """
+    return balance.adjusted() - min(balance.as_tuple().exponent, unit.as_tuple().exponent) < 28
+
+
 cdef class PureMarketMakingStrategy(StrategyBase):
     OPTION_LOG_CREATE_ORDER = 1 << 3
     OPTION_LOG_MAKER_ORDER_FILLED = 1 << 4
@@ -85,7 +98,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     bid_order_level_spreads: List[Decimal] = None,
                     ask_order_level_spreads: List[Decimal] = None,
                     should_wait_order_cancel_confirmation: bool = True,
-                    moving_price_band: Optional[MovingPriceBand] = None
+                    moving_price_band: Optional[MovingPriceBand] = None,
+                    float_proposal_enabled: bool = False
                     ):
         if order_override is None:
             order_override = {}
@@ -144,6 +158,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._float_proposal_enabled = float_proposal_enabled
+        self._level_size_ticks_key = None
+        self._level_size_ticks = None
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -410,6 +427,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def moving_price_band(self) -> MovingPriceBand:
         return self._moving_price_band
 
+    @property
+    def float_proposal_enabled(self) -> bool:
+        return self._float_proposal_enabled
+
+    @float_proposal_enabled.setter
+    def float_proposal_enabled(self, value: bool):
+        self._float_proposal_enabled = value
+
     def get_price(self) -> Decimal:
         price_provider = self._asset_price_delegate or self._market_info
         if self._price_type is PriceType.LastOwnTrade:
@@ -685,6 +710,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
+    def create_proposal(self) -> Proposal:
+        return self.c_create_proposal()
+
     def execute_orders_proposal(self, proposal: Proposal):
         return self.c_execute_orders_proposal(proposal)
 
@@ -739,19 +767,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
+                proposal = self.c_create_proposal()
 
             self._hanging_orders_tracker.process_tick()
 
@@ -763,11 +779,55 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_base_proposal(self):
+    cdef object c_create_proposal(self):
+        """
+        Creates the orders proposal. When the float proposal is enabled and supported, the proposal is calculated in
+        ticks, with integers and doubles, and converted to Decimal at the end. From the first step where a value is
+        too close to a quantum boundary to be calculated with doubles, the proposal continues in Decimal.
+        """
+        cdef:
+            object proposal = None
+            TickProposal tick_proposal = None
+
+        if self.c_is_float_proposal_supported():
+            tick_proposal = self.c_create_base_tick_proposal()
+
+        # 1. Create base order proposals
+        if tick_proposal is None:
+            proposal = self.c_create_base_proposal()
+        # 2. Apply functions that limit numbers of buys and sells proposal
+        self.c_apply_order_levels_modifiers(proposal if tick_proposal is None else tick_proposal)
+        # 3. Apply functions that modify orders price
+        if (tick_proposal is not None and self._add_transaction_costs_to_orders
+                and not self.c_apply_add_transaction_costs_to_ticks(tick_proposal)):
+            proposal, tick_proposal = tick_proposal.c_to_proposal(), None
+        if tick_proposal is None:
+            self.c_apply_order_price_modifiers(proposal)
+        # 4. Apply functions that modify orders size
+        if (tick_proposal is not None and self._inventory_skew_enabled
+                and not self.c_apply_inventory_skew_to_ticks(tick_proposal)):
+            proposal, tick_proposal = tick_proposal.c_to_proposal(), None
+        if tick_proposal is None:
+            self.c_apply_order_size_modifiers(proposal)
+        # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+        if tick_proposal is not None and not self.c_apply_budget_constraint_to_ticks(tick_proposal):
+            proposal, tick_proposal = tick_proposal.c_to_proposal(), None
+        if tick_proposal is None:
+            self.c_apply_budget_constraint(proposal)
+
+        if not self._take_if_crossed:
+            if tick_proposal is not None and not self.c_filter_out_takers_from_ticks(tick_proposal):
+                proposal, tick_proposal = tick_proposal.c_to_proposal(), None
+            if tick_proposal is None:
+                self.c_filter_out_takers(proposal)
+
+        if tick_proposal is not None:
+            proposal = tick_proposal.c_to_proposal()
+        return proposal
+
+    cdef tuple c_get_reference_prices(self):
         cdef:
             ExchangeBase market = self._market_info.market
-            list buys = []
-            list sells = []
 
         buy_reference_price = sell_reference_price = self.get_price()
 
@@ -780,6 +840,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 base_balance = float(market.get_balance(self._market_info.base_asset))
                 if base_balance > 0:
                     raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
+        return buy_reference_price, sell_reference_price
+
+    cdef object c_create_base_proposal(self):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list buys = []
+            list sells = []
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
 
         # First to check if a customized order override is configured, otherwise the proposal will be created according
         # to order spread, amount, and levels setting.
@@ -887,13 +956,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         if self._inventory_skew_enabled:
             self.c_apply_inventory_skew(proposal)
 
-    cdef c_apply_inventory_skew(self, object proposal):
-        cdef:
-            ExchangeBase market = self._market_info.market
-            object bid_adj_ratio
-            object ask_adj_ratio
-            object size
-
+    cdef tuple c_get_inventory_skew_ratios(self):
+        """
+        :return: (bid ratio, ask ratio) to apply to the orders sizes, as floats
+        """
         base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_orders)
 
         total_order_size = calculate_total_order_size(self._order_amount, self._order_level_amount, self._order_levels)
@@ -904,8 +970,18 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             float(self._inventory_target_base_pct),
             float(total_order_size * self._inventory_range_multiplier)
         )
-        bid_adj_ratio = Decimal(bid_ask_ratios.bid_ratio)
-        ask_adj_ratio = Decimal(bid_ask_ratios.ask_ratio)
+        return bid_ask_ratios.bid_ratio, bid_ask_ratios.ask_ratio
+
+    cdef c_apply_inventory_skew(self, object proposal):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object bid_adj_ratio
+            object ask_adj_ratio
+            object size
+
+        bid_ratio, ask_ratio = self.c_get_inventory_skew_ratios()
+        bid_adj_ratio = Decimal(bid_ratio)
+        ask_adj_ratio = Decimal(ask_ratio)
 
         for buy in proposal.buys:
             size = buy.size * bid_adj_ratio
@@ -1054,6 +1130,246 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             price = sell.price * (Decimal(1) + fee.percent)
             sell.price = market.c_quantize_order_price(self.trading_pair, price)
 
+    cdef bint c_is_float_proposal_supported(self):
+        """
+        The proposal can be calculated in ticks only if the market quantizes prices and amounts with the constant
+        increments of its trading rules, and without the features that place orders at unquantized prices.
+        """
+        market_class = type(self._market_info.market)
+        return (self._float_proposal_enabled
+                and not self._order_optimization_enabled
+                and not self._order_override
+                and getattr(market_class, "get_order_price_quantum", None) is ExchangePyBase.get_order_price_quantum
+                and getattr(market_class, "get_order_size_quantum", None) is ExchangePyBase.get_order_size_quantum)
+
+    cdef list c_get_level_size_ticks(self, object size_quantum):
+        """
+        The quantized size of each order level, in ticks. As they only change with the configuration, they are
+        calculated (in Decimal) once.
+        :return: the sizes, or None if they are too big to be calculated with doubles
+        """
+        cdef:
+            int levels = max(self._buy_levels, self._sell_levels)
+            tuple key = (self._order_amount, self._order_level_amount, levels, size_quantum)
+        if key != self._level_size_ticks_key:
+            sizes = [int((self._order_amount + (self._order_level_amount * level)) // size_quantum)
+                     for level in range(levels)]
+            self._level_size_ticks = sizes if all(abs(size) < MAX_TICKS for size in sizes) else None
+            self._level_size_ticks_key = key
+        return self._level_size_ticks
+
+    cdef TickProposal c_create_base_tick_proposal(self):
+        """
+        Same as c_create_base_proposal, with prices and sizes in ticks. Prices are calculated exactly with int64
+        fractions, Decimal arithmetic being exact too for numbers of that size.
+        :return: the proposal, or None if the numbers are too big for int64
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            TickProposal proposal = None
+            list level_sizes
+
+        buy_reference_price, sell_reference_price = self.c_get_reference_prices()
+        price_quantum = market.c_get_order_price_quantum(self.trading_pair, buy_reference_price)
+        size_quantum = market.c_get_order_size_quantum(self.trading_pair, self._order_amount)
+        if len(price_quantum.as_tuple().digits) + len(size_quantum.as_tuple().digits) > 9:
+            # Order costs (in quantums) would have too many digits for Decimal to calculate them exactly
+            return None
+        level_sizes = self.c_get_level_size_ticks(size_quantum)
+        if level_sizes is None:
+            return None
+        proposal = TickProposal(price_quantum, size_quantum)
+
+        if (not buy_reference_price.is_nan()
+                and not self.c_add_level_ticks(proposal, True, buy_reference_price, level_sizes)):
+            return None
+        if (not sell_reference_price.is_nan()
+                and not self.c_add_level_ticks(proposal, False, sell_reference_price, level_sizes)):
+            return None
+        return proposal
+
+    cdef bint c_add_level_ticks(self, TickProposal proposal, bint is_buy, object reference_price, list level_sizes):
+        """
+        Adds the orders of each level of a side, their price being reference_price * (1 -/+ spread -/+ level spread)
+        rounded down to a tick, i.e. (first_numerator -/+ level * step_numerator) // denominator in ticks.
+        :return: False if the numbers are too big for int64
+        """
+        cdef:
+            int levels = self._buy_levels if is_buy else self._sell_levels
+            int64_t first_numerator
+            int64_t step_numerator
+            int64_t denominator
+            int64_t numerator
+            int level
+
+        if not reference_price.is_finite() or levels == 0:
+            return True
+        reference_numerator, reference_denominator = as_fraction(reference_price)
+        quantum_numerator, quantum_denominator = as_fraction(proposal._price_quantum)
+        spread_numerator, spread_denominator = as_fraction(self._bid_spread if is_buy else self._ask_spread)
+        level_spread_numerator, level_spread_denominator = as_fraction(self._order_level_spread)
+        sign = -1 if is_buy else 1
+        factor_denominator = max(spread_denominator, level_spread_denominator)
+        factor_first = factor_denominator + sign * spread_numerator * (factor_denominator // spread_denominator)
+        factor_step = sign * level_spread_numerator * (factor_denominator // level_spread_denominator)
+        python_first_numerator = reference_numerator * quantum_denominator * factor_first
+        python_step_numerator = reference_numerator * quantum_denominator * factor_step
+        python_denominator = reference_denominator * factor_denominator * quantum_numerator
+        if not (abs(python_first_numerator) + (levels - 1) * abs(python_step_numerator) <= MAX_INT64
+                and 0 < python_denominator <= MAX_INT64):
+            return False
+        first_numerator = python_first_numerator
+        step_numerator = python_step_numerator
+        denominator = python_denominator
+
+        for level in range(levels):
+            if level_sizes[level] > 0:
+                numerator = first_numerator + level * step_numerator
+                if numerator < 0:
+                    return False
+                if is_buy:
+                    proposal.c_add_buy(numerator // denominator, level_sizes[level])
+                else:
+                    proposal.c_add_sell(numerator // denominator, level_sizes[level])
+        return True
+
+    cdef bint c_apply_add_transaction_costs_to_ticks(self, TickProposal proposal):
+        """
+        Same as c_apply_add_transaction_costs, with the fee percent of the first order of each side (percent fees don't
+        depend on the order amount and price).
+        :return: False if the numbers are too big for int64, the proposal is left unchanged then
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+
+        buy_ratio = sell_ratio = (1, 1)
+        buy = proposal.c_get_first_order(True)
+        if buy is not None:
+            fee = market.c_get_fee(self.base_asset, self.quote_asset,
+                                   self._limit_order_type, TradeType.BUY, buy.size, buy.price)
+            buy_ratio = as_fraction(Decimal(1) - fee.percent)
+        sell = proposal.c_get_first_order(False)
+        if sell is not None:
+            fee = market.c_get_fee(self.base_asset, self.quote_asset,
+                                   self._limit_order_type, TradeType.SELL, sell.size, sell.price)
+            sell_ratio = as_fraction(Decimal(1) + fee.percent)
+        if max(*buy_ratio, *sell_ratio) > MAX_INT64:
+            return False
+        return proposal.c_scale_prices(buy_ratio[0], buy_ratio[1], sell_ratio[0], sell_ratio[1])
+
+    cdef bint c_apply_inventory_skew_to_ticks(self, TickProposal proposal):
+        """
+        Same as c_apply_inventory_skew, with sizes in ticks.
+        :return: False if the sizes can't be rounded down with certainty, the proposal is left unchanged then
+        """
+        bid_ratio, ask_ratio = self.c_get_inventory_skew_ratios()
+        return proposal.c_scale_sizes(bid_ratio, ask_ratio)
+
+    cdef bint c_apply_budget_constraint_to_ticks(self, TickProposal proposal):
+        """
+        Same as c_apply_budget_constraint, with the buy fee percent of the first buy order. The balances are split in
+        a number of units (an order cost is always a whole number of units) plus a remainder, so comparing them with
+        the orders and subtracting the orders from them is done exactly with int64.
+        :return: False if the numbers are too big for int64, the proposal is left unchanged then
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            vector[TickOrder] buys = proposal._buys
+            vector[TickOrder] sells = proposal._sells
+            int64_t fee_numerator
+            int64_t quote_units
+            bint has_quote_remainder
+            int64_t price_units = 0
+            int64_t cost_units = 0
+            int64_t base_units
+            bint has_base_remainder
+            size_t i
+
+        base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+        if not (base_balance.is_finite() and quote_balance.is_finite()
+                and base_balance >= s_decimal_zero and quote_balance >= s_decimal_zero):
+            return False
+
+        if buys.size() > 0:
+            buy = proposal.c_get_first_order(True)
+            buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
+                                       buy.size, buy.price)
+            fee_factor_numerator, fee_factor_denominator = as_fraction(Decimal(1) + buy_fee.percent)
+            # An order cost is size_ticks * price_ticks * fee_numerator units
+            quote_unit = proposal._size_quantum * proposal._price_quantum / fee_factor_denominator
+            python_quote_units, quote_remainder = divmod(quote_balance, quote_unit)
+            if not (0 < fee_factor_numerator <= MAX_INT64 and python_quote_units <= MAX_INT64
+                    and c_is_exactly_subtracted(quote_balance, quote_unit)):
+                return False
+            fee_numerator = fee_factor_numerator
+            quote_units = int(python_quote_units)
+            has_quote_remainder = quote_remainder != s_decimal_zero
+            for i in range(buys.size()):
+                if quote_units == 0 and not has_quote_remainder:
+                    buys[i].size = 0
+                    continue
+                if not (c_multiply_ticks(buys[i].price, fee_numerator, 1, &price_units)
+                        and c_multiply_ticks(buys[i].size, price_units, 1, &cost_units)):
+                    return False
+                if quote_units < cost_units:
+                    # Adjust buy order size to use remaining balance if less than the order amount. Decimal rounds the
+                    # balance divided by the price with fee to 28 digits, which could round it up to the next tick.
+                    if has_quote_remainder and quote_units % price_units == price_units - 1:
+                        return False
+                    buys[i].size = quote_units // price_units
+                    quote_units = 0
+                    has_quote_remainder = False
+                else:
+                    quote_units -= cost_units
+
+        if sells.size() > 0:
+            python_base_units, base_remainder = divmod(base_balance, proposal._size_quantum)
+            if not (python_base_units <= MAX_INT64
+                    and c_is_exactly_subtracted(base_balance, proposal._size_quantum)):
+                return False
+            base_units = int(python_base_units)
+            has_base_remainder = base_remainder != s_decimal_zero
+            for i in range(sells.size()):
+                if base_units == 0 and not has_base_remainder:
+                    sells[i].size = 0
+                elif base_units < sells[i].size:
+                    # Adjust sell order size to use remaining balance if less than the order amount
+                    sells[i].size = base_units
+                    base_units = 0
+                    has_base_remainder = False
+                else:
+                    base_units -= sells[i].size
+
+        proposal._buys.swap(buys)
+        proposal._sells.swap(sells)
+        proposal.c_filter_out_empty_orders()
+        return True
+
+    cdef bint c_filter_out_takers_from_ticks(self, TickProposal proposal):
+        """
+        Same as c_filter_out_takers, comparing prices in ticks.
+        :return: False if the top prices are out of the int64 range, the proposal is left unchanged then
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            int64_t top_ask_ticks = MAX_INT64
+            bint is_top_ask_on_tick = True
+            int64_t top_bid_ticks = -1
+
+        top_ask = market.c_get_price(self.trading_pair, True)
+        if not top_ask.is_nan():
+            if not s_decimal_zero <= top_ask < MAX_INT64 * proposal._price_quantum:
+                return False
+            top_ask_ticks = int(top_ask // proposal._price_quantum)
+            is_top_ask_on_tick = top_ask_ticks * proposal._price_quantum == top_ask
+        top_bid = market.c_get_price(self.trading_pair, False)
+        if not top_bid.is_nan():
+            if not s_decimal_zero <= top_bid < MAX_INT64 * proposal._price_quantum:
+                return False
+            top_bid_ticks = int(top_bid // proposal._price_quantum)
+        proposal.c_filter_out_takers(top_ask_ticks, is_top_ask_on_tick, top_bid_ticks)
+        return True
+
     cdef c_did_fill_order(self, object order_filled_event):
         cdef:
             str order_id = order_filled_event.order_id
@@ -393,6 +393,13 @@ pure_market_making_config_map = {
                   type_str="bool",
                   default=True,
                   validator=validate_bool),
+    "float_proposal_enabled":
+        ConfigVar(key="float_proposal_enabled",
+                  prompt="Do you want to calculate the orders proposal with floating point numbers, converting prices "
+                         "and amounts to Decimal only when quantizing them? (Yes/No) >>> ",
+                  type_str="bool",
+                  default=False,
+                  validator=validate_bool),
     "split_order_levels_enabled":
         ConfigVar(key="split_order_levels_enabled",
                   prompt="Do you want bid and ask orders to be placed at multiple defined spread and amount? "
@@ -0,0 +1,32 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+
+cdef struct TickOrder:
+    int64_t price
+    int64_t size
+
+
+cdef bint c_floor_ticks(double value, double magnitude, int64_t *ticks)
+cdef bint c_scale_ticks(int64_t ticks, double ratio, int64_t *scaled_ticks)
+cdef bint c_multiply_ticks(int64_t ticks, int64_t numerator, int64_t denominator, int64_t *result)
+
+
+cdef class TickProposal:
+    cdef:
+        vector[TickOrder] _buys
+        vector[TickOrder] _sells
+        object _price_quantum
+        object _size_quantum
+
+    cdef c_add_buy(self, int64_t price, int64_t size)
+    cdef c_add_sell(self, int64_t price, int64_t size)
+    cdef object c_get_first_order(self, bint is_buy)
+    cdef bint c_scale_prices(self, int64_t buy_numerator, int64_t buy_denominator,
+                             int64_t sell_numerator, int64_t sell_denominator)
+    cdef bint c_scale_sizes(self, double buy_ratio, double sell_ratio)
+    cdef c_filter_out_empty_orders(self)
+    cdef c_filter_out_takers(self, int64_t top_ask, bint is_top_ask_on_tick, int64_t top_bid)
+    cdef object c_to_proposal(self)
@@ -0,0 +1,264 @@
+# distutils: language=c++
+
+from decimal import Decimal
+from typing import List, Tuple
+
+from libc.math cimport floor, fma, isfinite
+from libc.stdint cimport INT64_MAX
+
+from .data_types import PriceSize, Proposal
+
+# Maximum relative error accepted for a value calculated with doubles. Values closer than that to a quantum boundary
+# are too close to call, and have to be calculated with Decimal.
+cdef double RELATIVE_TOLERANCE = 1e-9
+# Number of ticks above which doubles can't represent every integer
+MAX_TICKS = 1 << 53
+cdef double c_max_ticks = MAX_TICKS
+# Largest int64 value, the integers calculated with ticks have to stay below it
+MAX_INT64 = (1 << 63) - 1
+
+
+def as_fraction(value: Decimal) -> Tuple[int, int]:
+    """
+    :return: (numerator, denominator) with value == numerator / denominator, the denominator being a power of ten
+    """
+    exponent = value.as_tuple().exponent
+    if exponent >= 0:
+        return int(value), 1
+    return int(value.scaleb(-exponent)), 10 ** -exponent
+
+
+cdef bint c_floor_ticks(double value, double magnitude, int64_t *ticks):
+    """
+    Rounds down an amount expressed in ticks (number of quantums), the way the amount is quantized with Decimal.
+    :param value: the amount divided by its quantum
+    :param magnitude: the magnitude (in ticks) of the terms the value is calculated from
+    :param ticks: where the rounded down value is stored
+    :return: False if the value is negative, too big, or too close to a quantum boundary to be rounded down with
+    certainty
+    """
+    cdef:
+        double tolerance = RELATIVE_TOLERANCE * magnitude
+        double floored
+    if not (value - tolerance >= 0 and value + tolerance < c_max_ticks):
+        return False
+    floored = floor(value)
+    if value - floored <= tolerance or floored + 1 - value <= tolerance:
+        return False
+    ticks[0] = <int64_t>floored
+    return True
+
+
+cdef bint c_scale_ticks(int64_t ticks, double ratio, int64_t *scaled_ticks):
+    """
+    Multiplies an amount in ticks by a float ratio and rounds it down to a tick.
+    :param ratio: the multiplier, it has to be the exact value of the Decimal the amount is multiplied by
+    :return: False if the result can't be rounded down with certainty
+    """
+    cdef double scaled
+    if not isfinite(ratio) or not 0 <= ticks < c_max_ticks:
+        return False
+    scaled = ticks * ratio
+    if 0 <= scaled < c_max_ticks and fma(<double>ticks, ratio, -scaled) == 0:
+        # The product is exact, and Decimal can't round a non integer double up to the next integer
+        scaled_ticks[0] = <int64_t>floor(scaled)
+        return True
+    return c_floor_ticks(scaled, scaled, scaled_ticks)
+
+
+cdef bint c_scale_ticks_with_decimal(int64_t ticks, double ratio, object quantum, int64_t *scaled_ticks):
+    """
+    Same as c_scale_ticks, calculated with Decimal the way an amount is scaled and quantized, for the results too
+    close to a quantum boundary to be rounded down with doubles.
+    :return: False if the ratio isn't finite or the result doesn't fit in an int64
+    """
+    if not isfinite(ratio):
+        return False
+    scaled = (Decimal(ticks) * quantum * Decimal(ratio)) // quantum
+    if not 0 <= scaled <= MAX_INT64:
+        return False
+    scaled_ticks[0] = int(scaled)
+    return True
+
+
+cdef bint c_multiply_ticks(int64_t ticks, int64_t numerator, int64_t denominator, int64_t *result):
+    """
+    Multiplies an amount in ticks by the fraction numerator / denominator, rounding it down to a tick. The calculation
+    is exact.
+    :return: False if an operand is negative or the product doesn't fit in an int64
+    """
+    if ticks < 0 or numerator < 0 or denominator <= 0:
+        return False
+    if numerator != 0 and ticks > INT64_MAX // numerator:
+        return False
+    result[0] = (ticks * numerator) // denominator
+    return True
+
+
+cdef list c_to_list(vector[TickOrder] &orders):
+    cdef:
+        list result = []
+        TickOrder order
+    for order in orders:
+        result.append((order.price, order.size))
+    return result
+
+
+cdef list c_to_price_sizes(vector[TickOrder] &orders, object price_quantum, object size_quantum):
+    cdef:
+        list result = []
+        TickOrder order
+    for order in orders:
+        result.append(PriceSize(Decimal(order.price) * price_quantum, Decimal(order.size) * size_quantum))
+    return result
+
+
+cdef class TickProposal:
+    """
+    Orders proposal with prices and sizes in ticks, i.e. as a number of price quantums and size quantums.
+    """
+
+    def __init__(self, price_quantum: Decimal, size_quantum: Decimal):
+        self._price_quantum = price_quantum
+        self._size_quantum = size_quantum
+
+    @property
+    def price_quantum(self) -> Decimal:
+        return self._price_quantum
+
+    @property
+    def size_quantum(self) -> Decimal:
+        return self._size_quantum
+
+    @property
+    def buys(self) -> List[Tuple[int, int]]:
+        return c_to_list(self._buys)
+
+    @buys.setter
+    def buys(self, orders: List[Tuple[int, int]]):
+        self._buys.clear()
+        for price, size in orders:
+            self.c_add_buy(price, size)
+
+    @property
+    def sells(self) -> List[Tuple[int, int]]:
+        return c_to_list(self._sells)
+
+    @sells.setter
+    def sells(self, orders: List[Tuple[int, int]]):
+        self._sells.clear()
+        for price, size in orders:
+            self.c_add_sell(price, size)
+
+    def to_proposal(self) -> Proposal:
+        return self.c_to_proposal()
+
+    cdef c_add_buy(self, int64_t price, int64_t size):
+        cdef TickOrder order
+        order.price = price
+        order.size = size
+        self._buys.push_back(order)
+
+    cdef c_add_sell(self, int64_t price, int64_t size):
+        cdef TickOrder order
+        order.price = price
+        order.size = size
+        self._sells.push_back(order)
+
+    cdef object c_get_first_order(self, bint is_buy):
+        """
+        :return: the first buy or sell order as a PriceSize, None if there are no orders on that side
+        """
+        cdef vector[TickOrder] *orders = &self._buys if is_buy else &self._sells
+        if orders.empty():
+            return None
+        return PriceSize(Decimal(orders.front().price) * self._price_quantum,
+                         Decimal(orders.front().size) * self._size_quantum)
+
+    cdef bint c_scale_prices(self, int64_t buy_numerator, int64_t buy_denominator,
+                             int64_t sell_numerator, int64_t sell_denominator):
+        """
+        Multiplies the buy and sell prices by their ratio (as a fraction), rounding them down to a tick. The proposal
+        is left unchanged if any price is out of the int64 range.
+        """
+        cdef:
+            vector[TickOrder] buys = self._buys
+            vector[TickOrder] sells = self._sells
+            int64_t price
+            size_t i
+        for i in range(buys.size()):
+            if not c_multiply_ticks(buys[i].price, buy_numerator, buy_denominator, &price):
+                return False
+            buys[i].price = price
+        for i in range(sells.size()):
+            if not c_multiply_ticks(sells[i].price, sell_numerator, sell_denominator, &price):
+                return False
+            sells[i].price = price
+        self._buys.swap(buys)
+        self._sells.swap(sells)
+        return True
+
+    cdef bint c_scale_sizes(self, double buy_ratio, double sell_ratio):
+        """
+        Multiplies the buy and sell sizes by their ratio, rounding them down to a tick. The sizes too close to a tick
+        boundary are calculated with Decimal. The proposal is left unchanged if any size can't be scaled.
+        """
+        cdef:
+            vector[TickOrder] buys = self._buys
+            vector[TickOrder] sells = self._sells
+            int64_t size
+            size_t i
+        for i in range(buys.size()):
+            if not (c_scale_ticks(buys[i].size, buy_ratio, &size)
+                    or c_scale_ticks_with_decimal(buys[i].size, buy_ratio, self._size_quantum, &size)):
+                return False
+            buys[i].size = size
+        for i in range(sells.size()):
+            if not (c_scale_ticks(sells[i].size, sell_ratio, &size)
+                    or c_scale_ticks_with_decimal(sells[i].size, sell_ratio, self._size_quantum, &size)):
+                return False
+            sells[i].size = size
+        self._buys.swap(buys)
+        self._sells.swap(sells)
+        return True
+
+    cdef c_filter_out_empty_orders(self):
+        cdef:
+            vector[TickOrder] buys
+            vector[TickOrder] sells
+            TickOrder order
+        for order in self._buys:
+            if order.size > 0:
+                buys.push_back(order)
+        for order in self._sells:
+            if order.size > 0:
+                sells.push_back(order)
+        self._buys.swap(buys)
+        self._sells.swap(sells)
+
+    cdef c_filter_out_takers(self, int64_t top_ask, bint is_top_ask_on_tick, int64_t top_bid):
+        """
+        Removes the orders that would be filled as takers.
+        :param top_ask: the top ask price rounded down to a tick
+        :param is_top_ask_on_tick: if rounding down the top ask price left it unchanged
+        :param top_bid: the top bid price rounded down to a tick
+        """
+        cdef:
+            vector[TickOrder] buys
+            vector[TickOrder] sells
+            TickOrder order
+        for order in self._buys:
+            if order.price < top_ask or (order.price == top_ask and not is_top_ask_on_tick):
+                buys.push_back(order)
+        for order in self._sells:
+            if order.price > top_bid:
+                sells.push_back(order)
+        self._buys.swap(buys)
+        self._sells.swap(sells)
+
+    cdef object c_to_proposal(self):
+        return Proposal(c_to_price_sizes(self._buys, self._price_quantum, self._size_quantum),
+                        c_to_price_sizes(self._sells, self._price_quantum, self._size_quantum))
+
+    def __repr__(self):
+        return f"{self._buys.size()} buys: {self.buys} {self._sells.size()} sells: {self.sells}"
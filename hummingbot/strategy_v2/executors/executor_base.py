@@ -1,6 +1,7 @@
+import asyncio
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -25,11 +26,26 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 from hummingbot.strategy_v2.runnable_base import RunnableBase
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+
 
 class ExecutorBase(RunnableBase):
     """
     Base class for all executors. Executors are responsible for executing orders based on the strategy.
     """
+    # Market events processed by the executors, with the name of the method that processes each one
+    ORDER_EVENT_PROCESSORS: Dict[MarketEvent, str] = {
+        MarketEvent.OrderCancelled: "process_order_canceled_event",
+        MarketEvent.BuyOrderCreated: "process_order_created_event",
+        MarketEvent.SellOrderCreated: "process_order_created_event",
+        MarketEvent.OrderFilled: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted: "process_order_completed_event",
+        MarketEvent.OrderFailure: "process_order_failed_event",
+    }
+    _order_event_processors_by_tag: Dict[int, str] = {
+        event.value: method_name for event, method_name in ORDER_EVENT_PROCESSORS.items()}
 
     def __init__(self, strategy: ScriptStrategyBase, connectors: List[str], config: ExecutorConfigBase, update_interval: float = 0.5):
         """
@@ -45,27 +61,21 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp: Optional[float] = None
         self._strategy: ScriptStrategyBase = strategy
         self._held_position_orders = []  # Keep track of orders that become held positions
+        self._event_router: Optional["ExecutorEventRouter"] = None
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        # Cached executor info, rebuilt only when the state version or the timestamp of an active executor changes
+        self._state_version: int = 0
+        self._executor_info_cache: Optional[ExecutorInfo] = None
+        self._executor_info_cache_key: Optional[Tuple] = None
+
+        # Event forwarder for the order events, dispatched to the process methods by event tag
+        self._order_event_forwarder = SourceInfoEventForwarder(self.process_order_event)
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
-            (MarketEvent.OrderCancelled, self._cancel_order_forwarder),
-            (MarketEvent.BuyOrderCreated, self._create_buy_order_forwarder),
-            (MarketEvent.SellOrderCreated, self._create_sell_order_forwarder),
-            (MarketEvent.OrderFilled, self._fill_order_forwarder),
-            (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
-            (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder),
-            (MarketEvent.OrderFailure, self._failed_order_forwarder),
+            (event, self._order_event_forwarder) for event in self.ORDER_EVENT_PROCESSORS
         ]
 
     @property
@@ -103,8 +113,37 @@ class ExecutorBase(RunnableBase):
         """
         return self._status == RunnableStatus.TERMINATED
 
+    @property
+    def state_version(self) -> int:
+        """
+        Returns a counter that is increased every time the state of the executor changes.
+        """
+        return self._state_version
+
+    def mark_state_changed(self):
+        """
+        Marks the state of the executor as changed, so the executor info is rebuilt the next time it is requested.
+        """
+        self._state_version += 1
+
     @property
     def executor_info(self) -> ExecutorInfo:
+        """
+        Returns the executor info. The info is cached until the state of the executor changes or, while the executor
+        is not closed, until the strategy timestamp changes, since its PnL depends on market prices. The state is
+        marked as changed on the order events, on the orders placed and after every control task run, the subclasses
+        changing the state shown in the info elsewhere must call `mark_state_changed`.
+
+        The same object is returned to every caller (the orchestrator, the controllers), it must not be mutated.
+        """
+        cache_key = (self._state_version, self._status, self.close_type,
+                     None if self.is_closed else self._strategy.current_timestamp)
+        if self._executor_info_cache is None or self._executor_info_cache_key != cache_key:
+            self._executor_info_cache = self._build_executor_info()
+            self._executor_info_cache_key = cache_key
+        return self._executor_info_cache
+
+    def _build_executor_info(self) -> ExecutorInfo:
         """
         Returns the executor info.
         """
@@ -160,6 +199,7 @@ class ExecutorBase(RunnableBase):
         Starts the executor and registers the events.
         """
         super().start()
+        self.mark_state_changed()
         self.register_events()
 
     def stop(self):
@@ -168,8 +208,25 @@ class ExecutorBase(RunnableBase):
         """
         self.close_timestamp = self._strategy.current_timestamp
         super().stop()
+        self.mark_state_changed()
         self.unregister_events()
 
+    async def control_loop(self):
+        """
+        Runs the control task every update interval, marking the state of the executor as changed after every run
+        since the control task updates the state shown in the executor info.
+        """
+        await self.on_start()
+        while not self.terminated.is_set():
+            try:
+                await self.control_task()
+            except Exception as e:
+                self.logger().error(e, exc_info=True)
+            finally:
+                self.mark_state_changed()
+                await asyncio.sleep(self.update_interval)
+        self.on_stop()
+
     async def on_start(self):
         """
         Called when the executor is started.
@@ -243,18 +300,33 @@ class ExecutorBase(RunnableBase):
         """
         return self.connectors[connector_name]._order_tracker.fetch_order(client_order_id=order_id)
 
+    def set_event_router(self, event_router: "ExecutorEventRouter"):
+        """
+        Sets the event router used to receive the events of the orders placed by the executor. When it is set, the
+        executor does not register its own listeners in the connectors. It must be called before the executor starts.
+
+        :param event_router: The event router shared by the executors of the orchestrator.
+        """
+        self._event_router = event_router
+
     def register_events(self):
         """
-        Registers the events with the connectors.
+        Registers the events with the connectors, or with the event router if the executor has one.
         """
+        if self._event_router is not None:
+            self._event_router.register_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.add_listener(event_pair[0], event_pair[1])
 
     def unregister_events(self):
         """
-        Unregisters the events from the connectors.
+        Unregisters the events from the connectors, or from the event router if the executor has one.
         """
+        if self._event_router is not None:
+            self._event_router.unregister_executor(self)
+            return
         for connector in self.connectors.values():
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
@@ -287,9 +359,13 @@ class ExecutorBase(RunnableBase):
         :return: The result of the order placement.
         """
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        if self._event_router is not None and order_id:
+            self._event_router.track_order(self, order_id)
+        self.mark_state_changed()
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         """
@@ -351,6 +427,20 @@ class ExecutorBase(RunnableBase):
         """
         return self._strategy.get_active_orders(connector_name)
 
+    def process_order_event(self, event_tag: int, market: ConnectorBase, event):
+        """
+        Marks the state of the executor as changed and dispatches an order event to the method that processes it.
+
+        :param event_tag: The event tag.
+        :param market: The market where the event occurred.
+        :param event: The event.
+        """
+        method_name = self._order_event_processors_by_tag.get(event_tag)
+        if method_name is None:
+            return
+        self.mark_state_changed()
+        getattr(self, method_name)(event_tag, market, event)
+
     def process_order_completed_event(self,
                                       event_tag: int,
                                       market: ConnectorBase,
@@ -0,0 +1,113 @@
+import logging
+from typing import Dict, List, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+
+
+class ExecutorEventRouter:
+    """
+    Routes order events from the connectors to the executor that placed the order.
+
+    A single listener is registered per connector and market event, no matter how many executors are running on that
+    connector. Every order placed by an executor is recorded in an order id -> executor table, so each event is
+    delivered only to its owner in O(1) instead of being broadcast to every live executor.
+    """
+    _logger = None
+    ROUTED_EVENTS = list(ExecutorBase.ORDER_EVENT_PROCESSORS.keys())
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._event_forwarder = SourceInfoEventForwarder(self._route_event)
+        self._executors_by_order_id: Dict[str, ExecutorBase] = {}
+        self._order_ids_by_executor: Dict[int, Set[str]] = {}
+        self._executors_count_by_connector: Dict[int, int] = {}
+        self._connectors: Dict[int, ConnectorBase] = {}
+
+    @property
+    def tracked_orders_count(self) -> int:
+        return len(self._executors_by_order_id)
+
+    @property
+    def connectors(self) -> List[ConnectorBase]:
+        return list(self._connectors.values())
+
+    def register_executor(self, executor: ExecutorBase):
+        """
+        Registers an executor in the router, adding the router listeners to the connectors it uses if they are not
+        already registered.
+
+        :param executor: The executor to register.
+        """
+        if id(executor) in self._order_ids_by_executor:
+            return
+        self._order_ids_by_executor[id(executor)] = set()
+        for connector in executor.connectors.values():
+            connector_key = id(connector)
+            executors_count = self._executors_count_by_connector.get(connector_key, 0)
+            if executors_count == 0:
+                self._connectors[connector_key] = connector
+                for event in self.ROUTED_EVENTS:
+                    connector.add_listener(event, self._event_forwarder)
+            self._executors_count_by_connector[connector_key] = executors_count + 1
+
+    def unregister_executor(self, executor: ExecutorBase):
+        """
+        Removes an executor and all its orders from the router. The router listeners are removed from a connector
+        once no registered executor uses it.
+
+        :param executor: The executor to unregister.
+        """
+        order_ids = self._order_ids_by_executor.pop(id(executor), None)
+        if order_ids is None:
+            return
+        for order_id in order_ids:
+            self._executors_by_order_id.pop(order_id, None)
+        for connector in executor.connectors.values():
+            connector_key = id(connector)
+            executors_count = self._executors_count_by_connector.get(connector_key, 0) - 1
+            if executors_count > 0:
+                self._executors_count_by_connector[connector_key] = executors_count
+                continue
+            self._executors_count_by_connector.pop(connector_key, None)
+            self._connectors.pop(connector_key, None)
+            for event in self.ROUTED_EVENTS:
+                connector.remove_listener(event, self._event_forwarder)
+
+    def track_order(self, executor: ExecutorBase, order_id: str):
+        """
+        Associates an order with the executor that placed it, so its events are routed to that executor.
+
+        :param executor: The executor that placed the order.
+        :param order_id: The client order id.
+        """
+        order_ids = self._order_ids_by_executor.get(id(executor))
+        if order_ids is None:
+            self.logger().warning(f"Order {order_id} placed by an executor not registered in the event router.")
+            return
+        order_ids.add(order_id)
+        self._executors_by_order_id[order_id] = executor
+
+    def stop(self):
+        """
+        Removes the router listeners from all connectors and clears the routing table.
+        """
+        for connector in self._connectors.values():
+            for event in self.ROUTED_EVENTS:
+                connector.remove_listener(event, self._event_forwarder)
+        self._connectors.clear()
+        self._executors_count_by_connector.clear()
+        self._order_ids_by_executor.clear()
+        self._executors_by_order_id.clear()
+
+    def _route_event(self, event_tag: int, market: ConnectorBase, event):
+        executor = self._executors_by_order_id.get(getattr(event, "order_id", None))
+        if executor is not None:
+            executor.process_order_event(event_tag, market, event)
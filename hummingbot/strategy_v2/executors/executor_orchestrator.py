@@ -3,7 +3,7 @@ import logging
 import uuid
 from collections import deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import PositionAction, PositionMode, PriceType, TradeType
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -49,6 +50,10 @@ class PositionHold:
         self.sell_amount_base = Decimal("0")
         self.sell_amount_quote = Decimal("0")
 
+        # Last position summary, reused while the mid price and the amounts don't change
+        self._summary_cache_key: Optional[Tuple] = None
+        self._summary_cache: Optional[PositionSummary] = None
+
     def add_orders_from_executor(self, executor: ExecutorInfo):
         custom_info = executor.custom_info
         if "held_position_orders" not in custom_info or len(custom_info["held_position_orders"]) == 0:
@@ -89,6 +94,11 @@ class PositionHold:
         if self.sell_amount_quote.is_nan() and self.sell_amount_base > 0:
             self.sell_amount_quote = self.sell_amount_base * mid_price
 
+        cache_key = (mid_price, self.buy_amount_base, self.buy_amount_quote, self.sell_amount_base,
+                     self.sell_amount_quote, self.volume_traded_quote, self.cum_fees_quote)
+        if self._summary_cache is not None and self._summary_cache_key == cache_key:
+            return self._summary_cache
+
         # Calculate buy and sell breakeven prices
         buy_breakeven_price = self.buy_amount_quote / self.buy_amount_base if self.buy_amount_base > 0 else Decimal("0")
         sell_breakeven_price = self.sell_amount_quote / self.sell_amount_base if self.sell_amount_base > 0 else Decimal("0")
@@ -120,7 +130,8 @@ class PositionHold:
                 breakeven_price = remaining_quote / remaining_base
                 unrealized_pnl_quote = (breakeven_price - mid_price) * remaining_base
 
-        return PositionSummary(
+        self._summary_cache_key = cache_key
+        self._summary_cache = PositionSummary(
             connector_name=self.connector_name,
             trading_pair=self.trading_pair,
             volume_traded_quote=self.volume_traded_quote,
@@ -130,6 +141,7 @@ class PositionHold:
             unrealized_pnl_quote=unrealized_pnl_quote,
             realized_pnl_quote=realized_pnl_quote,
             cum_fees_quote=self.cum_fees_quote)
+        return self._summary_cache
 
 
 class ExecutorOrchestrator:
@@ -165,7 +177,10 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
+        # Aggregated performance of the active executors by controller, with the executor infos it was computed from
+        self._executors_performance_cache: Dict[str, Tuple[List[ExecutorInfo], Dict]] = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        self.event_router = ExecutorEventRouter()
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -305,6 +320,7 @@ class ExecutorOrchestrator:
         self.store_all_positions()
         # Clear executors and trigger garbage collection
         self.active_executors.clear()
+        self.event_router.stop()
 
     def store_all_positions(self):
         """
@@ -397,6 +413,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_event_router(self.event_router)
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -527,27 +544,37 @@ class ExecutorOrchestrator:
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
-        Generate a report of all executors.
+        Generate a report of all executors. The executor infos are the cached infos of the executors, they must not
+        be mutated.
         """
         report = {}
         for controller_id, executors_list in self.active_executors.items():
             report[controller_id] = [executor.executor_info for executor in executors_list if executor]
         return report
 
-    def get_positions_report(self) -> Dict[str, List[PositionSummary]]:
+    def get_positions_report(self, mid_prices: Optional[Dict[Tuple[str, str], Decimal]] = None) -> Dict[str, List[PositionSummary]]:
         """
         Generate a report of all positions held.
+
+        :param mid_prices: Optional cache of mid prices by (connector name, trading pair) shared between reports.
         """
+        mid_prices = {} if mid_prices is None else mid_prices
         report = {}
         for controller_id, positions_list in self.positions_held.items():
             positions_summary = []
             for position in positions_list:
-                mid_price = self.strategy.market_data_provider.get_price_by_type(
-                    position.connector_name, position.trading_pair, PriceType.MidPrice)
+                mid_price = self._get_position_mid_price(position, mid_prices)
                 positions_summary.append(position.get_position_summary(mid_price))
             report[controller_id] = positions_summary
         return report
 
+    def _get_position_mid_price(self, position: PositionHold, mid_prices: Dict[Tuple[str, str], Decimal]) -> Decimal:
+        key = (position.connector_name, position.trading_pair)
+        if key not in mid_prices:
+            mid_prices[key] = self.strategy.market_data_provider.get_price_by_type(
+                position.connector_name, position.trading_pair, PriceType.MidPrice)
+        return mid_prices[key]
+
     def get_all_reports(self) -> Dict[str, Dict]:
         """
         Generate a unified report containing executors, positions, and performance for all controllers.
@@ -556,9 +583,10 @@ class ExecutorOrchestrator:
         # Update any pending position holds from done executors
         self._update_positions_from_done_executors()
 
-        # Generate all reports
+        # Generate all reports, querying the mid price of each position only once
+        mid_prices = {}
         executors_report = self.get_executors_report()
-        positions_report = self.get_positions_report()
+        positions_report = self.get_positions_report(mid_prices)
 
         # Get all controller IDs
         all_controller_ids = set(list(self.active_executors.keys()) +
@@ -570,12 +598,44 @@ class ExecutorOrchestrator:
             controller_id: {
                 "executors": executors_report.get(controller_id, []),
                 "positions": positions_report.get(controller_id, []),
-                "performance": self.generate_performance_report(controller_id)
+                "performance": self.generate_performance_report(controller_id, mid_prices)
             }
             for controller_id in all_controller_ids
         }
 
-    def generate_performance_report(self, controller_id: str) -> PerformanceReport:
+    def _get_executors_performance(self, controller_id: str) -> Dict:
+        """
+        Aggregate the performance of the active executors of a controller. The aggregate is only recomputed when the
+        executor infos change, since the executors cache their info until their state changes.
+        """
+        executors_info = [executor.executor_info for executor in self.active_executors.get(controller_id, [])]
+        cached = self._executors_performance_cache.get(controller_id)
+        if (cached is not None and len(cached[0]) == len(executors_info) and
+                all(cached_info is executor_info for cached_info, executor_info in zip(cached[0], executors_info))):
+            return cached[1]
+
+        performance = {
+            "realized_pnl_quote": Decimal("0"),
+            "unrealized_pnl_quote": Decimal("0"),
+            "volume_traded": Decimal("0"),
+            "close_type_counts": {},
+        }
+        for executor_info in executors_info:
+            if not executor_info.is_done:
+                performance["unrealized_pnl_quote"] += executor_info.net_pnl_quote
+            else:
+                performance["realized_pnl_quote"] += executor_info.net_pnl_quote
+                if executor_info.close_type:
+                    performance["close_type_counts"][executor_info.close_type] = \
+                        performance["close_type_counts"].get(executor_info.close_type, 0) + 1
+
+            performance["volume_traded"] += executor_info.filled_amount_quote
+        self._executors_performance_cache[controller_id] = (executors_info, performance)
+        return performance
+
+    def generate_performance_report(self, controller_id: str,
+                                    mid_prices: Optional[Dict[Tuple[str, str], Decimal]] = None) -> PerformanceReport:
+        mid_prices = {} if mid_prices is None else mid_prices
         # Create a new report starting from cached base values
         report = PerformanceReport()
         cached_report = self.cached_performance.get(controller_id, PerformanceReport())
@@ -586,21 +646,15 @@ class ExecutorOrchestrator:
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
         # Add data from active executors
-        active_executors = self.active_executors.get(controller_id, [])
-        positions = self.positions_held.get(controller_id, [])
-
-        for executor in active_executors:
-            executor_info = executor.executor_info
-            if not executor_info.is_done:
-                report.unrealized_pnl_quote += executor_info.net_pnl_quote
-            else:
-                report.realized_pnl_quote += executor_info.net_pnl_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
-
-            report.volume_traded += executor_info.filled_amount_quote
+        executors_performance = self._get_executors_performance(controller_id)
+        report.unrealized_pnl_quote += executors_performance["unrealized_pnl_quote"]
+        report.realized_pnl_quote += executors_performance["realized_pnl_quote"]
+        report.volume_traded += executors_performance["volume_traded"]
+        for close_type, count in executors_performance["close_type_counts"].items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
 
         # Add data from positions held and collect position summaries
+        positions = self.positions_held.get(controller_id, [])
         positions_summary = []
         for position in positions:
             # Skip if the connector/trading pair is not in the current strategy markets
@@ -609,8 +663,7 @@ class ExecutorOrchestrator:
                 self.logger().warning(f"Skipping position in performance report for {position.connector_name}.{position.trading_pair} - "
                                       f"not available in current strategy markets")
                 continue
-            mid_price = self.strategy.market_data_provider.get_price_by_type(
-                position.connector_name, position.trading_pair, PriceType.MidPrice)
+            mid_price = self._get_position_mid_price(position, mid_prices)
             position_summary = position.get_position_summary(mid_price if not mid_price.is_nan() else Decimal("0"))
 
             # Update report with position data
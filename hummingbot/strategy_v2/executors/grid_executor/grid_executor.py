@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.order_candidate import OrderCandidate, PerpetualOrderCandidate
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -79,6 +80,15 @@ class GridExecutor(ExecutorBase):
         self.realized_fees_quote = Decimal("0")
         self.realized_pnl_quote = Decimal("0")
         self.realized_pnl_pct = Decimal("0")
+        # Running sums of the filled orders, updated only with the orders filled since the last update
+        self._accumulated_filled_orders: List[Dict] = self._filled_orders
+        self._accumulated_filled_orders_count = 0
+        self._accumulated_held_orders_count = 0
+        self._accumulated_regular_orders_count = 0
+        self._accumulated_buy_quote = Decimal("0")
+        self._accumulated_buy_fees_quote = Decimal("0")
+        self._accumulated_sell_quote = Decimal("0")
+        self._accumulated_fees_quote = Decimal("0")
         self.max_open_creation_timestamp = 0
         self.max_close_creation_timestamp = 0
         self._open_fee_in_base = False
@@ -261,7 +271,7 @@ class GridExecutor(ExecutorBase):
             for level in close_orders_to_create:
                 self.adjust_and_place_close_order(level)
             for orders_id_to_cancel in open_order_ids_to_cancel + close_order_ids_to_cancel:
-                # TODO: Implement batch order cancel
+                # Cancels issued in the same tick are grouped in batch requests by connectors that support them
                 self._strategy.cancel(
                     connector_name=self.config.connector_name,
                     trading_pair=self.config.trading_pair,
@@ -290,10 +300,8 @@ class GridExecutor(ExecutorBase):
         # Get completed orders and store them in the filled orders list
         for level in completed:
             if level.active_open_order.order.completely_filled_event.is_set() and level.active_close_order.order.completely_filled_event.is_set():
-                open_order = level.active_open_order.order.to_json()
-                close_order = level.active_close_order.order.to_json()
-                self._filled_orders.append(open_order)
-                self._filled_orders.append(close_order)
+                self._add_filled_order(level.active_open_order.order)
+                self._add_filled_order(level.active_close_order.order)
                 self.levels_by_state[GridLevelStates.COMPLETE].remove(level)
                 level.reset_level()
                 self.levels_by_state[GridLevelStates.NOT_ACTIVE].append(level)
@@ -327,14 +335,14 @@ class GridExecutor(ExecutorBase):
                 if order_execution_completed:
                     for level in self.levels_by_state[GridLevelStates.OPEN_ORDER_FILLED]:
                         if level.active_open_order and level.active_open_order.order:
-                            self._filled_orders.append(level.active_open_order.order.to_json())
+                            self._add_filled_order(level.active_open_order.order)
                         level.reset_level()
                     for level in self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]:
                         if level.active_close_order and level.active_close_order.order:
-                            self._filled_orders.append(level.active_close_order.order.to_json())
+                            self._add_filled_order(level.active_close_order.order)
                         level.reset_level()
                     if self._close_order and self._close_order.order:
-                        self._filled_orders.append(self._close_order.order.to_json())
+                        self._add_filled_order(self._close_order.order)
                         self._close_order = None
                     self.update_realized_pnl_metrics()
                     self.levels_by_state = {}
@@ -660,7 +668,6 @@ class GridExecutor(ExecutorBase):
         close_order_placed = [level.active_close_order for level in
                               self.levels_by_state[GridLevelStates.CLOSE_ORDER_PLACED]]
         for order in open_order_placed + close_order_placed:
-            # TODO: Implement cancel batch orders
             if order:
                 self._strategy.cancel(
                     connector_name=self.config.connector_name,
@@ -815,7 +822,16 @@ class GridExecutor(ExecutorBase):
         open_filled_levels = self.levels_by_state[GridLevelStates.OPEN_ORDER_FILLED] + self.levels_by_state[
             GridLevelStates.CLOSE_ORDER_PLACED]
         side_multiplier = 1 if self.config.side == TradeType.BUY else -1
-        executed_amount_base = Decimal(sum([level.active_open_order.order.amount for level in open_filled_levels]))
+        executed_amount_base = Decimal("0")
+        executed_amount_quote = Decimal("0")
+        fees_base = Decimal("0")
+        fees_quote = Decimal("0")
+        for level in open_filled_levels:
+            open_order = level.active_open_order
+            executed_amount_base += open_order.order.amount
+            executed_amount_quote += open_order.order.price * open_order.order.amount
+            fees_base += open_order.cum_fees_base if self._open_fee_in_base else Decimal("0")
+            fees_quote += open_order.cum_fees_quote
         if executed_amount_base == Decimal("0"):
             self.position_size_base = Decimal("0")
             self.position_size_quote = Decimal("0")
@@ -824,16 +840,14 @@ class GridExecutor(ExecutorBase):
             self.position_pnl_pct = Decimal("0")
             self.close_liquidity_placed = Decimal("0")
         else:
-            self.position_break_even_price = sum(
-                [level.active_open_order.order.price * level.active_open_order.order.amount
-                 for level in open_filled_levels]) / executed_amount_base
+            self.position_break_even_price = executed_amount_quote / executed_amount_base
             if self._open_fee_in_base:
-                executed_amount_base -= sum([level.active_open_order.cum_fees_base for level in open_filled_levels])
+                executed_amount_base -= fees_base
             close_order_size_base = self._close_order.executed_amount_base if self._close_order and self._close_order.is_done else Decimal(
                 "0")
             self.position_size_base = executed_amount_base - close_order_size_base
             self.position_size_quote = self.position_size_base * self.position_break_even_price
-            self.position_fees_quote = Decimal(sum([level.active_open_order.cum_fees_quote for level in open_filled_levels]))
+            self.position_fees_quote = fees_quote
             self.position_pnl_quote = side_multiplier * ((self.mid_price - self.position_break_even_price) / self.position_break_even_price) * self.position_size_quote - self.position_fees_quote
             self.position_pnl_pct = self.position_pnl_quote / self.position_size_quote if self.position_size_quote > 0 else Decimal(
                 "0")
@@ -843,38 +857,65 @@ class GridExecutor(ExecutorBase):
         else:
             self.open_liquidity_placed = Decimal("0")
 
+    def _add_filled_order(self, order: InFlightOrder):
+        """
+        Store a filled order in the filled orders history. The order fills are dropped, since the history is only used
+        for reporting and the realized pnl only needs the executed amounts and fees.
+
+        :param order: The filled InFlightOrder.
+        """
+        order_json = order.to_json()
+        order_json.pop("order_fills", None)
+        self._filled_orders.append(order_json)
+
+    def _accumulate_filled_orders(self):
+        """
+        Add the orders filled since the last update to the realized pnl running sums, excluding held positions. The
+        sums are rebuilt from scratch only if the filled orders list is replaced or new held position orders appear.
+        """
+        if (self._accumulated_filled_orders is not self._filled_orders or
+                self._accumulated_held_orders_count != len(self._held_position_orders)):
+            self._accumulated_filled_orders = self._filled_orders
+            self._accumulated_filled_orders_count = 0
+            self._accumulated_held_orders_count = len(self._held_position_orders)
+            self._accumulated_regular_orders_count = 0
+            self._accumulated_buy_quote = Decimal("0")
+            self._accumulated_buy_fees_quote = Decimal("0")
+            self._accumulated_sell_quote = Decimal("0")
+            self._accumulated_fees_quote = Decimal("0")
+        if self._accumulated_filled_orders_count == len(self._filled_orders):
+            return
+        held_order_ids = {order.get("client_order_id") for order in self._held_position_orders}
+        for order in self._filled_orders[self._accumulated_filled_orders_count:]:
+            if order.get("client_order_id") in held_order_ids:
+                continue
+            executed_amount_quote = Decimal(order["executed_amount_quote"])
+            fee_quote = Decimal(order["cumulative_fee_paid_quote"])
+            if order["trade_type"] == TradeType.BUY.name:
+                self._accumulated_buy_quote += executed_amount_quote
+                self._accumulated_buy_fees_quote += fee_quote
+            elif order["trade_type"] == TradeType.SELL.name:
+                self._accumulated_sell_quote += executed_amount_quote
+            self._accumulated_fees_quote += fee_quote
+            self._accumulated_regular_orders_count += 1
+        self._accumulated_filled_orders_count = len(self._filled_orders)
+
     def update_realized_pnl_metrics(self):
         """
         Calculate the realized pnl in quote asset, excluding held positions
         """
-        if len(self._filled_orders) == 0:
-            self._reset_metrics()
-            return
+        self._accumulate_filled_orders()
         # Calculate metrics only for fully closed trades (not held positions)
-        regular_filled_orders = [order for order in self._filled_orders
-                                 if order not in self._held_position_orders]
-        if len(regular_filled_orders) == 0:
+        if self._accumulated_regular_orders_count == 0:
             self._reset_metrics()
             return
         if self._open_fee_in_base:
-            self.realized_buy_size_quote = sum([
-                Decimal(order["executed_amount_quote"]) - Decimal(order["cumulative_fee_paid_quote"])
-                for order in regular_filled_orders if order["trade_type"] == TradeType.BUY.name
-            ])
+            self.realized_buy_size_quote = self._accumulated_buy_quote - self._accumulated_buy_fees_quote
         else:
-            self.realized_buy_size_quote = sum([
-                Decimal(order["executed_amount_quote"])
-                for order in regular_filled_orders if order["trade_type"] == TradeType.BUY.name
-            ])
-        self.realized_sell_size_quote = sum([
-            Decimal(order["executed_amount_quote"])
-            for order in regular_filled_orders if order["trade_type"] == TradeType.SELL.name
-        ])
+            self.realized_buy_size_quote = self._accumulated_buy_quote
+        self.realized_sell_size_quote = self._accumulated_sell_quote
         self.realized_imbalance_quote = self.realized_buy_size_quote - self.realized_sell_size_quote
-        self.realized_fees_quote = sum([
-            Decimal(order["cumulative_fee_paid_quote"])
-            for order in regular_filled_orders
-        ])
+        self.realized_fees_quote = self._accumulated_fees_quote
         self.realized_pnl_quote = (
             self.realized_sell_size_quote -
             self.realized_buy_size_quote -
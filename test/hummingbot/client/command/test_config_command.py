@@ -70,6 +70,10 @@ class ConfigCommandTest(IsolatedAsyncioWrapperTestCase):
                            "    | ∟ mqtt_events                     | True                 |\n"
                            "    | ∟ mqtt_external_events            | True                 |\n"
                            "    | ∟ mqtt_autostart                  | False                |\n"
+                           "    | ∟ mqtt_batching                   | False                |\n"
+                           "    | ∟ mqtt_batch_encoding             | msgpack              |\n"
+                           "    | ∟ mqtt_batch_max_size             | 100                  |\n"
+                           "    | ∟ mqtt_batch_interval             | 0.1                  |\n"
                            "    | send_error_logs                   | True                 |\n"
                            "    | gateway                           |                      |\n"
                            "    | ∟ gateway_api_host                | localhost            |\n"
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.mock.mock_cli import CLIMockingAssistant
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_profiler import LoopProfiler
+
+
+class ProfileCommandTest(IsolatedAsyncioWrapperTestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    @patch("hummingbot.core.gateway.gateway_status_monitor.GatewayStatusMonitor.start")
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.mqtt_start")
+    async def asyncSetUp(self, mock_mqtt_start, mock_gateway_start, mock_trading_pair_fetcher):
+        await read_system_configs_from_yml()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+        self.profiler = LoopProfiler()
+        LoopProfiler._shared_instance = self.profiler
+
+    async def asyncTearDown(self):
+        self.profiler.stop()
+        LoopProfiler._shared_instance = None
+        self.cli_mock_assistant.stop()
+        await super().asyncTearDown()
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    async def test_profile_start_report_and_stop(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        exchange = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.order_book_tracker._order_book_diff_stream = asyncio.Queue()
+        self.app.trading_core.connector_manager.connectors["paper"] = exchange
+
+        self.app.profile()
+        self.assertIn("Profiling is not running", captures[-1])
+
+        self.app.profile("start")
+        self.assertTrue(self.profiler.is_running)
+        self.assertIn("Profiling started", captures[-1])
+        await safe_ensure_future(asyncio.sleep(0))
+
+        self.app.profile()
+        report = captures[-1]
+        self.assertIn("Event loop lag (ms)", report)
+        self.assertIn("sleep", report)
+        self.assertIn("paper.order_book_diff_stream", report)
+
+        self.app.profile("stop")
+        self.assertFalse(self.profiler.is_running)
+        self.assertIn("Profiling stopped", captures[-1])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    async def test_profile_export(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.app.profile("start")
+        await safe_ensure_future(asyncio.sleep(0))
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "metrics.json")
+            self.app.profile("export", export_format="json", file_path=file_path)
+            with open(file_path) as f:
+                metrics = json.load(f)
+
+        self.assertIn(f"Profiling metrics exported to {file_path}", captures[-1])
+        self.assertEqual(1, metrics["tasks"]["sleep"]["finished"])
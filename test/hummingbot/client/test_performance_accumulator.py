@@ -0,0 +1,282 @@
+import asyncio
+import copy
+import json
+import os
+import random
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import MarketPerformance, PerformanceAccumulator
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TradeFill
+
+trading_pair = "HBOT-USDT"
+base, quote = trading_pair.split("-")
+
+METRICS_FIELDS = ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base", "b_vol_quote",
+                  "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price", "start_base_bal",
+                  "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price", "cur_price", "start_base_ratio_pct",
+                  "cur_base_ratio_pct", "hold_value", "cur_value", "trade_pnl", "fee_in_quote", "total_pnl",
+                  "return_pct"]
+
+
+class PerformanceAccumulatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rate_oracle = RateOracle()
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def trade_fill(timestamp: int, order_id: str, trade_type: str, price: Decimal, amount: Decimal,
+                   position: str = PositionAction.NIL.value, trade_fee=None, market: str = "binance",
+                   symbol: str = trading_pair) -> TradeFill:
+        trade_base, trade_quote = symbol.split("-")
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market=market,
+            symbol=symbol,
+            base_asset=trade_base,
+            quote_asset=trade_quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=(trade_fee or AddedToCostTradeFee()).to_json(),
+            exchange_trade_id=f"{order_id}-{timestamp}",
+            position=position,
+        )
+
+    def random_spot_trades(self, rng: random.Random, count: int) -> List[TradeFill]:
+        trades = []
+        price = Decimal("10")
+        order_index = 0
+        for timestamp in range(count):
+            if rng.random() < 0.7:
+                order_index += 1
+            price += Decimal(rng.randint(-50, 50)) / Decimal("100")
+            fee_choice = rng.random()
+            if fee_choice < 0.3:
+                trade_fee = DeductedFromReturnsTradeFee(percent=Decimal("0.001"))
+            elif fee_choice < 0.6:
+                trade_fee = AddedToCostTradeFee(percent=Decimal("0.002"),
+                                                flat_fees=[TokenAmount("BNB", Decimal("0.0001"))])
+            else:
+                trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.01"))])
+            trades.append(self.trade_fill(timestamp=1_000 + timestamp,
+                                          order_id=f"order{order_index}",
+                                          trade_type="BUY" if order_index % 2 == 0 else "SELL",
+                                          price=price,
+                                          amount=Decimal(rng.randint(1, 200)) / Decimal("10"),
+                                          trade_fee=trade_fee))
+        return trades
+
+    def random_derivative_trades(self, rng: random.Random, count: int) -> List[TradeFill]:
+        # Flat fees only: PerformanceMetrics calculates the percent fees after overwriting the first fill of every
+        # order with the order aggregate
+        trades = []
+        for order_index in range(count):
+            is_buy = rng.random() < 0.5
+            position = rng.choice([PositionAction.OPEN.value, PositionAction.CLOSE.value])
+            for fill_index in range(rng.randint(1, 3)):
+                trades.append(self.trade_fill(timestamp=1_000 + len(trades),
+                                              order_id=f"order{order_index}",
+                                              trade_type="BUY" if is_buy else "SELL",
+                                              price=Decimal(rng.randint(900, 1100)) / Decimal("100"),
+                                              amount=Decimal(rng.randint(1, 50)),
+                                              position=position,
+                                              trade_fee=AddedToCostTradeFee(
+                                                  flat_fees=[TokenAmount(quote, Decimal("0.05"))])))
+        rng.shuffle(trades)
+        return trades
+
+    def assert_same_metrics(self, expected: PerformanceMetrics, metrics: PerformanceMetrics):
+        # The derivatives PnL is summed in a different order, the last digits of the 28 can differ
+        for field in METRICS_FIELDS:
+            self.assertAlmostEqual(getattr(expected, field), getattr(metrics, field), delta=Decimal("1e-18"), msg=field)
+        self.assertEqual(dict(expected.fees), dict(metrics.fees))
+
+    def assert_parity(self, trades: List[TradeFill], balances):
+        accumulator = PerformanceAccumulator.from_trades(trades)
+        market_performance = accumulator.markets[("binance", trading_pair)]
+        # PerformanceMetrics overwrites the trades of orders with multiple fills
+        expected = self.async_run_with_timeout(
+            PerformanceMetrics.create(trading_pair, copy.deepcopy(trades), balances))
+        metrics = self.async_run_with_timeout(market_performance.metrics(balances))
+
+        self.assertEqual(len(trades), accumulator.trades_count)
+        self.assert_same_metrics(expected, metrics)
+
+    def test_parity_with_performance_metrics_for_spot_trades(self):
+        rng = random.Random(7)
+        for count in (1, 2, 10, 300):
+            self.assert_parity(self.random_spot_trades(rng, count), {base: Decimal("100"), quote: Decimal("1000")})
+
+    def test_parity_with_performance_metrics_for_derivative_trades(self):
+        rng = random.Random(11)
+        for count in (2, 10, 200):
+            trades = self.random_derivative_trades(rng, count)
+            self.assertTrue(PerformanceAccumulator.from_trades(trades).markets[("binance", trading_pair)].are_derivatives)
+            self.assert_parity(trades, {quote: Decimal("1000")})
+
+    def test_parity_when_fills_are_replayed_one_by_one(self):
+        trades = self.random_derivative_trades(random.Random(3), 50)
+        accumulator = PerformanceAccumulator(start_timestamp=0)
+        balances = {quote: Decimal("500")}
+
+        for i, trade in enumerate(trades):
+            accumulator.add_trade_fill(trade)
+            if i % 10 == 0:
+                expected = self.async_run_with_timeout(
+                    PerformanceMetrics.create(trading_pair, copy.deepcopy(trades[:i + 1]), balances))
+                metrics = self.async_run_with_timeout(
+                    accumulator.markets[("binance", trading_pair)].metrics(balances))
+                self.assertAlmostEqual(expected.trade_pnl, metrics.trade_pnl, delta=Decimal("1e-18"))
+
+    def test_settled_position_pairs_dropped(self):
+        rng = random.Random(13)
+        trades = []
+        for order_index in range(300):
+            # Long positions opened with buys and closed with sells, and short ones the other way around
+            is_long = order_index % 3 != 0
+            for is_open in (True, False):
+                for _ in range(rng.randint(1, 2)):
+                    trades.append(self.trade_fill(timestamp=1_000 + len(trades),
+                                                  order_id=f"{'open' if is_open else 'close'}{order_index}",
+                                                  trade_type="BUY" if is_long == is_open else "SELL",
+                                                  price=Decimal(rng.randint(900, 1100)) / Decimal("100"),
+                                                  amount=Decimal(rng.randint(1, 50)),
+                                                  position=(PositionAction.OPEN if is_open else PositionAction.CLOSE).value))
+        # A position still open
+        trades.append(self.trade_fill(5_000, "open_last", "BUY", Decimal("10"), Decimal("1"),
+                                      position=PositionAction.OPEN.value))
+
+        self.assert_parity(trades, {quote: Decimal("1000")})
+        market_performance = PerformanceAccumulator.from_trades(trades).markets[("binance", trading_pair)]
+        self.assertEqual(4 * MarketPerformance.SETTLED_PAIRS_KEPT + 1, len(market_performance.to_json()["orders"]))
+
+        restored = MarketPerformance.from_json(json.loads(json.dumps(market_performance.to_json())))
+        close_trade = self.trade_fill(5_001, "close_last", "SELL", Decimal("12"), Decimal("1"),
+                                      position=PositionAction.CLOSE.value)
+        market_performance.add_trade_fill(close_trade)
+        restored.add_trade_fill(close_trade)
+        self.assertEqual(market_performance.closed_positions_pnl, restored.closed_positions_pnl)
+        self.assertEqual(Decimal("2"), restored.closed_positions_pnl - PerformanceAccumulator.from_trades(
+            trades[:-1]).markets[("binance", trading_pair)].closed_positions_pnl)
+
+    def test_spot_orders_not_kept(self):
+        market_performance = PerformanceAccumulator.from_trades(
+            self.random_spot_trades(random.Random(17), 50)).markets[("binance", trading_pair)]
+
+        self.assertEqual([], market_performance.to_json()["orders"])
+
+    def test_trades_grouped_by_market_and_trading_pair(self):
+        trades = [
+            self.trade_fill(1000, "order1", "BUY", Decimal("10"), Decimal("1")),
+            self.trade_fill(1001, "order2", "BUY", Decimal("10"), Decimal("1"), market="kucoin"),
+            self.trade_fill(1002, "order3", "SELL", Decimal("20"), Decimal("2"), symbol="BTC-USDT"),
+        ]
+
+        accumulator = PerformanceAccumulator.from_trades(trades)
+
+        self.assertEqual({("binance", trading_pair), ("kucoin", trading_pair), ("binance", "BTC-USDT")},
+                         set(accumulator.markets))
+        self.assertEqual(1, accumulator.markets[("binance", "BTC-USDT")].num_sells)
+
+    def test_trades_before_start_or_already_added_are_ignored(self):
+        accumulator = PerformanceAccumulator(start_timestamp=1000)
+        trade = self.trade_fill(1000, "order1", "BUY", Decimal("10"), Decimal("1"))
+
+        self.assertFalse(accumulator.add_trade_fill(self.trade_fill(999, "order0", "BUY", Decimal("10"), Decimal("1"))))
+        self.assertTrue(accumulator.add_trade_fill(trade))
+        self.assertFalse(accumulator.add_trade_fill(trade))
+        self.assertTrue(accumulator.add_trade_fill(self.trade_fill(1000, "order2", "BUY", Decimal("10"), Decimal("1"))))
+
+        self.assertEqual(2, accumulator.trades_count)
+        self.assertEqual(1000, accumulator.last_trade_timestamp)
+
+    def test_realized_and_unrealized_pnl(self):
+        performance = MarketPerformance("binance", trading_pair)
+        for trade in [
+            self.trade_fill(1000, "order1", "BUY", Decimal("10"), Decimal("2")),
+            self.trade_fill(1001, "order2", "BUY", Decimal("13"), Decimal("1")),
+            self.trade_fill(1002, "order3", "SELL", Decimal("15"), Decimal("1.5")),
+            self.trade_fill(1003, "order4", "SELL", Decimal("12"), Decimal("2.5")),
+        ]:
+            performance.add_trade_fill(trade)
+
+        # Average cost 11, 1.5 sold at 15 and 1.5 at 12, then a short of 1 at 12
+        self.assertEqual(Decimal("7.5"), performance.realized_pnl)
+        self.assertEqual(Decimal("-1"), performance.position_amount)
+        self.assertEqual(Decimal("12"), performance.position_average_price)
+        self.assertEqual(Decimal("2"), performance.unrealized_pnl(Decimal("10")))
+
+        metrics = self.async_run_with_timeout(performance.metrics({base: Decimal("0"), quote: Decimal("100")}))
+        # The trade PnL is the realized PnL plus the unrealized PnL at the current price
+        self.assertEqual(metrics.trade_pnl, performance.realized_pnl + performance.unrealized_pnl(metrics.cur_price))
+
+    def test_checkpoint_round_trip(self):
+        spot_trades = self.random_spot_trades(random.Random(5), 30)
+        for trade in spot_trades:
+            trade.market = "kucoin"
+        trades = self.random_derivative_trades(random.Random(5), 30) + spot_trades
+        accumulator = PerformanceAccumulator(start_timestamp=0, config_file_path="some-strategy.yml")
+        for trade in trades[:40]:
+            accumulator.add_trade_fill(trade)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "performance.json")
+            accumulator.save_checkpoint(file_path)
+            restored = PerformanceAccumulator.load_checkpoint(file_path, 0, "some-strategy.yml")
+            self.assertIsNone(PerformanceAccumulator.load_checkpoint(file_path, 1, "some-strategy.yml"))
+            self.assertIsNone(PerformanceAccumulator.load_checkpoint(file_path, 0, "other-strategy.yml"))
+
+        self.assertEqual(json.dumps(accumulator.to_json()), json.dumps(restored.to_json()))
+        for trade in trades[40:]:
+            accumulator.add_trade_fill(trade)
+            restored.add_trade_fill(trade)
+        for key, market_performance in accumulator.markets.items():
+            balances = {quote: Decimal("1000")}
+            self.assert_same_metrics(self.async_run_with_timeout(market_performance.metrics(balances)),
+                                     self.async_run_with_timeout(restored.markets[key].metrics(balances)))
+
+    def test_load_checkpoint_returns_none_for_missing_or_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "performance.json")
+            self.assertIsNone(PerformanceAccumulator.load_checkpoint(file_path, 0))
+            with open(file_path, "w") as checkpoint_file:
+                checkpoint_file.write("{")
+            self.assertIsNone(PerformanceAccumulator.load_checkpoint(file_path, 0))
+
+    def test_average_return_pct(self):
+        trades = [
+            self.trade_fill(1000, "order1", "BUY", Decimal("10"), Decimal("1")),
+            self.trade_fill(1001, "order2", "BUY", Decimal("10"), Decimal("1"), market="kucoin"),
+        ]
+        accumulator = PerformanceAccumulator.from_trades(trades)
+        balances = {"binance": {base: Decimal("1"), quote: Decimal("90")}}
+
+        async def market_balances(market: str):
+            return balances.get(market)
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades[:1], balances["binance"]))
+        self.assertEqual(expected.return_pct, self.async_run_with_timeout(accumulator.average_return_pct(market_balances)))
@@ -247,6 +247,69 @@ class BinancePerpetualAPIOrderBookDataSourceUnitTests(IsolatedAsyncioWrapperTest
         self.assertEqual(result.next_funding_utc_timestamp, int(mock_response["nextFundingTime"] * 1e-3))
         self.assertEqual(result.rate, Decimal(mock_response["lastFundingRate"]))
 
+    def _premium_index(self, symbol: str, rate: str) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "markPrice": "46382.32704603",
+            "indexPrice": "46385.80064948",
+            "estimatedSettlePrice": "46510.13598963",
+            "lastFundingRate": rate,
+            "interestRate": "0.00010000",
+            "nextFundingTime": 1641312000000,
+            "time": 1641288825000,
+        }
+
+    @aioresponses()
+    async def test_get_funding_infos_requests_all_symbols_at_once_for_many_trading_pairs(self, mock_api):
+        trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(CONSTANTS.MARK_PRICE_ALL_SYMBOLS_WEIGHT + 1)]
+        self.connector._set_trading_pair_symbol_map(
+            bidict({trading_pair.replace("-", ""): trading_pair for trading_pair in trading_pairs}))
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        mock_response = [self._premium_index(trading_pair.replace("-", ""), f"0.000{i}")
+                         for i, trading_pair in enumerate(trading_pairs)]
+        mock_response.append(self._premium_index("OTHERHBOT", "0.1"))
+        mock_api.get(regex_url, body=json.dumps(mock_response))
+
+        result = await self.data_source.get_funding_infos(trading_pairs)
+
+        self.assertEqual(set(trading_pairs), set(result))
+        self.assertEqual(Decimal("0.0003"), result["COINALPHA3-HBOT"].rate)
+        self.assertEqual("COINALPHA3-HBOT", result["COINALPHA3-HBOT"].trading_pair)
+        requests = [request for (_, request_url), request in mock_api.requests.items()
+                    if CONSTANTS.MARK_PRICE_URL in str(request_url)]
+        self.assertEqual(1, len(requests))
+        self.assertNotIn("symbol", str(list(mock_api.requests)))
+
+    @aioresponses()
+    async def test_get_funding_infos_returns_no_trading_pair_when_all_symbols_request_fails(self, mock_api):
+        trading_pairs = [f"COINALPHA{i}-HBOT" for i in range(CONSTANTS.MARK_PRICE_ALL_SYMBOLS_WEIGHT + 1)]
+        self.connector._set_trading_pair_symbol_map(
+            bidict({trading_pair.replace("-", ""): trading_pair for trading_pair in trading_pairs}))
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        mock_api.get(re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?")), status=500)
+
+        result = await self.data_source.get_funding_infos(trading_pairs)
+
+        self.assertEqual({}, result)
+        self.assertTrue(self._is_logged("ERROR", "Error fetching the funding info of all the symbols."))
+
+    @aioresponses()
+    async def test_get_funding_infos_requests_each_trading_pair_and_skips_failures(self, mock_api):
+        other_trading_pair = "COINBETA-HBOT"
+        self.connector._set_trading_pair_symbol_map(
+            bidict({self.ex_trading_pair: self.trading_pair, "COINBETAHBOT": other_trading_pair}))
+        url = web_utils.public_rest_url(CONSTANTS.MARK_PRICE_URL, domain=self.domain)
+        mock_api.get(re.compile(f"^{url}.*symbol={self.ex_trading_pair}"),
+                     body=json.dumps(self._premium_index(self.ex_trading_pair, "0.0001")))
+        mock_api.get(re.compile(f"^{url}.*symbol=COINBETAHBOT"), status=500)
+
+        result = await self.data_source.get_funding_infos([self.trading_pair, other_trading_pair])
+
+        self.assertEqual([self.trading_pair], list(result))
+        self.assertEqual(Decimal("0.0001"), result[self.trading_pair].rate)
+        self.assertTrue(self._is_logged("ERROR", f"Error fetching the funding info for {other_trading_pair}."))
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     async def test_listen_for_subscriptions_cancelled_when_connecting(self, _, mock_ws):
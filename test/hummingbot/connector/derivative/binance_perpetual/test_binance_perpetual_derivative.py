@@ -23,11 +23,12 @@ from hummingbot.connector.test_support.network_mocking_assistant import NetworkM
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
+from hummingbot.core.data_type.funding_info import FundingInfo
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
-from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.event.events import AccountEvent, MarketEvent, OrderFilledEvent
 
 
 class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
@@ -1488,12 +1489,17 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
 
     @aioresponses()
     async def test_cancel_all_successful(self, mocked_api):
+        self._simulate_trading_rules_initialized()
+        # Both cancelations are sent in a single batch request
         url = web_utils.private_rest_url(
-            CONSTANTS.ORDER_URL, domain=self.domain
+            CONSTANTS.BATCH_ORDER_URL, domain=self.domain
         )
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
 
-        cancel_response = {"code": 200, "msg": "success", "status": "CANCELED"}
+        cancel_response = [
+            {"clientOrderId": "OID1", "orderId": 8886774, "status": "CANCELED"},
+            {"clientOrderId": "OID2", "orderId": 8886775, "status": "CANCELED"},
+        ]
         mocked_api.delete(regex_url, body=json.dumps(cancel_response))
 
         self.exchange.start_tracking_order(
@@ -1525,10 +1531,16 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
 
         cancellation_results = await self.exchange.cancel_all(timeout_seconds=1)
 
+        cancel_request = next(value for key, value in mocked_api.requests.items()
+                              if key[1].human_repr().startswith(url))
+        self.assertEqual(1, len(cancel_request))
+        self.assertEqual('["OID1","OID2"]', cancel_request[0].kwargs["params"]["origClientOrderIdList"])
+
         order_cancelled_events = self.order_cancelled_logger.event_log
 
-        self.assertEqual(0, len(order_cancelled_events))
+        self.assertEqual(2, len(order_cancelled_events))
         self.assertEqual(2, len(cancellation_results))
+        self.assertTrue(all(result.success for result in cancellation_results))
 
     @aioresponses()
     async def test_cancel_all_unknown_order(self, req_mock):
@@ -1798,6 +1810,79 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
 
         self.assertTrue("OID1" in self.exchange._order_tracker._in_flight_orders)
 
+    @aioresponses()
+    async def test_create_orders_in_same_tick_with_batch_request(self, req_mock):
+        url = web_utils.private_rest_url(
+            CONSTANTS.BATCH_ORDER_URL, domain=self.domain
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        create_response = [
+            {"clientOrderId": "OID1", "updateTime": 1640780000000, "status": "NEW", "orderId": 8886774},
+            {"code": -2019, "msg": "Margin is insufficient."},
+            {"clientOrderId": "OID3", "updateTime": 1640780000000, "status": "NEW", "orderId": 8886776},
+        ]
+        req_mock.post(regex_url, body=json.dumps(create_response))
+        self._simulate_trading_rules_initialized()
+
+        await asyncio.gather(*[
+            self.exchange._create_order(
+                trade_type=trade_type,
+                order_id=order_id,
+                trading_pair=self.trading_pair,
+                amount=Decimal("9"),
+                order_type=order_type,
+                position_action=PositionAction.OPEN,
+                price=Decimal("10000"))
+            for order_id, trade_type, order_type in [("OID1", TradeType.BUY, OrderType.LIMIT),
+                                                     ("OID2", TradeType.BUY, OrderType.LIMIT),
+                                                     ("OID3", TradeType.SELL, OrderType.LIMIT_MAKER)]
+        ])
+
+        order_request = next(value for key, value in req_mock.requests.items()
+                             if key[1].human_repr().startswith(url))
+        self.assertEqual(1, len(order_request))
+        orders_params = json.loads(order_request[0].kwargs["data"]["batchOrders"])
+        self.assertEqual(["OID1", "OID2", "OID3"], [params["newClientOrderId"] for params in orders_params])
+        self.assertEqual(["BUY", "BUY", "SELL"], [params["side"] for params in orders_params])
+        self.assertEqual(["GTC", "GTC", "GTX"], [params["timeInForce"] for params in orders_params])
+        self.assertEqual(["9", "9", "9"], [params["quantity"] for params in orders_params])
+
+        self.assertEqual("8886774", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("8886776", self.exchange.in_flight_orders["OID3"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertTrue(self._is_logged(
+            "NETWORK",
+            f"Error submitting buy LIMIT order to {self.exchange.name_cap} for 9 {self.trading_pair} 10000.",
+        ))
+
+    @aioresponses()
+    async def test_batch_cancel(self, req_mock):
+        url = web_utils.private_rest_url(
+            CONSTANTS.BATCH_ORDER_URL, domain=self.domain
+        )
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        cancel_response = [
+            {"clientOrderId": "OID1", "orderId": 8886774, "status": "CANCELED"},
+            {"code": -2011, "msg": "Unknown order sent."},
+        ]
+        req_mock.delete(regex_url, body=json.dumps(cancel_response))
+        self._simulate_trading_rules_initialized()
+        orders = [
+            InFlightOrder(client_order_id=order_id, trading_pair=self.trading_pair, order_type=OrderType.LIMIT,
+                          trade_type=TradeType.BUY, amount=Decimal("1"), price=Decimal("10000"),
+                          creation_timestamp=1640780000)
+            for order_id in ["OID1", "OID2"]
+        ]
+
+        results = await self.exchange._place_batch_cancel(orders)
+
+        cancel_request = next(value for key, value in req_mock.requests.items()
+                              if key[1].human_repr().startswith(url))
+        self.assertEqual(self.symbol, cancel_request[0].kwargs["params"]["symbol"])
+        self.assertEqual('["OID1","OID2"]', cancel_request[0].kwargs["params"]["origClientOrderIdList"])
+        self.assertTrue(results[0])
+        self.assertTrue(self.exchange._is_order_not_found_during_cancelation_error(results[1]))
+
     @aioresponses()
     async def test_create_order_exception(self, req_mock):
         url = web_utils.private_rest_url(
@@ -2193,6 +2278,110 @@ class BinancePerpetualDerivativeUnitTest(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(limit_orders, list)
         self.assertIsInstance(limit_orders[0], LimitOrder)
 
+    async def test_init_funding_info_retries_the_trading_pairs_not_fetched(self):
+        funding_info = FundingInfo(self.trading_pair, Decimal("1"), Decimal("2"), 3, Decimal("0.0001"))
+        self.exchange._orderbook_ds.get_funding_infos = AsyncMock(side_effect=[{}, {self.trading_pair: funding_info}])
+        self.exchange._sleep = AsyncMock()
+
+        await self.exchange._init_funding_info()
+
+        self.assertEqual(2, self.exchange._orderbook_ds.get_funding_infos.call_count)
+        self.exchange._orderbook_ds.get_funding_infos.assert_called_with([self.trading_pair])
+        self.exchange._sleep.assert_called_once_with(self.exchange.SHORT_POLL_INTERVAL)
+        self.assertTrue(self.exchange.status_dict["funding_info"])
+        self.assertIs(funding_info, self.exchange.get_funding_info(self.trading_pair))
+        self.assertEqual([Decimal("0.0001")],
+                         [record.rate for record in self.exchange.get_funding_rate_history(self.trading_pair)])
+
+    async def test_configure_pairs_sets_position_mode_and_leverage_concurrently(self):
+        trading_pairs = [f"PAIR{i}-{self.quote_asset}" for i in range(4)]
+        self.exchange._trading_pairs = trading_pairs
+        in_flight_requests = 0
+        max_in_flight_requests = 0
+
+        async def set_mode(mode, trading_pair):
+            nonlocal in_flight_requests, max_in_flight_requests
+            in_flight_requests += 1
+            max_in_flight_requests = max(max_in_flight_requests, in_flight_requests)
+            await asyncio.sleep(0)
+            in_flight_requests -= 1
+            return True, ""
+
+        self.exchange._trading_pair_position_mode_set = AsyncMock(side_effect=set_mode)
+        self.exchange._set_trading_pair_leverage = AsyncMock(return_value=(True, ""))
+        event_logger = EventLogger()
+        self.exchange.add_listener(AccountEvent.PositionModeChangeSucceeded, event_logger)
+
+        results = await self.exchange.configure_pairs(
+            mode=PositionMode.HEDGE, leverage_by_pair={trading_pairs[0]: 5, trading_pairs[1]: 10}
+        )
+
+        self.assertEqual(4, max_in_flight_requests)
+        self.assertEqual(PositionMode.HEDGE, self.exchange.position_mode)
+        self.assertEqual(4, len(event_logger.event_log))
+        self.assertTrue(all(result.success for result in results.values()))
+        self.assertEqual(5, results[trading_pairs[0]].leverage)
+        self.assertTrue(results[trading_pairs[0]].leverage_set)
+        self.assertIsNone(results[trading_pairs[2]].leverage_set)
+        self.assertEqual(5, self.exchange.get_leverage(trading_pairs[0]))
+        self.assertEqual(10, self.exchange.get_leverage(trading_pairs[1]))
+        self.assertTrue(self._is_logged("DEBUG", "Position mode switched to PositionMode.HEDGE."))
+
+    async def test_configure_pairs_retries_transient_failures(self):
+        self.exchange._sleep = AsyncMock()
+        self.exchange._set_trading_pair_leverage = AsyncMock(
+            side_effect=[asyncio.TimeoutError(), (True, ""), IOError("down"), IOError("down"), IOError("down")]
+        )
+        self.exchange._trading_pairs = [self.trading_pair, "OTHER-HBOT"]
+
+        results = await self.exchange.configure_pairs(leverage_by_pair={self.trading_pair: 3})
+        self.assertTrue(results[self.trading_pair].leverage_set)
+        self.assertEqual(1, self.exchange._sleep.call_count)
+
+        results = await self.exchange.configure_pairs(leverage_by_pair={"OTHER-HBOT": 3})
+        self.assertFalse(results["OTHER-HBOT"].leverage_set)
+        self.assertEqual("down", results["OTHER-HBOT"].error)
+        self.assertEqual(1 + self.exchange.PAIR_CONFIGURATION_MAX_RETRIES, self.exchange._sleep.call_count)
+        self.assertTrue(self._is_logged("NETWORK", "Error setting leverage 3 for OTHER-HBOT: down"))
+
+    async def test_configure_pairs_does_not_retry_rejections_and_rolls_back_changed_pairs(self):
+        trading_pairs = [f"PAIR{i}-{self.quote_asset}" for i in range(3)]
+        self.exchange._trading_pairs = trading_pairs
+        self.exchange._sleep = AsyncMock()
+        self.exchange._set_trading_pair_leverage = AsyncMock(return_value=(True, ""))
+        calls = []
+
+        async def set_mode(mode, trading_pair):
+            calls.append((mode, trading_pair))
+            if trading_pair == trading_pairs[1]:
+                return False, "rejected"
+            return True, ""
+
+        self.exchange._trading_pair_position_mode_set = AsyncMock(side_effect=set_mode)
+        event_logger = EventLogger()
+        self.exchange.add_listener(AccountEvent.PositionModeChangeFailed, event_logger)
+
+        results = await self.exchange.configure_pairs(mode=PositionMode.HEDGE,
+                                                      leverage_by_pair={trading_pairs[0]: 5})
+
+        self.assertEqual(PositionMode.ONEWAY, self.exchange.position_mode)
+        self.exchange._sleep.assert_not_called()
+        self.exchange._set_trading_pair_leverage.assert_not_called()
+        rollback_calls = calls[len(trading_pairs):]
+        self.assertEqual(
+            sorted([(PositionMode.ONEWAY, trading_pairs[0]), (PositionMode.ONEWAY, trading_pairs[2])]),
+            sorted(rollback_calls),
+        )
+        self.assertTrue(results[trading_pairs[0]].rolled_back)
+        self.assertFalse(results[trading_pairs[1]].rolled_back)
+        self.assertEqual("rejected", results[trading_pairs[1]].error)
+        self.assertFalse(results[trading_pairs[0]].leverage_set)
+        self.assertFalse(any(result.success for result in results.values()))
+        self.assertEqual(3, len(event_logger.event_log))
+        self.assertTrue(
+            self._is_logged("NETWORK", f"Error switching {trading_pairs[1]} mode to PositionMode.HEDGE: rejected")
+        )
+
     def _simulate_trading_rules_initialized(self):
         margin_asset = self.quote_asset
         mocked_response = self._get_exchange_info_mock_response(margin_asset)
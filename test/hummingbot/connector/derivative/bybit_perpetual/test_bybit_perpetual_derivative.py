@@ -8,8 +8,9 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from unittest.mock import patch
 from urllib.parse import urlencode
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aioresponses.core import RequestCall
+from bidict import bidict
 
 import hummingbot.connector.derivative.bybit_perpetual.bybit_perpetual_constants as CONSTANTS
 import hummingbot.connector.derivative.bybit_perpetual.bybit_perpetual_web_utils as web_utils
@@ -810,12 +811,26 @@ class BybitPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDe
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both cancelations are sent in a single batch request
+        url = web_utils.get_rest_url_for_endpoint(
+            endpoint=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL, trading_pair=successful_order.trading_pair
+        )
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "linear", "symbol": self.exchange_trading_pair,
+                     "orderId": successful_order.exchange_order_id, "orderLinkId": successful_order.client_order_id},
+                    {"category": "linear", "symbol": self.exchange_trading_pair,
+                     "orderId": erroneous_order.exchange_order_id, "orderLinkId": erroneous_order.client_order_id},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 20000, "msg": "Could not find order"}]},
+            "time": 1672217377164
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses, ret_code: int = 110001,
@@ -1262,6 +1277,121 @@ class BybitPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualDe
             str(exception_context.exception)
         )
 
+    @aioresponses()
+    def test_create_orders_in_same_tick_with_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.get_rest_url_for_endpoint(
+            endpoint=CONSTANTS.PLACE_BATCH_ORDERS_PATH_URL, trading_pair=self.trading_pair
+        )
+
+        order_ids = [
+            self.place_buy_order(),
+            self.place_buy_order(price=Decimal("9999")),
+            self.place_sell_order(position_action=PositionAction.CLOSE),
+        ]
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "linear", "symbol": self.exchange_trading_pair, "orderId": "EOID1",
+                     "orderLinkId": order_ids[0], "createAt": "1713434102752"},
+                    {"category": "linear", "symbol": self.exchange_trading_pair, "orderId": "",
+                     "orderLinkId": order_ids[1], "createAt": ""},
+                    {"category": "linear", "symbol": self.exchange_trading_pair, "orderId": "EOID3",
+                     "orderLinkId": order_ids[2], "createAt": "1713434102752"},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 110007, "msg": "Insufficient available balance"},
+                    {"code": 0, "msg": "OK"},
+                ]
+            },
+            "time": 1713434102753
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual("linear", request_data["category"])
+        self.assertEqual(order_ids, [data["orderLinkId"] for data in request_data["request"]])
+        self.assertEqual(["Buy", "Buy", "Sell"], [data["side"] for data in request_data["request"]])
+        self.assertEqual([False, False, True], [data["reduceOnly"] for data in request_data["request"]])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.order_failure_logger.event_log[0].order_id)
+        self.assertIn("Insufficient available balance", self.order_failure_logger.event_log[0].error_message)
+
+    @aioresponses()
+    def test_batch_cancel(self, mock_api):
+        self.exchange = BybitPerpetualDerivative(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            bybit_perpetual_api_key=self.api_key,
+            bybit_perpetual_secret_key=self.api_secret,
+            trading_pairs=[self.trading_pair, self.non_linear_trading_pair],
+        )
+        self.exchange._set_trading_pair_symbol_map(bidict({
+            self.exchange_trading_pair: self.trading_pair,
+            self.exchange_symbol_for_tokens(self.base_asset, self.non_linear_quote_asset): self.non_linear_trading_pair,
+        }))
+        url = web_utils.get_rest_url_for_endpoint(
+            endpoint=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL, trading_pair=self.trading_pair
+        )
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", exchange_order_id=f"EOID{i}", trading_pair=trading_pair,
+                          order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"),
+                          price=Decimal("10000"), creation_timestamp=1640780000)
+            for i, trading_pair in enumerate([self.trading_pair, self.non_linear_trading_pair, self.trading_pair])
+        ]
+        linear_response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "linear", "symbol": self.exchange_trading_pair, "orderId": "EOID0",
+                     "orderLinkId": "OID0"},
+                    {"category": "linear", "symbol": self.exchange_trading_pair, "orderId": "EOID2",
+                     "orderLinkId": "OID2"},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 110001, "msg": "Order does not exist"}]},
+            "time": 1713434299047
+        }
+        non_linear_response = {"retCode": 10016, "retMsg": "Server error"}
+        mock_api.post(
+            url,
+            callback=lambda *args, **kwargs: CallbackResult(body=json.dumps(
+                linear_response if json.loads(kwargs["data"])["category"] == "linear" else non_linear_response)),
+            repeat=True)
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_cancel(orders))
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(cancel_requests))
+        requests_data = sorted((json.loads(request.kwargs["data"]) for request in cancel_requests),
+                               key=lambda data: data["category"])
+        self.assertEqual("inverse", requests_data[0]["category"])
+        self.assertEqual(["EOID1"], [data["orderId"] for data in requests_data[0]["request"]])
+        self.assertEqual("linear", requests_data[1]["category"])
+        self.assertEqual(["EOID0", "EOID2"], [data["orderId"] for data in requests_data[1]["request"]])
+
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], IOError)
+        self.assertIn("Server error", str(results[1]))
+        self.assertIsInstance(results[2], IOError)
+        self.assertTrue(self.exchange._is_order_not_found_during_cancelation_error(results[2]))
+
     def test_user_stream_balance_update(self):
         # Implement once bybit returns again something related to available balance
         pass
@@ -1714,6 +1714,19 @@ class GateIoPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualD
             )
         )
 
+    @aioresponses()
+    def test_position_mode_set_once_for_the_account(self, mock_api: aioresponses):
+        self.exchange._trading_pairs = [self.trading_pair, "ETH-USDT"]
+        url = self.configure_successful_set_position_mode(position_mode=PositionMode.HEDGE, mock_api=mock_api)
+
+        results = self.async_run_with_timeout(self.exchange.configure_pairs(mode=PositionMode.HEDGE))
+
+        self.assertTrue(all(result.position_mode_set for result in results.values()))
+        self.assertEqual(PositionMode.HEDGE, self.exchange.position_mode)
+        post_requests = [key for key in mock_api.requests if key[0] == "POST" and str(key[1]).startswith(url)]
+        self.assertEqual(1, len(post_requests))
+        self.assertEqual(1, len(mock_api.requests[post_requests[0]]))
+
     @aioresponses()
     def test_update_position_mode(
             self,
@@ -675,12 +675,26 @@ class KucoinPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualD
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL)
+        response = {
+            "code": CONSTANTS.RET_CODE_OK,
+            "data": [
+                {
+                    "orderId": successful_order.exchange_order_id,
+                    "clientOid": successful_order.client_order_id,
+                    "code": CONSTANTS.RET_CODE_BATCH_ORDER_OK,
+                    "msg": "success",
+                },
+                {
+                    "orderId": None,
+                    "clientOid": erroneous_order.client_order_id,
+                    "code": CONSTANTS.RET_CODE_PARAMS_ERROR,
+                    "msg": "Order cannot be canceled",
+                },
+            ],
+        }
+        mock_api.delete(url, body=json.dumps(response))
+        return [url]
 
     def configure_completely_filled_order_status_response(
         self,
@@ -1510,6 +1524,78 @@ class KucoinPerpetualDerivativeTests(AbstractPerpetualDerivativeTests.PerpetualD
         request_data = json.loads(order_request.kwargs["data"])
         self.assertEqual(True, request_data["postOnly"])
 
+    @aioresponses()
+    def test_create_orders_in_same_tick_with_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.CREATE_BATCH_ORDERS_PATH_URL)
+
+        order_ids = [
+            self.place_buy_order(),
+            self.place_buy_order(price=Decimal("9999")),
+            self.place_sell_order(position_action=PositionAction.CLOSE),
+        ]
+        response = {
+            "code": CONSTANTS.RET_CODE_OK,
+            "data": [
+                {"orderId": "EOID1", "clientOid": order_ids[0], "symbol": self.exchange_trading_pair,
+                 "code": CONSTANTS.RET_CODE_BATCH_ORDER_OK, "msg": "success"},
+                {"orderId": None, "clientOid": order_ids[1], "symbol": self.exchange_trading_pair,
+                 "code": "300003", "msg": "Balance insufficient"},
+                {"orderId": "EOID3", "clientOid": order_ids[2], "symbol": self.exchange_trading_pair,
+                 "code": CONSTANTS.RET_CODE_BATCH_ORDER_OK, "msg": "success"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_requests = [request for key, requests in mock_api.requests.items()
+                          if key[1].human_repr() == url for request in requests]
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(order_ids, [data["clientOid"] for data in request_data])
+        self.assertEqual(["buy", "buy", "sell"], [data["side"] for data in request_data])
+        self.assertEqual([False, False, True], [data["reduceOnly"] for data in request_data])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.order_failure_logger.event_log[0].order_id)
+        self.assertIn("Balance insufficient", self.order_failure_logger.event_log[0].error_message)
+
+    @aioresponses()
+    def test_batch_cancel(self, mock_api):
+        url = web_utils.get_rest_url_for_endpoint(endpoint=CONSTANTS.CANCEL_BATCH_ORDERS_PATH_URL)
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", exchange_order_id=f"EOID{i}", trading_pair=self.trading_pair,
+                          order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"),
+                          price=Decimal("10000"), creation_timestamp=1640780000)
+            for i in range(3)
+        ]
+        response = {
+            "code": CONSTANTS.RET_CODE_OK,
+            "data": [
+                {"orderId": "EOID0", "clientOid": "OID0", "code": CONSTANTS.RET_CODE_BATCH_ORDER_OK, "msg": "success"},
+                {"orderId": None, "clientOid": "OID2", "code": "100004", "msg": "Order cannot be canceled"},
+            ]
+        }
+        mock_api.delete(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_cancel(orders))
+
+        cancel_request = self._all_executed_requests(mock_api, url)[0]
+        self.assertEqual(
+            {"clientOidsList": [{"symbol": self.exchange_trading_pair, "clientOid": f"OID{i}"} for i in range(3)]},
+            json.loads(cancel_request.kwargs["data"]))
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], IOError)
+        self.assertIsInstance(results[2], IOError)
+        self.assertIn("Order cannot be canceled", str(results[2]))
+
     @aioresponses()
     @patch("hummingbot.connector.derivative.kucoin_perpetual.kucoin_perpetual_derivative.KucoinPerpetualDerivative.get_price")
     def test_create_buy_market_order_successfully(self, mock_api, get_price_mock):
@@ -0,0 +1,132 @@
+import asyncio
+import math
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.derivative.position_risk_monitor import PositionRiskMonitor
+from hummingbot.connector.perpetual_trading import PerpetualTrading
+from hummingbot.core.data_type.common import PositionSide
+from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import AccountEvent
+
+
+class PositionRiskMonitorTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "BTC-USDT"
+    other_trading_pair = "ETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.perpetual_trading = PerpetualTrading([self.trading_pair, self.other_trading_pair])
+        self.order_book = OrderBook()
+        self.connector = MagicMock()
+        self.connector.current_timestamp = 1640000000
+        self.connector.order_books = {self.trading_pair: self.order_book}
+        self.monitor = PositionRiskMonitor(self.connector, self.perpetual_trading)
+
+    def set_mid_price(self, price: float, update_id: int = 1):
+        self.order_book.apply_snapshot([OrderBookRow(price - 1, 1, update_id)],
+                                       [OrderBookRow(price + 1, 1, update_id)],
+                                       update_id)
+
+    def set_position(self, trading_pair: str, side: PositionSide, amount: str, entry_price: str, leverage: str):
+        self.perpetual_trading.set_position(
+            f"{trading_pair}{side.name}",
+            Position(trading_pair, side, Decimal("0"), Decimal(entry_price), Decimal(amount), Decimal(leverage)),
+        )
+
+    def triggered_events(self, event_tag: AccountEvent):
+        return [call.args[1] for call in self.connector.trigger_event.call_args_list if call.args[0] == event_tag]
+
+    def test_positions_valued_with_order_book_mid_price(self):
+        self.set_mid_price(100)
+        self.set_position(self.trading_pair, PositionSide.LONG, "1", "100", "10")
+        self.set_position(self.trading_pair, PositionSide.SHORT, "-2", "100", "5")
+
+        risks = self.monitor.update()
+
+        long_risk = risks[f"{self.trading_pair}LONG"]
+        self.assertEqual(100, long_risk.mark_price)
+        self.assertEqual(0, long_risk.unrealized_pnl)
+        self.assertAlmostEqual(100 * 0.9 / 0.995, long_risk.liquidation_price)
+        self.assertAlmostEqual((100 - 100 * 0.9 / 0.995) / 100, long_risk.liquidation_distance)
+        self.assertAlmostEqual(100 * 0.005 / 10, long_risk.margin_ratio)
+        short_risk = risks[f"{self.trading_pair}SHORT"]
+        self.assertEqual(200, short_risk.notional)
+        self.assertAlmostEqual(100 * 1.2 / 1.005, short_risk.liquidation_price)
+        self.assertAlmostEqual((100 * 1.2 / 1.005 - 100) / 100, short_risk.liquidation_distance)
+
+        self.set_mid_price(110, update_id=2)
+        risks = self.monitor.update()
+        self.assertEqual(10, risks[f"{self.trading_pair}LONG"].unrealized_pnl)
+        self.assertEqual(-20, risks[f"{self.trading_pair}SHORT"].unrealized_pnl)
+
+    def test_funding_info_mark_price_used_without_order_book(self):
+        self.perpetual_trading.initialize_funding_info(FundingInfo(
+            self.other_trading_pair, Decimal("2000"), Decimal("2010"), 0, Decimal("0.0001")))
+        self.set_position(self.other_trading_pair, PositionSide.LONG, "1", "2000", "0")
+
+        risk = self.monitor.update()[f"{self.other_trading_pair}LONG"]
+
+        self.assertEqual(2010, risk.mark_price)
+        self.assertEqual(10, risk.unrealized_pnl)
+        # The liquidation price can't be estimated without the leverage
+        self.assertTrue(math.isnan(risk.liquidation_price))
+        self.assertTrue(math.isnan(risk.margin_ratio))
+
+    def test_threshold_events_triggered_once_per_crossing(self):
+        self.monitor.set_thresholds(max_margin_ratio=Decimal("0.2"), min_liquidation_distance=Decimal("0.05"))
+        self.set_mid_price(100)
+        self.set_position(self.trading_pair, PositionSide.LONG, "1", "100", "10")
+        self.monitor.update()
+        self.connector.trigger_event.assert_not_called()
+
+        self.set_mid_price(92, update_id=2)
+        self.monitor.update()
+        self.monitor.update()
+
+        margin_calls = self.triggered_events(AccountEvent.MarginCall)
+        liquidation_risks = self.triggered_events(AccountEvent.LiquidationRisk)
+        self.assertEqual(1, len(margin_calls))
+        self.assertEqual(1, len(liquidation_risks))
+        self.assertEqual(self.trading_pair, liquidation_risks[0].trading_pair)
+        self.assertEqual(PositionSide.LONG, liquidation_risks[0].position_side)
+        self.assertEqual(0.05, liquidation_risks[0].threshold)
+        self.assertAlmostEqual(92 * 0.005 / 2, margin_calls[0].margin_ratio)
+        self.assertEqual(1640000000, margin_calls[0].timestamp)
+
+        self.set_mid_price(100, update_id=3)
+        self.monitor.update()
+        self.set_mid_price(92, update_id=4)
+        self.monitor.update()
+        self.assertEqual(2, len(self.triggered_events(AccountEvent.LiquidationRisk)))
+
+    async def test_updates_coalesced_per_loop_iteration(self):
+        self.set_mid_price(100)
+        self.set_position(self.trading_pair, PositionSide.LONG, "1", "100", "10")
+        self.monitor.start()
+        self.connector.order_book_tracker.add_update_listener.assert_called_once()
+        order_book_listener = self.connector.order_book_tracker.add_update_listener.call_args.args[0]
+        await asyncio.sleep(0)
+        self.assertEqual(1, len(self.monitor.risks))
+
+        self.monitor.update = MagicMock(wraps=self.monitor.update)
+        self.set_mid_price(110, update_id=2)
+        order_book_listener(self.trading_pair)
+        order_book_listener(self.trading_pair)
+        order_book_listener(self.other_trading_pair)
+        self.set_position(self.trading_pair, PositionSide.LONG, "2", "100", "10")
+        await asyncio.sleep(0)
+
+        self.monitor.update.assert_called_once()
+        self.assertEqual(20, self.monitor.risks[f"{self.trading_pair}LONG"].unrealized_pnl)
+
+        self.perpetual_trading.remove_position(f"{self.trading_pair}LONG")
+        await asyncio.sleep(0)
+        self.assertEqual({}, self.monitor.risks)
+
+        self.monitor.stop()
+        self.connector.order_book_tracker.remove_update_listener.assert_called_once_with(order_book_listener)
@@ -470,7 +470,7 @@ class TestBybitExchange(unittest.TestCase):
                                         amount=Decimal("100"),
                                         order_type=OrderType.LIMIT,
                                         price=Decimal("10000")))
-        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(self.test_task)
 
         order_request = next(((key, value) for key, value in mock_api.requests.items()
                               if key[1].human_repr().startswith(place_order_url)))
@@ -586,7 +586,7 @@ class TestBybitExchange(unittest.TestCase):
                                         amount=Decimal("100"),
                                         price=Decimal("10"),
                                         order_type=OrderType.MARKET))
-        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(self.test_task)
 
         order_request = next(((key, value) for key, value in mock_api.requests.items()
                               if key[1].human_repr().startswith(place_order_url)))
@@ -624,7 +624,7 @@ class TestBybitExchange(unittest.TestCase):
                                         amount=Decimal("100"),
                                         order_type=OrderType.LIMIT,
                                         price=Decimal("10000")))
-        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(self.test_task)
 
         self.assertNotIn("OID1", self.exchange.in_flight_orders)
         self.assertEqual(0, len(self.buy_order_created_logger.event_log))
@@ -654,7 +654,7 @@ class TestBybitExchange(unittest.TestCase):
                                         order_type=OrderType.LIMIT,
                                         price=Decimal("0.0001")))
         # The second order is used only to have the event triggered and avoid using timeouts for tests
-        asyncio.get_event_loop().create_task(
+        second_order_task = asyncio.get_event_loop().create_task(
             self.exchange._create_order(trade_type=TradeType.BUY,
                                         order_id="OID2",
                                         trading_pair=self.trading_pair,
@@ -662,7 +662,7 @@ class TestBybitExchange(unittest.TestCase):
                                         order_type=OrderType.LIMIT,
                                         price=Decimal("10000")))
 
-        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.gather(self.test_task, second_order_task))
 
         self.assertNotIn("OID1", self.exchange.in_flight_orders)
         self.assertEqual(0, len(self.buy_order_created_logger.event_log))
@@ -680,6 +680,7 @@ class TestBybitExchange(unittest.TestCase):
 
     @aioresponses()
     def test_cancel_order_successfully(self, mock_api):
+        self._simulate_trading_rules_initialized()
         request_sent_event = asyncio.Event()
         self.exchange._set_current_timestamp(1640780000)
 
@@ -716,10 +717,13 @@ class TestBybitExchange(unittest.TestCase):
 
         self.exchange.cancel(client_order_id="OID1", trading_pair=self.trading_pair)
         self.async_run_with_timeout(request_sent_event.wait())
+        # Let the cancel task process the response
+        self.async_run_with_timeout(asyncio.sleep(0.01))
 
         cancel_request = next(((key, value) for key, value in mock_api.requests.items()
                                if key[1].human_repr().startswith(url)))
         self._validate_auth_credentials_present(cancel_request[1][0])
+        self.assertEqual(self.ex_trading_pair, json.loads(cancel_request[1][0].kwargs["data"])["symbol"])
 
         cancel_event: OrderCancelledEvent = self.order_cancelled_logger.event_log[0]
         self.assertEqual(self.exchange.current_timestamp, cancel_event.timestamp)
@@ -734,6 +738,7 @@ class TestBybitExchange(unittest.TestCase):
 
     @aioresponses()
     def test_cancel_order_raises_failure_event_when_request_fails(self, mock_api):
+        self._simulate_trading_rules_initialized()
         request_sent_event = asyncio.Event()
         self.exchange._set_current_timestamp(1640780000)
 
@@ -758,6 +763,8 @@ class TestBybitExchange(unittest.TestCase):
 
         self.exchange.cancel(client_order_id="OID1", trading_pair=self.trading_pair)
         self.async_run_with_timeout(request_sent_event.wait())
+        # Let the cancel task process the response
+        self.async_run_with_timeout(asyncio.sleep(0.01))
 
         self.assertEqual(0, len(self.order_cancelled_logger.event_log))
 
@@ -770,6 +777,7 @@ class TestBybitExchange(unittest.TestCase):
 
     @aioresponses()
     def test_cancel_orders_with_cancel_all(self, mock_api):
+        self._simulate_trading_rules_initialized()
         self.exchange._set_current_timestamp(1640780000)
 
         self.exchange.start_tracking_order(
@@ -817,6 +825,125 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_create_orders_in_same_tick_with_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_PLACE_PATH_URL)
+
+        order_ids = [
+            self.exchange.buy(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("10000")),
+            self.exchange.buy(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("9999")),
+            self.exchange.sell(self.trading_pair, Decimal("100"), OrderType.MARKET, Decimal("10000")),
+        ]
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID1",
+                     "orderLinkId": order_ids[0], "createAt": "1640780000000"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "",
+                     "orderLinkId": order_ids[1], "createAt": ""},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID3",
+                     "orderLinkId": order_ids[2], "createAt": "1640780000000"},
+                ]
+            },
+            "retExtInfo": {
+                "list": [
+                    {"code": 0, "msg": "OK"},
+                    {"code": 170131, "msg": "Insufficient balance."},
+                    {"code": 0, "msg": "OK"},
+                ]
+            },
+            "time": 1640780000000
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_requests = [request for key, requests in mock_api.requests.items()
+                          if key[1].human_repr().startswith(url) for request in requests]
+        self.assertEqual(1, len(order_requests))
+        self._validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(CONSTANTS.TRADE_CATEGORY, request_data["category"])
+        self.assertEqual(order_ids, [data["orderLinkId"] for data in request_data["request"]])
+        self.assertEqual([CONSTANTS.SIDE_BUY, CONSTANTS.SIDE_BUY, CONSTANTS.SIDE_SELL],
+                         [data["side"] for data in request_data["request"]])
+        self.assertEqual(["Limit", "Limit", "Market"], [data["orderType"] for data in request_data["request"]])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.order_failure_logger.event_log[0].order_id)
+        self.assertIn("Insufficient balance.", self.order_failure_logger.event_log[0].error_message)
+
+    @aioresponses()
+    def test_batch_cancel(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        url = web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL)
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", exchange_order_id=f"EOID{i}", trading_pair=self.trading_pair,
+                          order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"),
+                          price=Decimal("10000"), creation_timestamp=1640780000)
+            for i in range(2)
+        ]
+        response = {
+            "retCode": 0,
+            "retMsg": "OK",
+            "result": {
+                "list": [
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID0", "orderLinkId": "OID0"},
+                    {"category": "spot", "symbol": self.ex_trading_pair, "orderId": "EOID1", "orderLinkId": "OID1"},
+                ]
+            },
+            "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 170213, "msg": "Order does not exist."}]},
+            "time": 1640780000000
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_cancel(orders))
+
+        cancel_request = next(request for key, requests in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url) for request in requests)
+        self.assertEqual(
+            {"category": CONSTANTS.TRADE_CATEGORY,
+             "request": [{"symbol": self.ex_trading_pair, "orderId": f"EOID{i}"} for i in range(2)]},
+            json.loads(cancel_request.kwargs["data"]))
+        self.assertTrue(results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual("Order does not exist.", str(results[1]))
+
+    @aioresponses()
+    def test_batch_cancel_sends_single_cancels_for_classic_accounts(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._account_type = "SPOT"
+        url = web_utils.rest_url(CONSTANTS.ORDER_CANCEL_PATH_URL)
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", exchange_order_id=f"EOID{i}", trading_pair=self.trading_pair,
+                          order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"),
+                          price=Decimal("10000"), creation_timestamp=1640780000)
+            for i in range(2)
+        ]
+        for order in orders:
+            response = {
+                "retCode": 0,
+                "retMsg": "OK",
+                "result": {"orderId": order.exchange_order_id, "orderLinkId": order.client_order_id},
+                "retExtInfo": {},
+                "time": 1640780000000
+            }
+            mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_cancel(orders))
+
+        self.assertEqual([True, True], results)
+        self.assertFalse(any(key[1].human_repr().startswith(web_utils.rest_url(CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL))
+                             for key in mock_api.requests))
+
     @aioresponses()
     @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
     def test_update_time_synchronizer_successfully(self, mock_api, seconds_counter_mock):
@@ -6,7 +6,7 @@ from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCa
 from typing import Any, Awaitable, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from bidict import bidict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -770,6 +770,103 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
             )
         )
 
+    @aioresponses()
+    async def test_create_orders_in_same_tick_with_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        request_sent_event = asyncio.Event()
+
+        order_ids = [
+            self.exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("5.1")),
+            self.exchange.buy(self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("5")),
+            self.exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT_MAKER, Decimal("6")),
+        ]
+        response = [
+            {**self.get_order_create_response_mock(exchange_order_id="1"), "text": order_ids[0], "succeeded": True},
+            {"text": order_ids[1], "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough balance"},
+            {**self.get_order_create_response_mock(exchange_order_id="3"), "text": order_ids[2], "succeeded": True},
+        ]
+        mock_api.post(regex_url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        await asyncio.wait_for(request_sent_event.wait(), 1)
+        await asyncio.sleep(0.01)
+
+        order_requests = [value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url)]
+        self.assertEqual(1, len(order_requests))
+        request_data = json.loads(order_requests[0][0].kwargs["data"])
+        self.assertEqual(order_ids, [data["text"] for data in request_data])
+        self.assertEqual(["buy", "buy", "sell"], [data["side"] for data in request_data])
+        self.assertEqual(["gtc", "gtc", "poc"], [data["time_in_force"] for data in request_data])
+
+        self.assertEqual("1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertEqual(1, len(self.sell_order_created_logger.event_log))
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(order_ids[1], failure_event.order_id)
+        self.assertIn("BALANCE_NOT_ENOUGH", failure_event.error_message)
+
+    @aioresponses()
+    async def test_batch_order_request_split_by_currency_pairs(self, mock_api):
+        trading_pairs = [f"COIN{i}-HBOT" for i in range(6)]
+        self.exchange._set_trading_pair_symbol_map(
+            bidict({trading_pair.replace("-", "_"): trading_pair for trading_pair in trading_pairs}))
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", trading_pair=trading_pair, order_type=OrderType.LIMIT,
+                          trade_type=TradeType.BUY, amount=Decimal("1"), price=Decimal("10"),
+                          creation_timestamp=1640780000)
+            for i, trading_pair in enumerate(trading_pairs + trading_pairs[:1])
+        ]
+
+        def response(url, **kwargs):
+            return CallbackResult(body=json.dumps([
+                {"text": data["text"], "id": data["text"].replace("OID", "EOID"), "status": "open", "succeeded": True}
+                for data in json.loads(kwargs["data"])
+            ]))
+
+        mock_api.post(regex_url, callback=response, repeat=True)
+
+        results = await self.exchange._place_batch_orders([(order, {}) for order in orders])
+
+        order_requests = [value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url)]
+        requests_data = [json.loads(request.kwargs["data"]) for request in order_requests[0]]
+        self.assertEqual([["OID0", "OID6", "OID1", "OID2", "OID3"], ["OID4", "OID5"]],
+                         [[data["text"] for data in request_data] for request_data in requests_data])
+        self.assertEqual([f"EOID{i}" for i in range(7)], [result[0] for result in results])
+
+    @aioresponses()
+    async def test_batch_cancel(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        orders = [self.get_in_flight_order("OID1", "1"), self.get_in_flight_order("OID2", "2"),
+                  self.get_in_flight_order("OID3", None)]
+        update_event = MagicMock()
+        update_event.wait.side_effect = asyncio.TimeoutError
+        orders[2].exchange_order_id_update_event = update_event
+        response = [
+            {"currency_pair": self.ex_trading_pair, "id": "1", "succeeded": True, "label": "", "message": ""},
+            {"currency_pair": self.ex_trading_pair, "id": "2", "succeeded": False,
+             "label": CONSTANTS.ERR_LABEL_ORDER_NOT_FOUND, "message": "Order not found"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(response))
+
+        results = await self.exchange._place_batch_cancel(orders)
+
+        cancel_request = next(value for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url))
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": "1"}, {"currency_pair": self.ex_trading_pair, "id": "2"}],
+            json.loads(cancel_request[0].kwargs["data"]))
+        self.assertTrue(results[0])
+        self.assertTrue(self.exchange._is_order_not_found_during_cancelation_error(results[1]))
+        self.assertIsInstance(results[2], asyncio.TimeoutError)
+
     @aioresponses()
     def test_execute_cancel(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -837,7 +934,8 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
                         callback=lambda *args, **kwargs: request_sent_event.set())
 
         self.exchange.cancel(trading_pair=self.trading_pair, client_order_id="OID1")
-        await asyncio.sleep(0.0001)
+        await asyncio.wait_for(request_sent_event.wait(), 1)
+        await asyncio.sleep(0.01)
 
         self.assertEqual(0, len(self.order_cancelled_logger.event_log))
 
@@ -926,20 +1024,25 @@ class TestGateIoExchange(IsolatedAsyncioWrapperTestCase):
         self.assertIn("OID2", self.exchange.in_flight_orders)
         order2 = self.exchange.in_flight_orders["OID2"]
 
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order1.exchange_order_id)}"
+        # Both cancelations are sent in a single batch request
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
         regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
-
-        response = self.get_order_create_response_mock(cancelled=True, exchange_order_id=order1.exchange_order_id)
-
-        mock_api.delete(regex_url, body=json.dumps(response))
-
-        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.ORDER_DELETE_PATH_URL.format(order_id=order2.exchange_order_id)}"
-        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
-
-        mock_api.delete(regex_url, status=400)
+        response = [
+            {"currency_pair": self.ex_trading_pair, "id": order1.exchange_order_id, "succeeded": True,
+             "label": "", "message": ""},
+            {"currency_pair": self.ex_trading_pair, "id": order2.exchange_order_id, "succeeded": False,
+             "label": "INVALID_PARAM_VALUE", "message": "Invalid order"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(response))
 
         cancellation_results = self.async_run_with_timeout(self.exchange.cancel_all(10))
 
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": "4"}, {"currency_pair": self.ex_trading_pair, "id": "5"}],
+            json.loads(cancel_request[1][0].kwargs["data"]))
+
         self.assertEqual(2, len(cancellation_results))
         self.assertEqual(CancellationResult(order1.client_order_id, True), cancellation_results[0])
         self.assertEqual(CancellationResult(order2.client_order_id, False), cancellation_results[1])
@@ -715,6 +715,98 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    @patch("hummingbot.connector.exchange.kucoin.kucoin_exchange.KucoinExchange.get_price")
+    def test_create_orders_in_same_tick_with_batch_request(self, mock_api, get_price_mock):
+        get_price_mock.return_value = Decimal(1000)
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        multi_url = web_utils.private_rest_url(CONSTANTS.ORDERS_MULTI_PATH_URL)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_PATH_URL)
+
+        order_ids = [
+            self.exchange.buy(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("10000")),
+            self.exchange.buy(self.trading_pair, Decimal("100"), OrderType.LIMIT_MAKER, Decimal("9999")),
+            self.exchange.sell(self.trading_pair, Decimal("100"), OrderType.MARKET),
+            self.exchange.sell(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("10001")),
+        ]
+        multi_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "buy", "price": "10000",
+                     "size": "100", "id": "EOID1", "status": "success", "failMsg": None, "clientOid": order_ids[0]},
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "buy", "price": "9999",
+                     "size": "100", "id": None, "status": "fail", "failMsg": "Balance insufficient!",
+                     "clientOid": order_ids[1]},
+                    {"symbol": self.exchange_trading_pair, "type": "limit", "side": "sell", "price": "10001",
+                     "size": "100", "id": "EOID4", "status": "success", "failMsg": None, "clientOid": order_ids[3]},
+                ]
+            }
+        }
+        mock_api.post(multi_url,
+                      body=json.dumps(multi_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+        mock_api.post(url, body=json.dumps({"code": "200000", "data": {"orderId": "EOID3"}}))
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        multi_requests = [request for key, requests in mock_api.requests.items()
+                          if key[1].human_repr() == multi_url for request in requests]
+        self.assertEqual(1, len(multi_requests))
+        self._validate_auth_credentials_present(multi_requests[0])
+        request_data = json.loads(multi_requests[0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual([order_ids[0], order_ids[1], order_ids[3]],
+                         [data["clientOid"] for data in request_data["orderList"]])
+        self.assertEqual(["buy", "buy", "sell"], [data["side"] for data in request_data["orderList"]])
+        self.assertEqual([None, True, None], [data.get("postOnly") for data in request_data["orderList"]])
+        single_requests = [request for key, requests in mock_api.requests.items()
+                           if key[1].human_repr() == url for request in requests]
+        self.assertEqual(1, len(single_requests))
+        self.assertEqual(order_ids[2], json.loads(single_requests[0].kwargs["data"])["clientOid"])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertEqual("EOID4", self.exchange.in_flight_orders[order_ids[3]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.order_failure_logger.event_log[0].order_id)
+        self.assertIn("Balance insufficient!", self.order_failure_logger.event_log[0].error_message)
+
+    @aioresponses()
+    def test_place_batch_orders_with_hft_domain(self, mock_api):
+        self.exchange._domain = "hft"
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_MULTI_PATH_URL_HFT, domain="hft")
+        orders = [
+            (InFlightOrder(client_order_id=f"OID{i}", trading_pair=self.trading_pair, order_type=OrderType.LIMIT,
+                           trade_type=TradeType.BUY, amount=Decimal("1"), price=Decimal("10000"),
+                           creation_timestamp=1640780000), {})
+            for i in range(2)
+        ]
+        response = {
+            "code": "200000",
+            "data": [
+                {"orderId": "EOID0", "success": True},
+                {"success": False, "failMsg": "The order funds should more then 0.1 USDT."},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_orders(orders))
+
+        order_request = next(request for key, requests in mock_api.requests.items()
+                             if key[1].human_repr() == url for request in requests)
+        request_data = json.loads(order_request.kwargs["data"])
+        self.assertEqual(["orderList"], list(request_data))
+        self.assertEqual([self.exchange_trading_pair] * 2, [data["symbol"] for data in request_data["orderList"]])
+        self.assertEqual(("EOID0", self.exchange.current_timestamp), results[0])
+        self.assertIsInstance(results[1], IOError)
+        self.assertIn("The order funds should more then 0.1 USDT.", str(results[1]))
+
     @aioresponses()
     def test_create_order_fails_and_raises_failure_event(self, mock_api):
         self._simulate_trading_rules_initialized()
@@ -596,12 +596,20 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both cancelations are sent in a single batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": successful_order.client_order_id, "ordId": successful_order.exchange_order_id,
+                 "sCode": "0", "sMsg": ""},
+                {"clOrdId": erroneous_order.client_order_id, "ordId": erroneous_order.exchange_order_id,
+                 "sCode": "1", "sMsg": "Error"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1314,6 +1322,75 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
 
+    @aioresponses()
+    def test_create_orders_in_same_tick_with_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_PATH)
+
+        order_ids = [
+            self.place_buy_order(),
+            self.place_buy_order(price=Decimal("9999")),
+            self.place_sell_order(order_type=OrderType.LIMIT_MAKER),
+        ]
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": order_ids[0], "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": order_ids[1], "ordId": "", "tag": "", "sCode": "51008", "sMsg": "Insufficient balance"},
+                {"clOrdId": order_ids[2], "ordId": "EOID3", "tag": "", "sCode": "0", "sMsg": ""},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(order_ids, [data["clOrdId"] for data in request_data])
+        self.assertEqual(["buy", "buy", "sell"], [data["side"] for data in request_data])
+        self.assertEqual(["limit", "limit", "post_only"], [data["ordType"] for data in request_data])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[order_ids[0]].exchange_order_id)
+        self.assertEqual("EOID3", self.exchange.in_flight_orders[order_ids[2]].exchange_order_id)
+        self.assertNotIn(order_ids[1], self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.order_failure_logger.event_log[0].order_id)
+        self.assertIn("Insufficient balance", self.order_failure_logger.event_log[0].error_message)
+
+    @aioresponses()
+    def test_batch_cancel(self, mock_api):
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        orders = [
+            InFlightOrder(client_order_id=f"OID{i}", exchange_order_id=f"EOID{i}", trading_pair=self.trading_pair,
+                          order_type=OrderType.LIMIT, trade_type=TradeType.BUY, amount=Decimal("1"),
+                          price=Decimal("10000"), creation_timestamp=1640780000)
+            for i in range(3)
+        ]
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID0", "ordId": "EOID0", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID1", "ordId": "EOID1", "sCode": "51400", "sMsg": "Order does not exist"},
+                {"clOrdId": "OID2", "ordId": "EOID2", "sCode": "51402", "sMsg": "Order has been completed"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._place_batch_cancel(orders))
+
+        cancel_request = self._all_executed_requests(mock_api, url)[0]
+        self.assertEqual(
+            [{"clOrdId": f"OID{i}", "instId": self.trading_pair} for i in range(3)],
+            json.loads(cancel_request.kwargs["data"]))
+        self.assertEqual([True, True], results[:2])
+        self.assertIsInstance(results[2], IOError)
+
     @aioresponses()
     def test_create_buy_market_order_successfully(self, mock_api):
         self._simulate_trading_rules_initialized()
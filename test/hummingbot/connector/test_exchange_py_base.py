@@ -0,0 +1,331 @@
+import asyncio
+import os
+import time
+import unittest
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class MockBatchExchange(ExchangePyBase):
+    """
+    Local mock exchange. Requests are processed one at a time (like a rate limited API) and each one takes
+    `request_latency` seconds, no matter how many orders it carries.
+    """
+
+    def __init__(self, trading_pair: str, batch_size: int = 1, request_latency: float = 0):
+        self.BATCH_ORDER_CREATE_MAX_SIZE = batch_size
+        self.BATCH_ORDER_CANCEL_MAX_SIZE = batch_size
+        self._trading_pair = trading_pair
+        self._request_latency = request_latency
+        self._request_lock = asyncio.Lock()
+        self.create_requests: List[List[str]] = []
+        self.create_request_kwargs: List[Dict[str, Any]] = []
+        self.cancel_requests: List[List[str]] = []
+        self.rejected_order_ids = set()
+        super().__init__(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        self._trading_rules[trading_pair] = TradingRule(
+            trading_pair=trading_pair,
+            min_order_size=Decimal("0.001"),
+            min_price_increment=Decimal("0.01"),
+            min_base_amount_increment=Decimal("0.001"),
+        )
+
+    async def _request(self, requests: List[List[str]], order_ids: List[str]):
+        async with self._request_lock:
+            requests.append(order_ids)
+            await asyncio.sleep(self._request_latency)
+
+    def _rejection_or(self, order: InFlightOrder, result: Any) -> Any:
+        if order.client_order_id in self.rejected_order_ids:
+            return IOError(f"Order {order.client_order_id} rejected")
+        return result
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs) -> Tuple[str, float]:
+        await self._request(self.create_requests, [order_id])
+        if order_id in self.rejected_order_ids:
+            raise IOError(f"Order {order_id} rejected")
+        return f"EOID-{order_id}", self.current_timestamp
+
+    async def _place_batch_orders(
+        self, orders: List[Tuple[InFlightOrder, Dict[str, Any]]]
+    ) -> List[Union[Tuple[str, float], Exception]]:
+        await self._request(self.create_requests, [order.client_order_id for order, _ in orders])
+        self.create_request_kwargs.extend(kwargs for _, kwargs in orders)
+        return [self._rejection_or(order, (f"EOID-{order.client_order_id}", self.current_timestamp))
+                for order, _ in orders]
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        await self._request(self.cancel_requests, [order_id])
+        return True
+
+    async def _place_batch_cancel(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        await self._request(self.cancel_requests, [order.client_order_id for order in orders])
+        return [self._rejection_or(order, True) for order in orders]
+
+    @property
+    def name(self) -> str:
+        return "mock_batch_exchange"
+
+    @property
+    def authenticator(self):
+        return None
+
+    @property
+    def rate_limits_rules(self):
+        return []
+
+    @property
+    def domain(self):
+        return ""
+
+    @property
+    def client_order_id_max_length(self):
+        return 36
+
+    @property
+    def client_order_id_prefix(self):
+        return "HBOT"
+
+    @property
+    def trading_rules_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs_request_path(self):
+        return ""
+
+    @property
+    def check_network_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs(self):
+        return [self._trading_pair]
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    def supported_order_types(self):
+        return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
+        return False
+
+    def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
+        return False
+
+    def _get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                 amount: Decimal, price: Decimal = Decimal("NaN"), is_maker: Optional[bool] = None):
+        return AddedToCostTradeFee(percent=Decimal("0"))
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_balances(self):
+        pass
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder):
+        return []
+
+    async def _request_order_status(self, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    def _create_web_assistants_factory(self):
+        return MagicMock()
+
+    def _create_order_book_data_source(self):
+        return MagicMock()
+
+    def _create_user_stream_data_source(self):
+        return MagicMock()
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass
+
+
+class ExchangePyBaseBatchingTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def create_exchange(self, batch_size: int, request_latency: float = 0) -> MockBatchExchange:
+        exchange = MockBatchExchange(self.trading_pair, batch_size=batch_size, request_latency=request_latency)
+        exchange._set_current_timestamp(1640000000)
+        self.failure_logger = EventLogger()
+        self.cancel_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFailure, self.failure_logger)
+        exchange.add_listener(MarketEvent.OrderCancelled, self.cancel_logger)
+        return exchange
+
+    @staticmethod
+    async def wait_for(condition: Callable[[], bool], timeout: float = 5):
+        async def _wait():
+            while not condition():
+                await asyncio.sleep(0.001)
+        await asyncio.wait_for(_wait(), timeout)
+
+    def place_orders(self, exchange: MockBatchExchange, count: int) -> List[str]:
+        return [
+            exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100") - Decimal(i) / 100)
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def all_orders_processed(exchange: MockBatchExchange, order_ids: List[str]) -> bool:
+        orders = exchange._order_tracker.all_orders
+        return all(order_id in orders and orders[order_id].current_state != OrderState.PENDING_CREATE
+                   for order_id in order_ids)
+
+    async def test_orders_created_in_same_tick_are_sent_in_batches(self):
+        exchange = self.create_exchange(batch_size=10)
+
+        order_ids = self.place_orders(exchange, 25)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+
+        self.assertEqual([10, 10, 5], [len(request) for request in exchange.create_requests])
+        self.assertEqual(order_ids, [order_id for request in exchange.create_requests for order_id in request])
+        for order_id in order_ids:
+            order = exchange.in_flight_orders[order_id]
+            self.assertEqual(OrderState.OPEN, order.current_state)
+            self.assertEqual(f"EOID-{order_id}", order.exchange_order_id)
+
+    async def test_single_order_uses_regular_request(self):
+        exchange = self.create_exchange(batch_size=10)
+        exchange._place_batch_orders = MagicMock(side_effect=AssertionError("batch request used"))
+
+        order_ids = self.place_orders(exchange, 1)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+
+        self.assertEqual([order_ids], exchange.create_requests)
+        self.assertEqual(OrderState.OPEN, exchange.in_flight_orders[order_ids[0]].current_state)
+
+    async def test_rejected_order_in_batch_fails_alone(self):
+        exchange = self.create_exchange(batch_size=10)
+        order_ids = self.place_orders(exchange, 3)
+        exchange.rejected_order_ids.add(order_ids[1])
+
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+
+        self.assertEqual(1, len(exchange.create_requests))
+        self.assertEqual(1, len(self.failure_logger.event_log))
+        self.assertEqual(order_ids[1], self.failure_logger.event_log[0].order_id)
+        self.assertNotIn(order_ids[1], exchange.in_flight_orders)
+        self.assertEqual(OrderState.OPEN, exchange.in_flight_orders[order_ids[0]].current_state)
+        self.assertEqual(OrderState.OPEN, exchange.in_flight_orders[order_ids[2]].current_state)
+
+    async def test_failed_batch_request_fails_all_its_orders(self):
+        exchange = self.create_exchange(batch_size=10)
+        exchange._place_batch_orders = MagicMock(side_effect=IOError("Exchange unavailable"))
+
+        order_ids = self.place_orders(exchange, 3)
+        await self.wait_for(lambda: len(self.failure_logger.event_log) == 3)
+
+        self.assertEqual(set(order_ids), {event.order_id for event in self.failure_logger.event_log})
+        self.assertEqual(0, len(exchange.in_flight_orders))
+
+    async def test_cancels_in_same_tick_are_sent_in_batches(self):
+        exchange = self.create_exchange(batch_size=10)
+        order_ids = self.place_orders(exchange, 12)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+        exchange.rejected_order_ids.add(order_ids[0])
+
+        results = await exchange.cancel_all(timeout_seconds=5)
+
+        self.assertEqual([10, 2], [len(request) for request in exchange.cancel_requests])
+        self.assertEqual(11, len(self.cancel_logger.event_log))
+        self.assertEqual(
+            {order_id: order_id != order_ids[0] for order_id in order_ids},
+            {result.order_id: result.success for result in results})
+
+    async def test_batching_disabled_by_default(self):
+        exchange = self.create_exchange(batch_size=1)
+
+        order_ids = self.place_orders(exchange, 3)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+
+        self.assertEqual([[order_id] for order_id in order_ids], exchange.create_requests)
+
+    async def test_order_arguments_forwarded_to_batch_request(self):
+        exchange = self.create_exchange(batch_size=10)
+
+        order_ids = [
+            exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"), position_action="OPEN"),
+            exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"), position_action="CLOSE"),
+        ]
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+
+        self.assertEqual([order_ids], exchange.create_requests)
+        self.assertEqual([{"position_action": "OPEN"}, {"position_action": "CLOSE"}], exchange.create_request_kwargs)
+
+    async def test_default_batch_hooks_send_one_request_per_order(self):
+        exchange = self.create_exchange(batch_size=10)
+        exchange._place_batch_orders = super(MockBatchExchange, exchange)._place_batch_orders
+        exchange._place_batch_cancel = super(MockBatchExchange, exchange)._place_batch_cancel
+
+        order_ids = self.place_orders(exchange, 3)
+        exchange.rejected_order_ids.add(order_ids[2])
+        await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids))
+        results = await exchange.cancel_all(timeout_seconds=5)
+
+        self.assertEqual([[order_id] for order_id in order_ids], exchange.create_requests)
+        self.assertEqual(order_ids[2], self.failure_logger.event_log[0].order_id)
+        self.assertEqual([[order_id] for order_id in order_ids[:2]], exchange.cancel_requests)
+        self.assertTrue(all(result.success for result in results))
+
+    async def test_orders_grouped_in_batch_requests_by_tick(self):
+        exchange = self.create_exchange(batch_size=10)
+
+        first_tick_order_ids = self.place_orders(exchange, 12)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, first_tick_order_ids))
+        second_tick_order_ids = self.place_orders(exchange, 3)
+        await self.wait_for(lambda: self.all_orders_processed(exchange, second_tick_order_ids))
+
+        self.assertEqual(3, len(exchange.create_requests))
+        self.assertEqual([first_tick_order_ids[:10], first_tick_order_ids[10:], second_tick_order_ids],
+                         exchange.create_requests)
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Benchmark, set HUMMINGBOT_BENCHMARKS to run it")
+    async def test_benchmark_orders_per_second(self):
+        orders_count = 200
+        request_latency = 0.002
+
+        async def run(batch_size: int) -> float:
+            exchange = self.create_exchange(batch_size=batch_size, request_latency=request_latency)
+            start = time.perf_counter()
+            order_ids = self.place_orders(exchange, orders_count)
+            await self.wait_for(lambda: self.all_orders_processed(exchange, order_ids), timeout=30)
+            elapsed = time.perf_counter() - start
+            self.assertEqual(-(-orders_count // batch_size), len(exchange.create_requests))
+            return orders_count / elapsed
+
+        single_rate = await run(batch_size=1)
+        batch_rate = await run(batch_size=10)
+
+        self.assertGreater(batch_rate, single_rate,
+                           msg=f"{orders_count} orders, {request_latency * 1e3:.0f} ms per request: "
+                               f"single {single_rate:.0f} orders/s, batch {batch_rate:.0f} orders/s")
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -289,6 +291,62 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_performance_accumulator_catches_up_and_follows_fills(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        checkpoint_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(checkpoint_dir.cleanup)
+        checkpoint_path = os.path.join(checkpoint_dir.name, "performance.json")
+        recorder._performance_checkpoint_path = MagicMock(return_value=checkpoint_path)
+
+        def fill(timestamp: int, trade_type: TradeType, price: Decimal):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+                timestamp=timestamp,
+                order_id=f"OID{timestamp}",
+                trading_pair=self.trading_pair,
+                trade_type=trade_type,
+                order_type=OrderType.LIMIT,
+                price=price,
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=f"TradeId{timestamp}",
+            ))
+
+        fill(1642010000, TradeType.BUY, Decimal(1000))
+        fill(1642020000, TradeType.BUY, Decimal(1010))
+
+        # The trades before the start are left out, the trades recorded before the first request are read from the DB
+        accumulator = recorder.get_performance_accumulator(1642015000 * 1000)
+        self.assertEqual(1, accumulator.trades_count)
+
+        fill(1642030000, TradeType.SELL, Decimal(1020))
+        self.assertIs(accumulator, recorder.get_performance_accumulator(1642015000 * 1000))
+        market_performance = accumulator.markets[(self.display_name, self.trading_pair)]
+        self.assertEqual(1, market_performance.num_buys)
+        self.assertEqual(1, market_performance.num_sells)
+        self.assertEqual(Decimal(10), market_performance.realized_pnl)
+
+        self.remove_listener = MagicMock()
+        recorder.stop()
+        self.assertTrue(os.path.exists(checkpoint_path))
+
+        # A new recorder restores the checkpoint, and adds the trades recorded since
+        recorder._performance_accumulator = None
+        fill(1642040000, TradeType.SELL, Decimal(1030))
+        restored = recorder.get_performance_accumulator(1642015000 * 1000)
+        self.assertIsNot(accumulator, restored)
+        self.assertEqual(3, restored.trades_count)
+        self.assertEqual(2, restored.markets[(self.display_name, self.trading_pair)].num_sells)
+
     def test_trade_fee_in_quote_not_available(self):
         recorder = MarketsRecorder(
             sql=self.manager,
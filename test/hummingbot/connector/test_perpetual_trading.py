@@ -161,3 +161,60 @@ class PerpetualTest(unittest.TestCase):
             pass
 
         self.assertEqual(Decimal("10"), self.perpetual_trading.funding_info[self.trading_pair].index_price)
+
+    def test_funding_info_updates_replace_the_funding_info(self):
+        self.perpetual_trading.start()
+        funding_info = FundingInfo(
+            self.trading_pair,
+            index_price=Decimal("1"),
+            mark_price=Decimal("2"),
+            next_funding_utc_timestamp=3,
+            rate=Decimal("4"),
+        )
+        self.perpetual_trading.initialize_funding_info(funding_info)
+        funding_infos = self.perpetual_trading.funding_info
+
+        async def return_update():
+            return FundingInfoUpdate(self.trading_pair, mark_price=Decimal("20"))
+
+        mock_queue = MagicMock()
+        mock_queue.get.side_effect = [return_update(), asyncio.CancelledError()]
+        self.perpetual_trading._funding_info_stream = mock_queue
+        self.listening_task = self.perpetual_trading._funding_info_updater_task
+
+        try:
+            self.async_run_with_timeout(self.listening_task)
+        except asyncio.CancelledError:
+            pass
+
+        # The funding info returned before the update is unchanged, the read-only view shows the new one
+        self.assertEqual(Decimal("2"), funding_info.mark_price)
+        new_funding_info = self.perpetual_trading.get_funding_info(self.trading_pair)
+        self.assertIsNot(funding_info, new_funding_info)
+        self.assertEqual(Decimal("20"), new_funding_info.mark_price)
+        self.assertEqual(Decimal("1"), new_funding_info.index_price)
+        self.assertIs(new_funding_info, funding_infos[self.trading_pair])
+        with self.assertRaises(TypeError):
+            funding_infos[self.trading_pair] = funding_info
+
+    def test_funding_rate_history(self):
+        perpetual_trading = PerpetualTrading([self.trading_pair], funding_rate_history_size=2)
+        self.assertEqual([], perpetual_trading.get_funding_rate_history(self.trading_pair))
+
+        funding_info = FundingInfo(self.trading_pair, Decimal("1"), Decimal("2"), 3, Decimal("4"))
+        perpetual_trading.initialize_funding_info(funding_info)
+        for update in [FundingInfoUpdate(self.trading_pair, mark_price=Decimal("3")),
+                       FundingInfoUpdate(self.trading_pair, rate=Decimal("5")),
+                       FundingInfoUpdate(self.trading_pair, next_funding_utc_timestamp=6)]:
+            funding_info = funding_info.updated(update)
+            perpetual_trading._funding_info[self.trading_pair] = funding_info
+            perpetual_trading._record_funding_rate(funding_info)
+
+        history = perpetual_trading.get_funding_rate_history(self.trading_pair)
+        # Price only updates are not recorded, and only the last records are kept
+        self.assertEqual([(Decimal("5"), 3), (Decimal("5"), 6)],
+                         [(record.rate, record.next_funding_utc_timestamp) for record in history])
+        self.assertEqual(Decimal("3"), history[0].mark_price)
+
+        perpetual_trading.stop()
+        self.assertEqual([], perpetual_trading.get_funding_rate_history(self.trading_pair))
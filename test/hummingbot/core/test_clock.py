@@ -5,6 +5,7 @@ import unittest
 import pandas as pd
 
 from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -122,3 +123,78 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_backtest_ticks_iterators_at_their_tick_interval_in_order(self):
+        ticks = []
+
+        class RecordingIterator(PyTimeIterator):
+            def __init__(self, name: str):
+                super().__init__()
+                self.name = name
+
+            def tick(self, timestamp: float):
+                ticks.append((self.name, timestamp - ClockUnitTest.backtest_start_timestamp))
+
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.backtest_start_timestamp, self.backtest_end_timestamp)
+        fast_iterator = RecordingIterator("fast")
+        default_iterator = RecordingIterator("default")
+        slow_iterator = RecordingIterator("slow")
+        clock.add_iterator(slow_iterator, tick_interval=2.0)
+        clock.add_iterator(fast_iterator, tick_interval=0.5)
+        clock.add_iterator(default_iterator)
+
+        clock.backtest_til(self.backtest_start_timestamp + 2)
+
+        self.assertEqual(
+            [("fast", 0.5), ("fast", 1.0), ("default", 1.0), ("fast", 1.5),
+             ("slow", 2.0), ("fast", 2.0), ("default", 2.0)],
+            ticks,
+        )
+        self.assertEqual(0.5, clock.get_tick_interval(fast_iterator))
+        self.assertEqual(1.0, clock.get_tick_interval(default_iterator))
+        self.assertEqual(4, clock.get_tick_stats(fast_iterator).tick_count)
+        self.assertEqual(1, clock.get_tick_stats(slow_iterator).tick_count)
+        # Overruns and skipped ticks are only measured in real time
+        self.assertEqual(0, clock.get_tick_stats(slow_iterator).overrun_count)
+
+        clock.remove_iterator(fast_iterator)
+        self.assertNotIn(fast_iterator, clock.tick_stats)
+        clock.backtest_til(self.backtest_start_timestamp + 3)
+        self.assertEqual(("default", 3.0), ticks[-1])
+
+    def test_run_til_measures_overruns_and_skipped_ticks(self):
+        class SlowIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                time.sleep(0.25)
+
+        slow_iterator = SlowIterator()
+        fast_iterator = TimeIterator()
+        clock = Clock(ClockMode.REALTIME, 1.0)
+        clock.add_iterator(fast_iterator, tick_interval=0.1)
+        clock.add_iterator(slow_iterator, tick_interval=0.2)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 1.1))
+
+        slow_stats = clock.get_tick_stats(slow_iterator)
+        fast_stats = clock.get_tick_stats(fast_iterator)
+        self.assertGreater(slow_stats.tick_count, 0)
+        self.assertEqual(slow_stats.tick_count, slow_stats.overrun_count)
+        self.assertGreater(slow_stats.skipped_tick_count, 0)
+        self.assertGreaterEqual(slow_stats.max_duration, 0.25)
+        self.assertEqual(slow_stats.tick_count, slow_stats.latency_histogram()[0.5])
+        self.assertEqual(0, fast_stats.overrun_count)
+        self.assertGreater(fast_stats.tick_count, slow_stats.tick_count)
+
+    def test_set_tick_interval(self):
+        time_iterator = TimeIterator()
+        with self.assertRaises(ValueError):
+            self.clock_backtest.set_tick_interval(time_iterator, 1.0)
+
+        self.clock_backtest.add_iterator(time_iterator)
+        self.clock_backtest.set_tick_interval(time_iterator, 5.0)
+        self.assertEqual(5.0, self.clock_backtest.get_tick_interval(time_iterator))
+        self.clock_backtest.set_tick_interval(time_iterator)
+        self.assertEqual(self.tick_size, self.clock_backtest.get_tick_interval(time_iterator))
+        with self.assertRaises(ValueError):
+            self.clock_backtest.set_tick_interval(time_iterator, 0)
@@ -1,13 +1,35 @@
 import unittest
 import gc
+import os
+import time
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
 
 
+class RecordingListener(EventListener):
+    def __init__(self, name, calls):
+        super().__init__()
+        self.name = name
+        self.calls = calls
+
+    def __call__(self, arg):
+        self.calls.append(self.name)
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg):
+        self.count += 1
+
+
 class PubSubTest(unittest.TestCase):
     def setUp(self) -> None:
         self.pubsub = PubSub()
@@ -89,6 +111,89 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_trigger_event_by_priority_then_addition_order(self):
+        calls = []
+        listeners = {name: RecordingListener(name, calls) for name in ("a", "b", "c", "d")}
+        self.pubsub.add_listener(self.event_tag_zero, listeners["a"])
+        self.pubsub.add_listener(self.event_tag_zero, listeners["b"], priority=-1)
+        self.pubsub.add_listener(self.event_tag_zero, listeners["c"], priority=10)
+        self.pubsub.add_listener(self.event_tag_zero, listeners["d"])
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(["c", "a", "d", "b"], calls)
+        self.assertEqual([listeners[name] for name in ("c", "a", "d", "b")],
+                         self.pubsub.get_listeners(self.event_tag_zero))
+
+        # Adding a listener again only changes its priority
+        self.pubsub.add_listener(self.event_tag_zero, listeners["b"], priority=20)
+        calls.clear()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(["b", "c", "a", "d"], calls)
+
+    def test_dead_listeners_skipped_and_removed_lazily(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.add_listener(self.event_tag_one, self.listener_zero)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None
+        gc.collect()
+        self.assertIsNone(listener_zero_weakref())
+
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+        self.assertEqual([], self.pubsub.get_listeners(self.event_tag_one))
+
+    def test_listeners_changed_while_triggering_event(self):
+        calls = []
+        late_listener = RecordingListener("late", calls)
+        pubsub = self.pubsub
+
+        class RemovingListener(EventListener):
+            def __call__(self, arg):
+                calls.append("removing")
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, self)
+                pubsub.add_listener(MockEventType.EVENT_ZERO, late_listener)
+
+        removing_listener = RemovingListener()
+        other_listener = RecordingListener("other", calls)
+        self.pubsub.add_listener(self.event_tag_zero, removing_listener, priority=1)
+        self.pubsub.add_listener(self.event_tag_zero, other_listener)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(["removing", "other"], calls)
+
+        calls.clear()
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(["other", "late"], calls)
+
+    def test_events_delivered_to_1000_listeners(self):
+        listeners = [CountingListener() for _ in range(1000)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+
+        for _ in range(10):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([10] * 1000, [listener.count for listener in listeners])
+        self.assertEqual(listeners, self.pubsub.get_listeners(self.event_tag_zero))
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Benchmark, set HUMMINGBOT_BENCHMARKS to run it")
+    def test_benchmark_one_million_events(self):
+        listeners = [CountingListener() for _ in range(1000)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        trigger_time = time.perf_counter() - start
+
+        self.assertEqual(1_000_000, sum(listener.count for listener in listeners))
+        self.assertLess(trigger_time, 10, msg=f"1M events dispatched in {trigger_time:.1f} s")
+
 
 if __name__ == "__main__":
     unittest.main()
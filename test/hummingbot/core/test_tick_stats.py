@@ -0,0 +1,36 @@
+import math
+import unittest
+
+from hummingbot.core.tick_stats import TickStats
+
+
+class TickStatsTest(unittest.TestCase):
+
+    def test_record(self):
+        stats = TickStats()
+        stats.record(0.002)
+        stats.record(0.3, overrun=True, skipped_ticks=2)
+
+        self.assertEqual(2, stats.tick_count)
+        self.assertEqual(1, stats.overrun_count)
+        self.assertEqual(2, stats.skipped_tick_count)
+        self.assertEqual(0.3, stats.last_duration)
+        self.assertEqual(0.3, stats.max_duration)
+
+    def test_rolling_latency_histogram(self):
+        stats = TickStats(window_size=3)
+        self.assertTrue(math.isnan(stats.latency_percentile(50)))
+        self.assertEqual(0, sum(stats.latency_histogram().values()))
+
+        for duration in (10.0, 0.00005, 0.001, 0.2):
+            stats.record(duration)
+
+        histogram = stats.latency_histogram()
+        self.assertEqual(len(TickStats.HISTOGRAM_BUCKETS) + 1, len(histogram))
+        # The first duration is out of the window
+        self.assertEqual(0, histogram[float("inf")])
+        self.assertEqual(1, histogram[0.0001])
+        self.assertEqual(1, histogram[0.001])
+        self.assertEqual(1, histogram[0.5])
+        self.assertEqual(0.001, stats.latency_percentile(50))
+        self.assertEqual(4, stats.tick_count)
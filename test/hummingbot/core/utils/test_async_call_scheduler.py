@@ -0,0 +1,87 @@
+import asyncio
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_utils import safe_gather
+
+
+class AsyncCallSchedulerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.calls = []
+
+    def tearDown(self) -> None:
+        self.scheduler.stop()
+        super().tearDown()
+
+    async def call(self, name: str, duration: float = 0.0):
+        self.calls.append(name)
+        await asyncio.sleep(duration)
+        return name
+
+    async def test_calls_run_concurrently_up_to_the_limit(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=3)
+        running = 0
+        max_running = 0
+
+        async def call():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return True
+
+        start_time = time.perf_counter()
+        results = await safe_gather(*[self.scheduler.schedule_async_call(call(), 1) for _ in range(6)])
+
+        self.assertEqual([True] * 6, results)
+        self.assertEqual(3, max_running)
+        self.assertLess(time.perf_counter() - start_time, 0.2)
+        stats = self.scheduler.get_stats()
+        self.assertEqual(6, stats["completed"])
+        self.assertEqual(6, stats["execution"]["count"])
+        self.assertGreaterEqual(self.scheduler.execution_latency.min, 0.04)
+        self.assertGreaterEqual(self.scheduler.queue_wait_latency.max, 0.04)
+
+    async def test_callers_served_round_robin(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=1)
+        calls = [self.scheduler.schedule_async_call(self.call(f"bulk{i}"), 1, caller="bulk") for i in range(3)]
+        calls.append(self.scheduler.schedule_async_call(self.call("urgent"), 1, caller="urgent"))
+
+        await safe_gather(*calls)
+
+        self.assertEqual(["bulk0", "urgent", "bulk1", "bulk2"], self.calls)
+
+    async def test_stale_calls_dropped(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=1)
+        slow_call = self.scheduler.schedule_async_call(self.call("slow", 0.05), 1)
+        stale_call = self.scheduler.schedule_async_call(self.call("stale"), 1, max_wait_seconds=0.01)
+        fresh_call = self.scheduler.schedule_async_call(self.call("fresh"), 1, max_wait_seconds=1)
+
+        results = await safe_gather(slow_call, stale_call, fresh_call, return_exceptions=True)
+
+        self.assertEqual("slow", results[0])
+        self.assertIsInstance(results[1], asyncio.TimeoutError)
+        self.assertEqual("fresh", results[2])
+        self.assertEqual(["slow", "fresh"], self.calls)
+        self.assertEqual(1, self.scheduler.get_stats()["dropped"])
+
+    async def test_errors_and_timeouts_returned_to_the_caller(self):
+        self.scheduler = AsyncCallScheduler(call_interval=0, max_concurrency=2)
+
+        def failing_function():
+            raise ValueError("failure")
+
+        with self.assertRaises(ValueError):
+            await self.scheduler.call_async(failing_function)
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.scheduler.schedule_async_call(self.call("slow", 1), 0.01)
+        self.assertEqual(3, await self.scheduler.call_async(len, "abc"))
+
+        stats = self.scheduler.get_stats()
+        self.assertEqual(2, stats["failed"])
+        self.assertEqual(1, stats["completed"])
+        self.assertEqual(0, stats["running"])
@@ -0,0 +1,61 @@
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(unittest.TestCase):
+
+    def test_invalid_bucket_bounds(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram(bucket_bounds=[])
+        with self.assertRaises(ValueError):
+            LatencyHistogram(bucket_bounds=[0.1, 0.01])
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(0, histogram.count)
+        self.assertTrue(math.isnan(histogram.mean))
+        self.assertTrue(math.isnan(histogram.max))
+        self.assertTrue(math.isnan(histogram.percentile(50)))
+
+    def test_observe(self):
+        histogram = LatencyHistogram(bucket_bounds=[0.001, 0.01, 0.1])
+
+        for latency in (0.0005, 0.001, 0.005, 0.05, 0.5):
+            histogram.observe(latency)
+
+        # The bucket bounds are inclusive upper bounds, the last bucket holds the latencies above the last bound
+        self.assertEqual([2, 1, 1, 1], histogram.bucket_counts)
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(0.5565, histogram.sum)
+        self.assertAlmostEqual(0.1113, histogram.mean)
+        self.assertEqual(0.0005, histogram.min)
+        self.assertEqual(0.5, histogram.max)
+
+    def test_percentiles_estimated_within_bucket_precision(self):
+        histogram = LatencyHistogram()
+        latencies = np.random.default_rng(42).lognormal(mean=-4, sigma=1, size=10000)
+        for latency in latencies:
+            histogram.observe(latency)
+
+        for percent in (50, 90, 99):
+            expected = np.percentile(latencies, percent)
+            # The default buckets double at every bound
+            self.assertLess(abs(histogram.percentile(percent) - expected), expected)
+        self.assertEqual(latencies.max(), histogram.percentile(100))
+        self.assertEqual(latencies.min(), histogram.percentile(0))
+        self.assertEqual({"count", "mean", "p50", "p90", "p99", "max"}, set(histogram.summary()))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.observe(0.1)
+
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, sum(histogram.bucket_counts))
+        self.assertTrue(math.isnan(histogram.min))
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.utils import loop_profiler
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.loop_profiler import LoopProfiler
+
+
+async def busy_coroutine(busy_time: float, steps: int):
+    for _ in range(steps):
+        end_time = time.perf_counter() + busy_time
+        while time.perf_counter() < end_time:
+            pass
+        await asyncio.sleep(0)
+    return steps
+
+
+async def failing_coroutine():
+    await asyncio.sleep(0)
+    raise ValueError("failure")
+
+
+class LoopProfilerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.profiler = LoopProfiler(lag_sample_interval=0.01)
+
+    def tearDown(self) -> None:
+        self.profiler.stop()
+        super().tearDown()
+
+    async def test_tasks_not_profiled_while_stopped(self):
+        self.assertEqual(3, await safe_ensure_future(busy_coroutine(0, 3)))
+        self.assertEqual({}, self.profiler.task_profiles)
+
+    async def test_task_steps_profiled_per_coroutine_function(self):
+        self.profiler.start()
+
+        self.assertEqual(3, await safe_ensure_future(busy_coroutine(0.002, 3)))
+        results = await safe_gather(busy_coroutine(0.001, 2), busy_coroutine(0, 1))
+        self.assertEqual([2, 1], results)
+        with self.assertRaises(ValueError):
+            await safe_gather(failing_coroutine())
+        task = safe_ensure_future(busy_coroutine(0, 100))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0)
+
+        profile = self.profiler.task_profiles["busy_coroutine"]
+        self.assertEqual(4, profile.started)
+        self.assertEqual(4, profile.finished)
+        self.assertEqual(0, profile.running)
+        # The last step of a coroutine runs until it returns
+        self.assertEqual(4 + 3 + 2 + 2, profile.steps)
+        self.assertGreaterEqual(profile.busy_time, 0.008)
+        self.assertGreater(profile.cpu_time, 0)
+        self.assertGreaterEqual(profile.max_step_time, 0.002)
+        self.assertEqual(1, self.profiler.task_profiles["failing_coroutine"].finished)
+
+    async def test_loop_lag_and_gauges_sampled(self):
+        queue = asyncio.Queue()
+        self.profiler.register_queue("test.queue", queue)
+        self.profiler.register_gauge("failing", MagicMock(side_effect=ValueError))
+        self.profiler.start()
+
+        queue.put_nowait(1)
+        queue.put_nowait(2)
+        await asyncio.sleep(0.015)
+        queue.get_nowait()
+        # Blocks the event loop to make the sampler late
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+
+        self.assertGreaterEqual(self.profiler.loop_lag.count, 1)
+        self.assertGreaterEqual(self.profiler.loop_lag.max, 0.03)
+        gauges = self.profiler.to_dict()["gauges"]
+        self.assertEqual({"test.queue": {"value": 1, "max": 2}}, gauges)
+
+    async def test_connector_queues_registered(self):
+        connector = MagicMock()
+        connector.order_book_tracker._order_book_diff_stream = asyncio.Queue()
+        connector.order_book_tracker._order_book_snapshot_stream = asyncio.Queue()
+        connector.order_book_tracker._order_book_trade_stream = asyncio.Queue()
+        connector._user_stream_tracker.user_stream = asyncio.Queue()
+        connector._user_stream_tracker.user_stream.put_nowait({})
+        # Not a perpetual connector
+        connector._perpetual_trading = None
+
+        self.profiler.register_connector_queues("binance", connector)
+        self.profiler.sample_gauges()
+
+        gauges = self.profiler.to_dict()["gauges"]
+        self.assertEqual(
+            ["binance.order_book_diff_stream", "binance.order_book_snapshot_stream",
+             "binance.order_book_trade_stream", "binance.user_stream"],
+            list(gauges),
+        )
+        self.assertEqual(1, gauges["binance.user_stream"]["value"])
+
+        self.profiler.unregister_connector_queues("binance")
+        self.profiler.sample_gauges()
+        self.assertEqual({}, self.profiler.to_dict()["gauges"])
+
+    async def test_throttler_waits_recorded_per_limit(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="orders", limit=1, time_interval=0.05)])
+        self.profiler.start()
+
+        async with throttler.execute_task("orders"):
+            pass
+        async with throttler.execute_task("orders"):
+            pass
+
+        waits = self.profiler.throttler_waits["orders"]
+        self.assertEqual(2, waits.count)
+        self.assertGreaterEqual(waits.max, 0.04)
+
+    async def test_prometheus_and_json_exports(self):
+        self.profiler.start(lag_sample_interval=10)
+        await safe_ensure_future(busy_coroutine(0, 1))
+        self.profiler.observe_throttler_wait('limit "1"', 0.001)
+        self.profiler.loop_lag.observe(0.0003)
+
+        text = self.profiler.to_prometheus_text()
+
+        self.assertIn("# TYPE hummingbot_loop_lag_seconds histogram", text)
+        self.assertIn('hummingbot_loop_lag_seconds_bucket{le="0.0002"} 0', text)
+        self.assertIn('hummingbot_loop_lag_seconds_bucket{le="0.0004"} 1', text)
+        self.assertIn('hummingbot_loop_lag_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("hummingbot_loop_lag_seconds_count 1", text)
+        self.assertIn('hummingbot_throttler_wait_seconds_count{limit_id="limit \\"1\\""} 1', text)
+        self.assertIn('hummingbot_tasks_finished_total{task="busy_coroutine"} 1', text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "profile.json")
+            self.profiler.write(file_path)
+            with open(file_path) as f:
+                metrics = json.load(f)
+            self.assertFalse(os.path.exists(f"{file_path}.tmp"))
+        self.assertEqual(2, metrics["tasks"]["busy_coroutine"]["steps"])
+        self.assertEqual(1, metrics["throttler_waits"]['limit "1"']["count"])
+        self.assertEqual(1, metrics["loop_lag"]["count"])
+
+    async def test_export_file_written_periodically(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "profile.prom")
+            self.profiler.start(export_file_path=file_path, export_interval=0)
+            await asyncio.sleep(0.015)
+            self.assertTrue(os.path.exists(file_path))
+
+            self.profiler.stop()
+
+            self.assertFalse(self.profiler.is_running)
+            self.assertIsNone(loop_profiler.active_profiler)
+            with open(file_path) as f:
+                self.assertIn("hummingbot_loop_lag_seconds_count", f.read())
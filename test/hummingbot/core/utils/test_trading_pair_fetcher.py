@@ -1,5 +1,8 @@
 import asyncio
 import json
+import os
+import tempfile
+import time
 import unittest
 from decimal import Decimal
 from typing import Any, Awaitable, Dict
@@ -36,9 +39,17 @@ class TestTradingPairFetcher(unittest.TestCase):
         self._original_async_loop = asyncio.get_event_loop()
         self.async_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.async_loop)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.catalog_file_path = os.path.join(self.temp_dir.name, TradingPairFetcher.CATALOG_FILE_NAME)
+        catalog_path_patcher = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._catalog_file_path",
+            return_value=self.catalog_file_path)
+        catalog_path_patcher.start()
+        self.addCleanup(catalog_path_patcher.stop)
 
     def tearDown(self) -> None:
         super().tearDown()
+        self.temp_dir.cleanup()
         self.async_loop.stop()
         self.async_loop.close()
         asyncio.set_event_loop(self._original_async_loop)
@@ -258,3 +269,121 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertIn("ETH-BTC", binance_pairs)
         self.assertIn("LTC-BTC", binance_pairs)
         self.assertNotIn("BNB-BTC", binance_pairs)
+
+    def write_catalog(self, catalog: Dict[str, Any]):
+        with open(self.catalog_file_path, "w") as catalog_file:
+            json.dump(catalog, catalog_file)
+
+    def read_catalog(self) -> Dict[str, Any]:
+        with open(self.catalog_file_path) as catalog_file:
+            return json.load(catalog_file)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_trading_pairs_saved_to_catalog(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1"),
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        # The paper trade connector shares the fetch of the connector it is based on
+        self.assertEqual(1, connector.all_trading_pairs.call_count)
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, fetcher.trading_pairs)
+        catalog = self.read_catalog()
+        self.assertEqual(["mock_exchange_1"], list(catalog))
+        self.assertEqual(["MOCK-HBOT"], catalog["mock_exchange_1"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fresh_catalog_served_without_instantiating_connectors(self, mock_connector_settings):
+        connector_setting = self.MockConnectorSetting(name="mock_exchange_1")
+        connector_setting.non_trading_connector_instance_with_default_configuration = MagicMock()
+        mock_connector_settings.return_value = {"mock_exchange_1": connector_setting}
+        self.write_catalog({"mock_exchange_1": {"timestamp": time.time() - 10, "trading_pairs": ["CACHED-HBOT"]}})
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertTrue(fetcher.ready)
+        self.assertEqual({"mock_exchange_1": ["CACHED-HBOT"]}, fetcher.trading_pairs)
+        connector_setting.non_trading_connector_instance_with_default_configuration.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_outdated_catalog_served_until_refreshed(self, mock_connector_settings):
+        refreshed = asyncio.Event()
+        connector = MagicMock()
+
+        async def all_trading_pairs():
+            await refreshed.wait()
+            return ["NEW-HBOT"]
+
+        connector.all_trading_pairs.side_effect = all_trading_pairs
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector)
+        }
+        self.write_catalog({"mock_exchange_1": {"timestamp": time.time() - 2 * TradingPairFetcher.CATALOG_TTL,
+                                                "trading_pairs": ["OLD-HBOT"]}})
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(fetcher))
+
+        self.assertEqual({"mock_exchange_1": ["OLD-HBOT"]}, fetcher.trading_pairs)
+
+        refreshed.set()
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["NEW-HBOT"]}, fetcher.trading_pairs)
+        self.assertEqual(["NEW-HBOT"], self.read_catalog()["mock_exchange_1"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetch_failure_keeps_catalog_trading_pairs(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = Exception("Test error")
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector)
+        }
+        self.write_catalog({"mock_exchange_1": {"timestamp": 0, "trading_pairs": ["OLD-HBOT"]}})
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(client_config_map)
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["OLD-HBOT"]}, fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_concurrent_fetches_limited(self, mock_connector_settings):
+        running_fetches = 0
+        max_running_fetches = 0
+
+        async def all_trading_pairs():
+            nonlocal running_fetches, max_running_fetches
+            running_fetches += 1
+            max_running_fetches = max(max_running_fetches, running_fetches)
+            await asyncio.sleep(0.01)
+            running_fetches -= 1
+            return ["MOCK-HBOT"]
+
+        connector = MagicMock()
+        connector.all_trading_pairs.side_effect = all_trading_pairs
+        mock_connector_settings.return_value = {
+            f"mock_exchange_{i}": self.MockConnectorSetting(name=f"mock_exchange_{i}", connector=connector)
+            for i in range(10)
+        }
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+
+        fetcher = TradingPairFetcher(client_config_map, max_concurrent_fetches=3)
+        self.async_run_with_timeout(fetcher._fetch_task)
+
+        self.assertEqual(10, len(fetcher.trading_pairs))
+        self.assertEqual(3, max_running_fetches)
@@ -14,6 +14,7 @@ from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.streaming_indicators import SMAIndicator
 
 
 class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
@@ -90,6 +91,35 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_cached_candles_df_rebuilt_only_when_candles_change(self):
+        candles = np.array(self._candles_data_mock(), dtype=float)
+        self.data_feed._candles.extend(candles[:-1])
+
+        cached_df = self.data_feed.cached_candles_df
+        self.assertIs(cached_df, self.data_feed.cached_candles_df)
+        self.assertIsNot(cached_df, self.data_feed.candles_df)
+
+        self.data_feed._candles.append(candles[-1])
+        self.assertIsNot(cached_df, self.data_feed.cached_candles_df)
+        self.assertEqual(4, len(self.data_feed.cached_candles_df))
+
+        updated_candle = candles[-1].copy()
+        updated_candle[4] += 1
+        self.data_feed._candles[-1] = updated_candle
+        self.assertEqual(updated_candle[4], self.data_feed.candles_df["close"].iloc[-1])
+
+    def test_arrays(self):
+        candles = np.array(self._candles_data_mock(), dtype=float)
+        self.data_feed._candles.extend(candles)
+
+        arrays = self.data_feed.arrays()
+
+        self.assertEqual(self.data_feed.columns, list(arrays.keys()))
+        for i, column in enumerate(self.data_feed.columns):
+            np.testing.assert_array_equal(candles[:, i], arrays[column])
+            self.assertFalse(arrays[column].flags.writeable)
+        self.assertTrue(np.shares_memory(arrays["close"], self.data_feed.get_array("close")))
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -170,6 +200,19 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.assertEqual(len(self.data_feed._candles), 0)
         self.assertEqual(self.data_feed._ws_candle_available.is_set(), False)
 
+    def test_add_indicator_calculates_stored_candles(self):
+        candles = np.array(self._candles_data_mock(), dtype=float)
+        self.data_feed._candles.extend(candles)
+
+        indicator = self.data_feed.add_indicator(SMAIndicator(length=1))
+
+        self.assertIs(indicator, self.data_feed.add_indicator(SMAIndicator(length=1)))
+        self.assertIs(indicator, self.data_feed.get_indicator("SMA_1"))
+        np.testing.assert_array_equal(candles[:, 4], indicator.get_values("SMA_1"))
+
+        self.data_feed._reset_candles()
+        self.assertEqual(0, len(indicator))
+
     def test_ensure_timestamp_in_seconds(self):
         self.assertEqual(self.data_feed.ensure_timestamp_in_seconds(1622505600), 1622505600)
         self.assertEqual(self.data_feed.ensure_timestamp_in_seconds(1622505600000), 1622505600)
@@ -328,6 +371,25 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    @patch("hummingbot.data_feed.candles_feed.candles_base.CandlesBase.fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    async def test_process_websocket_messages_updates_indicators(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        indicator = self.data_feed.add_indicator(SMAIndicator(length=1))
+
+        for message in (self.get_candles_ws_data_mock_1(), self.get_candles_ws_data_mock_1(),
+                        self.get_candles_ws_data_mock_2()):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps(message))
+
+        self.listening_task = asyncio.create_task(self.data_feed.listen_for_subscriptions())
+
+        await self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(self.data_feed.candles_df["close"].tolist(), indicator.get_values("SMA_1").tolist())
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
@@ -0,0 +1,112 @@
+import unittest
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTests(unittest.TestCase):
+    columns_count = 3
+
+    def candle(self, value: float) -> np.ndarray:
+        return np.array([value, value + 0.1, value + 0.2])
+
+    def assert_same_candles(self, expected: deque, buffer: CandlesBuffer):
+        self.assertEqual(len(expected), len(buffer))
+        np.testing.assert_array_equal(np.array(list(expected)).reshape(-1, self.columns_count), buffer.to_array())
+
+    def test_same_candles_as_deque(self):
+        rng = np.random.default_rng(42)
+        expected = deque(maxlen=5)
+        buffer = CandlesBuffer(self.columns_count, maxlen=5)
+
+        for i in range(2000):
+            operation = rng.integers(0, 7)
+            if operation <= 2:
+                expected.append(self.candle(i))
+                buffer.append(self.candle(i))
+            elif operation == 3:
+                expected.appendleft(self.candle(i))
+                buffer.appendleft(self.candle(i))
+            elif operation == 4:
+                candles = [self.candle(i + j / 10) for j in range(rng.integers(0, 8))]
+                expected.extendleft(candles)
+                buffer.extendleft(candles)
+            elif operation == 5 and len(expected) > 0:
+                expected[-1] = self.candle(-i)
+                buffer[-1] = self.candle(-i)
+            elif rng.random() < 0.1:
+                expected.clear()
+                buffer.clear()
+            self.assert_same_candles(expected, buffer)
+            if len(expected) > 0:
+                np.testing.assert_array_equal(expected[0], buffer[0])
+                np.testing.assert_array_equal(expected[-1], buffer[-1])
+
+    def test_indexing_out_of_range(self):
+        buffer = CandlesBuffer(self.columns_count, maxlen=5)
+        buffer.append(self.candle(1))
+
+        with self.assertRaises(IndexError):
+            buffer[1]
+        with self.assertRaises(IndexError):
+            buffer[-2]
+
+    def test_version_changes_with_candles(self):
+        buffer = CandlesBuffer(self.columns_count, maxlen=5)
+        versions = [buffer.version]
+
+        buffer.append(self.candle(1))
+        versions.append(buffer.version)
+        buffer[-1] = self.candle(2)
+        versions.append(buffer.version)
+        buffer.clear()
+        versions.append(buffer.version)
+
+        self.assertEqual(len(versions), len(set(versions)))
+
+    def test_columns_are_read_only_views(self):
+        buffer = CandlesBuffer(self.columns_count, maxlen=5)
+        buffer.extend(self.candle(i) for i in range(8))
+
+        column = buffer.column(1)
+
+        np.testing.assert_array_equal([3.1, 4.1, 5.1, 6.1, 7.1], column)
+        self.assertFalse(column.flags.writeable)
+        self.assertTrue(np.shares_memory(column, buffer.column(1)))
+        with self.assertRaises(ValueError):
+            column[0] = 0
+
+    def test_iteration_and_array_conversion_copy_candles(self):
+        buffer = CandlesBuffer(self.columns_count, maxlen=5)
+        buffer.extend(self.candle(i) for i in range(3))
+
+        candles = list(buffer)
+        buffer[0] = self.candle(10)
+
+        np.testing.assert_array_equal(self.candle(0), candles[0])
+        np.testing.assert_array_equal(buffer.to_array(), np.array(buffer))
+        np.testing.assert_array_equal(buffer.to_array()[-2:], buffer.to_array(start=-2))
+
+    def test_dataframe_matches_deque_and_version_tracks_changes(self):
+        candles = [np.arange(10, dtype=float) + i for i in range(1000)]
+        candles_deque = deque(candles, maxlen=1000)
+        buffer = CandlesBuffer(10, maxlen=1000)
+        buffer.extend(candles)
+        version = buffer.version
+
+        pd.testing.assert_frame_equal(pd.DataFrame(candles_deque, dtype=float),
+                                      pd.DataFrame(buffer.to_array(), dtype=float))
+        # Reads don't change the version, so a DataFrame cached by version stays valid
+        buffer.to_array()
+        list(buffer)
+        self.assertEqual(version, buffer.version)
+
+        new_candle = np.arange(10, dtype=float) + 1000
+        candles_deque.append(new_candle)
+        buffer.append(new_candle)
+        self.assertNotEqual(version, buffer.version)
+        pd.testing.assert_frame_equal(pd.DataFrame(candles_deque, dtype=float),
+                                      pd.DataFrame(buffer.to_array(), dtype=float))
@@ -0,0 +1,181 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.streaming_indicators import (
+    ATRIndicator,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+    SMAIndicator,
+    StreamingIndicatorBase,
+    SuperTrendIndicator,
+)
+
+
+def presma_ewm(series: pd.Series, length: int, alpha: float) -> pd.Series:
+    """
+    Reference exponential average seeded with the simple average of the first `length` valid values.
+    """
+    result = pd.Series(np.nan, index=series.index)
+    valid = series.dropna()
+    if len(valid) < length:
+        return result
+    seeded = valid.copy()
+    seeded.iloc[:length - 1] = np.nan
+    seeded.iloc[length - 1] = valid.iloc[:length].mean()
+    result.loc[valid.index] = seeded.ewm(alpha=alpha, adjust=False).mean()
+    return result
+
+
+def true_range(df: pd.DataFrame) -> pd.Series:
+    previous_close = df["close"].shift(1)
+    ranges = pd.concat([df["high"] - df["low"], (df["high"] - previous_close).abs(),
+                        (df["low"] - previous_close).abs()], axis=1)
+    return ranges.max(axis=1)
+
+
+def reference_supertrend(df: pd.DataFrame, length: int, multiplier: float) -> np.ndarray:
+    atr = presma_ewm(true_range(df), length, 1 / length)
+    median_price = (df["high"] + df["low"]) / 2
+    lower_band = (median_price - multiplier * atr).to_numpy(copy=True)
+    upper_band = (median_price + multiplier * atr).to_numpy(copy=True)
+    close = df["close"].to_numpy()
+    result = np.full((len(df), 4), np.nan)
+    direction = 1
+    for i in range(1, len(df)):
+        if close[i] > upper_band[i - 1]:
+            direction = 1
+        elif close[i] < lower_band[i - 1]:
+            direction = -1
+        else:
+            if direction > 0 and lower_band[i] < lower_band[i - 1]:
+                lower_band[i] = lower_band[i - 1]
+            if direction < 0 and upper_band[i] > upper_band[i - 1]:
+                upper_band[i] = upper_band[i - 1]
+        band = lower_band[i] if direction > 0 else upper_band[i]
+        result[i] = [band, direction if i >= length else np.nan,
+                     band if direction > 0 else np.nan, band if direction < 0 else np.nan]
+    return result
+
+
+class StreamingIndicatorsTests(unittest.TestCase):
+    candles_count = 300
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(42)
+        close = 100 + np.cumsum(rng.normal(0, 1, cls.candles_count))
+        high = close + rng.random(cls.candles_count)
+        low = close - rng.random(cls.candles_count)
+        cls.df = pd.DataFrame({
+            "timestamp": np.arange(cls.candles_count) * 60.0,
+            "open": close + rng.normal(0, 0.3, cls.candles_count),
+            "high": high,
+            "low": low,
+            "close": close,
+        })
+        for column in ["volume", "quote_asset_volume", "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]:
+            cls.df[column] = 1.0
+        cls.candles = cls.df.to_numpy()
+
+    def stream(self, indicator: StreamingIndicatorBase, with_partial_updates: bool = False) -> np.ndarray:
+        for candle in self.candles:
+            if with_partial_updates:
+                # The candle is first received while the interval is still open, with other prices
+                partial_candle = candle.copy()
+                partial_candle[2:5] = candle[1] * 1.01, candle[1] * 0.99, candle[1]
+                indicator.update(partial_candle, is_new=True)
+                indicator.update(candle, is_new=False)
+            else:
+                indicator.update(candle)
+        return indicator.values
+
+    def assert_values_equal(self, expected, values: np.ndarray):
+        np.testing.assert_allclose(values, np.asarray(expected, dtype=float), rtol=1e-9, atol=1e-9)
+
+    def test_sma(self):
+        values = self.stream(SMAIndicator(length=10, max_records=self.candles_count))
+        self.assert_values_equal(self.df["close"].rolling(10).mean().to_numpy()[:, None], values)
+
+    def test_ema(self):
+        values = self.stream(EMAIndicator(length=10, max_records=self.candles_count))
+        self.assert_values_equal(presma_ewm(self.df["close"], 10, 2 / 11).to_numpy()[:, None], values)
+
+    def test_bollinger_bands(self):
+        indicator = BollingerBandsIndicator(length=20, std=2.0, max_records=self.candles_count)
+        values = self.stream(indicator)
+
+        mid = self.df["close"].rolling(20).mean()
+        deviation = 2.0 * self.df["close"].rolling(20).std(ddof=0)
+        lower, upper = mid - deviation, mid + deviation
+        expected = pd.concat([lower, mid, upper, 100 * (upper - lower) / mid,
+                              (self.df["close"] - lower) / (upper - lower)], axis=1)
+        self.assertEqual(["BBL_20_2.0", "BBM_20_2.0", "BBU_20_2.0", "BBB_20_2.0", "BBP_20_2.0"], indicator.columns)
+        self.assert_values_equal(expected, values)
+
+    def test_macd(self):
+        indicator = MACDIndicator(fast=12, slow=26, signal=9, max_records=self.candles_count)
+        values = self.stream(indicator)
+
+        macd = presma_ewm(self.df["close"], 12, 2 / 13) - presma_ewm(self.df["close"], 26, 2 / 27)
+        signal = presma_ewm(macd, 9, 2 / 10)
+        self.assertEqual(["MACD_12_26_9", "MACDh_12_26_9", "MACDs_12_26_9"], indicator.columns)
+        self.assert_values_equal(pd.concat([macd, macd - signal, signal], axis=1), values)
+
+    def test_rsi(self):
+        values = self.stream(RSIIndicator(length=14, max_records=self.candles_count))
+
+        change = self.df["close"].diff()
+        gains = presma_ewm(change.clip(lower=0), 14, 1 / 14)
+        losses = presma_ewm((-change).clip(lower=0), 14, 1 / 14)
+        self.assert_values_equal((100 * gains / (gains + losses)).to_numpy()[:, None], values)
+
+    def test_atr(self):
+        values = self.stream(ATRIndicator(length=14, max_records=self.candles_count))
+        self.assert_values_equal(presma_ewm(true_range(self.df), 14, 1 / 14).to_numpy()[:, None], values)
+
+    def test_supertrend(self):
+        indicator = SuperTrendIndicator(length=7, multiplier=3.0, max_records=self.candles_count)
+        values = self.stream(indicator)
+
+        self.assertEqual(["SUPERT_7_3.0", "SUPERTd_7_3.0", "SUPERTl_7_3.0", "SUPERTs_7_3.0"], indicator.columns)
+        self.assert_values_equal(reference_supertrend(self.df, 7, 3.0), values)
+
+    def test_updates_of_last_candle_replace_its_values(self):
+        for indicator_class in (SMAIndicator, EMAIndicator, BollingerBandsIndicator, MACDIndicator, RSIIndicator,
+                                ATRIndicator, SuperTrendIndicator):
+            expected = self.stream(indicator_class(max_records=self.candles_count))
+            values = self.stream(indicator_class(max_records=self.candles_count), with_partial_updates=True)
+            self.assert_values_equal(expected, values)
+
+    def test_values_limited_to_max_records_without_copies(self):
+        indicator = SMAIndicator(length=5, max_records=50)
+        first_values = None
+        for i, candle in enumerate(self.candles):
+            indicator.update(candle)
+            if i == 60:
+                first_values = indicator.values
+
+        values = indicator.values
+        self.assertEqual(50, len(indicator))
+        self.assert_values_equal(self.df["close"].rolling(5).mean().to_numpy()[-50:, None], values)
+        self.assertTrue(np.shares_memory(values, indicator.get_values("SMA_5")))
+        self.assertFalse(values.flags.writeable)
+        self.assertEqual(50, len(first_values))
+
+    def test_last_values_and_reset(self):
+        indicator = MACDIndicator(max_records=self.candles_count)
+        self.assertTrue(all(np.isnan(value) for value in indicator.last.values()))
+
+        values = self.stream(indicator)
+        self.assertEqual(dict(zip(indicator.columns, values[-1])), indicator.last)
+        np.testing.assert_array_equal(self.candles[-1], indicator.last_candle)
+
+        indicator.reset(max_records=10)
+        self.assertEqual(0, len(indicator))
+        self.assertEqual(10, indicator.max_records)
+        self.assert_values_equal(values[-10:], self.stream(indicator))
@@ -274,6 +274,28 @@ class TestBinanceLiquidations(IsolatedAsyncioWrapperTestCase):
         all_liquidations_df = self.liquidations_feed.liquidations_df()
         self.assertEqual(len(all_liquidations_df), 0)
 
+    def test_liquidations_stats_and_cached_df(self):
+        feed = BinancePerpetualLiquidations(trading_pairs=set(), max_retention_seconds=15, aggregation_windows=[10])
+        feed._add_liquidation("BTC-USDT", 1000, 2.0, 100.0, LiquidationSide.LONG)
+        feed._add_liquidation("BTC-USDT", 5000, 1.0, 110.0, LiquidationSide.SHORT)
+        feed._add_liquidation("BTC-USDT", 12000, 3.0, 90.0, LiquidationSide.LONG)
+
+        stats = feed.liquidations_stats("BTC-USDT", 10, current_timestamp=12000)
+        self.assertEqual(2, stats.count)
+        self.assertEqual(270.0, stats.long_notional)
+        self.assertEqual(110.0, stats.short_notional)
+        self.assertEqual(0, feed.liquidations_stats("ETH-USDT", 10).count)
+
+        df = feed.liquidations_df("BTC-USDT")
+        self.assertEqual([1000, 5000, 12000], df["timestamp"].tolist())
+        self.assertEqual([LiquidationSide.LONG, LiquidationSide.SHORT, LiquidationSide.LONG], df["side"].tolist())
+        # The returned DataFrame is a copy of the cached one
+        df.loc[0, "price"] = 0.0
+        self.assertEqual(100.0, feed.liquidations_df("BTC-USDT")["price"][0])
+
+        feed._add_liquidation("BTC-USDT", 13000, 1.0, 90.0, LiquidationSide.SHORT)
+        self.assertEqual(4, len(feed.liquidations_df("BTC-USDT")))
+
     @aioresponses()
     async def test_get_exchange_info(self, mock_api: aioresponses):
         url = f"{CONSTANTS.REST_URL}{CONSTANTS.EXCHANGE_INFO}"
@@ -0,0 +1,183 @@
+import os
+import random
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.liquidations_feed.liquidations_storage import LiquidationsStorage
+
+
+class LiquidationsStorageTests(unittest.TestCase):
+
+    def assert_stats_equal(self, expected, stats):
+        self.assertEqual(expected[0], stats.long_count)
+        self.assertEqual(expected[1], stats.short_count)
+        self.assertAlmostEqual(expected[2], stats.long_notional, places=6)
+        self.assertAlmostEqual(expected[3], stats.short_notional, places=6)
+
+    @staticmethod
+    def expected_stats(liquidations, cutoff):
+        in_window = [liq for liq in liquidations if liq[0] > cutoff]
+        return (sum(1 for liq in in_window if liq[3]),
+                sum(1 for liq in in_window if not liq[3]),
+                sum(liq[1] * liq[2] for liq in in_window if liq[3]),
+                sum(liq[1] * liq[2] for liq in in_window if not liq[3]))
+
+    def test_liquidations_stored_in_timestamp_order(self):
+        storage = LiquidationsStorage(initial_capacity=2)
+
+        storage.append(1000, 1.0, 10.0, True)
+        storage.append(3000, 2.0, 10.0, False)
+        storage.append(2000, 3.0, 10.0, True)
+        storage.append(3000, 4.0, 10.0, True)
+
+        self.assertEqual(4, len(storage))
+        self.assertEqual([1000, 2000, 3000, 3000], storage.timestamps.tolist())
+        self.assertEqual([1.0, 3.0, 2.0, 4.0], storage.quantities.tolist())
+        self.assertEqual([True, True, False, True], storage.is_long.tolist())
+        self.assertFalse(storage.timestamps.flags.writeable)
+
+    def test_remove_older_than(self):
+        storage = LiquidationsStorage(windows_seconds=[1])
+        for timestamp in range(1000, 6000, 1000):
+            storage.append(timestamp, 1.0, 10.0, True)
+        version = storage.version
+
+        storage.remove_older_than(3000)
+
+        self.assertEqual([4000, 5000], storage.timestamps.tolist())
+        self.assertNotEqual(version, storage.version)
+        version = storage.version
+        storage.remove_older_than(3500)
+        self.assertEqual(version, storage.version)
+
+        storage.clear()
+        self.assertEqual(0, len(storage))
+        self.assertEqual(0, storage.window_stats(1).count)
+
+    def test_window_stats(self):
+        storage = LiquidationsStorage(windows_seconds=[2])
+        storage.append(1000, 1.0, 10.0, True)
+        storage.append(2000, 2.0, 10.0, False)
+        storage.append(3000, 3.0, 10.0, True)
+
+        stats = storage.window_stats(2)
+        self.assertEqual(2, stats.count)
+        self.assertEqual(30.0, stats.long_notional)
+        self.assertEqual(20.0, stats.short_notional)
+        self.assertEqual(50.0, stats.notional)
+
+        self.assert_stats_equal((1, 0, 30.0, 0.0), storage.window_stats(2, current_timestamp=4500))
+        self.assert_stats_equal((0, 0, 0.0, 0.0), storage.window_stats(2, current_timestamp=6000))
+        # Windows not tracked, or ending before the tracked window, are calculated from the arrays
+        self.assert_stats_equal((2, 1, 40.0, 20.0), storage.window_stats(10))
+        self.assert_stats_equal((1, 1, 10.0, 20.0), storage.window_stats(2, current_timestamp=2000))
+
+    def test_random_operations_match_brute_force(self):
+        rng = random.Random(42)
+        windows = [0.5, 2, 5]
+        storage = LiquidationsStorage(windows_seconds=windows, initial_capacity=4)
+        liquidations = []
+        timestamp = 0
+        removed_until = -1
+
+        for _ in range(3000):
+            operation = rng.random()
+            if operation < 0.8:
+                timestamp += rng.randint(0, 200)
+                # Some liquidations come slightly out of order
+                liquidation_timestamp = max(timestamp - rng.choice([0, 0, 0, 300]), removed_until + 1)
+                liquidation = (liquidation_timestamp, rng.uniform(0.1, 5), rng.uniform(10, 20), rng.random() < 0.5)
+                storage.append(*liquidation)
+                liquidations.append(liquidation)
+            elif operation < 0.9:
+                removed_until = max(removed_until, timestamp - rng.randint(1000, 4000))
+                storage.remove_older_than(removed_until)
+                liquidations = [liq for liq in liquidations if liq[0] > removed_until]
+            else:
+                window = rng.choice(windows + [1, 10])
+                current_timestamp = timestamp + rng.randint(0, 1000)
+                self.assert_stats_equal(self.expected_stats(liquidations, current_timestamp - window * 1000),
+                                        storage.window_stats(window, current_timestamp))
+
+            sorted_liquidations = sorted(liquidations, key=lambda liq: liq[0])
+            self.assertEqual([liq[0] for liq in sorted_liquidations], storage.timestamps.tolist())
+
+        for window in windows:
+            self.assert_stats_equal(self.expected_stats(liquidations, timestamp + 1000 - window * 1000),
+                                    storage.window_stats(window, timestamp + 1000))
+
+    def test_liquidation_storm_keeps_retention_window(self):
+        # A cascade: 100 liquidations per second during 90 seconds, keeping 60 seconds
+        liquidations_per_second = 100
+        seconds = 90
+        retention_ms = 60_000
+        rng = np.random.default_rng(1)
+        quantities = rng.uniform(0.1, 5, liquidations_per_second * seconds)
+        prices = rng.uniform(10, 20, liquidations_per_second * seconds)
+        sides = rng.random(liquidations_per_second * seconds) < 0.5
+        storage = LiquidationsStorage(windows_seconds=[10])
+        liquidations = []
+
+        for second in range(seconds):
+            for i in range(second * liquidations_per_second, (second + 1) * liquidations_per_second):
+                liquidation = (second * 1000 + i % liquidations_per_second, quantities[i], prices[i], sides[i])
+                storage.append(*liquidation)
+                liquidations.append(liquidation)
+            cutoff = (second + 1) * 1000 - retention_ms
+            storage.remove_older_than(cutoff)
+            liquidations = [liq for liq in liquidations if liq[0] > cutoff]
+            self.assertEqual(len(liquidations), len(storage))
+
+        timestamp = seconds * 1000
+        self.assert_stats_equal(self.expected_stats(liquidations, timestamp - 10_000),
+                                storage.window_stats(10, timestamp))
+        df = pd.DataFrame({"timestamp": storage.timestamps, "quantity": storage.quantities})
+        self.assertEqual([liq[0] for liq in liquidations], df["timestamp"].tolist())
+        np.testing.assert_allclose([liq[1] for liq in liquidations], df["quantity"].to_numpy())
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Benchmark, set HUMMINGBOT_BENCHMARKS to run it")
+    def test_benchmark_liquidation_storm(self):
+        # A cascade: 200 liquidations per second during 5 minutes, keeping 60 seconds, reading a DataFrame every
+        # second and the last 10 seconds aggregates on every liquidation
+        liquidations_per_second = 200
+        seconds = 300
+        retention_ms = 60_000
+        rng = np.random.default_rng(1)
+        quantities = rng.uniform(0.1, 5, liquidations_per_second * seconds)
+        prices = rng.uniform(10, 20, liquidations_per_second * seconds)
+        sides = rng.random(liquidations_per_second * seconds) < 0.5
+
+        storage = LiquidationsStorage(windows_seconds=[10])
+        start = time.perf_counter()
+        for second in range(seconds):
+            for i in range(second * liquidations_per_second, (second + 1) * liquidations_per_second):
+                timestamp = second * 1000 + i % liquidations_per_second
+                storage.append(timestamp, quantities[i], prices[i], sides[i])
+                storage.window_stats(10, timestamp)
+            storage.remove_older_than((second + 1) * 1000 - retention_ms)
+            pd.DataFrame({"timestamp": storage.timestamps, "quantity": storage.quantities})
+        storage_time = time.perf_counter() - start
+
+        # The previous approach: lists of dataclass-like records, filtered on every cleanup, and the aggregates
+        # recalculated from the records
+        liquidations = []
+        start = time.perf_counter()
+        for second in range(seconds):
+            for i in range(second * liquidations_per_second, (second + 1) * liquidations_per_second):
+                timestamp = second * 1000 + i % liquidations_per_second
+                liquidations.append({"timestamp": timestamp, "quantity": quantities[i], "price": prices[i],
+                                     "is_long": sides[i]})
+                if i % liquidations_per_second == 0:
+                    sum(liq["quantity"] * liq["price"] for liq in liquidations if liq["timestamp"] > timestamp - 10000)
+            liquidations = [liq for liq in liquidations if (second + 1) * 1000 - liq["timestamp"] < retention_ms]
+            pd.DataFrame(liquidations)
+        lists_time = time.perf_counter() - start
+
+        self.assertEqual(len(liquidations), len(storage))
+        self.assertLess(storage_time, lists_time,
+                        msg=f"Liquidation storm ({liquidations_per_second * seconds} liquidations): storage "
+                            f"{storage_time:.3f} s, lists {lists_time:.3f} s (aggregates calculated once per second "
+                            f"only)")
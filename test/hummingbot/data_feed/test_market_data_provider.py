@@ -40,6 +40,18 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         with self.assertRaises(ValueError):
             self.provider.get_non_trading_connector("binance_invalid")
 
+    def test_non_trading_connectors_shared_between_providers(self):
+        other_provider = MarketDataProvider({})
+        initial_reference_count = self.provider._connector_pool.reference_count("binance")
+        connector = self.provider.get_non_trading_connector("binance")
+        self.assertIs(connector, other_provider.get_non_trading_connector("binance"))
+        self.assertIs(connector, self.provider.get_non_trading_connector("binance"))
+        self.assertEqual(initial_reference_count + 2, self.provider._connector_pool.reference_count("binance"))
+
+        self.provider.stop()
+        other_provider.stop()
+        self.assertEqual(initial_reference_count, self.provider._connector_pool.reference_count("binance"))
+
     def test_stop(self):
         mock_candles_feed = MagicMock()
         self.provider.candles_feeds = {"mock_feed": mock_candles_feed}
@@ -273,6 +285,38 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
 
         mock_oracle_instance.set_price.assert_called_with("BTC-USDT", Decimal("50000"))
 
+    @patch('hummingbot.core.rate_oracle.rate_oracle.RateOracle.get_instance')
+    async def test_update_rates_task_updates_connectors_concurrently(self, mock_rate_oracle):
+        mock_oracle_instance = MagicMock()
+        mock_rate_oracle.return_value = mock_oracle_instance
+        provider = MarketDataProvider({}, rates_update_timeout=0.2)
+
+        async def slow_last_traded_prices(trading_pairs):
+            await asyncio.sleep(10)
+
+        async def last_traded_prices(trading_pairs):
+            await asyncio.sleep(0.1)
+            return {"ETH-USDT": 3000}
+
+        slow_connector = MagicMock()
+        slow_connector.get_last_traded_prices.side_effect = slow_last_traded_prices
+        connectors = [MagicMock() for _ in range(3)]
+        for connector in connectors:
+            connector.get_last_traded_prices.side_effect = last_traded_prices
+        provider._rate_sources = {"slow": slow_connector, **{f"exchange_{i}": c for i, c in enumerate(connectors)}}
+        for connector_name in provider._rate_sources:
+            provider._rates_required.add_or_update(connector_name, ConnectorPair(connector_name=connector_name,
+                                                                                 trading_pair="ETH-USDT"))
+
+        task = asyncio.ensure_future(provider.update_rates_task())
+        await asyncio.sleep(0.3)
+        task.cancel()
+
+        # Queried one after the other, the connectors would take 0.5 seconds. The slow one timed out without blocking
+        # the others.
+        self.assertEqual(3, mock_oracle_instance.set_price.call_count)
+        slow_connector.get_last_traded_prices.assert_called_once()
+
     @patch('hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_instance')
     async def test_update_rates_task_gateway_error(self, mock_gateway_client):
         # Test gateway connector with error
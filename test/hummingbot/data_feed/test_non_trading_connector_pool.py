@@ -0,0 +1,76 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.data_feed.non_trading_connector_pool import NonTradingConnectorPool
+
+
+class TestNonTradingConnectorPool(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.created_connectors = []
+        self.pool = NonTradingConnectorPool(idle_timeout=0.05, connector_factory=self.create_connector)
+
+    def create_connector(self, connector_name: str):
+        if connector_name == "unknown":
+            raise ValueError(f"Connector {connector_name} not found")
+        connector = MagicMock()
+        connector.name = connector_name
+        connector.start_network = AsyncMock()
+        connector.stop_network = AsyncMock()
+        self.created_connectors.append(connector)
+        return connector
+
+    async def test_connector_shared_between_users(self):
+        connector = self.pool.acquire("binance")
+
+        self.assertIs(connector, self.pool.acquire("binance"))
+        self.assertIsNot(connector, self.pool.acquire("kucoin"))
+        self.assertEqual(2, self.pool.reference_count("binance"))
+        self.assertEqual(2, len(self.created_connectors))
+        connector.start_network.assert_not_called()
+
+    async def test_unknown_connector(self):
+        with self.assertRaises(ValueError):
+            self.pool.acquire("unknown")
+        self.assertEqual(set(), self.pool.connector_names)
+
+    async def test_network_started_once_when_required(self):
+        connector = self.pool.acquire("binance", start_network=True)
+        self.pool.acquire("binance", start_network=True)
+        await asyncio.sleep(0)
+
+        connector.start_network.assert_awaited_once()
+
+    async def test_idle_connector_closed_after_timeout(self):
+        connector = self.pool.acquire("binance", start_network=True)
+        self.pool.acquire("binance")
+
+        self.pool.release("binance")
+        self.pool.release("binance")
+        self.assertIn("binance", self.pool.connector_names)
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(set(), self.pool.connector_names)
+        connector.stop_network.assert_awaited_once()
+        self.assertIsNot(connector, self.pool.acquire("binance"))
+
+    async def test_connector_reacquired_before_timeout_kept(self):
+        connector = self.pool.acquire("binance")
+        self.pool.release("binance")
+        self.assertIs(connector, self.pool.acquire("binance"))
+
+        await asyncio.sleep(0.1)
+
+        self.assertIn("binance", self.pool.connector_names)
+        self.assertEqual(1, self.pool.reference_count("binance"))
+
+    def test_idle_connectors_closed_on_acquire_without_event_loop(self):
+        self.pool.acquire("binance")
+        self.pool.release("binance")
+        self.pool.close_idle_connectors(force=True)
+
+        self.assertEqual(set(), self.pool.connector_names)
+        # Releasing a connector without users is ignored
+        self.pool.release("binance")
@@ -0,0 +1,243 @@
+import json
+import logging
+import os
+import sys
+import threading
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+import hummingbot
+from hummingbot.logger import NETWORK
+from hummingbot.logger.log_pipeline import (
+    JsonLinesFormatter,
+    LogPipeline,
+    add_log_handler,
+    get_log_pipeline,
+    install_log_pipeline,
+    shutdown_log_pipeline,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.threads = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.threads.append(threading.current_thread())
+
+
+class BlockingHandler(RecordingHandler):
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.unblocked = threading.Event()
+
+    def emit(self, record: logging.LogRecord):
+        self.entered.set()
+        self.unblocked.wait(5)
+        super().emit(record)
+
+
+class LogPipelineTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.logger = logging.getLogger(f"{__name__}.{self._testMethodName}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self) -> None:
+        shutdown_log_pipeline()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        super().tearDown()
+
+    def test_records_handled_in_listener_thread(self):
+        handler = RecordingHandler()
+        warning_handler = RecordingHandler(logging.WARNING)
+        self.logger.addHandler(handler)
+        self.logger.addHandler(warning_handler)
+
+        pipeline = install_log_pipeline({"enabled": True}, [self.logger.name])
+        self.assertIs(pipeline, get_log_pipeline())
+        self.assertEqual(1, len(self.logger.handlers))
+
+        arguments = ["first"]
+        self.logger.info("Message %s", arguments)
+        arguments.append("second")
+        try:
+            raise ValueError("failure")
+        except ValueError:
+            self.logger.error("Error", exc_info=True)
+        shutdown_log_pipeline()
+
+        self.assertEqual(["Message ['first']", "Error"], [record.getMessage() for record in handler.records])
+        self.assertNotIn(threading.current_thread(), handler.threads)
+        self.assertIsNotNone(handler.records[1].exc_info)
+        self.assertEqual(["Error"], [record.getMessage() for record in warning_handler.records])
+        # The handlers are put back
+        self.assertEqual([handler, warning_handler], self.logger.handlers)
+
+    def test_handler_added_to_pipeline_logger(self):
+        self.logger.addHandler(RecordingHandler())
+        install_log_pipeline({"enabled": True}, [self.logger.name])
+        added_handler = RecordingHandler()
+
+        add_log_handler(self.logger, added_handler)
+        self.logger.info("Message")
+        shutdown_log_pipeline()
+
+        self.assertEqual(1, len(added_handler.records))
+        self.assertIn(added_handler, self.logger.handlers)
+
+    def test_pipeline_disabled_in_settings(self):
+        handler = RecordingHandler()
+        self.logger.addHandler(handler)
+
+        self.assertIsNone(install_log_pipeline({"enabled": False}, [self.logger.name]))
+        self.assertEqual([handler], self.logger.handlers)
+
+    def test_records_sampled_and_dropped_under_overload(self):
+        handler = BlockingHandler()
+        self.logger.addHandler(handler)
+        pipeline = LogPipeline(queue_size=10, sample_threshold=0.5, sample_rate=2, duplicate_interval=None)
+        pipeline.attach(self.logger)
+        pipeline.start()
+
+        # The listener blocks on the first record, the next ones stay in the queue
+        self.logger.info("blocking")
+        handler.entered.wait(5)
+        for i in range(20):
+            self.logger.info(f"info {i}")
+        self.logger.error("error")
+        handler.unblocked.set()
+        pipeline.stop()
+
+        messages = [record.getMessage() for record in handler.records]
+        self.assertEqual("blocking", messages[0])
+        self.assertIn("error", messages)
+        self.assertEqual(10, len(messages) - 1)
+        self.assertGreater(pipeline.sampled_out_count, 0)
+        self.assertGreater(pipeline.dropped_count, 0)
+
+        # The lost records are reported once the queue has room again
+        pipeline = LogPipeline(queue_size=10, duplicate_interval=None)
+        pipeline._lost_count = 3
+        pipeline.attach(logging.getLogger(f"{self.logger.name}.other"))
+        handler.records.clear()
+        pipeline.enqueue(logging.makeLogRecord({"msg": "next", "levelno": logging.INFO}), (handler,))
+        pipeline.start()
+        pipeline.stop()
+        self.assertEqual(["3 log records were dropped, the logging queue was overloaded.", "next"],
+                         [record.getMessage() for record in handler.records])
+
+    @patch("hummingbot.logger.log_pipeline.time.monotonic")
+    def test_duplicate_messages_rate_limited_by_call_site(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        handler = RecordingHandler()
+        self.logger.addHandler(handler)
+        # The handler of the parent logger, outside of the pipeline, gets the same records as the pipeline handler
+        parent_handler = RecordingHandler()
+        parent_logger = logging.getLogger(f"{self.logger.name}_parent")
+        parent_logger.propagate = False
+        parent_logger.addHandler(parent_handler)
+        child_logger = logging.getLogger(f"{parent_logger.name}.child")
+        child_logger.setLevel(logging.DEBUG)
+        child_handler = RecordingHandler()
+        child_logger.addHandler(child_handler)
+        pipeline = LogPipeline(duplicate_interval=10, duplicate_burst=2)
+        pipeline.attach(self.logger)
+        pipeline.attach(child_logger)
+
+        def log_from_same_line(logger: logging.Logger, level: int, message: str):
+            logger.log(level, message)
+
+        try:
+            for _ in range(5):
+                log_from_same_line(self.logger, NETWORK, "Disconnected")
+            log_from_same_line(self.logger, NETWORK, "Reconnected")
+            for _ in range(5):
+                log_from_same_line(self.logger, logging.DEBUG, "Debug messages are not filtered")
+            for _ in range(5):
+                log_from_same_line(self.logger, logging.ERROR, "Errors are not filtered")
+            for _ in range(3):
+                log_from_same_line(child_logger, NETWORK, "Timeout")
+            monotonic_mock.return_value = 111
+            log_from_same_line(self.logger, NETWORK, "Disconnected")
+            log_from_same_line(child_logger, NETWORK, "Timeout")
+            pipeline.start()
+            pipeline.stop()
+        finally:
+            pipeline.detach(child_logger)
+            child_logger.removeHandler(child_handler)
+            parent_logger.removeHandler(parent_handler)
+
+        messages = [record.getMessage() for record in handler.records]
+        self.assertEqual(["Disconnected", "Disconnected", "Reconnected"], messages[:3])
+        self.assertEqual(5, messages.count("Debug messages are not filtered"))
+        self.assertEqual(5, messages.count("Errors are not filtered"))
+        self.assertEqual("Disconnected (3 duplicate messages suppressed)", messages[-1])
+        self.assertEqual(["Timeout", "Timeout", "Timeout (1 duplicate messages suppressed)"],
+                         [record.getMessage() for record in child_handler.records])
+        # The shared records are not changed by the pipeline
+        self.assertEqual(["Timeout"] * 4, [record.getMessage() for record in parent_handler.records])
+        self.assertEqual(4, pipeline.suppressed_count)
+
+    def test_json_lines_formatter(self):
+        formatter = JsonLinesFormatter()
+        try:
+            raise ValueError("failure")
+        except ValueError:
+            record = self.logger.makeRecord(self.logger.name, logging.ERROR, __file__, 10, "Error %s", ("x",),
+                                            exc_info=sys.exc_info())
+        event_record = self.logger.makeRecord(self.logger.name, 15, __file__, 20, "", None, None,
+                                              extra={"dict_msg": {"event": "fill"}})
+
+        entry = json.loads(formatter.format(record))
+        event_entry = json.loads(formatter.format(event_record))
+
+        self.assertEqual("Error x", entry["message"])
+        self.assertEqual("ERROR", entry["level"])
+        self.assertEqual(10, entry["line"])
+        self.assertIn("ValueError: failure", entry["exception"])
+        self.assertEqual({"event": "fill"}, event_entry["message"])
+
+    def test_pipeline_configured_from_logging_template(self):
+        with TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "conf"))
+            os.makedirs(os.path.join(directory, "logs"))
+            # The pipeline is disabled by default
+            with open(os.path.join(hummingbot.root_path(), "hummingbot", "templates", "hummingbot_logs_TEMPLATE.yml")) as f:
+                template = f.read()
+            self.assertIn("    enabled: false\n", template)
+            with open(os.path.join(directory, "conf", "hummingbot_logs.yml"), "w") as f:
+                f.write(template.replace("    enabled: false\n", "    enabled: true\n"))
+            root_logger = logging.getLogger()
+            root_handlers = list(root_logger.handlers)
+            root_level = root_logger.level
+            try:
+                with patch("hummingbot.prefix_path", return_value=directory):
+                    hummingbot.init_logging("hummingbot_logs.yml", MagicMock(), strategy_file_path="test")
+                pipeline = get_log_pipeline()
+                self.assertIsNotNone(pipeline)
+                self.assertIsNotNone(pipeline.pipeline_handler(logging.getLogger("hummingbot.connector")))
+                self.assertIsNotNone(pipeline.pipeline_handler(root_logger))
+
+                logging.getLogger("hummingbot.connector.test").error("Connector error")
+                shutdown_log_pipeline()
+
+                with open(os.path.join(directory, "logs", "logs_test.log")) as f:
+                    self.assertIn("Connector error", f.read())
+                self.assertFalse(os.path.exists(os.path.join(directory, "logs", "logs_test.jsonl")))
+            finally:
+                shutdown_log_pipeline()
+                for handler in list(root_logger.handlers):
+                    root_logger.removeHandler(handler)
+                    handler.close()
+                for handler in root_handlers:
+                    root_logger.addHandler(handler)
+                root_logger.setLevel(root_level)
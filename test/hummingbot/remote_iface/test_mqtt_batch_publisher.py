@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.mock.mock_mqtt_server import FakeMQTTBroker
+from unittest.mock import MagicMock, patch
+
+from commlib.node import Node
+from commlib.transports.mqtt import ConnectionParameters as MQTTConnectionParameters
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.remote_iface.batch_publisher import (
+    BATCH_SERIALIZERS,
+    MQTTBatchPublisher,
+    decode_batch,
+    encode_batch,
+)
+from hummingbot.remote_iface.mqtt import MQTTLogHandler
+
+
+class MQTTBatchPublisherTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fake_mqtt_broker = FakeMQTTBroker()
+        mqtt_transport_patcher = patch("commlib.transports.mqtt.MQTTTransport")
+        self.addCleanup(mqtt_transport_patcher.stop)
+        mqtt_transport_mock = mqtt_transport_patcher.start()
+        mqtt_transport_mock.side_effect = self.fake_mqtt_broker.create_transport
+        self.node = Node(node_name="test_node",
+                         connection_params=MQTTConnectionParameters(),
+                         heartbeats=False)
+        self.node.run()
+        self.batch_publishers = []
+
+    def tearDown(self) -> None:
+        for batch_publisher in self.batch_publishers:
+            batch_publisher.stop()
+        self.node.stop()
+        super().tearDown()
+
+    def create_batch_publisher(self, **kwargs) -> MQTTBatchPublisher:
+        batch_publisher = MQTTBatchPublisher(self.node, "hbot/TEST_ID/events", asyncio.get_running_loop(), **kwargs)
+        self.batch_publishers.append(batch_publisher)
+        batch_publisher.start()
+        return batch_publisher
+
+    def received_batches(self, batch_publisher: MQTTBatchPublisher):
+        return [decode_batch(payload, batch_publisher.encoding)
+                for payload in self.fake_mqtt_broker.received_msgs.get(batch_publisher.topic, [])]
+
+    def test_encodings_round_trip(self):
+        messages = [{"timestamp": 1, "type": "OrderFilled", "data": {"price": 10.5, "order_id": "OID1"}}] * 50
+
+        for encoding in ("msgpack", "zlib_json"):
+            payload = encode_batch(messages, encoding)
+            self.assertIsInstance(payload, bytes)
+            self.assertEqual(messages, decode_batch(payload, encoding))
+            serializer = BATCH_SERIALIZERS[encoding]
+            self.assertEqual(payload, serializer.serialize({"messages": messages}))
+            self.assertEqual({"messages": messages}, serializer.deserialize(payload))
+        self.assertLess(len(encode_batch(messages, "zlib_json")), len(str(messages)) / 10)
+        with self.assertRaises(ValueError):
+            encode_batch(messages, "xml")
+
+    async def test_batch_published_when_full(self):
+        batch_publisher = self.create_batch_publisher(max_batch_size=3, max_batch_interval=10)
+
+        for i in range(7):
+            self.assertTrue(batch_publisher.publish({"id": i}))
+        await asyncio.sleep(0.05)
+
+        self.assertEqual("hbot/TEST_ID/events/batch/msgpack", batch_publisher.topic)
+        self.assertEqual([[{"id": 0}, {"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}, {"id": 5}]],
+                         self.received_batches(batch_publisher))
+        # The last message is published on stop
+        batch_publisher.stop()
+        self.assertEqual([{"id": 6}], self.received_batches(batch_publisher)[-1])
+        self.assertEqual(3, batch_publisher.published_batch_count)
+        self.assertEqual(7, batch_publisher.published_message_count)
+
+    async def test_batch_published_after_interval(self):
+        batch_publisher = self.create_batch_publisher(encoding="zlib_json", max_batch_size=100,
+                                                      max_batch_interval=0.05)
+
+        batch_publisher.publish({"id": 0})
+        batch_publisher.publish({"id": 1})
+        await asyncio.sleep(0.01)
+        self.assertEqual([], self.received_batches(batch_publisher))
+        await asyncio.sleep(0.1)
+
+        self.assertEqual([[{"id": 0}, {"id": 1}]], self.received_batches(batch_publisher))
+
+    @patch("hummingbot.remote_iface.batch_publisher.MQTTBatchPublisher.RECONNECT_CHECK_INTERVAL", 0.01)
+    async def test_batches_held_while_disconnected(self):
+        batch_publisher = self.create_batch_publisher(max_batch_size=2, max_batch_interval=0.01, max_queue_size=4)
+        # Like the MQTT gateway while its broker connections are down
+        self.node.health = False
+
+        results = [batch_publisher.publish({"id": i}) for i in range(2)]
+        await asyncio.sleep(0.05)
+        results.extend(batch_publisher.publish({"id": i}) for i in range(2, 8))
+
+        # The first batch is held by the publishing task, the queue keeps the next 4 messages
+        self.assertEqual([True] * 6 + [False] * 2, results)
+        self.assertEqual(2, batch_publisher.dropped_message_count)
+        self.assertEqual([], self.received_batches(batch_publisher))
+
+        put_task = asyncio.ensure_future(batch_publisher.put({"id": 8}))
+        await asyncio.sleep(0.02)
+        self.assertFalse(put_task.done())
+
+        self.node.health = True
+        await asyncio.wait_for(put_task, 1)
+        await asyncio.sleep(0.1)
+        ids = [message["id"] for batch in self.received_batches(batch_publisher) for message in batch]
+        self.assertEqual([0, 1, 2, 3, 4, 5, 8], ids)
+
+    async def test_log_handler_batches_records(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.mqtt_bridge.mqtt_batching = True
+        client_config_map.mqtt_bridge.mqtt_batch_interval = 0.01
+        hb_app = MagicMock()
+        hb_app.ev_loop = asyncio.get_running_loop()
+        hb_app.instance_id = "TEST_ID"
+        hb_app.client_config_map = client_config_map
+        self.node.namespace = "hbot"
+        log_handler = MQTTLogHandler(hb_app, self.node)
+        self.batch_publishers.append(log_handler.batch_publisher)
+
+        for i in range(3):
+            log_handler.emit(logging.makeLogRecord({"msg": f"Message {i}", "levelno": logging.INFO,
+                                                    "levelname": "INFO", "name": "test"}))
+        await asyncio.sleep(0.05)
+
+        batches = self.received_batches(log_handler.batch_publisher)
+        self.assertEqual("hbot/TEST_ID/log/batch/msgpack", log_handler.batch_publisher.topic)
+        self.assertEqual(1, len(batches))
+        self.assertEqual(["Message 0", "Message 1", "Message 2"], [message["msg"] for message in batches[0]])
+        self.assertNotIn("hbot/TEST_ID/log", self.fake_mqtt_broker.received_msgs)
+        log_handler.close()
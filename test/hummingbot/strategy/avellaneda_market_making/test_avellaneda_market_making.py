@@ -1,5 +1,7 @@
 import datetime
 import math
+import os
+import tempfile
 import unittest
 from copy import deepcopy
 from decimal import Decimal
@@ -1628,3 +1630,35 @@ class AvellanedaMarketMakingUnitTests(unittest.TestCase):
 
         self.assertEqual(available_base_balance, base_balance + Decimal(2))
         self.assertEqual(available_quote_balance, quote_balance + (Decimal(1) * Decimal(1000)))
+
+    def test_debug_variables_written_in_background(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            debug_csv_path = os.path.join(temp_dir, "debug.csv")
+            strategy = AvellanedaMarketMakingStrategy()
+            strategy.init_params(
+                config_map=self.config_map,
+                market_info=self.market_info,
+                debug_csv_path=debug_csv_path,
+                is_debug=True,
+            )
+            strategy.avg_vol = self.avg_vol_indicator
+            strategy.trading_intensity = self.trading_intensity_indicator
+            strategy.start(self.clock, self.start_timestamp)
+            self.simulate_low_volatility(strategy)
+            self.simulate_high_liquidity(strategy)
+            strategy.measure_order_book_liquidity()
+            strategy.calculate_reservation_price_and_optimal_spread()
+
+            strategy.dump_debug_variables()
+            strategy.dump_debug_variables()
+            # The records are only written to the file when it is due, or when the strategy stops
+            self.assertFalse(os.path.exists(debug_csv_path))
+            strategy.stop(self.clock)
+
+            df = pd.read_csv(debug_csv_path)
+            self.assertEqual(2, len(df))
+            self.assertEqual(["timestamp", "mid_price", "best_bid", "best_ask", "reservation_price", "optimal_spread"],
+                             list(df.columns[:6]))
+            self.assertAlmostEqual(float(strategy.reservation_price), df["reservation_price"].iloc[-1])
+            self.assertAlmostEqual(float(strategy.optimal_spread), df["optimal_spread"].iloc[-1])
+            self.assertAlmostEqual(float(strategy.alpha), df["alpha"].iloc[-1])
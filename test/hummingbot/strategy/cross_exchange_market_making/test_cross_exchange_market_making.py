@@ -25,6 +25,7 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    MarketOrderFailureEvent,
     OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCompletedEvent,
@@ -379,6 +380,141 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertAlmostEqual(Decimal("3.0"), maker_fill.amount)
         self.assertAlmostEqual(Decimal("3.0"), taker_fill.amount)
 
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_exchange_names")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    @patch('hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making.'
+           'CrossExchangeMarketMakingStrategy.is_gateway_market')
+    def test_fills_hedged_together_without_waiting_for_tick(self,
+                                                            is_gateway_mock: unittest.mock.Mock,
+                                                            get_connector_settings_mock,
+                                                            get_exchange_names_mock):
+        is_gateway_mock.return_value = False
+        get_exchange_names_mock.return_value = set(self.get_mock_connector_settings().keys())
+        get_connector_settings_mock.return_value = self.get_mock_connector_settings()
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+        bid_order: LimitOrder = self.strategy.active_maker_bids[0][1]
+
+        for trade_id, amount in (("trade_1", Decimal("1")), ("trade_2", Decimal("2"))):
+            self.maker_market.trigger_event(
+                MarketEvent.OrderFilled,
+                OrderFilledEvent(
+                    self.maker_market.current_timestamp,
+                    bid_order.client_order_id,
+                    bid_order.trading_pair,
+                    TradeType.BUY,
+                    OrderType.LIMIT,
+                    bid_order.price,
+                    amount,
+                    AddedToCostTradeFee(Decimal(0)),
+                    trade_id
+                ),
+            )
+        self.assertEqual(0, len(self.taker_order_created_logger.event_log))
+
+        # The hedge is created in the next loop iterations, without any clock tick
+        self.async_run_with_timeout(self.taker_order_created_logger.wait_for(SellOrderCreatedEvent))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual(1, len(self.taker_order_created_logger.event_log))
+        taker_order: SellOrderCreatedEvent = self.taker_order_created_logger.event_log[0]
+        self.assertEqual(Decimal("3"), taker_order.amount)
+        self.assertEqual(2, self.strategy.fill_to_hedge_submit_latency.count)
+        self.assertEqual(0, self.strategy.fill_to_hedge_fill_latency.count)
+
+        self.clock.backtest_til(self.start_timestamp + 10)
+        if len(self.taker_order_fill_logger.event_log) == 0:
+            self.async_run_with_timeout(self.taker_order_fill_logger.wait_for(OrderFilledEvent))
+
+        self.assertEqual(2, self.strategy.fill_to_hedge_fill_latency.count)
+        self.assertLessEqual(self.strategy.fill_to_hedge_submit_latency.max,
+                             self.strategy.fill_to_hedge_fill_latency.min)
+        status = self.strategy.format_status()
+        self.assertIn("Hedge latency (ms):", status)
+        self.assertIn("Fill to hedge submit", status)
+        self.assertIn("Fill to hedge fill", status)
+
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_exchange_names")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    @patch('hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making.'
+           'CrossExchangeMarketMakingStrategy.is_gateway_market')
+    def test_fill_latency_tracking_discarded_for_failed_hedges_and_on_stop(self,
+                                                                           is_gateway_mock: unittest.mock.Mock,
+                                                                           get_connector_settings_mock,
+                                                                           get_exchange_names_mock):
+        is_gateway_mock.return_value = False
+        get_exchange_names_mock.return_value = set(self.get_mock_connector_settings().keys())
+        get_connector_settings_mock.return_value = self.get_mock_connector_settings()
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+        bid_order: LimitOrder = self.strategy.active_maker_bids[0][1]
+
+        self.maker_market.trigger_event(
+            MarketEvent.OrderFilled,
+            OrderFilledEvent(
+                self.maker_market.current_timestamp,
+                bid_order.client_order_id,
+                bid_order.trading_pair,
+                TradeType.BUY,
+                OrderType.LIMIT,
+                bid_order.price,
+                Decimal("1"),
+                AddedToCostTradeFee(Decimal(0)),
+                "trade_1"
+            ),
+        )
+        self.async_run_with_timeout(self.taker_order_created_logger.wait_for(SellOrderCreatedEvent))
+        self.assertEqual({"trade_1"}, self.strategy._hedge_submitted_trade_ids)
+        self.assertIn("trade_1", self.strategy._fill_reception_times)
+
+        # The failed hedge is resubmitted, the fill is not tracked anymore
+        taker_order: SellOrderCreatedEvent = self.taker_order_created_logger.event_log[0]
+        self.taker_market.trigger_event(
+            MarketEvent.OrderFailure,
+            MarketOrderFailureEvent(self.taker_market.current_timestamp, taker_order.order_id, OrderType.LIMIT),
+        )
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.assertEqual({}, self.strategy._fill_reception_times)
+        self.assertEqual(set(), self.strategy._hedge_submitted_trade_ids)
+        self.assertEqual(1, self.strategy.fill_to_hedge_submit_latency.count)
+
+        self.strategy._fill_reception_times["trade_2"] = 0
+        self.strategy._hedge_submitted_trade_ids.add("trade_2")
+        self.strategy.stop(self.clock)
+
+        self.assertEqual({}, self.strategy._fill_reception_times)
+        self.assertEqual(set(), self.strategy._hedge_submitted_trade_ids)
+
+    def test_pending_hedges_cancelled_on_stop(self):
+        hedge_started = asyncio.Event()
+        hedged_maker_order_ids = []
+
+        async def check_and_hedge_orders(maker_order_id, market_pair):
+            # Waits like a hedge waiting for a gateway price
+            hedge_started.set()
+            await asyncio.sleep(10)
+            hedged_maker_order_ids.append(maker_order_id)
+
+        market_pair = self.market_pair
+        with patch.object(self.strategy, "check_and_hedge_orders", side_effect=check_and_hedge_orders):
+            self.strategy.schedule_hedge("maker_1", market_pair)
+            self.async_run_with_timeout(hedge_started.wait())
+            self.strategy.schedule_hedge("maker_2", market_pair)
+            hedge_task = self.strategy._hedge_fills_tasks[market_pair]
+
+            self.strategy.stop(self.clock)
+            self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+        self.assertTrue(hedge_task.cancelled())
+        self.assertEqual({}, self.strategy._hedge_fills_tasks)
+        self.assertEqual({}, self.strategy._pending_hedge_maker_order_ids)
+        self.assertEqual([], hedged_maker_order_ids)
+
     def test_top_depth_tolerance(self):  # TODO
         self.clock.remove_iterator(self.strategy)
         self.clock.add_iterator(self.strategy_with_top_depth_tolerance)
@@ -0,0 +1,297 @@
+import random
+import unittest
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.data_types import Proposal
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class MockTradingRulesExchange(ExchangePyBase):
+    """
+    Local mock exchange quantizing prices and amounts with its trading rules, with an order book and balances set by
+    the tests.
+    """
+
+    def __init__(self, trading_pair: str):
+        self._trading_pair = trading_pair
+        self.fee_percent = Decimal("0")
+        super().__init__(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+
+    def set_trading_rule(self, min_price_increment: Decimal, min_base_amount_increment: Decimal):
+        self._trading_rules[self._trading_pair] = TradingRule(
+            trading_pair=self._trading_pair,
+            min_price_increment=min_price_increment,
+            min_base_amount_increment=min_base_amount_increment,
+        )
+
+    def set_order_book(self, bids: List[Tuple[Decimal, Decimal]], asks: List[Tuple[Decimal, Decimal]]):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(float(price), float(amount), 1) for price, amount in bids],
+                                  [OrderBookRow(float(price), float(amount), 1) for price, amount in asks],
+                                  1)
+        self.order_book_tracker._order_books[self._trading_pair] = order_book
+
+    def set_balance(self, asset: str, amount: Decimal):
+        self._account_balances[asset] = amount
+        self._account_available_balances[asset] = amount
+
+    @property
+    def name(self) -> str:
+        return "mock_trading_rules_exchange"
+
+    @property
+    def authenticator(self):
+        return None
+
+    @property
+    def rate_limits_rules(self):
+        return []
+
+    @property
+    def domain(self):
+        return ""
+
+    @property
+    def client_order_id_max_length(self):
+        return 36
+
+    @property
+    def client_order_id_prefix(self):
+        return "HBOT"
+
+    @property
+    def trading_rules_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs_request_path(self):
+        return ""
+
+    @property
+    def check_network_request_path(self):
+        return ""
+
+    @property
+    def trading_pairs(self):
+        return [self._trading_pair]
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    def supported_order_types(self):
+        return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
+        return False
+
+    def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
+        return False
+
+    def _get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                 amount: Decimal, price: Decimal = Decimal("NaN"), is_maker: Optional[bool] = None):
+        return AddedToCostTradeFee(percent=self.fee_percent)
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs) -> Tuple[str, float]:
+        raise NotImplementedError
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_balances(self):
+        pass
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder):
+        return []
+
+    async def _request_order_status(self, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    def _create_web_assistants_factory(self):
+        return MagicMock()
+
+    def _create_order_book_data_source(self):
+        return MagicMock()
+
+    def _create_user_stream_data_source(self):
+        return MagicMock()
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass
+
+
+def proposal_orders(proposal: Proposal) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    # Compared as strings, so that the orders are also represented the same
+    return ([(str(buy.price), str(buy.size)) for buy in proposal.buys],
+            [(str(sell.price), str(sell.size)) for sell in proposal.sells])
+
+
+class PMMFloatProposalTests(unittest.TestCase):
+    trading_pair = "HBOT-ETH"
+    base_asset = "HBOT"
+    quote_asset = "ETH"
+
+    def setUp(self):
+        super().setUp()
+        self.market = MockTradingRulesExchange(self.trading_pair)
+        self.market_info = MarketTradingPairTuple(self.market, self.trading_pair, self.base_asset, self.quote_asset)
+
+    def random_decimal(self, rng: random.Random, low: float, high: float, digits: int = 6) -> Decimal:
+        return round(Decimal(rng.uniform(low, high)), digits)
+
+    def randomize_market(self, rng: random.Random) -> Tuple[Decimal, Decimal]:
+        price_exponent = rng.randint(-4, 4)
+        mid_price = Decimal(rng.uniform(1, 10)).scaleb(price_exponent)
+        price_quantum = Decimal(1).scaleb(price_exponent - rng.randint(2, 6))
+        size_quantum = Decimal(1).scaleb(rng.randint(-6, 1))
+        self.market.set_trading_rule(price_quantum, size_quantum)
+        if rng.random() < 0.3:
+            # Prices on the price quantums
+            mid_price = (mid_price // price_quantum) * price_quantum
+        half_spread = mid_price * Decimal(rng.choice([0, 0.0001, 0.001, 0.01]))
+        bids = [(mid_price - half_spread - i * price_quantum * rng.randint(1, 5), Decimal(rng.randint(1, 100)))
+                for i in range(10)]
+        asks = [(mid_price + half_spread + i * price_quantum * rng.randint(1, 5), Decimal(rng.randint(1, 100)))
+                for i in range(10)]
+        self.market.set_order_book(bids, asks)
+        order_amount = self.random_decimal(rng, 0.1, 10, rng.randint(0, 6)).scaleb(-price_exponent)
+        self.market.set_balance(self.base_asset, rng.choice([
+            Decimal(0),
+            order_amount * rng.randint(1, 40),
+            self.random_decimal(rng, 0, 200).scaleb(-price_exponent)]))
+        self.market.set_balance(self.quote_asset, rng.choice([
+            Decimal(0),
+            order_amount * mid_price * rng.randint(1, 40),
+            self.random_decimal(rng, 0, 200)]))
+        self.market.fee_percent = rng.choice([Decimal(0), Decimal("0.001"), self.random_decimal(rng, -0.001, 0.01)])
+        return order_amount, mid_price
+
+    def create_strategy(self, rng: random.Random, order_amount: Decimal,
+                        mid_price: Decimal) -> PureMarketMakingStrategy:
+        strategy = PureMarketMakingStrategy()
+        order_levels = rng.randint(1, 20)
+        strategy.init_params(
+            self.market_info,
+            bid_spread=rng.choice([Decimal(0), self.random_decimal(rng, -0.001, 0.05)]),
+            ask_spread=rng.choice([Decimal(0), self.random_decimal(rng, -0.001, 0.05)]),
+            order_amount=order_amount,
+            order_levels=order_levels,
+            order_level_spread=rng.choice([Decimal(0), self.random_decimal(rng, 0, 0.01)]),
+            order_level_amount=rng.choice([Decimal(0), order_amount * self.random_decimal(rng, -0.05, 0.5, 2)]),
+            inventory_skew_enabled=rng.random() < 0.5,
+            inventory_target_base_pct=self.random_decimal(rng, 0, 1, 2),
+            inventory_range_multiplier=self.random_decimal(rng, 0.1, 3, 2),
+            add_transaction_costs_to_orders=rng.random() < 0.5,
+            price_type=rng.choice(["mid_price", "best_bid", "best_ask"]),
+            take_if_crossed=rng.random() < 0.2,
+            price_ceiling=rng.choice([Decimal(-1), mid_price * self.random_decimal(rng, 0.99, 1.01, 3)]),
+            price_floor=rng.choice([Decimal(-1), mid_price * self.random_decimal(rng, 0.9, 0.99, 3)]),
+        )
+        strategy.buy_levels = rng.randint(0, order_levels)
+        return strategy
+
+    def test_float_proposal_disabled_by_default(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(self.market_info, bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"),
+                             order_amount=Decimal("1"))
+
+        self.assertFalse(strategy.float_proposal_enabled)
+
+    def test_same_orders_as_decimal_proposal_over_random_books(self):
+        rng = random.Random(42)
+        for i in range(400):
+            order_amount, mid_price = self.randomize_market(rng)
+            strategy = self.create_strategy(rng, order_amount, mid_price)
+
+            decimal_orders = proposal_orders(strategy.create_proposal())
+            strategy.float_proposal_enabled = True
+            float_orders = proposal_orders(strategy.create_proposal())
+
+            self.assertEqual(decimal_orders, float_orders, f"Different orders in random case {i}")
+
+    def test_same_orders_at_quantum_boundaries(self):
+        self.market.set_trading_rule(Decimal("0.01"), Decimal("0.1"))
+        self.market.set_order_book([(Decimal("99.99"), Decimal("10"))], [(Decimal("100.01"), Decimal("10"))])
+        # The balances are exactly used by the orders
+        self.market.set_balance(self.base_asset, Decimal("3"))
+        self.market.set_balance(self.quote_asset, Decimal("299.97"))
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(self.market_info, bid_spread=Decimal("0"), ask_spread=Decimal("0"),
+                             order_amount=Decimal("1"), order_levels=4, order_level_spread=Decimal("0.0001"),
+                             take_if_crossed=True)
+
+        decimal_orders = proposal_orders(strategy.create_proposal())
+        strategy.float_proposal_enabled = True
+        float_orders = proposal_orders(strategy.create_proposal())
+
+        self.assertEqual(decimal_orders, float_orders)
+        self.assertEqual(([("100.00", "1.0"), ("99.99", "1.0"), ("99.98", "1.0")],
+                          [("100.00", "1.0"), ("100.01", "1.0"), ("100.02", "1.0")]),
+                         float_orders)
+
+    def test_decimal_proposal_used_for_markets_with_other_quantization(self):
+        market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(trading_pair=self.trading_pair, mid_price=100, min_price=1, max_price=200,
+                                       price_step_size=1, volume_step_size=10)
+        market.set_balance(self.base_asset, 500)
+        market.set_balance(self.quote_asset, 5000)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+                             bid_spread=Decimal("0.01"), ask_spread=Decimal("0.01"), order_amount=Decimal("1"),
+                             order_levels=3, order_level_spread=Decimal("0.01"))
+
+        decimal_orders = proposal_orders(strategy.create_proposal())
+        strategy.float_proposal_enabled = True
+
+        self.assertEqual(decimal_orders, proposal_orders(strategy.create_proposal()))
+
+    def test_float_proposal_matches_decimal_with_20_levels_and_costs(self):
+        self.market.set_trading_rule(Decimal("0.01"), Decimal("0.001"))
+        self.market.set_order_book([(Decimal("99.995"), Decimal("10"))], [(Decimal("100.015"), Decimal("10"))])
+        self.market.set_balance(self.base_asset, Decimal("1000"))
+        self.market.set_balance(self.quote_asset, Decimal("100000"))
+        self.market.fee_percent = Decimal("0.001")
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(self.market_info, bid_spread=Decimal("0.0011"), ask_spread=Decimal("0.0013"),
+                             order_amount=Decimal("1.5"), order_levels=20, order_level_spread=Decimal("0.00051"),
+                             order_level_amount=Decimal("0.25"), inventory_skew_enabled=True,
+                             inventory_target_base_pct=Decimal("0.45"), inventory_range_multiplier=Decimal("20"),
+                             add_transaction_costs_to_orders=True)
+
+        decimal_orders = proposal_orders(strategy.create_proposal())
+        strategy.float_proposal_enabled = True
+        float_orders = proposal_orders(strategy.create_proposal())
+
+        self.assertEqual(decimal_orders, float_orders)
+        self.assertEqual(20, len(float_orders[0]))
+        self.assertEqual(20, len(float_orders[1]))
@@ -1,4 +1,5 @@
 import asyncio
+import os
 import time
 import unittest
 from decimal import Decimal
@@ -485,3 +486,95 @@ class OrderTrackerUnitTests(unittest.TestCase):
 
         # Check that check_and_cleanup_shadow_records clears shadow_limit_orders
         self.assertTrue(len(self.order_tracker.shadow_limit_orders) == 0)
+
+    def test_active_orders_indexes_follow_cancels(self):
+        for order in self.limit_orders:
+            self.simulate_place_order(self.order_tracker, order, self.market_info)
+            self.simulate_order_created(self.order_tracker, order)
+        canceled_bid, canceled_ask = self.limit_orders[0], self.limit_orders[1]
+        self.simulate_cancel_order(self.order_tracker, canceled_bid)
+        self.simulate_cancel_order(self.order_tracker, canceled_ask)
+
+        active_ids = {order.client_order_id for _, order in self.order_tracker.active_limit_orders}
+        self.assertEqual({order.client_order_id for order in self.limit_orders[2:]}, active_ids)
+        self.assertNotIn(canceled_bid, [order for _, order in self.order_tracker.active_bids])
+        self.assertNotIn(canceled_ask, [order for _, order in self.order_tracker.active_asks])
+        self.assertEqual(9, len(self.order_tracker.active_bids))
+        self.assertEqual(9, len(self.order_tracker.active_asks))
+        self.assertEqual(18, len(self.order_tracker.market_pair_to_active_orders[self.market_info]))
+        self.assertEqual(20, len(self.order_tracker.tracked_limit_orders))
+        self.assertEqual(10, len(self.order_tracker.tracked_bids))
+        self.assertEqual(10, len(self.order_tracker.tracked_asks))
+
+        # Once the cancels expire the orders are active again and the cancels can be tracked again
+        self.clock.backtest_til(self.start_timestamp + OrderTracker.CANCEL_EXPIRY_DURATION + self.clock_tick_size)
+
+        self.assertEqual(20, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(0, len(self.order_tracker.in_flight_cancels))
+        self.assertTrue(self.order_tracker.check_and_track_cancel(canceled_bid.client_order_id))
+        self.assertEqual(19, len(self.order_tracker.active_limit_orders))
+
+        # Orders no longer tracked are removed from every index
+        for order in self.limit_orders:
+            self.simulate_stop_tracking_order(self.order_tracker, order, self.market_info)
+
+        self.assertEqual(0, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(0, len(self.order_tracker.active_bids))
+        self.assertEqual(0, len(self.order_tracker.tracked_limit_orders))
+        self.assertEqual({}, self.order_tracker.market_pair_to_active_orders)
+        self.assertEqual(0, len(self.order_tracker.in_flight_cancels))
+
+    def track_live_orders(self, orders_count: int):
+        for i in range(orders_count):
+            order_id = f"LIVE-{i}"
+            self.order_tracker.start_tracking_limit_order(self.market_info, order_id, i % 2 == 0, Decimal("100"),
+                                                          Decimal("1"))
+            if i % 10 == 0:
+                self.order_tracker.check_and_track_cancel(order_id)
+
+    def full_scan_active_orders(self):
+        # Lists built by scanning all the tracked orders, as done before the indexes
+        orders = [(market_pair.market, order)
+                  for market_pair, orders_map in self.order_tracker.get_limit_orders().items()
+                  for order in orders_map.values()
+                  if not self.order_tracker.has_in_flight_cancel(order.client_order_id)]
+        bids = [(market, order) for market, order in orders if order.is_buy]
+        asks = [(market, order) for market, order in orders if not order.is_buy]
+        return orders, bids, asks
+
+    def indexed_active_orders(self):
+        return self.order_tracker.active_limit_orders, self.order_tracker.active_bids, self.order_tracker.active_asks
+
+    def test_indexes_match_full_scan_with_500_live_orders(self):
+        self.track_live_orders(500)
+
+        self.assertEqual(450, len(self.full_scan_active_orders()[0]))
+        self.assertEqual(self.full_scan_active_orders(), self.indexed_active_orders())
+        for i in range(200):
+            self.order_tracker.check_and_track_cancel(f"LIVE-{i}")
+        self.assertEqual(270, len(self.order_tracker.active_limit_orders))
+        self.assertEqual(self.full_scan_active_orders(), self.indexed_active_orders())
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Benchmark, set HUMMINGBOT_BENCHMARKS to run it")
+    def test_benchmark_tick_with_500_live_orders(self):
+        orders_count = 500
+        ticks_count = 200
+        self.track_live_orders(orders_count)
+
+        # A legacy strategy tick reads the active orders lists a few times and checks a cancel
+        start = time.perf_counter()
+        for i in range(ticks_count):
+            for _ in range(3):
+                self.full_scan_active_orders()
+        full_scan_time = (time.perf_counter() - start) / ticks_count
+
+        start = time.perf_counter()
+        for i in range(ticks_count):
+            for _ in range(3):
+                self.indexed_active_orders()
+            self.order_tracker.check_and_track_cancel(f"LIVE-{i}")
+        indexed_time = (time.perf_counter() - start) / ticks_count
+
+        self.assertLess(indexed_time, full_scan_time,
+                        msg=f"Tick with {orders_count} live orders: full scan {full_scan_time * 1e6:.1f} us, "
+                            f"indexed {indexed_time * 1e6:.1f} us")
@@ -0,0 +1,132 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.debug_records_writer import DebugRecordsWriter
+
+
+class DebugRecordsWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "debug.csv")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            DebugRecordsWriter(self.file_path, ["price"], file_format="json")
+        with self.assertRaises(ValueError):
+            DebugRecordsWriter(self.file_path, ["price"], buffer_size=0)
+
+    def test_records_buffered_until_flush_interval(self):
+        writer = DebugRecordsWriter(self.file_path, ["price", "spread"], flush_interval=10)
+
+        for i in range(10):
+            writer.add_record(1000 + i, (Decimal("100") + i, None))
+
+        self.assertEqual(10, writer.pending_records_count)
+        self.assertFalse(os.path.exists(self.file_path))
+
+        writer.add_record(1010, (Decimal("110"), Decimal("0.5")))
+        writer.close()
+
+        df = pd.read_csv(self.file_path)
+        self.assertEqual(["timestamp", "price", "spread"], list(df.columns))
+        self.assertEqual(list(range(1000, 1011)), df["timestamp"].tolist())
+        self.assertEqual(list(range(100, 111)), df["price"].tolist())
+        self.assertTrue(df["spread"][:10].isna().all())
+        self.assertEqual(0.5, df["spread"].iloc[10])
+
+    def test_records_appended_across_flushes(self):
+        writer = DebugRecordsWriter(self.file_path, ["price"], flush_interval=5)
+
+        for i in range(23):
+            writer.add_record(i, (i * 2,))
+        writer.close()
+
+        df = pd.read_csv(self.file_path)
+        self.assertEqual(list(range(23)), df["timestamp"].tolist())
+        self.assertEqual([i * 2 for i in range(23)], df["price"].tolist())
+
+    def test_oldest_records_dropped_while_writing(self):
+        writer = DebugRecordsWriter(self.file_path, ["price"], buffer_size=5, flush_interval=1000)
+        # Simulates a write still in progress
+        writer._write_future = MagicMock()
+        writer._write_future.done.return_value = False
+
+        for i in range(8):
+            writer.add_record(i, (i,))
+
+        self.assertEqual(5, writer.pending_records_count)
+        self.assertEqual(3, writer.dropped_records_count)
+
+        writer._write_future = None
+        writer.close()
+        df = pd.read_csv(self.file_path)
+        self.assertEqual([3, 4, 5, 6, 7], df["price"].tolist())
+
+    def test_file_rotated_when_too_big(self):
+        writer = DebugRecordsWriter(self.file_path, ["price"], flush_interval=1, max_file_size=50, backup_count=2)
+
+        for i in range(40):
+            writer.add_record(i, (i,))
+            # Waits for each record to be written
+            writer.close()
+
+        self.assertTrue(os.path.exists(self.file_path + ".1"))
+        self.assertTrue(os.path.exists(self.file_path + ".2"))
+        self.assertFalse(os.path.exists(self.file_path + ".3"))
+        df = pd.concat([pd.read_csv(self.file_path + suffix) for suffix in (".2", ".1", "")])
+        # The oldest records were in the files rotated out
+        self.assertEqual(list(range(40 - len(df), 40)), df["price"].tolist())
+
+    def test_write_errors_logged(self):
+        writer = DebugRecordsWriter(os.path.join(self.temp_dir.name, "missing", "debug.csv"), ["price"])
+        writer.add_record(1, (1,))
+
+        with self.assertLogs(writer.logger(), level="ERROR"):
+            writer.close()
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow") is not None, "requires pyarrow")
+    def test_parquet_format(self):
+        file_path = os.path.join(self.temp_dir.name, "debug.parquet")
+        writer = DebugRecordsWriter(file_path, ["price"], file_format="parquet", flush_interval=5)
+
+        for i in range(12):
+            writer.add_record(i, (i,))
+        writer.close()
+
+        self.assertEqual(list(range(12)), pd.read_parquet(file_path)["price"].tolist())
+
+    def test_wide_records_flushed_when_buffer_full(self):
+        values = tuple(Decimal("100.123456") + i for i in range(20))
+        columns = [f"column_{i}" for i in range(20)]
+        writer = DebugRecordsWriter(self.file_path, columns, buffer_size=100, flush_interval=60)
+
+        for i in range(100):
+            writer.add_record(1000 + i * 0.1, values)
+        # The full buffer is handed over before the flush interval
+        self.assertEqual(0, writer.pending_records_count)
+        writer._write_future.result()
+        self.assertEqual(100, len(pd.read_csv(self.file_path)))
+
+        for i in range(5):
+            writer.add_record(1010 + i * 0.1, values)
+        self.assertEqual(5, writer.pending_records_count)
+        writer.close()
+
+        df = pd.read_csv(self.file_path)
+        self.assertEqual(["timestamp"] + columns, list(df.columns))
+        self.assertEqual(105, len(df))
+        self.assertEqual(0, writer.dropped_records_count)
+        np.testing.assert_allclose(df.iloc[:, 1:].to_numpy(), np.array([[float(value) for value in values]] * 105))
@@ -107,3 +107,52 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view_is_ordered_and_not_copied(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(np.shares_memory(view, buffer.get_as_numpy_view()))
+        self.assertFalse(np.shares_memory(view, buffer.get_as_numpy_array()))
+        self.assertEqual(4, len(buffer))
+
+    def test_length_over_int16_range(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.arange(10, length + 10)))
+        self.assertEqual(length + 9, buffer.get_last_value())
+        self.assertEqual(9, buffer.get_last_removed_value())
+
+    def test_running_statistics_match_numpy(self):
+        values = np.random.default_rng(7).normal(1e4, 50, self.BUFFER_LENGTH * 10 + 7)
+        for i, value in enumerate(values):
+            self.buffer.add_value(value)
+            window = values[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            self.assertAlmostEqual(np.mean(window), self.buffer.window_mean, delta=1e-9)
+            self.assertAlmostEqual(np.var(window), self.buffer.window_variance, delta=1e-7)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(window), self.buffer.mean_value, delta=1e-9)
+                self.assertAlmostEqual(np.var(window), self.buffer.variance, delta=1e-7)
+                self.assertAlmostEqual(np.std(window), self.buffer.std_dev, delta=1e-9)
+
+    def test_window_statistics_of_empty_buffer(self):
+        self.assertTrue(np.isnan(self.buffer.window_mean))
+        self.assertTrue(np.isnan(self.buffer.window_variance))
+        self.assertTrue(np.isnan(self.buffer.get_last_removed_value()))
+
+    def test_length_change_keeps_last_values_and_statistics(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.arange(20, 30)))
+        self.assertEqual(np.mean(np.arange(20, 30)), self.buffer.mean_value)
+        self.assertEqual(np.var(np.arange(20, 30)), self.buffer.variance)
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        self.samples = np.random.default_rng(self.INITIAL_RANDOM_SEED).normal(100, 5, self.BUFFER_LENGTH * 5)
+
+    @staticmethod
+    def full_calculation(samples: np.ndarray, sampling_length: int) -> float:
+        # Calculation over the whole sampling buffer, as done before the recursive update
+        return pd.Series(samples[-sampling_length:]).ewm(span=sampling_length, adjust=True).mean().iloc[-1]
+
+    def test_processing_length_should_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
+
+    def test_recursive_update_matches_full_calculation(self):
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(self.samples):
+            indicator.add_sample(sample)
+            self.assertAlmostEqual(self.full_calculation(self.samples[:i + 1], self.BUFFER_LENGTH),
+                                   indicator.current_value, 9)
+
+    def test_sampling_length_change(self):
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in self.samples[:self.BUFFER_LENGTH * 2]:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 10
+        for i in range(self.BUFFER_LENGTH * 2, len(self.samples)):
+            indicator.add_sample(self.samples[i])
+            self.assertAlmostEqual(self.full_calculation(self.samples[:i + 1], 10), indicator.current_value, 9)
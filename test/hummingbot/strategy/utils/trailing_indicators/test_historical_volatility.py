@@ -66,3 +66,18 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_recursive_update_matches_full_calculation(self):
+        sampling_length = 50
+        processing_length = 5
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, sampling_length * 5)))
+        self.indicator = HistoricalVolatilityIndicator(sampling_length, processing_length)
+
+        variances = []
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            # Calculation over the whole sampling buffer, as done before the recursive update
+            window = samples[max(0, i + 1 - sampling_length):i + 1]
+            variances.append(np.var(np.diff(np.log(window))) if window.size > 1 else np.nan)
+            expected = np.sqrt(np.mean(np.nan_to_num(variances[-processing_length:])))
+            self.assertAlmostEqual(expected, self.indicator.current_value, 12)
@@ -20,3 +20,28 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_recursive_update_matches_full_calculation(self):
+        sampling_length = 50
+        samples = np.random.normal(100, 10, sampling_length * 5)
+        self.indicator = InstantVolatilityIndicator(sampling_length, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            # Calculation over the whole sampling buffer, as done before the recursive update
+            window = samples[max(0, i + 1 - sampling_length):i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 9)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, 100)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+        for sample in samples[:60]:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 20
+        for i in range(60, len(samples)):
+            self.indicator.add_sample(samples[i])
+            window = samples[i + 1 - 20:i + 1]
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 9)
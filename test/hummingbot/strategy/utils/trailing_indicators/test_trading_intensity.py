@@ -1,6 +1,8 @@
 import math
+import time
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -259,3 +261,54 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def deterministic_indicator(self, last_price: float, a: float, b: float, **kwargs) -> TradingIntensityIndicator:
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, **kwargs)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+        for p in [2, 3, 4, 5]:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp + 1,
+                price=p,
+                amount=a * np.exp(-b * (p - last_price)),
+                type=TradeType.SELL,
+            ))
+        return indicator
+
+    def test_calculate_trading_intensity_with_fast_estimation(self):
+        indicator = self.deterministic_indicator(last_price=1, a=2, b=0.1, fast_estimation=True)
+
+        indicator.calculate(self.start_timestamp + 1)
+        alpha, kappa = indicator.current_value
+
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_calculate_trading_intensity_in_background(self):
+        indicator = self.deterministic_indicator(last_price=1, a=2, b=0.1, estimate_in_background=True)
+
+        indicator.calculate(self.start_timestamp + 1)
+        deadline = time.time() + 5
+        while indicator.is_estimating and time.time() < deadline:
+            time.sleep(0.01)
+        alpha, kappa = indicator.current_value
+
+        self.assertFalse(indicator.is_estimating)
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)
+
+    def test_intensity_estimated_only_when_samples_change(self):
+        indicator = self.deterministic_indicator(last_price=1, a=2, b=0.1)
+        module = "hummingbot.strategy.__utils__.trailing_indicators.trading_intensity"
+
+        with patch(f"{module}.estimate_intensity", return_value=(2, 0.1)) as estimate_mock:
+            indicator.calculate(self.start_timestamp + 1)
+            indicator.calculate(self.start_timestamp + 2)
+            indicator.calculate(self.start_timestamp + 3)
+
+        self.assertEqual(1, estimate_mock.call_count)
+        price_levels, lambdas, initial_values, fast_estimation = estimate_mock.call_args.args
+        self.assertEqual([1, 2, 3, 4], sorted(price_levels))
+        self.assertEqual((0, 0), initial_values)
+        self.assertFalse(fast_estimation)
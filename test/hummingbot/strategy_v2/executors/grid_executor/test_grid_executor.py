@@ -444,6 +444,57 @@ class TestGridExecutor(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.assertEqual(executor.realized_pnl_quote, Decimal("-145"))  # 165 - 310
         self.assertAlmostEqual(round(executor.realized_pnl_pct, 4), round(Decimal("-0.4677419355"), 4))  # -145 / 310
 
+    @staticmethod
+    def get_filled_order(client_order_id: str, trade_type: TradeType, amount: Decimal, price: Decimal) -> InFlightOrder:
+        order = InFlightOrder(
+            client_order_id=client_order_id,
+            trading_pair="ETH-USDT",
+            order_type=OrderType.LIMIT,
+            trade_type=trade_type,
+            amount=amount,
+            price=price,
+            creation_timestamp=1640001112.0,
+            initial_state=OrderState.FILLED,
+        )
+        order.executed_amount_base = amount
+        order.executed_amount_quote = amount * price
+        return order
+
+    @patch.object(GridExecutor, "get_price")
+    def test_realized_pnl_metrics_are_accumulated_incrementally(self, get_price_mock):
+        get_price_mock.return_value = Decimal("100")
+        config = GridExecutorConfig(
+            id="test",
+            timestamp=123,
+            side=TradeType.BUY,
+            connector_name="binance",
+            trading_pair="ETH-USDT",
+            start_price=Decimal("100"),
+            end_price=Decimal("120"),
+            total_amount_quote=Decimal("100"),
+            min_spread_between_orders=Decimal("0.01"),
+            min_order_amount_quote=Decimal("10"),
+            limit_price=Decimal("90"),
+            triple_barrier_config=TripleBarrierConfig(take_profit=Decimal("0.001"), stop_loss=Decimal("0.05")),
+        )
+        executor = self.get_grid_executor_from_config(config)
+        for i in range(100):
+            executor._add_filled_order(self.get_filled_order(f"buy_{i}", TradeType.BUY, Decimal("1"), Decimal("100")))
+            executor._add_filled_order(self.get_filled_order(f"sell_{i}", TradeType.SELL, Decimal("1"), Decimal("101")))
+            executor.update_realized_pnl_metrics()
+        self.assertNotIn("order_fills", executor._filled_orders[0])
+        self.assertEqual(200, executor._accumulated_filled_orders_count)
+        self.assertEqual(Decimal("10000"), executor.realized_buy_size_quote)
+        self.assertEqual(Decimal("10100"), executor.realized_sell_size_quote)
+        self.assertEqual(Decimal("100"), executor.realized_pnl_quote)
+        self.assertEqual(Decimal("0.01"), executor.realized_pnl_pct)
+
+        # Orders that become held positions are excluded from the realized metrics
+        executor._held_position_orders.append(executor._filled_orders[-1])
+        executor.update_realized_pnl_metrics()
+        self.assertEqual(Decimal("9999"), executor.realized_sell_size_quote)
+        self.assertEqual(Decimal("-1"), executor.realized_pnl_quote)
+
     @patch.object(GridExecutor, "_sleep")
     @patch.object(GridExecutor, "get_price")
     async def test_control_shutdown_process(self, get_price_mock, _):
@@ -1,7 +1,7 @@
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_py_base import ExchangePyBase
@@ -11,6 +11,7 @@ from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
+    MarketEvent,
     MarketOrderFailureEvent,
     OrderCancelledEvent,
     OrderFilledEvent,
@@ -152,6 +153,47 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.stop()
         self.assertEqual(RunnableStatus.TERMINATED, self.component.status)
 
+    def test_executor_info_cached_until_state_changes(self):
+        self.component._build_executor_info = MagicMock(side_effect=lambda: MagicMock())
+        self.strategy.current_timestamp = 1234567890
+
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+        self.assertEqual(1, self.component._build_executor_info.call_count)
+
+        self.component.process_order_event(
+            MarketEvent.OrderCancelled.value, MagicMock(), OrderCancelledEvent(1234567890, "OID-BUY-1"))
+        self.assertIsNot(executor_info, self.component.executor_info)
+        self.assertEqual(2, self.component._build_executor_info.call_count)
+
+        self.strategy.current_timestamp = 1234567891
+        self.component.executor_info
+        self.assertEqual(3, self.component._build_executor_info.call_count)
+
+        self.component.stop()
+        closed_executor_info = self.component.executor_info
+        self.strategy.current_timestamp = 1234567892
+        self.assertIs(closed_executor_info, self.component.executor_info)
+        self.assertEqual(4, self.component._build_executor_info.call_count)
+
+    async def test_executor_info_rebuilt_after_order_placed_and_control_task(self):
+        self.component._build_executor_info = MagicMock(side_effect=lambda: MagicMock())
+        self.strategy.current_timestamp = 1234567890
+        executor_info = self.component.executor_info
+
+        self.component.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                   side=TradeType.BUY, price=Decimal("1000.0"), amount=Decimal("1.0"))
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+
+        self.component.control_task = AsyncMock(side_effect=lambda: self.component.terminated.set())
+        self.component.validate_sufficient_balance = AsyncMock()
+        self.component.update_interval = 0
+        await self.component.control_loop()
+        self.component.control_task.assert_awaited_once()
+        self.assertIsNot(executor_info, self.component.executor_info)
+        self.assertEqual(3, self.component._build_executor_info.call_count)
+
     def test_get_price_by_type(self):
         price = self.component.get_price("connector1", "EHT-USDT", PriceType.MidPrice)
         self.assertEqual(price, Decimal("1000.0"))
@@ -0,0 +1,172 @@
+import os
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_event_router import ExecutorEventRouter
+
+
+class RecordingExecutor(ExecutorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.filled_events: List[OrderFilledEvent] = []
+        self.canceled_events: List[OrderCancelledEvent] = []
+
+    def process_order_filled_event(self, event_tag, market, event):
+        self.filled_events.append(event)
+
+    def process_order_canceled_event(self, event_tag, market, event):
+        self.canceled_events.append(event)
+
+
+class TestExecutorEventRouter(unittest.TestCase):
+    def setUp(self):
+        self.connector = PubSub()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.order_counter = 0
+        self.strategy.buy.side_effect = self._next_order_id
+        self.router = ExecutorEventRouter()
+
+    def _next_order_id(self, *args, **kwargs):
+        self.order_counter += 1
+        return f"OID-{self.order_counter}"
+
+    def create_executor(self, executor_id: str, with_router: bool = True) -> RecordingExecutor:
+        config = ExecutorConfigBase(id=executor_id, type="position_executor", timestamp=1234567890)
+        executor = RecordingExecutor(strategy=self.strategy, connectors=["connector1"], config=config)
+        if with_router:
+            executor.set_event_router(self.router)
+        executor.register_events()
+        return executor
+
+    @staticmethod
+    def place_order(executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=Decimal("1"), price=Decimal("1000"))
+
+    @staticmethod
+    def filled_event(order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=1234567890,
+            order_id=order_id,
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+        )
+
+    def test_single_listener_per_connector(self):
+        self.create_executor("executor_1")
+        self.create_executor("executor_2")
+        for event in ExecutorEventRouter.ROUTED_EVENTS:
+            self.assertEqual(1, len(self.connector.get_listeners(event)))
+
+    def test_event_routed_only_to_order_owner(self):
+        executor_1 = self.create_executor("executor_1")
+        executor_2 = self.create_executor("executor_2")
+        order_id = self.place_order(executor_2)
+
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event(order_id))
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1234567890, order_id))
+
+        self.assertEqual([], executor_1.filled_events)
+        self.assertEqual(1, len(executor_2.filled_events))
+        self.assertEqual(order_id, executor_2.filled_events[0].order_id)
+        self.assertEqual(1, len(executor_2.canceled_events))
+
+    def test_events_of_unknown_orders_are_ignored(self):
+        executor = self.create_executor("executor_1")
+        self.place_order(executor)
+
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event("OID-unknown"))
+
+        self.assertEqual([], executor.filled_events)
+
+    def test_unregister_executor_removes_orders_and_listeners(self):
+        executor_1 = self.create_executor("executor_1")
+        executor_2 = self.create_executor("executor_2")
+        order_id = self.place_order(executor_1)
+        self.place_order(executor_2)
+        self.assertEqual(2, self.router.tracked_orders_count)
+
+        executor_1.unregister_events()
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event(order_id))
+
+        self.assertEqual([], executor_1.filled_events)
+        self.assertEqual(1, self.router.tracked_orders_count)
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+        executor_2.unregister_events()
+
+        self.assertEqual(0, self.router.tracked_orders_count)
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual([], self.router.connectors)
+
+    def test_stop_removes_all_listeners(self):
+        executor = self.create_executor("executor_1")
+        self.place_order(executor)
+
+        self.router.stop()
+
+        self.assertEqual(0, self.router.tracked_orders_count)
+        self.assertEqual(0, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+    def test_executor_without_router_keeps_own_listeners(self):
+        executors = [self.create_executor(f"executor_{i}", with_router=False) for i in range(2)]
+        self.assertEqual(len(executors), len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+
+    def test_fills_delivered_only_to_order_owner(self):
+        executors = [self.create_executor(f"executor_{i}") for i in range(100)]
+        owners = executors[::10]
+        order_ids = [self.place_order(executor) for executor in owners]
+
+        for order_id in order_ids:
+            self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event(order_id))
+
+        # A single listener is registered on the connector, each fill only reaches the executor owning the order
+        self.assertEqual(1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        for executor, order_id in zip(owners, order_ids):
+            self.assertEqual([order_id], [event.order_id for event in executor.filled_events])
+        self.assertEqual(len(order_ids), sum(len(executor.filled_events) for executor in executors))
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Benchmark, set HUMMINGBOT_BENCHMARKS to run it")
+    def test_benchmark_5000_executors(self):
+        executors_count = 5000
+        events_count = 200
+
+        def run(with_router: bool) -> float:
+            self.connector = PubSub()
+            self.strategy.connectors = {"connector1": self.connector}
+            self.router = ExecutorEventRouter()
+            executors = [self.create_executor(f"executor_{i}", with_router) for i in range(executors_count)]
+            events = [self.filled_event(self.place_order(executors[i * executors_count // events_count]))
+                      for i in range(events_count)]
+            start = time.perf_counter()
+            for event in events:
+                self.connector.trigger_event(MarketEvent.OrderFilled, event)
+            elapsed = time.perf_counter() - start
+            # Without the router every executor receives every fill and filters the order ids on its own
+            delivered = sum(len(executor.filled_events) for executor in executors)
+            self.assertEqual(events_count if with_router else events_count * executors_count, delivered)
+            for executor in executors:
+                executor.unregister_events()
+            return elapsed
+
+        broadcast_time = run(with_router=False)
+        routed_time = run(with_router=True)
+
+        self.assertLess(routed_time, broadcast_time,
+                        msg=f"{executors_count} executors, {events_count} fills: broadcast {broadcast_time:.4f} s, "
+                            f"routed {routed_time:.4f} s")
@@ -181,6 +181,59 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    def test_generate_performance_report_reuses_executors_aggregate(self):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+        executor = MagicMock(spec=PositionExecutor)
+        executor.executor_info = ExecutorInfo(
+            id="123", timestamp=1234, type="position_executor", status=RunnableStatus.RUNNING, config=config,
+            filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(10), net_pnl_pct=Decimal(10),
+            cum_fees_quote=Decimal(1), is_trading=True, is_active=True, custom_info={"side": TradeType.BUY}
+        )
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+        self.orchestrator.active_executors["test"] = [executor]
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        cached_aggregate = self.orchestrator._executors_performance_cache["test"][1]
+        self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertIs(cached_aggregate, self.orchestrator._executors_performance_cache["test"][1])
+        self.assertEqual(Decimal(10), report.unrealized_pnl_quote)
+
+        executor.executor_info = executor.executor_info.model_copy(update={"net_pnl_quote": Decimal(20)})
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertIsNot(cached_aggregate, self.orchestrator._executors_performance_cache["test"][1])
+        self.assertEqual(Decimal(20), report.unrealized_pnl_quote)
+
+    def test_get_all_reports_queries_mid_price_once_per_position(self):
+        position_held = PositionHold("binance", "ETH-USDT", side=TradeType.BUY)
+        position_held.buy_amount_base = Decimal(1)
+        position_held.buy_amount_quote = Decimal(200)
+        self.orchestrator.positions_held["test"] = [position_held]
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+
+        reports = self.orchestrator.get_all_reports()
+
+        self.mock_strategy.market_data_provider.get_price_by_type.assert_called_once()
+        self.assertIs(reports["test"]["positions"][0], reports["test"]["performance"].positions_summary[0])
+        self.assertEqual(Decimal(30), reports["test"]["performance"].unrealized_pnl_quote)
+
+    def test_position_summary_is_recomputed_only_on_changes(self):
+        position_held = PositionHold("binance", "ETH-USDT", side=TradeType.BUY)
+        position_held.buy_amount_base = Decimal(1)
+        position_held.buy_amount_quote = Decimal(200)
+
+        summary = position_held.get_position_summary(Decimal(230))
+        self.assertIs(summary, position_held.get_position_summary(Decimal(230)))
+
+        new_price_summary = position_held.get_position_summary(Decimal(240))
+        self.assertEqual(Decimal(40), new_price_summary.unrealized_pnl_quote)
+
+        position_held.buy_amount_base = Decimal(2)
+        position_held.buy_amount_quote = Decimal(400)
+        self.assertEqual(Decimal(80), position_held.get_position_summary(Decimal(240)).unrealized_pnl_quote)
+
     @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
     def test_initialize_cached_performance(self, mock_get_instance: MagicMock):
         # Create mock markets recorder
@@ -25,8 +25,14 @@ class FakeMQTTBroker:
 
     def create_transport(self, *args, **kwargs):
         if not self._transport:
-            self._transport = FakeMQTTTransport(*args, **kwargs)
-        return self._transport
+            self._transport = FakeMQTTTransport()
+        if kwargs.get("serializer", JSONSerializer) is JSONSerializer:
+            return self._transport
+        # The endpoints with their own serializer get their own transport, with the same messages and subscriptions
+        transport = FakeMQTTTransport(*args, **kwargs)
+        transport._subscriptions = self._transport._subscriptions
+        transport._received_msgs = self._transport._received_msgs
+        return transport
 
     def publish_to_subscription(self, topic, payload):
         callback = self._transport._subscriptions[topic]
@@ -57,8 +63,8 @@ class FakeMQTTBroker:
 
     def clear(self):
         if self._transport is not None:
-            self._transport._received_msgs = {}
-            self._transport._subscriptions = {}
+            self._transport._received_msgs.clear()
+            self._transport._subscriptions.clear()
 
 
 class FakeMQTTTransport:
@@ -67,6 +73,7 @@ class FakeMQTTTransport:
         self._subscriptions = {}
         self._received_msgs = {}
         self._connected = False
+        self._serializer = kwargs.get("serializer", JSONSerializer)
 
     @property
     def is_connected(self) -> bool:
@@ -83,7 +90,10 @@ class FakeMQTTTransport:
 
     def publish(self, topic: str, payload: Dict[str, Any], qos: Any = "", retain: bool = False):
         logging.info(f"\nFakeMQTT publish on\n> {topic}\n     {payload}\n")
-        payload = ujson.loads(JSONSerializer.serialize(payload))
+        if self._serializer is JSONSerializer:
+            payload = ujson.loads(JSONSerializer.serialize(payload))
+        else:
+            payload = self._serializer.serialize(payload)
         if not self._received_msgs.get(topic):
             self._received_msgs[topic] = []
         self._received_msgs[topic].append(payload)